@@ -1,31 +1,81 @@
 """API REST pour les transactions bancaires."""
 
 import os
-from typing import Any, Dict, List, Optional
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict, List, Optional
 
+import pandas as pd
 from fastapi import FastAPI, HTTPException
 from pydantic import BaseModel
 
 from banking_api.models import (
     AmountDistributionBin,
+    CardProfile,
+    CustomerAnomalies,
     CustomerListResponse,
     CustomerProfile,
+    CustomerTimeline,
     DailyStats,
+    EntityFeatures,
+    ErrorBreakdownResponse,
+    FraudAlertsResponse,
+    FraudBacktest,
+    FraudBatchPrediction,
     FraudByType,
+    FraudModelInfo,
     FraudPrediction,
+    FraudRingsResponse,
     FraudSummary,
+    GeoStatsResponse,
+    GroupStatsResponse,
+    HeavyHittersResponse,
+    LocationRiskResponse,
+    MccDetail,
+    MccStats,
+    MerchantListResponse,
+    MerchantProfile,
     OverviewResponse,
+    PercentilesResponse,
+    RankedEntity,
+    SimilarCustomersResponse,
     StatsByType,
     TopCustomer,
 )
 from banking_api.services import (
+    aggregation_service,
+    alerts_service,
+    card_service,
     customer_service,
+    features_service,
+    fraud_batcher,
     fraud_detection_service,
+    fraud_rings_service,
+    geo_service,
+    heavy_hitters_service,
+    mcc_service,
+    merchant_service,
+    ranking_service,
     stats_service,
     transactions_service,
 )
+from banking_api.services.fraud_model import get_fraud_model
+from banking_api.services.fraud_rules import get_rule_set
 
-app = FastAPI(title="Banking Transactions API", version="1.0.0")
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """
+    Charge les règles, le modèle de fraude, les tables de risque
+    géographique et le batcher au démarrage.
+    """
+    get_rule_set()
+    get_fraud_model()
+    geo_service.preload_location_risk()
+    fraud_batcher.get_batcher()
+    yield
+
+
+app = FastAPI(title="Banking Transactions API", version="1.0.0", lifespan=lifespan)
 
 
 # ==================== MODELS ====================
@@ -37,6 +87,19 @@ class SearchRequest(BaseModel):
     type: Optional[str] = None
     isFraud: Optional[int] = None
     amount_range: Optional[List[float]] = None
+    errors: Optional[str] = None
+
+
+class StreamedTransaction(BaseModel):
+    """Modèle d'une transaction reçue en flux."""
+
+    date: str
+    amount: float
+    client_id: int
+    card_id: int
+    merchant_id: int
+    merchant_state: Optional[str] = ""
+    merchant_city: Optional[str] = ""
 
 
 # ==================== SYSTEM ROUTES ====================
@@ -80,6 +143,7 @@ def read_transactions(
     isFraud: Optional[int] = None,
     min_amount: Optional[float] = None,
     max_amount: Optional[float] = None,
+    errors: Optional[str] = None,
 ) -> Dict[str, Any]:
     """
     Liste paginée des transactions avec filtres optionnels.
@@ -98,6 +162,8 @@ def read_transactions(
         Montant minimum
     max_amount : Optional[float]
         Montant maximum
+    errors : Optional[str]
+        Codes d'erreur requis, séparés par des virgules (ex: "Bad CVV")
 
     Returns
     -------
@@ -105,7 +171,7 @@ def read_transactions(
         Transactions paginées avec métadonnées
     """
     return transactions_service.get_paginated_transactions(
-        page, limit, type, isFraud, min_amount, max_amount
+        page, limit, type, isFraud, min_amount, max_amount, errors
     )
 
 
@@ -237,6 +303,7 @@ def search_transactions(request: SearchRequest) -> Dict[str, Any]:
         is_fraud=request.isFraud,
         amount_min=amount_min,
         amount_max=amount_max,
+        errors=request.errors,
     )
 
     return {"count": len(results), "transactions": results}
@@ -285,17 +352,34 @@ def get_stats_overview() -> Dict[str, Any]:
     "/api/stats/amount-distribution",
     tags=["Statistiques"],
     response_model=AmountDistributionBin,
+    response_model_exclude_none=True,
 )
-def get_amount_distribution() -> Dict[str, Any]:
+def get_amount_distribution(
+    bins: Optional[int] = None,
+    edges: Optional[str] = None,
+    scale: str = "linear",
+    by: Optional[str] = None,
+) -> Dict[str, Any]:
     """
     Histogramme du montant des transactions (en classes de valeurs).
 
+    Parameters
+    ----------
+    bins : Optional[int]
+        Nombre de tranches régulières
+    edges : Optional[str]
+        Bornes explicites séparées par des virgules (ex: 0,50,100,1000)
+    scale : str
+        Échelle des tranches régulières : "linear" ou "log" (défaut: "linear")
+    by : Optional[str]
+        Breakdown par "type" ou "isFraud"
+
     Returns
     -------
     Dict[str, Any]
         Bins (intervalles) et counts (nombre par intervalle)
     """
-    return stats_service.get_amount_distribution()
+    return stats_service.get_amount_distribution(bins, edges, scale, by)
 
 
 @app.get("/api/stats/by-type", tags=["Statistiques"], response_model=List[StatsByType])
@@ -329,6 +413,389 @@ def get_daily_stats(days: int = 7) -> List[Dict[str, Any]]:
     return stats_service.get_daily_stats(days)
 
 
+@app.get("/api/stats/group", tags=["Statistiques"], response_model=GroupStatsResponse)
+def get_group_stats(
+    by: str,
+    metrics: str = "count,sum,mean",
+    type: Optional[str] = None,
+    merchant_state: Optional[str] = None,
+    isFraud: Optional[int] = None,
+    start_date: Optional[str] = None,
+    end_date: Optional[str] = None,
+    having: Optional[str] = None,
+    top: Optional[int] = None,
+    sort: Optional[str] = None,
+) -> Dict[str, Any]:
+    """
+    Agrégation générique par dimensions (ex: by=use_chip,merchant_state).
+
+    Parameters
+    ----------
+    by : str
+        Dimensions séparées par des virgules
+    metrics : str
+        Métriques : count, sum, mean, min, max, fraud_count, fraud_rate,
+        distinct_customers, distinct_cards, distinct_merchants (approximatives)
+    type : Optional[str]
+        Filtrer par type de transaction
+    merchant_state : Optional[str]
+        Filtrer par état du marchand
+    isFraud : Optional[int]
+        Filtrer par fraude (0 ou 1)
+    start_date : Optional[str]
+        Date de début incluse (YYYY-MM-DD)
+    end_date : Optional[str]
+        Date de fin incluse (YYYY-MM-DD)
+    having : Optional[str]
+        Conditions sur les métriques (ex: count>100,fraud_rate>0.01)
+    top : Optional[int]
+        Nombre maximum de groupes retournés
+    sort : Optional[str]
+        Métrique de classement pour top (défaut: première métrique)
+
+    Returns
+    -------
+    Dict[str, Any]
+        Groupes avec leurs métriques
+    """
+    return aggregation_service.get_group_stats(
+        by,
+        metrics,
+        type_filter=type,
+        merchant_state=merchant_state,
+        is_fraud=isFraud,
+        start_date=start_date,
+        end_date=end_date,
+        having=having,
+        top=top,
+        sort=sort,
+    )
+
+
+@app.get(
+    "/api/stats/percentiles", tags=["Statistiques"], response_model=PercentilesResponse
+)
+def get_percentiles(
+    by: Optional[str] = None,
+    q: str = stats_service.DEFAULT_QUANTILES,
+    key: Optional[str] = None,
+) -> Dict[str, Any]:
+    """
+    Percentiles approchés du montant (erreur relative de 1 %).
+
+    Parameters
+    ----------
+    by : Optional[str]
+        Dimension : use_chip, merchant_state ou client_id (défaut: global)
+    q : str
+        Quantiles séparés par des virgules (défaut: 0.5,0.9,0.99,0.999)
+    key : Optional[str]
+        Ne retourner que ce groupe (ex: un identifiant client)
+
+    Returns
+    -------
+    Dict[str, Any]
+        Percentiles par groupe
+    """
+    return stats_service.get_percentiles(by, q, key)
+
+
+@app.get(
+    "/api/stats/rankings/{entity}",
+    tags=["Statistiques"],
+    response_model=List[RankedEntity],
+)
+def get_rankings(
+    entity: str,
+    n: int = 10,
+    by: str = "volume",
+    type: Optional[str] = None,
+    merchant_state: Optional[str] = None,
+    start_date: Optional[str] = None,
+    end_date: Optional[str] = None,
+    min_count: int = 1,
+) -> List[Dict[str, Any]]:
+    """
+    Top N des clients, marchands ou cartes selon un critère.
+
+    Parameters
+    ----------
+    entity : str
+        "customers", "merchants" ou "cards"
+    n : int
+        Nombre d'entités (défaut: 10)
+    by : str
+        Critère : volume, count, fraud_count, fraud_rate, avg_ticket
+    type : Optional[str]
+        Filtrer par type de transaction
+    merchant_state : Optional[str]
+        Filtrer par état du marchand
+    start_date : Optional[str]
+        Date de début incluse (YYYY-MM-DD)
+    end_date : Optional[str]
+        Date de fin incluse (YYYY-MM-DD)
+    min_count : int
+        Nombre minimum de transactions pour être classé (défaut: 1)
+
+    Returns
+    -------
+    List[Dict[str, Any]]
+        Entités classées avec leurs statistiques
+    """
+    return ranking_service.rank_entities(
+        entity,
+        n,
+        by,
+        type_filter=type,
+        merchant_state=merchant_state,
+        start_date=start_date,
+        end_date=end_date,
+        min_count=min_count,
+    )
+
+
+@app.get(
+    "/api/stats/geo",
+    tags=["Statistiques"],
+    response_model=GeoStatsResponse,
+    response_model_exclude_none=True,
+)
+def get_geo_stats(
+    level: str = "state",
+    type: Optional[str] = None,
+    merchant_state: Optional[str] = None,
+    start_date: Optional[str] = None,
+    end_date: Optional[str] = None,
+    sort: str = "count",
+    limit: Optional[int] = None,
+) -> Dict[str, Any]:
+    """
+    Nombre, volume et taux de fraude par état, ville ou code postal.
+
+    Parameters
+    ----------
+    level : str
+        "state", "city" ou "zip" (défaut: "state")
+    type : Optional[str]
+        Filtrer par type de transaction
+    merchant_state : Optional[str]
+        Restreindre à un état
+    start_date : Optional[str]
+        Date de début incluse (YYYY-MM-DD)
+    end_date : Optional[str]
+        Date de fin incluse (YYYY-MM-DD)
+    sort : str
+        Tri décroissant : count, volume, fraud_count, fraud_rate (défaut: "count")
+    limit : Optional[int]
+        Nombre maximum de zones
+
+    Returns
+    -------
+    Dict[str, Any]
+        Statistiques par zone
+    """
+    return geo_service.get_geo_stats(
+        level,
+        type_filter=type,
+        merchant_state=merchant_state,
+        start_date=start_date,
+        end_date=end_date,
+        sort=sort,
+        limit=limit,
+    )
+
+
+@app.get(
+    "/api/stats/geo/risk", tags=["Statistiques"], response_model=LocationRiskResponse
+)
+def get_location_risk(
+    merchant_state: str = "", merchant_city: str = "", zip: str = ""
+) -> Dict[str, Any]:
+    """
+    Taux de fraude historique lissé de la zone la plus précise connue.
+
+    Parameters
+    ----------
+    merchant_state : str
+        État du marchand
+    merchant_city : str
+        Ville du marchand
+    zip : str
+        Code postal
+
+    Returns
+    -------
+    Dict[str, Any]
+        Zone retenue, taux lissé et lift par rapport au taux global
+    """
+    return geo_service.get_location_risk(merchant_state, merchant_city, zip)
+
+
+@app.get("/api/stats/mcc", tags=["Statistiques"], response_model=List[MccStats])
+def get_mcc_stats(
+    sort: str = "volume",
+    limit: Optional[int] = None,
+    min_count: int = 1,
+    type: Optional[str] = None,
+    start_date: Optional[str] = None,
+    end_date: Optional[str] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Volume, nombre, ticket moyen et fraude par catégorie de marchand (MCC).
+
+    Parameters
+    ----------
+    sort : str
+        Tri décroissant : volume, count, avg_ticket, fraud_count, fraud_rate
+        (défaut: "volume")
+    limit : Optional[int]
+        Nombre maximum de MCC
+    min_count : int
+        Nombre minimum de transactions (défaut: 1)
+    type : Optional[str]
+        Filtrer par type de transaction
+    start_date : Optional[str]
+        Date de début incluse (YYYY-MM-DD)
+    end_date : Optional[str]
+        Date de fin incluse (YYYY-MM-DD)
+
+    Returns
+    -------
+    List[Dict[str, Any]]
+        Statistiques par MCC
+    """
+    return mcc_service.get_mcc_stats(
+        sort, limit, min_count, type_filter=type, start_date=start_date, end_date=end_date
+    )
+
+
+@app.get("/api/stats/mcc/risky", tags=["Statistiques"], response_model=List[MccStats])
+def get_risky_mcc(n: int = 10, min_count: int = 100) -> List[Dict[str, Any]]:
+    """
+    MCC les plus risqués (taux de fraude décroissant).
+
+    Parameters
+    ----------
+    n : int
+        Nombre de MCC (défaut: 10)
+    min_count : int
+        Nombre minimum de transactions pour un taux fiable (défaut: 100)
+
+    Returns
+    -------
+    List[Dict[str, Any]]
+        MCC classés par taux de fraude
+    """
+    return mcc_service.get_mcc_stats("fraud_rate", n, min_count)
+
+
+@app.get("/api/stats/mcc/{mcc}", tags=["Statistiques"], response_model=MccDetail)
+def get_mcc_detail(mcc: int) -> Dict[str, Any]:
+    """
+    Statistiques d'un MCC et tendance mensuelle.
+
+    Parameters
+    ----------
+    mcc : int
+        Code MCC
+
+    Returns
+    -------
+    Dict[str, Any]
+        Statistiques du MCC et activité par mois
+    """
+    return mcc_service.get_mcc_detail(mcc)
+
+
+@app.get(
+    "/api/stats/errors", tags=["Statistiques"], response_model=ErrorBreakdownResponse
+)
+def get_error_breakdown() -> Dict[str, Any]:
+    """
+    Répartition des transactions par code d'erreur.
+
+    Returns
+    -------
+    Dict[str, Any]
+        Statistiques par code d'erreur et combinaisons fréquentes
+    """
+    return stats_service.get_error_breakdown()
+
+
+@app.get("/api/stats/top", tags=["Statistiques"], response_model=HeavyHittersResponse)
+def get_heavy_hitters(
+    entity: str = "merchant", window: str = "1d", k: int = 20, by: str = "volume"
+) -> Dict[str, Any]:
+    """
+    Top K approximatif des entités sur une fenêtre de temps récente.
+
+    Parameters
+    ----------
+    entity : str
+        "merchant", "customer" ou "card" (défaut: "merchant")
+    window : str
+        1h, 6h, 24h, 1d, 7d, 30d ou 90d (défaut: "1d")
+    k : int
+        Nombre d'entités (défaut: 20)
+    by : str
+        "volume" (montants absolus) ou "count" (défaut: "volume")
+
+    Returns
+    -------
+    Dict[str, Any]
+        Fenêtre, borne d'erreur et entités classées
+    """
+    return heavy_hitters_service.get_top(entity, window, k, by)
+
+
+@app.post("/api/stats/top/events", tags=["Statistiques"])
+def post_heavy_hitter_event(event: StreamedTransaction) -> Dict[str, str]:
+    """
+    Ajoute une transaction reçue en flux aux résumés par fenêtre, aux
+    profils comportementaux et aux détecteurs de vélocité du client et de
+    la carte.
+
+    Parameters
+    ----------
+    event : StreamedTransaction
+        Transaction reçue
+
+    Returns
+    -------
+    Dict[str, str]
+        Accusé de réception
+    """
+    # Date validée une seule fois, avant toute écriture : un événement
+    # invalide n'est enregistré nulle part
+    try:
+        parsed = pd.Timestamp(event.date)
+    except ValueError:
+        parsed = pd.NaT
+    if pd.isna(parsed):
+        raise HTTPException(status_code=400, detail=f"Date invalide: {event.date}")
+    timestamp = parsed.value // 10**9
+
+    heavy_hitters_service.record_transaction(
+        timestamp, event.amount, event.client_id, event.card_id, event.merchant_id
+    )
+    features_service.record_transaction(
+        timestamp,
+        event.amount,
+        event.client_id,
+        event.card_id,
+        event.merchant_state or "",
+        event.merchant_city or "",
+    )
+    alerts_service.record_transaction(
+        timestamp,
+        event.amount,
+        event.client_id,
+        event.card_id,
+        event.merchant_state or "",
+    )
+    return {"status": "recorded"}
+
+
 # ==================== FRAUD ROUTES ====================
 
 
@@ -339,6 +806,32 @@ class FraudPredictRequest(BaseModel):
     amount: float
     merchant_city: Optional[str] = ""
     merchant_state: Optional[str] = ""
+    mcc: Optional[int] = None
+    date: Optional[str] = None
+    client_id: Optional[int] = None
+    card_id: Optional[int] = None
+    zip: Optional[str] = None
+
+
+class FraudBatchRequest(BaseModel):
+    """
+    Lot de transactions à scorer.
+
+    Deux formats : une liste ``transactions`` d'objets, ou des colonnes
+    ``type`` / ``amount`` (et optionnellement ``merchant_city`` /
+    ``merchant_state``), plus rapides à décoder pour les gros lots.
+    """
+
+    transactions: Optional[List[FraudPredictRequest]] = None
+    type: Optional[List[str]] = None
+    amount: Optional[List[float]] = None
+    merchant_city: Optional[List[str]] = None
+    merchant_state: Optional[List[str]] = None
+    mcc: Optional[List[Optional[int]]] = None
+    date: Optional[List[Optional[str]]] = None
+    client_id: Optional[List[Optional[int]]] = None
+    card_id: Optional[List[Optional[int]]] = None
+    zip: Optional[List[Optional[str]]] = None
 
 
 @app.get("/api/fraud/summary", tags=["Fraude"], response_model=FraudSummary)
@@ -354,6 +847,77 @@ def get_fraud_summary() -> Dict[str, Any]:
     return fraud_detection_service.get_fraud_summary()
 
 
+@app.get("/api/fraud/backtest", tags=["Fraude"], response_model=FraudBacktest)
+def get_fraud_backtest() -> Dict[str, Any]:
+    """
+    Backtest du scoring de fraude (modèle ou règles) sur les transactions labellisées.
+
+    Returns
+    -------
+    Dict[str, Any]
+        Matrice de confusion, précision, rappel, F1 et courbe ROC / PR
+    """
+    return fraud_detection_service.get_fraud_backtest()
+
+
+@app.get("/api/fraud/model", tags=["Fraude"], response_model=FraudModelInfo)
+def get_fraud_model_info() -> Dict[str, Any]:
+    """
+    Modèle de fraude chargé (ou repli sur les règles).
+
+    Returns
+    -------
+    Dict[str, Any]
+        Disponibilité, version, seuil et métriques de validation du modèle
+    """
+    return fraud_detection_service.get_model_info()
+
+
+@app.get("/api/fraud/alerts", tags=["Fraude"], response_model=FraudAlertsResponse)
+def get_fraud_alerts(
+    rule: Optional[str] = None, limit: int = 100, offset: int = 0
+) -> Dict[str, Any]:
+    """
+    Alertes des règles de vélocité (cartes et clients), les plus récentes d'abord.
+
+    Parameters
+    ----------
+    rule : Optional[str]
+        Ne garder que les alertes d'une règle (défaut: toutes)
+    limit : int
+        Nombre maximum d'alertes retournées (défaut: 100)
+    offset : int
+        Nombre d'alertes sautées (pagination)
+
+    Returns
+    -------
+    Dict[str, Any]
+        Nombre total d'alertes, répartition par règle et page d'alertes
+    """
+    return alerts_service.get_alerts(rule, limit, offset)
+
+
+@app.get("/api/fraud/rings", tags=["Fraude"], response_model=FraudRingsResponse)
+def get_fraud_rings(limit: int = 20, min_clients: int = 2) -> Dict[str, Any]:
+    """
+    Réseaux de clients reliés par des cartes partagées ou des marchands
+    fraudés en commun.
+
+    Parameters
+    ----------
+    limit : int
+        Nombre maximum de réseaux retournés (défaut: 20)
+    min_clients : int
+        Taille minimale d'un réseau, en clients (défaut: 2)
+
+    Returns
+    -------
+    Dict[str, Any]
+        Réseaux classés par nombre de transactions frauduleuses
+    """
+    return fraud_rings_service.get_fraud_rings(limit, min_clients)
+
+
 @app.get("/api/fraud/by-type", tags=["Fraude"], response_model=List[FraudByType])
 def get_fraud_by_type() -> List[Dict[str, Any]]:
     """
@@ -368,10 +932,13 @@ def get_fraud_by_type() -> List[Dict[str, Any]]:
 
 
 @app.post("/api/fraud/predict", tags=["Fraude"], response_model=FraudPrediction)
-def predict_fraud(request: FraudPredictRequest) -> Dict[str, Any]:
+async def predict_fraud(request: FraudPredictRequest) -> Dict[str, Any]:
     """
     Endpoint de scoring pour prédire si une transaction donnée est frauduleuse.
 
+    Les requêtes concurrentes sont regroupées en micro-lots vectorisés
+    (voir ``fraud_batcher``).
+
     Parameters
     ----------
     request : FraudPredictRequest
@@ -382,11 +949,63 @@ def predict_fraud(request: FraudPredictRequest) -> Dict[str, Any]:
     Dict[str, Any]
         Prédiction de fraude avec probabilité et raisons
     """
-    return fraud_detection_service.predict_fraud(
+    return await fraud_batcher.get_batcher().predict(
         transaction_type=request.type,
         amount=request.amount,
         merchant_city=request.merchant_city or "",
         merchant_state=request.merchant_state or "",
+        mcc=request.mcc,
+        date=request.date,
+        client_id=request.client_id,
+        card_id=request.card_id,
+        zip_code=request.zip,
+    )
+
+
+@app.post(
+    "/api/fraud/predict/batch", tags=["Fraude"], response_model=FraudBatchPrediction
+)
+def predict_fraud_batch(request: FraudBatchRequest) -> Dict[str, Any]:
+    """
+    Scoring vectorisé d'un lot de transactions (mêmes règles que /predict).
+
+    Parameters
+    ----------
+    request : FraudBatchRequest
+        Transactions en liste d'objets ou en colonnes
+
+    Returns
+    -------
+    Dict[str, Any]
+        Prédictions par transaction, dans l'ordre du lot
+    """
+    if request.transactions is not None:
+        return fraud_detection_service.predict_fraud_batch(
+            [t.type for t in request.transactions],
+            [t.amount for t in request.transactions],
+            [t.merchant_city or "" for t in request.transactions],
+            [t.merchant_state or "" for t in request.transactions],
+            [t.mcc for t in request.transactions],
+            [t.date for t in request.transactions],
+            [t.client_id for t in request.transactions],
+            [t.card_id for t in request.transactions],
+            [t.zip for t in request.transactions],
+        )
+    if request.type is None or request.amount is None:
+        raise HTTPException(
+            status_code=400,
+            detail="Fournir 'transactions' ou les colonnes 'type' et 'amount'",
+        )
+    return fraud_detection_service.predict_fraud_batch(
+        request.type,
+        request.amount,
+        request.merchant_city,
+        request.merchant_state,
+        request.mcc,
+        request.date,
+        request.client_id,
+        request.card_id,
+        request.zip,
     )
 
 
@@ -423,7 +1042,8 @@ def get_top_customers(n: int = 10, by: str = "volume") -> List[Dict[str, Any]]:
     n : int
         Nombre de clients à retourner (défaut: 10)
     by : str
-        Critère de classement : "volume" ou "count" (défaut: "volume")
+        Critère de classement : "volume", "count", "fraud_count", "fraud_rate"
+        ou "avg_ticket" (défaut: "volume")
 
     Returns
     -------
@@ -451,3 +1071,192 @@ def get_customer_profile(customer_id: str) -> Dict[str, Any]:
         Nombre de transactions, solde moyen, fraude impliquée, etc.
     """
     return customer_service.get_customer_profile(customer_id)
+
+
+@app.get(
+    "/api/customers/{customer_id}/features",
+    tags=["Clients"],
+    response_model=EntityFeatures,
+)
+def get_customer_features(customer_id: str) -> Dict[str, Any]:
+    """
+    Profil comportemental d'un client (feature store du scoring de fraude).
+
+    Parameters
+    ----------
+    customer_id : str
+        Identifiant du client
+
+    Returns
+    -------
+    Dict[str, Any]
+        Montant moyen et écart-type, lieux et heure habituels, vélocité
+    """
+    return features_service.get_entity_features("customer", customer_id)
+
+
+@app.get(
+    "/api/customers/{customer_id}/anomalies",
+    tags=["Clients"],
+    response_model=CustomerAnomalies,
+)
+def get_customer_anomalies(customer_id: str, top: int = 10) -> Dict[str, Any]:
+    """
+    Transactions les plus inhabituelles pour un client (montant, heure,
+    État, MCC comparés à son propre historique).
+
+    Parameters
+    ----------
+    customer_id : str
+        Identifiant du client
+    top : int
+        Nombre de transactions retournées (défaut: 10)
+
+    Returns
+    -------
+    Dict[str, Any]
+        Transactions par score d'anomalie décroissant
+    """
+    return customer_service.get_customer_anomalies(customer_id, top)
+
+
+@app.get(
+    "/api/customers/{customer_id}/similar",
+    tags=["Clients"],
+    response_model=SimilarCustomersResponse,
+)
+def get_similar_customers(customer_id: str, k: int = 10) -> Dict[str, Any]:
+    """
+    Clients au profil de dépense le plus proche (MCC, type, heure, montants).
+
+    Parameters
+    ----------
+    customer_id : str
+        Identifiant du client de référence
+    k : int
+        Nombre de clients retournés (défaut: 10)
+
+    Returns
+    -------
+    Dict[str, Any]
+        Clients par similarité décroissante
+    """
+    return customer_service.get_similar_customers(customer_id, k)
+
+
+@app.get(
+    "/api/customers/{customer_id}/timeline",
+    tags=["Clients"],
+    response_model=CustomerTimeline,
+    response_model_exclude_none=True,
+)
+def get_customer_timeline(
+    customer_id: str, points: int = 300, method: str = "lttb"
+) -> Dict[str, Any]:
+    """
+    Chronologie des montants d'un client, bornée à ``points`` points.
+
+    Parameters
+    ----------
+    customer_id : str
+        Identifiant du client
+    points : int
+        Nombre maximum de points retournés (défaut: 300)
+    method : str
+        "lttb" (transactions représentatives) ou "buckets" (agrégats par
+        intervalle de temps)
+
+    Returns
+    -------
+    Dict[str, Any]
+        Série sous-échantillonnée
+    """
+    return customer_service.get_customer_timeline(customer_id, points, method)
+
+
+# ==================== MERCHANTS ROUTES ====================
+
+
+@app.get("/api/merchants", tags=["Marchands"], response_model=MerchantListResponse)
+def get_merchants(page: int = 1, limit: int = 10, sort: str = "id") -> Dict[str, Any]:
+    """
+    Liste paginée des marchands avec leurs statistiques.
+
+    Parameters
+    ----------
+    page : int
+        Numéro de page (défaut: 1)
+    limit : int
+        Nombre de marchands par page (défaut: 10)
+    sort : str
+        "id" ou critère décroissant : volume, count, fraud_rate, avg_ticket,
+        customers (défaut: "id")
+
+    Returns
+    -------
+    Dict[str, Any]
+        Liste paginée des marchands
+    """
+    return merchant_service.get_merchants(page, limit, sort)
+
+
+@app.get(
+    "/api/merchants/{merchant_id}", tags=["Marchands"], response_model=MerchantProfile
+)
+def get_merchant_profile(merchant_id: str) -> Dict[str, Any]:
+    """
+    Profil détaillé d'un marchand.
+
+    Parameters
+    ----------
+    merchant_id : str
+        Identifiant du marchand
+
+    Returns
+    -------
+    Dict[str, Any]
+        Volume, fraude, MCC et villes principaux, clients distincts,
+        activité par jour
+    """
+    return merchant_service.get_merchant_profile(merchant_id)
+
+
+# ==================== CARDS ROUTES ====================
+
+
+@app.get("/api/cards/{card_id}", tags=["Cartes"], response_model=CardProfile)
+def get_card_profile(card_id: str, window: str = "24h") -> Dict[str, Any]:
+    """
+    Statistiques et vélocité d'une carte.
+
+    Parameters
+    ----------
+    card_id : str
+        Identifiant de la carte
+    window : str
+        Fenêtre d'activité récente : 1m, 1h, 24h ou 7d (défaut: "24h")
+
+    Returns
+    -------
+    Dict[str, Any]
+        Statistiques, pics de transactions et activité récente
+    """
+    return card_service.get_card_profile(card_id, window)
+
+
+@app.get("/api/cards/{card_id}/features", tags=["Cartes"], response_model=EntityFeatures)
+def get_card_features(card_id: str) -> Dict[str, Any]:
+    """
+    Profil comportemental d'une carte (feature store du scoring de fraude).
+
+    Parameters
+    ----------
+    card_id : str
+        Identifiant de la carte
+
+    Returns
+    -------
+    Dict[str, Any]
+        Montant moyen et écart-type, lieux et heure habituels, vélocité
+    """
+    return features_service.get_entity_features("card", card_id)
@@ -1,15 +1,50 @@
 """Models package."""
 
+from banking_api.models.card import CardProfile
 from banking_api.models.customer import (
+    CustomerAnomalies,
+    CustomerAnomaly,
     CustomerListResponse,
     CustomerProfile,
+    CustomerTimeline,
+    SimilarCustomer,
+    SimilarCustomersResponse,
+    TimelinePoint,
     TopCustomer,
 )
-from banking_api.models.fraud import FraudByType, FraudPrediction, FraudSummary
+from banking_api.models.fraud import (
+    EntityFeatures,
+    FraudAlert,
+    FraudAlertsResponse,
+    FraudBacktest,
+    FraudBatchPrediction,
+    FraudByType,
+    FraudConfusionMatrix,
+    FraudCurvePoint,
+    FraudModelInfo,
+    FraudPrediction,
+    FraudRing,
+    FraudRingsResponse,
+    FraudSummary,
+)
+from banking_api.models.merchant import (
+    MerchantListResponse,
+    MerchantProfile,
+    MerchantSummary,
+)
 from banking_api.models.stats import (
     AmountDistributionBin,
     DailyStats,
+    ErrorBreakdownResponse,
+    GeoStatsResponse,
+    GroupStatsResponse,
+    HeavyHittersResponse,
+    LocationRiskResponse,
+    MccDetail,
+    MccStats,
     OverviewResponse,
+    PercentilesResponse,
+    RankedEntity,
     StatsByType,
 )
 from banking_api.models.transaction import Transaction
@@ -20,10 +55,39 @@ __all__ = [
     "AmountDistributionBin",
     "StatsByType",
     "DailyStats",
+    "PercentilesResponse",
+    "RankedEntity",
+    "GroupStatsResponse",
+    "GeoStatsResponse",
+    "LocationRiskResponse",
+    "ErrorBreakdownResponse",
+    "HeavyHittersResponse",
+    "MccStats",
+    "MccDetail",
     "CustomerListResponse",
     "CustomerProfile",
     "TopCustomer",
+    "CustomerAnomaly",
+    "CustomerAnomalies",
+    "SimilarCustomer",
+    "SimilarCustomersResponse",
+    "CustomerTimeline",
+    "TimelinePoint",
+    "MerchantSummary",
+    "MerchantListResponse",
+    "MerchantProfile",
+    "CardProfile",
     "FraudSummary",
     "FraudByType",
     "FraudPrediction",
+    "FraudBatchPrediction",
+    "FraudBacktest",
+    "FraudConfusionMatrix",
+    "FraudCurvePoint",
+    "EntityFeatures",
+    "FraudModelInfo",
+    "FraudAlert",
+    "FraudAlertsResponse",
+    "FraudRing",
+    "FraudRingsResponse",
 ]
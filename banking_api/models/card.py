@@ -0,0 +1,44 @@
+"""Modèles pour les cartes."""
+
+from typing import Optional
+
+from pydantic import BaseModel, Field
+
+
+class CardVelocity(BaseModel):
+    """Vélocité d'une carte sur tout son historique."""
+
+    peak_per_minute: int = Field(..., description="Maximum de transactions en 1 minute")
+    peak_per_hour: int = Field(..., description="Maximum de transactions en 1 heure")
+    peak_per_day: int = Field(..., description="Maximum de transactions en 24 heures")
+    min_interval_seconds: Optional[int] = Field(
+        None, description="Plus petit écart entre deux transactions"
+    )
+    median_interval_seconds: Optional[float] = Field(
+        None, description="Écart médian entre deux transactions"
+    )
+
+
+class CardRecentActivity(BaseModel):
+    """Activité d'une carte sur la fenêtre précédant sa dernière transaction."""
+
+    window: str = Field(..., description="Fenêtre (1m, 1h, 24h ou 7d)")
+    transaction_count: int = Field(..., description="Nombre de transactions")
+    total_amount: float = Field(..., description="Montant total")
+    distinct_merchants: int = Field(..., description="Nombre de marchands distincts")
+
+
+class CardProfile(BaseModel):
+    """Profil d'une carte : statistiques et vélocité."""
+
+    card_id: int = Field(..., description="Identifiant de la carte")
+    client_id: int = Field(..., description="Identifiant du titulaire")
+    transaction_count: int = Field(..., description="Nombre de transactions")
+    total_amount: float = Field(..., description="Montant total")
+    avg_amount: float = Field(..., description="Montant moyen")
+    fraud_count: int = Field(..., description="Nombre de fraudes")
+    distinct_merchants: int = Field(..., description="Nombre de marchands distincts")
+    first_date: str = Field(..., description="Date de la première transaction")
+    last_date: str = Field(..., description="Date de la dernière transaction")
+    velocity: CardVelocity = Field(..., description="Pics et intervalles")
+    recent: CardRecentActivity = Field(..., description="Activité récente")
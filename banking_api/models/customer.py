@@ -1,6 +1,6 @@
 """Modèles pour les clients."""
 
-from typing import List
+from typing import List, Optional
 
 from pydantic import BaseModel, Field
 
@@ -25,6 +25,14 @@ class CustomerProfile(BaseModel):
         ..., description="Indique si le client a été impliqué dans une fraude"
     )
     fraud_count: int = Field(..., description="Nombre de fraudes")
+    min_amount: Optional[float] = Field(None, description="Montant minimum")
+    max_amount: Optional[float] = Field(None, description="Montant maximum")
+    first_date: Optional[str] = Field(None, description="Date de la première transaction")
+    last_date: Optional[str] = Field(None, description="Date de la dernière transaction")
+    distinct_cards: Optional[int] = Field(None, description="Nombre de cartes distinctes")
+    distinct_merchants: Optional[int] = Field(
+        None, description="Nombre de marchands distincts"
+    )
 
 
 class TopCustomer(BaseModel):
@@ -38,3 +46,66 @@ class TopCustomer(BaseModel):
     fraudulent: bool = Field(
         ..., description="Indique si le client a commis des fraudes"
     )
+
+
+class CustomerAnomaly(BaseModel):
+    """Transaction inhabituelle pour le client."""
+
+    transaction_id: int = Field(..., description="Identifiant de la transaction")
+    date: str = Field(..., description="Date de la transaction")
+    amount: float = Field(..., description="Montant de la transaction")
+    merchant_state: str = Field(..., description="État du marchand")
+    mcc: int = Field(..., description="Code MCC du marchand")
+    score: float = Field(..., description="Score d'anomalie (somme des composantes)")
+    amount_zscore: float = Field(..., description="Z-score robuste du montant")
+    hour_surprise: float = Field(..., description="Rareté de l'heure pour le client")
+    state_surprise: float = Field(..., description="Rareté de l'État pour le client")
+    mcc_surprise: float = Field(..., description="Rareté du MCC pour le client")
+
+
+class CustomerAnomalies(BaseModel):
+    """Transactions les plus inhabituelles d'un client."""
+
+    customer_id: int = Field(..., description="Identifiant du client")
+    transaction_count: int = Field(..., description="Nombre de transactions du client")
+    anomalies: List[CustomerAnomaly]
+
+
+class SimilarCustomer(BaseModel):
+    """Client au profil de dépense proche."""
+
+    customer_id: int = Field(..., description="Identifiant du client")
+    similarity: float = Field(..., description="Similarité cosinus (1 = identique)")
+    transaction_count: int = Field(..., description="Nombre de transactions")
+    total_amount: float = Field(..., description="Montant total des transactions")
+    fraud_count: int = Field(..., description="Nombre de fraudes")
+
+
+class SimilarCustomersResponse(BaseModel):
+    """Clients les plus similaires à un client de référence."""
+
+    customer_id: int = Field(..., description="Client de référence")
+    k: int = Field(..., description="Nombre de clients demandés")
+    similar: List[SimilarCustomer]
+
+
+class TimelinePoint(BaseModel):
+    """Point de la chronologie d'un client (transaction ou seau de temps)."""
+
+    date: str = Field(..., description="Date de la transaction ou début du seau")
+    amount: Optional[float] = Field(None, description="Montant (lttb)")
+    transaction_id: Optional[int] = Field(None, description="Transaction retenue (lttb)")
+    end_date: Optional[str] = Field(None, description="Fin du seau (buckets)")
+    count: Optional[int] = Field(None, description="Nombre de transactions (buckets)")
+    total_amount: Optional[float] = Field(None, description="Montant total (buckets)")
+    min_amount: Optional[float] = Field(None, description="Montant minimum (buckets)")
+    max_amount: Optional[float] = Field(None, description="Montant maximum (buckets)")
+
+
+class CustomerTimeline(BaseModel):
+    """Chronologie sous-échantillonnée des transactions d'un client."""
+
+    customer_id: int = Field(..., description="Identifiant du client")
+    transaction_count: int = Field(..., description="Nombre de transactions du client")
+    method: str = Field(..., description="lttb ou buckets")
+    points: List[TimelinePoint]
@@ -1,6 +1,6 @@
 """Modèles pour la détection de fraude."""
 
-from typing import List
+from typing import Any, Dict, List, Optional
 
 from pydantic import BaseModel, Field
 
@@ -29,3 +29,143 @@ class FraudPrediction(BaseModel):
     isFraud: bool = Field(..., description="Prédiction de fraude (True/False)")
     probability: float = Field(..., description="Probabilité de fraude (0-1)")
     reasons: List[str] = Field(..., description="Raisons de la prédiction")
+
+
+class FraudBatchPrediction(BaseModel):
+    """Prédictions de fraude d'un lot, en colonnes (une entrée par transaction)."""
+
+    count: int = Field(..., description="Nombre de transactions du lot")
+    flagged: int = Field(..., description="Nombre de fraudes prédites")
+    isFraud: List[bool] = Field(..., description="Prédiction par transaction")
+    probability: List[float] = Field(..., description="Probabilité par transaction")
+    reasons: List[List[str]] = Field(..., description="Raisons par transaction")
+
+
+class FraudConfusionMatrix(BaseModel):
+    """Matrice de confusion des règles sur les transactions labellisées."""
+
+    tp: int = Field(..., description="Fraudes détectées (vrais positifs)")
+    fp: int = Field(..., description="Transactions légitimes signalées (faux positifs)")
+    fn: int = Field(..., description="Fraudes manquées (faux négatifs)")
+    tn: int = Field(..., description="Transactions légitimes non signalées")
+
+
+class FraudCurvePoint(BaseModel):
+    """Point de la courbe ROC / précision-rappel pour un seuil de score."""
+
+    threshold: float = Field(..., description="Seuil de score (fraude si score >= seuil)")
+    flagged: int = Field(..., description="Transactions signalées à ce seuil")
+    tp: int = Field(..., description="Vrais positifs à ce seuil")
+    fp: int = Field(..., description="Faux positifs à ce seuil")
+    precision: float = Field(..., description="Précision à ce seuil (0-1)")
+    recall: float = Field(..., description="Rappel (taux de vrais positifs) à ce seuil")
+    fpr: float = Field(..., description="Taux de faux positifs à ce seuil")
+
+
+class FraudBacktest(BaseModel):
+    """Backtest du scoring de fraude (modèle ou règles) sur le dataset labellisé."""
+
+    scorer: str = Field(..., description="Scoring évalué : model ou rules")
+    rule_version: str = Field(..., description="Version du jeu de règles évalué")
+    model_version: Optional[str] = Field(None, description="Version du modèle évalué")
+    dataset_version: str = Field(..., description="Version du dataset évalué")
+    threshold: float = Field(..., description="Seuil de décision du scoring")
+    evaluated_after: Optional[str] = Field(
+        None, description="Fin de l'entraînement du modèle, transactions évaluées après"
+    )
+    in_sample: bool = Field(
+        False, description="Métriques incluant les transactions d'entraînement du modèle"
+    )
+    labelled: int = Field(..., description="Nombre de transactions labellisées évaluées")
+    positives: int = Field(..., description="Nombre de fraudes labellisées évaluées")
+    confusion: FraudConfusionMatrix = Field(..., description="Matrice de confusion")
+    precision: float = Field(..., description="Précision au seuil de décision (0-1)")
+    recall: float = Field(..., description="Rappel au seuil de décision (0-1)")
+    f1: float = Field(..., description="Score F1 au seuil de décision (0-1)")
+    roc_auc: float = Field(..., description="Aire sous la courbe ROC")
+    average_precision: float = Field(..., description="Aire sous la courbe précision-rappel")
+    curve: List[FraudCurvePoint] = Field(..., description="Un point par seuil distinct")
+
+
+class EntityFeatures(BaseModel):
+    """Profil comportemental d'un client ou d'une carte (feature store)."""
+
+    entity: str = Field(..., description="Type d'entité (customer ou card)")
+    id: int = Field(..., description="Identifiant du client ou de la carte")
+    count: int = Field(..., description="Nombre de transactions")
+    amount_mean: float = Field(..., description="Montant moyen")
+    amount_std: float = Field(..., description="Écart-type des montants")
+    typical_hour: float = Field(..., description="Heure habituelle (moyenne circulaire, 0-24)")
+    home_state: str = Field(..., description="État le plus fréquent")
+    home_city: str = Field(..., description="Ville la plus fréquente")
+    distinct_states: int = Field(..., description="Nombre d'États distincts")
+    distinct_cities: int = Field(..., description="Nombre de villes distinctes")
+    last_seen: str = Field(..., description="Date de la dernière transaction")
+    velocity: float = Field(
+        ..., description="Vélocité à la dernière transaction (décroissance sur 24h)"
+    )
+
+
+class FraudModelInfo(BaseModel):
+    """Modèle de fraude utilisé pour le scoring."""
+
+    available: bool = Field(..., description="True si un modèle entraîné est chargé")
+    rule_version: str = Field(..., description="Version du jeu de règles")
+    version: Optional[str] = Field(None, description="Version de l'artefact du modèle")
+    threshold: Optional[float] = Field(None, description="Seuil de décision du modèle")
+    features: Optional[List[str]] = Field(None, description="Caractéristiques du modèle")
+    metadata: Optional[Dict[str, Any]] = Field(
+        None, description="Entraînement : date, tailles, métriques de validation"
+    )
+
+
+class FraudAlert(BaseModel):
+    """Alerte de vélocité sur une transaction."""
+
+    rule: str = Field(..., description="Règle de vélocité déclenchée")
+    description: str = Field(..., description="Raison de l'alerte")
+    entity: str = Field(..., description="Entité surveillée (card ou customer)")
+    entity_id: int = Field(..., description="Identifiant de la carte ou du client")
+    transaction_id: Optional[int] = Field(
+        None, description="Transaction du dataset (None pour le flux)"
+    )
+    date: str = Field(..., description="Date de la transaction")
+    amount: float = Field(..., description="Montant de la transaction")
+    merchant_state: str = Field(..., description="État du marchand")
+    transaction_count: int = Field(..., description="Transactions dans la fenêtre")
+    distinct_states: int = Field(..., description="États distincts dans la fenêtre")
+    amount_jump: Optional[float] = Field(
+        None, description="Rapport au montant de la transaction précédente"
+    )
+    source: str = Field(..., description="dataset ou stream")
+
+
+class FraudAlertsResponse(BaseModel):
+    """Alertes de vélocité, les plus récentes d'abord."""
+
+    total: int = Field(..., description="Nombre total d'alertes")
+    by_rule: Dict[str, int] = Field(..., description="Nombre d'alertes par règle")
+    alerts: List[FraudAlert]
+
+
+class FraudRing(BaseModel):
+    """Réseau de clients reliés par des cartes ou des marchands fraudés."""
+
+    rank: int = Field(..., description="Rang (par nombre de fraudes)")
+    client_count: int = Field(..., description="Nombre de clients du réseau")
+    merchant_count: int = Field(..., description="Nombre de marchands fraudés")
+    card_count: int = Field(..., description="Nombre de cartes utilisées")
+    fraud_count: int = Field(..., description="Nombre de transactions frauduleuses")
+    fraud_amount: float = Field(..., description="Montant total des fraudes")
+    first_date: str = Field(..., description="Première fraude du réseau")
+    last_date: str = Field(..., description="Dernière fraude du réseau")
+    clients: List[int] = Field(..., description="Clients (au plus 50)")
+    merchants: List[int] = Field(..., description="Marchands (au plus 50)")
+    cards: List[int] = Field(..., description="Cartes (au plus 50)")
+
+
+class FraudRingsResponse(BaseModel):
+    """Réseaux de fraude classés."""
+
+    total: int = Field(..., description="Nombre de réseaux")
+    rings: List[FraudRing]
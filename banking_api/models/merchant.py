@@ -0,0 +1,51 @@
+"""Modèles pour les marchands."""
+
+from typing import List
+
+from pydantic import BaseModel, Field
+
+from banking_api.models.stats import DailyStats
+
+
+class MerchantSummary(BaseModel):
+    """Statistiques agrégées d'un marchand."""
+
+    merchant_id: int = Field(..., description="Identifiant du marchand")
+    transaction_count: int = Field(..., description="Nombre de transactions")
+    total_amount: float = Field(..., description="Montant total (volume)")
+    avg_amount: float = Field(..., description="Montant moyen (ticket moyen)")
+    fraud_count: int = Field(..., description="Nombre de fraudes")
+    fraud_rate: float = Field(..., description="Taux de fraude (0-1)")
+    top_mcc: int = Field(..., description="Code MCC le plus fréquent")
+    top_city: str = Field(..., description="Ville la plus fréquente")
+    distinct_cities: int = Field(..., description="Nombre de villes distinctes")
+    distinct_customers: int = Field(..., description="Nombre de clients distincts")
+
+
+class MerchantListResponse(BaseModel):
+    """Liste paginée de marchands."""
+
+    page: int = Field(..., description="Numéro de la page actuelle")
+    limit: int = Field(..., description="Nombre de marchands par page")
+    total: int = Field(..., description="Nombre total de marchands")
+    sort: str = Field(..., description="Critère de tri")
+    merchants: List[MerchantSummary] = Field(..., description="Marchands de la page")
+
+
+class CityCount(BaseModel):
+    """Nombre de transactions d'un marchand dans une ville."""
+
+    city: str = Field(..., description="Ville")
+    count: int = Field(..., description="Nombre de transactions")
+
+
+class MerchantProfile(MerchantSummary):
+    """Profil détaillé d'un marchand."""
+
+    min_amount: float = Field(..., description="Montant minimum")
+    max_amount: float = Field(..., description="Montant maximum")
+    first_date: str = Field(..., description="Date de la première transaction")
+    last_date: str = Field(..., description="Date de la dernière transaction")
+    distinct_cards: int = Field(..., description="Nombre de cartes distinctes")
+    cities: List[CityCount] = Field(..., description="Villes, par fréquence décroissante")
+    daily_trend: List[DailyStats] = Field(..., description="Activité par jour")
@@ -1,6 +1,6 @@
 """Modèles pour les statistiques."""
 
-from typing import List
+from typing import Any, Dict, List, Optional
 
 from pydantic import BaseModel, Field
 
@@ -23,6 +23,12 @@ class AmountDistributionBin(BaseModel):
         ..., description="Intervalles de montants (ex: '0-100', '100-500')"
     )
     counts: List[int] = Field(..., description="Nombre de transactions par intervalle")
+    edges: Optional[List[float]] = Field(
+        None, description="Bornes numériques des intervalles (spécification personnalisée)"
+    )
+    breakdown: Optional[Dict[str, List[int]]] = Field(
+        None, description="Nombre de transactions par intervalle pour chaque groupe"
+    )
 
 
 class StatsByType(BaseModel):
@@ -41,3 +47,156 @@ class DailyStats(BaseModel):
     count: int = Field(..., description="Nombre de transactions")
     avg_amount: float = Field(..., description="Montant moyen")
     total_amount: float = Field(..., description="Montant total")
+
+
+class GroupStatsResponse(BaseModel):
+    """Résultat d'une agrégation générique."""
+
+    by: List[str] = Field(..., description="Dimensions de regroupement")
+    metrics: List[str] = Field(..., description="Métriques calculées")
+    total_groups: int = Field(..., description="Nombre de groupes retenus")
+    groups: List[Dict[str, Any]] = Field(
+        ..., description="Groupes avec libellés des dimensions et métriques"
+    )
+
+
+class PercentilesResponse(BaseModel):
+    """Percentiles approchés du montant."""
+
+    by: Optional[str] = Field(None, description="Dimension de regroupement")
+    quantiles: List[float] = Field(..., description="Quantiles demandés")
+    relative_accuracy: float = Field(
+        ..., description="Erreur relative maximale sur chaque percentile"
+    )
+    groups: List[Dict[str, Any]] = Field(
+        ..., description="Nombre de transactions et percentiles par groupe"
+    )
+
+
+class RankedEntity(BaseModel):
+    """Entité (client, marchand ou carte) classée."""
+
+    rank: int = Field(..., description="Rang (1 = meilleur)")
+    id: int = Field(..., description="Identifiant de l'entité")
+    transaction_count: int = Field(..., description="Nombre de transactions")
+    total_amount: float = Field(..., description="Montant total")
+    avg_amount: float = Field(..., description="Montant moyen (ticket moyen)")
+    fraud_count: int = Field(..., description="Nombre de fraudes")
+    fraud_rate: float = Field(..., description="Taux de fraude (0-1)")
+
+
+class HeavyHitter(BaseModel):
+    """Entité lourde d'une fenêtre de temps (valeur approchée)."""
+
+    rank: int = Field(..., description="Rang (1 = plus lourde)")
+    id: int = Field(..., description="Identifiant de l'entité")
+    value: float = Field(..., description="Valeur estimée (surestimation)")
+    error: float = Field(
+        ..., description="Erreur maximale : valeur exacte dans [value - error, value]"
+    )
+
+
+class HeavyHittersResponse(BaseModel):
+    """Top K approximatif sur une fenêtre de temps récente."""
+
+    entity: str = Field(..., description="Entité classée")
+    window: str = Field(..., description="Fenêtre demandée (ex: 1h, 7d)")
+    by: str = Field(..., description="Mesure : volume ou count")
+    window_start: str = Field(..., description="Début de la fenêtre (inclus)")
+    window_end: str = Field(..., description="Fin de la fenêtre (exclue)")
+    total: float = Field(..., description="Total de la mesure sur la fenêtre")
+    max_error: float = Field(
+        ..., description="Valeur maximale d'une entité absente du résumé"
+    )
+    top: List[HeavyHitter] = Field(..., description="Entités classées")
+
+
+class GeoArea(BaseModel):
+    """Statistiques d'une zone géographique (état, ville ou code postal)."""
+
+    state: str = Field(..., description="État du marchand (vide pour l'en ligne)")
+    city: Optional[str] = Field(None, description="Ville (niveau city)")
+    zip: Optional[str] = Field(None, description="Code postal (niveau zip)")
+    count: int = Field(..., description="Nombre de transactions")
+    total_amount: float = Field(..., description="Montant total")
+    avg_amount: float = Field(..., description="Montant moyen")
+    fraud_count: int = Field(..., description="Nombre de fraudes")
+    fraud_rate: float = Field(..., description="Taux de fraude (0-1)")
+
+
+class GeoStatsResponse(BaseModel):
+    """Statistiques par zone géographique."""
+
+    level: str = Field(..., description="Niveau : state, city ou zip")
+    total_areas: int = Field(..., description="Nombre de zones avant limite")
+    areas: List[GeoArea] = Field(..., description="Zones triées")
+
+
+class LocationRiskResponse(BaseModel):
+    """Risque de fraude historique d'une zone (taux lissé)."""
+
+    level: Optional[str] = Field(
+        None, description="Zone retenue : zip, city, state (absent si inconnue)"
+    )
+    transaction_count: int = Field(..., description="Transactions de la zone")
+    fraud_count: int = Field(..., description="Fraudes de la zone")
+    fraud_rate: float = Field(..., description="Taux de fraude lissé (0-1)")
+    global_rate: float = Field(..., description="Taux de fraude global (0-1)")
+    lift: float = Field(..., description="Taux de la zone / taux global")
+
+
+class MccStats(BaseModel):
+    """Statistiques d'une catégorie de marchand (MCC)."""
+
+    mcc: int = Field(..., description="Code MCC")
+    count: int = Field(..., description="Nombre de transactions")
+    total_amount: float = Field(..., description="Montant total")
+    avg_amount: float = Field(..., description="Montant moyen")
+    fraud_count: int = Field(..., description="Nombre de fraudes")
+    fraud_rate: float = Field(..., description="Taux de fraude (0-1)")
+    fraud_lift: float = Field(..., description="Taux de fraude / taux global")
+
+
+class MccMonth(BaseModel):
+    """Activité mensuelle d'un MCC."""
+
+    month: str = Field(..., description="Mois au format YYYY-MM")
+    count: int = Field(..., description="Nombre de transactions")
+    total_amount: float = Field(..., description="Montant total")
+    fraud_count: int = Field(..., description="Nombre de fraudes")
+    fraud_rate: float = Field(..., description="Taux de fraude (0-1)")
+
+
+class MccDetail(MccStats):
+    """Statistiques d'un MCC et tendance mensuelle."""
+
+    trend: List[MccMonth] = Field(..., description="Activité par mois")
+
+
+class ErrorStats(BaseModel):
+    """Statistiques d'un code d'erreur."""
+
+    error: str = Field(..., description="Code d'erreur")
+    count: int = Field(..., description="Nombre de transactions concernées")
+    share: float = Field(..., description="Part des transactions (0-1)")
+    total_amount: float = Field(..., description="Montant total")
+    fraud_count: int = Field(..., description="Nombre de fraudes")
+    fraud_rate: float = Field(..., description="Taux de fraude (0-1)")
+
+
+class ErrorCombination(BaseModel):
+    """Combinaison de codes d'erreur présents ensemble."""
+
+    errors: List[str] = Field(..., description="Codes d'erreur de la combinaison")
+    count: int = Field(..., description="Nombre de transactions")
+
+
+class ErrorBreakdownResponse(BaseModel):
+    """Répartition des transactions par code d'erreur."""
+
+    total_transactions: int = Field(..., description="Nombre total de transactions")
+    with_errors: int = Field(..., description="Transactions avec au moins une erreur")
+    errors: List[ErrorStats] = Field(..., description="Statistiques par code")
+    combinations: List[ErrorCombination] = Field(
+        ..., description="Combinaisons les plus fréquentes"
+    )
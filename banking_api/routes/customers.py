@@ -2,7 +2,7 @@
 
 from fastapi import APIRouter, HTTPException
 
-from banking_api.services.data_cache import get_cached_dataframe
+from banking_api.services.data_cache import get_customer_summary
 
 router = APIRouter()
 
@@ -22,36 +22,20 @@ def get_customers(skip: int = 0, limit: int = 100) -> dict:
     if limit > 1000:
         raise HTTPException(status_code=400, detail="Limit cannot exceed 1000")
 
-    df = get_cached_dataframe()
-
-    # Grouper par client_id
-    customer_groups = (
-        df.groupby("client_id")
-        .agg({"amount": ["count", "mean"], "isFraud": "sum"})
-        .reset_index()
-    )
-
-    customer_groups.columns = [
-        "customer_id",
-        "transaction_count",
-        "avg_amount",
-        "fraud_count",
-    ]
-    customer_groups["fraudulent"] = customer_groups["fraud_count"] > 0
-
-    # Pagination
-    total_customers = len(customer_groups)
-    paginated_customers = customer_groups.iloc[skip : skip + limit]
+    # Table de synthèse pré-calculée : la page est une simple tranche
+    summary = get_customer_summary()
+    total_customers = len(summary)
+    paginated_customers = summary.iloc[skip : skip + limit]
 
     customers = [
         {
-            "id": str(row["customer_id"]),
-            "transaction_count": int(row["transaction_count"]),
-            "avg_amount": round(row["avg_amount"], 2),
-            "fraud_count": int(row["fraud_count"]),
-            "fraudulent": bool(row["fraudulent"]),
+            "id": str(row.Index),
+            "transaction_count": int(row.transaction_count),
+            "avg_amount": round(row.avg_amount, 2),
+            "fraud_count": int(row.fraud_count),
+            "fraudulent": bool(row.fraud_count > 0),
         }
-        for _, row in paginated_customers.iterrows()
+        for row in paginated_customers.itertuples()
     ]
 
     return {
@@ -74,35 +58,20 @@ def get_top_customers(limit: int = 10) -> list:
     Returns:
         list: Liste des meilleurs clients
     """
-    df = get_cached_dataframe()
-
-    # Grouper par client_id
-    customer_groups = (
-        df.groupby("client_id")
-        .agg({"amount": ["count", "mean"], "isFraud": "sum"})
-        .reset_index()
-    )
-
-    customer_groups.columns = [
-        "customer_id",
-        "transaction_count",
-        "avg_amount",
-        "fraud_count",
-    ]
-    customer_groups["fraudulent"] = customer_groups["fraud_count"] > 0
+    summary = get_customer_summary()
 
     # Trier par nombre de transactions
-    top_customers = customer_groups.nlargest(limit, "transaction_count")
+    top_customers = summary.nlargest(limit, "transaction_count")
 
     return [
         {
-            "customer_id": int(row["customer_id"]),
-            "transaction_count": int(row["transaction_count"]),
-            "avg_amount": round(row["avg_amount"], 2),
-            "fraud_count": int(row["fraud_count"]),
-            "fraudulent": bool(row["fraudulent"]),
+            "customer_id": int(row.Index),
+            "transaction_count": int(row.transaction_count),
+            "avg_amount": round(row.avg_amount, 2),
+            "fraud_count": int(row.fraud_count),
+            "fraudulent": bool(row.fraud_count > 0),
         }
-        for _, row in top_customers.iterrows()
+        for row in top_customers.itertuples()
     ]
 
 
@@ -117,24 +86,18 @@ def get_customer_profile(customer_id: str) -> dict:
     Returns:
         dict: Profil du client
     """
-    df = get_cached_dataframe()
-
-    # Filtrer les transactions du client
-    customer_df = df[df["client_id"] == int(customer_id)]
+    summary = get_customer_summary()
 
-    if customer_df.empty:
+    if int(customer_id) not in summary.index:
         raise HTTPException(status_code=404, detail="Customer not found")
 
-    # Calculer les statistiques
-    total_transactions = len(customer_df)
-    avg_amount = customer_df["amount"].mean()
-    fraud_count = int(customer_df["isFraud"].sum())
-    fraudulent = fraud_count > 0
+    row = summary.loc[int(customer_id)]
+    fraud_count = int(row["fraud_count"])
 
     return {
         "id": customer_id,
-        "transaction_count": total_transactions,
-        "avg_amount": round(avg_amount, 2),
+        "transaction_count": int(row["transaction_count"]),
+        "avg_amount": round(row["avg_amount"], 2),
         "fraud_count": fraud_count,
-        "fraudulent": fraudulent,
+        "fraudulent": fraud_count > 0,
     }
@@ -0,0 +1,188 @@
+"""Cube d'agrégats pré-calculé pour les statistiques et la fraude."""
+
+from typing import Dict, List, NamedTuple, Sequence, Tuple
+
+import numpy as np
+
+# Dimensions du cube, dans l'ordre de la clé composite
+CUBE_DIMENSIONS: Tuple[str, ...] = (
+    "use_chip",
+    "merchant_state",
+    "day",
+    "isFraud",
+    "amount_bucket",
+)
+
+# Au-delà de ce nombre de cellules, on passe d'un bincount dense à un tri
+_DENSE_KEY_LIMIT: int = 1 << 26
+
+# Au-delà, la clé composite ne tient pas dans un int64 : tri des lignes de codes
+_COMPOSITE_KEY_LIMIT: int = int(np.iinfo(np.int64).max)
+
+
+class AggregateCube(NamedTuple):
+    """
+    Cube d'agrégats : une ligne par cellule non vide.
+
+    Attributes
+    ----------
+    dimensions : Tuple[str, ...]
+        Noms des dimensions
+    labels : Dict[str, np.ndarray]
+        Libellés de chaque dimension
+    codes : Dict[str, np.ndarray]
+        Code de chaque cellule pour chaque dimension
+    count : np.ndarray
+        Nombre de transactions par cellule
+    amount_sum : np.ndarray
+        Somme des montants par cellule
+    amount_max : float
+        Montant maximum du dataset
+    """
+
+    dimensions: Tuple[str, ...]
+    labels: Dict[str, np.ndarray]
+    codes: Dict[str, np.ndarray]
+    count: np.ndarray
+    amount_sum: np.ndarray
+    amount_max: float
+
+
+def group_keys(
+    codes: Sequence[np.ndarray], sizes: Sequence[int]
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Regroupe des lignes selon une clé composite de codes entiers.
+
+    Parameters
+    ----------
+    codes : Sequence[np.ndarray]
+        Codes entiers de chaque dimension (même longueur)
+    sizes : Sequence[int]
+        Nombre de valeurs possibles de chaque dimension
+
+    Returns
+    -------
+    Tuple[np.ndarray, np.ndarray]
+        (clés distinctes triées, indice de groupe de chaque ligne)
+    """
+    shape = tuple(max(int(s), 1) for s in sizes)
+    key = np.ravel_multi_index(tuple(codes), shape).astype(np.int64)
+
+    n_cells = int(np.prod(shape, dtype=np.int64))
+    if n_cells <= _DENSE_KEY_LIMIT:
+        present = np.bincount(key, minlength=n_cells) > 0
+        cells = np.flatnonzero(present)
+        lookup = np.cumsum(present) - 1
+        return cells, lookup[key]
+
+    cells, inverse = np.unique(key, return_inverse=True)
+    return cells, inverse
+
+
+def group_rows(
+    codes: Sequence[np.ndarray], sizes: Sequence[int]
+) -> Tuple[List[np.ndarray], np.ndarray]:
+    """
+    Regroupe des lignes selon plusieurs dimensions, quelle que soit leur cardinalité.
+
+    Passe par la clé composite de ``group_keys`` quand le produit des
+    cardinalités tient dans un int64, sinon trie directement les lignes de
+    codes (``np.unique(..., axis=0)``). L'ordre des groupes est le même
+    dans les deux cas.
+
+    Parameters
+    ----------
+    codes : Sequence[np.ndarray]
+        Codes entiers de chaque dimension (même longueur)
+    sizes : Sequence[int]
+        Nombre de valeurs possibles de chaque dimension
+
+    Returns
+    -------
+    Tuple[List[np.ndarray], np.ndarray]
+        (codes de chaque dimension par groupe, indice de groupe de chaque
+        ligne), groupes triés par codes croissants
+    """
+    shape = tuple(max(int(s), 1) for s in sizes)
+    n_cells = 1
+    for size in shape:
+        n_cells *= size
+
+    if n_cells <= _COMPOSITE_KEY_LIMIT:
+        cells, inverse = group_keys(codes, sizes)
+        return list(np.unravel_index(cells, shape)), inverse
+
+    stacked = np.column_stack([np.asarray(c, dtype=np.int64) for c in codes])
+    rows, inverse = np.unique(stacked, axis=0, return_inverse=True)
+    return [rows[:, i] for i in range(len(shape))], inverse.reshape(-1)
+
+
+def build_aggregate_cube(
+    encoded: Dict[str, Tuple[np.ndarray, np.ndarray]], amounts: np.ndarray
+) -> AggregateCube:
+    """
+    Construit le cube en une seule passe vectorisée.
+
+    Parameters
+    ----------
+    encoded : Dict[str, Tuple[np.ndarray, np.ndarray]]
+        (codes, libellés) pour chaque dimension de ``CUBE_DIMENSIONS``
+    amounts : np.ndarray
+        Montants des transactions
+
+    Returns
+    -------
+    AggregateCube
+        Cube d'agrégats
+    """
+    sizes = [len(encoded[dim][1]) for dim in CUBE_DIMENSIONS]
+    cells, inverse = group_keys([encoded[dim][0] for dim in CUBE_DIMENSIONS], sizes)
+
+    count = np.bincount(inverse, minlength=len(cells)).astype(np.int64)
+    amount_sum = np.bincount(inverse, weights=amounts, minlength=len(cells))
+    cell_codes = np.unravel_index(cells, tuple(max(s, 1) for s in sizes))
+
+    return AggregateCube(
+        dimensions=CUBE_DIMENSIONS,
+        labels={dim: encoded[dim][1] for dim in CUBE_DIMENSIONS},
+        codes={
+            dim: cell_codes[i].astype(np.int32) for i, dim in enumerate(CUBE_DIMENSIONS)
+        },
+        count=count,
+        amount_sum=amount_sum,
+        amount_max=float(amounts.max()) if len(amounts) else 0.0,
+    )
+
+
+def rollup(
+    cube: AggregateCube, dimensions: List[str]
+) -> Tuple[Dict[str, np.ndarray], np.ndarray, np.ndarray]:
+    """
+    Agrège le cube sur un sous-ensemble de dimensions.
+
+    Parameters
+    ----------
+    cube : AggregateCube
+        Cube source
+    dimensions : List[str]
+        Dimensions conservées (les autres sont sommées)
+
+    Returns
+    -------
+    Tuple[Dict[str, np.ndarray], np.ndarray, np.ndarray]
+        (codes de chaque dimension par groupe, nombre, somme des montants),
+        groupes triés par codes croissants
+    """
+    sizes = [len(cube.labels[dim]) for dim in dimensions]
+    groups, inverse = group_keys([cube.codes[dim] for dim in dimensions], sizes)
+
+    count = np.bincount(inverse, weights=cube.count, minlength=len(groups))
+    amount_sum = np.bincount(inverse, weights=cube.amount_sum, minlength=len(groups))
+    group_codes = np.unravel_index(groups, tuple(max(s, 1) for s in sizes))
+
+    return (
+        {dim: group_codes[i] for i, dim in enumerate(dimensions)},
+        count.astype(np.int64),
+        amount_sum,
+    )
@@ -0,0 +1,666 @@
+"""Service d'agrégation générique (group-by) sur les colonnes encodées."""
+
+import re
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+from fastapi import HTTPException
+
+from banking_api.services.aggregate_cube import CUBE_DIMENSIONS, group_rows
+from banking_api.services.data_cache import (
+    get_aggregate_cube,
+    get_cached_dataframe,
+    get_dataset_version,
+    get_distinct_sketches,
+    get_encoded_column,
+)
+from banking_api.services.hyperloglog import (
+    SparseSketches,
+    build_sketches,
+    estimate,
+    merge_groups,
+)
+
+# Colonnes sur lesquelles on peut grouper
+GROUPABLE_DIMENSIONS: Tuple[str, ...] = (
+    "use_chip",
+    "merchant_state",
+    "merchant_city",
+    "zip",
+    "mcc",
+    "client_id",
+    "card_id",
+    "merchant_id",
+    "day",
+    "month",
+    "isFraud",
+    "amount_bucket",
+)
+
+# Métriques calculables directement depuis le cube
+CUBE_METRICS: Tuple[str, ...] = ("count", "sum", "mean", "fraud_count", "fraud_rate")
+
+# Métriques de valeurs distinctes (HyperLogLog) -> identifiant compté
+DISTINCT_METRICS: Dict[str, str] = {
+    "distinct_customers": "client_id",
+    "distinct_cards": "card_id",
+    "distinct_merchants": "merchant_id",
+}
+
+METRICS: Tuple[str, ...] = CUBE_METRICS + ("min", "max") + tuple(DISTINCT_METRICS)
+
+# Filtres acceptés : nom du paramètre -> dimension filtrée
+FILTER_DIMENSIONS: Dict[str, str] = {
+    "type": "use_chip",
+    "merchant_state": "merchant_state",
+    "isFraud": "isFraud",
+    "start_date": "day",
+    "end_date": "day",
+}
+
+_HAVING_PATTERN = re.compile(r"^\s*(\w+)\s*(>=|<=|!=|=|>|<)\s*(-?\d+(?:\.\d+)?)\s*$")
+
+_COMPARATORS: Dict[str, Callable[[np.ndarray, float], np.ndarray]] = {
+    ">": np.greater,
+    ">=": np.greater_equal,
+    "<": np.less,
+    "<=": np.less_equal,
+    "=": np.equal,
+    "!=": np.not_equal,
+}
+
+Filters = Tuple[Tuple[str, Any], ...]
+
+
+class _Source(NamedTuple):
+    """Données à agréger : lignes brutes ou cellules du cube."""
+
+    codes: Callable[[str], np.ndarray]
+    labels: Callable[[str], np.ndarray]
+    count: Optional[np.ndarray]
+    amount: np.ndarray
+    fraud: np.ndarray
+
+
+def _row_source() -> _Source:
+    """
+    Source d'agrégation sur les lignes du dataset.
+
+    Returns
+    -------
+    _Source
+        Une ligne par transaction
+    """
+    df = get_cached_dataframe()
+    return _Source(
+        codes=lambda name: get_encoded_column(name).codes,
+        labels=lambda name: get_encoded_column(name).labels,
+        count=None,
+        amount=df["amount"].to_numpy(dtype=float),
+        fraud=df["isFraud"].to_numpy(dtype=float),
+    )
+
+
+def _cube_source() -> _Source:
+    """
+    Source d'agrégation sur les cellules du cube.
+
+    Returns
+    -------
+    _Source
+        Une ligne par cellule, pondérée par son nombre de transactions
+    """
+    cube = get_aggregate_cube()
+    return _Source(
+        codes=lambda name: cube.codes[name],
+        labels=lambda name: cube.labels[name],
+        count=cube.count.astype(float),
+        amount=cube.amount_sum,
+        fraud=(cube.count * cube.codes["isFraud"]).astype(float),
+    )
+
+
+def filter_mask(
+    source_codes: Callable[[str], np.ndarray],
+    source_labels: Callable[[str], np.ndarray],
+    filters: Filters,
+) -> Optional[np.ndarray]:
+    """
+    Construit le masque de lignes correspondant aux filtres.
+
+    Parameters
+    ----------
+    source_codes : Callable[[str], np.ndarray]
+        Accès aux codes d'une dimension
+    source_labels : Callable[[str], np.ndarray]
+        Accès aux libellés d'une dimension
+    filters : Filters
+        Couples (nom du filtre, valeur)
+
+    Returns
+    -------
+    Optional[np.ndarray]
+        Masque booléen, ou None si aucun filtre
+    """
+    mask: Optional[np.ndarray] = None
+
+    for name, value in filters:
+        dimension = FILTER_DIMENSIONS[name]
+        labels = source_labels(dimension)
+
+        # Les dates sont comparées sur les libellés de jour (YYYY-MM-DD)
+        if name == "start_date":
+            accepted = labels >= value
+        elif name == "end_date":
+            accepted = labels <= value
+        else:
+            accepted = labels == value
+
+        condition = np.asarray(accepted, dtype=bool)[source_codes(dimension)]
+        mask = condition if mask is None else mask & condition
+
+    return mask
+
+
+def _uses_cube(by: Tuple[str, ...], metrics: Tuple[str, ...], filters: Filters) -> bool:
+    """Indique si la requête peut être servie par le cube."""
+    filtered = {FILTER_DIMENSIONS[name] for name, _ in filters}
+    return (
+        set(by) <= set(CUBE_DIMENSIONS)
+        and set(metrics) <= set(CUBE_METRICS)
+        and filtered <= set(CUBE_DIMENSIONS)
+    )
+
+
+def _presketched_distinct(
+    item: str, by: Tuple[str, ...], filters: Filters, group_codes: List[np.ndarray]
+) -> Optional[np.ndarray]:
+    """
+    Valeurs distinctes lues dans les sketches pré-calculés par (dimension, jour).
+
+    Applicable quand ``by`` vaut ``(dim,)`` ou ``(dim, "day")`` et que seuls
+    des filtres de dates sont actifs : les sketches journaliers sont alors
+    fusionnés sans relire les lignes.
+
+    Parameters
+    ----------
+    item : str
+        Identifiant compté
+    by : Tuple[str, ...]
+        Dimensions de regroupement
+    filters : Filters
+        Filtres actifs
+    group_codes : List[np.ndarray]
+        Codes de chaque dimension par groupe du résultat (triés)
+
+    Returns
+    -------
+    Optional[np.ndarray]
+        Estimation par groupe, ou None si non applicable
+    """
+    if not 1 <= len(by) <= 2 or by[0] == "day" or by[1:] not in ((), ("day",)):
+        return None
+    if any(name not in ("start_date", "end_date") for name, _ in filters):
+        return None
+
+    sketches = get_distinct_sketches(item, by[0])
+    day_labels = get_encoded_column("day").labels
+    n_days = len(day_labels)
+
+    keep = filter_mask(
+        lambda _: sketches.groups % n_days, lambda _: day_labels, filters
+    )
+    mapping = sketches.groups if len(by) == 2 else sketches.groups // n_days
+    merged = merge_groups(sketches, mapping, keep)
+    groups = group_codes[0] * n_days + group_codes[1] if len(by) == 2 else group_codes[0]
+
+    # Renumérote les clés composites en positions dans le résultat
+    positions = np.searchsorted(groups, merged.groups)
+    return estimate(SparseSketches(positions, merged.registers, merged.ranks), len(groups))
+
+
+def _distinct_counts(
+    item: str,
+    by: Tuple[str, ...],
+    filters: Filters,
+    group_codes: List[np.ndarray],
+    inverse: np.ndarray,
+    mask: Optional[np.ndarray],
+) -> np.ndarray:
+    """
+    Nombre approximatif de valeurs distinctes de ``item`` par groupe.
+
+    Parameters
+    ----------
+    item : str
+        Identifiant compté
+    by : Tuple[str, ...]
+        Dimensions de regroupement
+    filters : Filters
+        Filtres actifs
+    group_codes : List[np.ndarray]
+        Codes de chaque dimension par groupe
+    inverse : np.ndarray
+        Groupe de chaque ligne retenue
+    mask : Optional[np.ndarray]
+        Lignes retenues par les filtres
+
+    Returns
+    -------
+    np.ndarray
+        Estimation HyperLogLog par groupe
+    """
+    presketched = _presketched_distinct(item, by, filters, group_codes)
+    if presketched is not None:
+        return presketched
+
+    values = get_cached_dataframe()[item].to_numpy()
+    if mask is not None:
+        values = values[mask]
+    return estimate(build_sketches(inverse, values), len(group_codes[0]))
+
+
+def _extremum(
+    ufunc: np.ufunc, inverse: np.ndarray, values: np.ndarray, n_groups: int
+) -> np.ndarray:
+    """
+    Minimum ou maximum de ``values`` par groupe.
+
+    Parameters
+    ----------
+    ufunc : np.ufunc
+        ``np.minimum`` ou ``np.maximum``
+    inverse : np.ndarray
+        Groupe de chaque valeur
+    values : np.ndarray
+        Valeurs à réduire
+    n_groups : int
+        Nombre de groupes
+
+    Returns
+    -------
+    np.ndarray
+        Extremum par groupe
+    """
+    result = np.full(n_groups, np.inf if ufunc is np.minimum else -np.inf)
+    ufunc.at(result, inverse, values)
+    return result
+
+
+@lru_cache(maxsize=128)
+def _group_by_cached(
+    dataset_version: str,
+    by: Tuple[str, ...],
+    metrics: Tuple[str, ...],
+    filters: Filters,
+) -> Dict[str, np.ndarray]:
+    """
+    Cache une agrégation par (version, dimensions, métriques, filtres).
+
+    Parameters
+    ----------
+    dataset_version : str
+        Version du dataset (clé de cache uniquement)
+    by : Tuple[str, ...]
+        Dimensions de regroupement
+    metrics : Tuple[str, ...]
+        Métriques à calculer
+    filters : Filters
+        Filtres appliqués avant agrégation
+
+    Returns
+    -------
+    Dict[str, np.ndarray]
+        Colonnes du résultat : libellés des dimensions puis métriques
+    """
+    source = _cube_source() if _uses_cube(by, metrics, filters) else _row_source()
+
+    codes = [source.codes(dim) for dim in by]
+    count_weights = source.count
+    amount = source.amount
+    fraud = source.fraud
+
+    mask = filter_mask(source.codes, source.labels, filters)
+    if mask is not None:
+        codes = [c[mask] for c in codes]
+        count_weights = count_weights[mask] if count_weights is not None else None
+        amount = amount[mask]
+        fraud = fraud[mask]
+
+    sizes = [len(source.labels(dim)) for dim in by]
+    group_codes, inverse = group_rows(codes, sizes)
+    n_groups = len(group_codes[0])
+
+    columns: Dict[str, np.ndarray] = {
+        dim: source.labels(dim)[group_codes[i]] for i, dim in enumerate(by)
+    }
+
+    count = np.bincount(inverse, weights=count_weights, minlength=n_groups)
+    amount_sum = np.bincount(inverse, weights=amount, minlength=n_groups)
+    fraud_count = np.bincount(inverse, weights=fraud, minlength=n_groups)
+
+    simple_metrics: Dict[str, Callable[[], np.ndarray]] = {
+        "count": lambda: count.astype(np.int64),
+        "sum": lambda: amount_sum,
+        "mean": lambda: amount_sum / count,
+        "fraud_count": lambda: fraud_count.astype(np.int64),
+        "fraud_rate": lambda: fraud_count / count,
+        "min": lambda: _extremum(np.minimum, inverse, amount, n_groups),
+        "max": lambda: _extremum(np.maximum, inverse, amount, n_groups),
+    }
+
+    for metric in metrics:
+        if metric in DISTINCT_METRICS:
+            columns[metric] = _distinct_counts(
+                DISTINCT_METRICS[metric], by, filters, group_codes, inverse, mask
+            )
+        else:
+            columns[metric] = simple_metrics[metric]()
+
+    return columns
+
+
+def _parse_day(date: Optional[str]) -> Optional[str]:
+    """
+    Normalise une date en libellé de jour (YYYY-MM-DD), comparable aux libellés.
+
+    Parameters
+    ----------
+    date : Optional[str]
+        Date fournie par l'utilisateur
+
+    Returns
+    -------
+    Optional[str]
+        Jour normalisé, ou None si aucune date
+    """
+    if date is None:
+        return None
+    try:
+        return pd.Timestamp(date).strftime("%Y-%m-%d")
+    except ValueError:
+        raise HTTPException(status_code=400, detail=f"Date invalide: {date}")
+
+
+def build_filters(
+    type_filter: Optional[str] = None,
+    merchant_state: Optional[str] = None,
+    is_fraud: Optional[int] = None,
+    start_date: Optional[str] = None,
+    end_date: Optional[str] = None,
+) -> Filters:
+    """
+    Normalise les filtres en tuple hashable (clé de cache).
+
+    Parameters
+    ----------
+    type_filter : Optional[str]
+        Type de transaction
+    merchant_state : Optional[str]
+        État du marchand
+    is_fraud : Optional[int]
+        Indicateur de fraude (0 ou 1)
+    start_date : Optional[str]
+        Date de début incluse (YYYY-MM-DD)
+    end_date : Optional[str]
+        Date de fin incluse (YYYY-MM-DD)
+
+    Returns
+    -------
+    Filters
+        Couples (nom du filtre, valeur) des filtres actifs, dates normalisées
+    """
+    filter_values = {
+        "type": type_filter,
+        "merchant_state": merchant_state,
+        "isFraud": is_fraud,
+        "start_date": _parse_day(start_date),
+        "end_date": _parse_day(end_date),
+    }
+    return tuple(
+        (name, value) for name, value in filter_values.items() if value is not None
+    )
+
+
+def aggregate(
+    by: Tuple[str, ...], metrics: Tuple[str, ...], filters: Filters = ()
+) -> Dict[str, np.ndarray]:
+    """
+    Agrégation mise en cache pour la version courante du dataset.
+
+    Parameters
+    ----------
+    by : Tuple[str, ...]
+        Dimensions de regroupement
+    metrics : Tuple[str, ...]
+        Métriques à calculer
+    filters : Filters
+        Filtres normalisés (voir ``build_filters``)
+
+    Returns
+    -------
+    Dict[str, np.ndarray]
+        Colonnes du résultat : libellés des dimensions puis métriques
+    """
+    return _group_by_cached(get_dataset_version(), by, metrics, filters)
+
+
+def _parse_list(value: str, allowed: Tuple[str, ...], kind: str) -> Tuple[str, ...]:
+    """
+    Découpe une liste séparée par des virgules et la valide.
+
+    Parameters
+    ----------
+    value : str
+        Liste brute (ex: "use_chip,merchant_state")
+    allowed : Tuple[str, ...]
+        Valeurs autorisées
+    kind : str
+        Nature des éléments (pour le message d'erreur)
+
+    Returns
+    -------
+    Tuple[str, ...]
+        Éléments validés, sans doublon
+    """
+    items = tuple(dict.fromkeys(v.strip() for v in value.split(",") if v.strip()))
+    if not items:
+        raise HTTPException(status_code=400, detail=f"Aucune {kind} fournie")
+    invalid = [item for item in items if item not in allowed]
+    if invalid:
+        raise HTTPException(
+            status_code=400,
+            detail=f"{kind.capitalize()} invalide(s): {', '.join(invalid)}",
+        )
+    return items
+
+
+def _having_mask(
+    columns: Dict[str, np.ndarray], metrics: Tuple[str, ...], having: str
+) -> np.ndarray:
+    """
+    Évalue une clause ``having`` (ex: "count>100,fraud_rate>=0.01").
+
+    Parameters
+    ----------
+    columns : Dict[str, np.ndarray]
+        Colonnes du résultat agrégé
+    metrics : Tuple[str, ...]
+        Métriques disponibles
+    having : str
+        Conditions séparées par des virgules
+
+    Returns
+    -------
+    np.ndarray
+        Masque des groupes retenus
+    """
+    n_groups = len(next(iter(columns.values())))
+    mask = np.ones(n_groups, dtype=bool)
+
+    for clause in having.split(","):
+        match = _HAVING_PATTERN.match(clause)
+        if match is None or match.group(1) not in metrics:
+            raise HTTPException(
+                status_code=400, detail=f"Clause having invalide: {clause.strip()}"
+            )
+        metric, operator, threshold = match.groups()
+        mask &= _COMPARATORS[operator](columns[metric], float(threshold))
+
+    return mask
+
+
+def top_k_indices(values: np.ndarray, k: int) -> np.ndarray:
+    """
+    Indices des ``k`` plus grandes valeurs, triés par valeur décroissante.
+
+    Utilise ``argpartition`` : O(n) pour la sélection, O(k log k) pour le tri.
+
+    Parameters
+    ----------
+    values : np.ndarray
+        Valeurs à classer
+    k : int
+        Nombre d'éléments retenus
+
+    Returns
+    -------
+    np.ndarray
+        Indices des k meilleurs éléments
+    """
+    if k >= len(values):
+        return np.argsort(-values, kind="stable")
+    candidates = np.argpartition(-values, k - 1)[:k]
+    return candidates[np.argsort(-values[candidates], kind="stable")]
+
+
+def _to_python(value: Any) -> Any:
+    """Convertit un scalaire numpy en type Python natif (sérialisable)."""
+    return value.item() if isinstance(value, np.generic) else value
+
+
+def _format_groups(
+    columns: Dict[str, np.ndarray],
+    dimensions: Tuple[str, ...],
+    metrics: Tuple[str, ...],
+    selected: np.ndarray,
+) -> List[Dict[str, Any]]:
+    """
+    Convertit les groupes sélectionnés en dictionnaires sérialisables.
+
+    Parameters
+    ----------
+    columns : Dict[str, np.ndarray]
+        Colonnes du résultat agrégé
+    dimensions : Tuple[str, ...]
+        Dimensions de regroupement
+    metrics : Tuple[str, ...]
+        Métriques calculées
+    selected : np.ndarray
+        Indices des groupes à retourner, dans l'ordre
+
+    Returns
+    -------
+    List[Dict[str, Any]]
+        Un dictionnaire par groupe
+    """
+    groups: List[Dict[str, Any]] = []
+    for i in selected:
+        group: Dict[str, Any] = {dim: _to_python(columns[dim][i]) for dim in dimensions}
+        for metric in metrics:
+            value = columns[metric][i]
+            if metric in ("count", "fraud_count") or metric in DISTINCT_METRICS:
+                group[metric] = int(round(float(value)))
+            elif metric == "fraud_rate":
+                group[metric] = round(float(value), 5)
+            else:
+                group[metric] = round(float(value), 2)
+        groups.append(group)
+    return groups
+
+
+def get_group_stats(
+    by: str,
+    metrics: str = "count,sum,mean",
+    type_filter: Optional[str] = None,
+    merchant_state: Optional[str] = None,
+    is_fraud: Optional[int] = None,
+    start_date: Optional[str] = None,
+    end_date: Optional[str] = None,
+    having: Optional[str] = None,
+    top: Optional[int] = None,
+    sort: Optional[str] = None,
+) -> Dict[str, Any]:
+    """
+    Agrégation générique par une ou plusieurs dimensions.
+
+    Parameters
+    ----------
+    by : str
+        Dimensions séparées par des virgules (ex: "use_chip,merchant_state")
+    metrics : str
+        Métriques séparées par des virgules parmi ``METRICS`` ; les métriques
+        ``distinct_*`` sont des estimations HyperLogLog (erreur type ~1,6 %)
+    type_filter : Optional[str]
+        Filtrer par type de transaction
+    merchant_state : Optional[str]
+        Filtrer par état du marchand
+    is_fraud : Optional[int]
+        Filtrer par fraude (0 ou 1)
+    start_date : Optional[str]
+        Date de début incluse (YYYY-MM-DD)
+    end_date : Optional[str]
+        Date de fin incluse (YYYY-MM-DD)
+    having : Optional[str]
+        Conditions sur les métriques (ex: "count>100")
+    top : Optional[int]
+        Ne garder que les N meilleurs groupes
+    sort : Optional[str]
+        Métrique de classement pour ``top`` (défaut: première métrique)
+
+    Returns
+    -------
+    Dict[str, Any]
+        Dictionnaire contenant :
+        - by : dimensions de regroupement
+        - metrics : métriques calculées
+        - total_groups : nombre de groupes après ``having``
+        - groups : liste des groupes avec leurs métriques
+    """
+    dimensions = _parse_list(by, GROUPABLE_DIMENSIONS, "dimension")
+    metric_names = _parse_list(metrics, METRICS, "métrique")
+
+    if top is not None and top <= 0:
+        raise HTTPException(status_code=400, detail="top doit être positif")
+    sort_metric = sort or metric_names[0]
+    if sort_metric not in metric_names:
+        raise HTTPException(
+            status_code=400, detail=f"Métrique de tri invalide: {sort_metric}"
+        )
+
+    filters = build_filters(type_filter, merchant_state, is_fraud, start_date, end_date)
+
+    try:
+        columns = aggregate(dimensions, metric_names, filters)
+
+        selected = np.arange(len(columns[dimensions[0]]))
+        if having:
+            selected = selected[_having_mask(columns, metric_names, having)]
+        total_groups = len(selected)
+        if top is not None:
+            selected = selected[top_k_indices(columns[sort_metric][selected], top)]
+
+        groups = _format_groups(columns, dimensions, metric_names, selected)
+
+        return {
+            "by": list(dimensions),
+            "metrics": list(metric_names),
+            "total_groups": total_groups,
+            "groups": groups,
+        }
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Erreur lors du calcul: {str(e)}")
@@ -0,0 +1,328 @@
+"""Service des alertes de vélocité (dataset historique et transactions en flux)."""
+
+import threading
+from collections import deque
+from functools import lru_cache
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+from fastapi import HTTPException
+
+from banking_api.services.data_cache import (
+    get_cached_dataframe,
+    get_dataset_version,
+    get_encoded_column,
+    get_row_index,
+    get_timestamps,
+)
+from banking_api.services.entity_summary import format_timestamps
+from banking_api.services.velocity import VELOCITY_RULES, evaluate_rule
+
+# Entités surveillées : nom dans les règles -> colonne identifiant
+ALERT_ENTITIES: Dict[str, str] = {
+    "card": "card_id",
+    "customer": "client_id",
+}
+
+# Dernières transactions conservées par entité pour le flux
+RING_SIZE: int = 64
+
+# Alertes du flux conservées (les plus anciennes sont oubliées)
+MAX_STREAM_ALERTS: int = 10_000
+
+_RULES_BY_NAME = {rule.name: rule for rule in VELOCITY_RULES}
+
+_lock = threading.Lock()
+
+# Transaction d'un tampon : (horodatage, État du marchand, montant)
+_Event = Tuple[int, str, float]
+
+
+@lru_cache(maxsize=1)
+def _get_dataset_alerts(dataset_version: str) -> pd.DataFrame:
+    """
+    Évalue toutes les règles de vélocité sur le dataset.
+
+    Chaque entité est une tranche contiguë et chronologique de son index
+    de lignes : une règle est évaluée en une passe vectorisée.
+
+    Parameters
+    ----------
+    dataset_version : str
+        Version du dataset (clé du cache)
+
+    Returns
+    -------
+    pd.DataFrame
+        Une ligne par alerte, de la plus récente à la plus ancienne
+    """
+    df = get_cached_dataframe()
+    timestamps = get_timestamps()
+    amounts = df["amount"].to_numpy(dtype=float)
+    states = get_encoded_column("merchant_state")
+    state_codes = np.where(
+        states.labels[states.codes] == "", -1, states.codes
+    ).astype(np.int64)
+
+    frames = []
+    for rule in VELOCITY_RULES:
+        index = get_row_index(ALERT_ENTITIES[rule.entity])
+        rows = index.rows
+        groups = np.repeat(np.arange(len(index.labels)), np.diff(index.offsets))
+        hits = evaluate_rule(
+            rule, groups, timestamps[rows], state_codes[rows], amounts[rows]
+        )
+        matched = rows[hits["positions"]]
+        frames.append(
+            pd.DataFrame(
+                {
+                    "rule": rule.name,
+                    "entity_id": index.labels[groups[hits["positions"]]],
+                    "row": matched,
+                    "timestamp": timestamps[matched],
+                    "count": hits["count"],
+                    "distinct_states": hits["distinct_states"],
+                    "amount_jump": hits["amount_jump"],
+                }
+            )
+        )
+
+    alerts = pd.concat(frames, ignore_index=True)
+    return alerts.sort_values(
+        ["timestamp", "row"], ascending=False, kind="stable"
+    ).reset_index(drop=True)
+
+
+@lru_cache(maxsize=1)
+def _get_stream(dataset_version: str) -> Dict[str, Any]:
+    """
+    État du flux : tampons circulaires par entité et alertes récentes.
+
+    Parameters
+    ----------
+    dataset_version : str
+        Version du dataset (clé du cache, un rechargement repart à zéro)
+
+    Returns
+    -------
+    Dict[str, Any]
+        buffers (entité -> identifiant -> tampon) et alerts
+    """
+    return {
+        "buffers": {entity: {} for entity in ALERT_ENTITIES},
+        "alerts": deque(maxlen=MAX_STREAM_ALERTS),
+    }
+
+
+def _history(entity: str, entity_id: int) -> Deque[_Event]:
+    """Tampon initialisé avec les dernières transactions de l'entité du dataset."""
+    buffer: Deque[_Event] = deque(maxlen=RING_SIZE)
+    index = get_row_index(ALERT_ENTITIES[entity])
+    position = np.searchsorted(index.labels, entity_id)
+    if position < len(index.labels) and index.labels[position] == entity_id:
+        rows = index.rows[index.offsets[position] : index.offsets[position + 1]]
+        rows = rows[-RING_SIZE:]
+        states = get_encoded_column("merchant_state")
+        amounts = get_cached_dataframe()["amount"].to_numpy(dtype=float)
+        buffer.extend(
+            zip(
+                get_timestamps()[rows].tolist(),
+                states.labels[states.codes[rows]].tolist(),
+                amounts[rows].tolist(),
+            )
+        )
+    return buffer
+
+
+def _check_buffer(buffer: Deque[_Event], entity: str) -> List[Dict[str, Any]]:
+    """Règles de l'entité déclenchées par la dernière transaction du tampon."""
+    timestamps, states, amounts = (np.array(column) for column in zip(*buffer))
+    labels, state_codes = np.unique(states, return_inverse=True)
+    state_codes = np.where(labels[state_codes] == "", -1, state_codes)
+    order = np.argsort(timestamps, kind="stable")
+    last = int(np.flatnonzero(order == len(buffer) - 1)[0])
+
+    triggered = []
+    for rule in VELOCITY_RULES:
+        if rule.entity != entity:
+            continue
+        hits = evaluate_rule(
+            rule,
+            np.zeros(len(buffer), dtype=np.int64),
+            timestamps[order],
+            state_codes[order],
+            amounts[order].astype(float),
+        )
+        match = np.flatnonzero(hits["positions"] == last)
+        if len(match):
+            triggered.append(
+                {
+                    "rule": rule.name,
+                    "count": int(hits["count"][match[0]]),
+                    "distinct_states": int(hits["distinct_states"][match[0]]),
+                    "amount_jump": float(hits["amount_jump"][match[0]]),
+                }
+            )
+    return triggered
+
+
+def record_transaction(
+    timestamp: int,
+    amount: float,
+    client_id: int,
+    card_id: int,
+    merchant_state: str = "",
+) -> List[Dict[str, Any]]:
+    """
+    Ajoute une transaction reçue en flux aux tampons et détecte les alertes.
+
+    Parameters
+    ----------
+    timestamp : int
+        Horodatage de la transaction (secondes depuis l'epoch)
+    amount : float
+        Montant de la transaction
+    client_id : int
+        Identifiant du client
+    card_id : int
+        Identifiant de la carte
+    merchant_state : str
+        État du marchand
+
+    Returns
+    -------
+    List[Dict[str, Any]]
+        Alertes déclenchées par la transaction
+    """
+    stream = _get_stream(get_dataset_version())
+    alerts = []
+    with _lock:
+        for entity, entity_id in (("card", card_id), ("customer", client_id)):
+            buffers = stream["buffers"][entity]
+            if entity_id not in buffers:
+                buffers[entity_id] = _history(entity, entity_id)
+            buffers[entity_id].append((timestamp, merchant_state, amount))
+            for hit in _check_buffer(buffers[entity_id], entity):
+                alert = {
+                    **hit,
+                    "entity_id": entity_id,
+                    "timestamp": timestamp,
+                    "amount": amount,
+                    "merchant_state": merchant_state,
+                }
+                stream["alerts"].append(alert)
+                alerts.append(alert)
+    return alerts
+
+
+def _format_alert(
+    rule: str,
+    entity_id: int,
+    timestamp: int,
+    count: int,
+    distinct_states: int,
+    amount_jump: float,
+    amount: float,
+    merchant_state: str,
+    transaction_id: Optional[int],
+    source: str,
+) -> Dict[str, Any]:
+    """Alerte au format de l'API."""
+    velocity_rule = _RULES_BY_NAME[rule]
+    return {
+        "rule": rule,
+        "description": velocity_rule.description,
+        "entity": velocity_rule.entity,
+        "entity_id": int(entity_id),
+        "transaction_id": transaction_id,
+        "date": format_timestamps(np.array([timestamp]))[0],
+        "amount": round(float(amount), 2),
+        "merchant_state": merchant_state,
+        "transaction_count": int(count),
+        "distinct_states": int(distinct_states),
+        "amount_jump": None if np.isnan(amount_jump) else round(float(amount_jump), 2),
+        "source": source,
+    }
+
+
+def get_alerts(
+    rule: Optional[str] = None, limit: int = 100, offset: int = 0
+) -> Dict[str, Any]:
+    """
+    Alertes de vélocité, les plus récentes d'abord.
+
+    Les alertes du flux précèdent celles du dataset historique.
+
+    Parameters
+    ----------
+    rule : Optional[str]
+        Ne garder que les alertes d'une règle (défaut: toutes)
+    limit : int
+        Nombre maximum d'alertes retournées (défaut: 100)
+    offset : int
+        Nombre d'alertes sautées (pagination)
+
+    Returns
+    -------
+    Dict[str, Any]
+        Nombre total d'alertes, répartition par règle et page d'alertes
+    """
+    if rule is not None and rule not in _RULES_BY_NAME:
+        raise HTTPException(status_code=400, detail=f"Règle invalide: {rule}")
+    if limit < 1 or offset < 0:
+        raise HTTPException(status_code=400, detail="limit >= 1 et offset >= 0 requis")
+
+    try:
+        version = get_dataset_version()
+        dataset = _get_dataset_alerts(version)
+        stream = _get_stream(version)
+        with _lock:
+            streamed = list(reversed(stream["alerts"]))
+
+        if rule is not None:
+            dataset = dataset[dataset["rule"] == rule]
+            streamed = [alert for alert in streamed if alert["rule"] == rule]
+
+        by_rule = dataset["rule"].value_counts().to_dict()
+        for alert in streamed:
+            by_rule[alert["rule"]] = by_rule.get(alert["rule"], 0) + 1
+
+        page = [
+            _format_alert(**alert, transaction_id=None, source="stream")
+            for alert in streamed[offset : offset + limit]
+        ]
+        start = max(offset - len(streamed), 0)
+        rows = dataset.iloc[start : start + limit - len(page)]
+        if len(rows):
+            df = get_cached_dataframe()
+            states = get_encoded_column("merchant_state")
+            row_positions = rows["row"].to_numpy()
+            page.extend(
+                _format_alert(
+                    *values,
+                    transaction_id=int(transaction_id),
+                    source="dataset",
+                )
+                for *values, transaction_id in zip(
+                    rows["rule"],
+                    rows["entity_id"],
+                    rows["timestamp"],
+                    rows["count"],
+                    rows["distinct_states"],
+                    rows["amount_jump"],
+                    df["amount"].to_numpy(dtype=float)[row_positions],
+                    states.labels[states.codes[row_positions]],
+                    df["id"].to_numpy()[row_positions],
+                )
+            )
+
+        return {
+            "total": len(dataset) + len(streamed),
+            "by_rule": {name: int(by_rule.get(name, 0)) for name in _RULES_BY_NAME},
+            "alerts": page,
+        }
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Erreur lors du calcul: {str(e)}")
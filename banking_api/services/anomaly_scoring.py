@@ -0,0 +1,166 @@
+"""Score d'anomalie de chaque transaction par rapport à l'historique de son client.
+
+Le score additionne des composantes comparables (de l'ordre de 0 à 10) :
+
+- ``amount_zscore`` : z-score robuste du montant, ``|x - médiane| / échelle``
+  avec ``échelle = 1.4826 * MAD`` (écart absolu médian), bornée par
+  ``MIN_AMOUNT_SCALE`` et par ``MIN_RELATIVE_SCALE`` fois la médiane, puis
+  plafonné à ``MAX_AMOUNT_ZSCORE`` ;
+- ``hour_surprise``, ``state_surprise``, ``mcc_surprise`` : surprise
+  ``-log10(part)`` de l'heure, de l'État et du MCC de la transaction parmi
+  les transactions du client (une valeur vue une fois sur 1000 vaut 3).
+
+Les transactions sont traitées dans l'ordre de l'index par client (une
+tranche contiguë par client) : médianes et fréquences sont calculées en
+passes groupées vectorisées pour tous les clients à la fois.
+"""
+
+from typing import Dict, Tuple
+
+import numpy as np
+
+# Plafond du z-score robuste du montant
+MAX_AMOUNT_ZSCORE: float = 10.0
+
+# Échelle minimale des montants : absolue et relative à la médiane
+MIN_AMOUNT_SCALE: float = 1.0
+MIN_RELATIVE_SCALE: float = 0.1
+
+# Facteur rendant la MAD comparable à un écart-type (loi normale)
+_MAD_TO_STD: float = 1.4826
+
+ANOMALY_COMPONENTS: Tuple[str, ...] = (
+    "amount_zscore",
+    "hour_surprise",
+    "state_surprise",
+    "mcc_surprise",
+)
+
+
+def group_medians(values: np.ndarray, offsets: np.ndarray) -> np.ndarray:
+    """
+    Médiane de chaque groupe de lignes contiguës.
+
+    Parameters
+    ----------
+    values : np.ndarray
+        Valeurs, groupées par tranches contiguës
+    offsets : np.ndarray
+        Début de chaque groupe (dernier élément = total), groupes non vides
+
+    Returns
+    -------
+    np.ndarray
+        Médiane par groupe
+    """
+    sizes = np.diff(offsets)
+    groups = np.repeat(np.arange(len(sizes)), sizes)
+    ordered = values[np.lexsort((values, groups))]
+    low = ordered[offsets[:-1] + (sizes - 1) // 2]
+    high = ordered[offsets[:-1] + sizes // 2]
+    return (low + high) / 2
+
+
+def robust_zscores(values: np.ndarray, offsets: np.ndarray) -> np.ndarray:
+    """
+    Z-score robuste (médiane / MAD) de chaque valeur dans son groupe.
+
+    Parameters
+    ----------
+    values : np.ndarray
+        Valeurs, groupées par tranches contiguës
+    offsets : np.ndarray
+        Début de chaque groupe (dernier élément = total)
+
+    Returns
+    -------
+    np.ndarray
+        Z-score robuste, plafonné à MAX_AMOUNT_ZSCORE
+    """
+    sizes = np.diff(offsets)
+    medians = np.repeat(group_medians(values, offsets), sizes)
+    deviations = np.abs(values - medians)
+    mads = np.repeat(group_medians(deviations, offsets), sizes)
+    scales = np.maximum(
+        _MAD_TO_STD * mads,
+        np.maximum(MIN_AMOUNT_SCALE, MIN_RELATIVE_SCALE * np.abs(medians)),
+    )
+    return np.minimum(deviations / scales, MAX_AMOUNT_ZSCORE)
+
+
+def surprise(codes: np.ndarray, offsets: np.ndarray) -> np.ndarray:
+    """
+    Surprise ``-log10(part)`` de la valeur de chaque ligne dans son groupe.
+
+    Parameters
+    ----------
+    codes : np.ndarray
+        Codes entiers (>= 0), groupés par tranches contiguës
+    offsets : np.ndarray
+        Début de chaque groupe (dernier élément = total)
+
+    Returns
+    -------
+    np.ndarray
+        0 pour une valeur présente sur toutes les lignes du groupe
+    """
+    sizes = np.diff(offsets)
+    groups = np.repeat(np.arange(len(sizes)), sizes).astype(np.int64)
+    n_codes = int(codes.max()) + 1 if len(codes) else 1
+    _, inverse, counts = np.unique(
+        groups * n_codes + codes, return_inverse=True, return_counts=True
+    )
+    return np.log10(sizes[groups] / counts[inverse])
+
+
+def anomaly_components(
+    offsets: np.ndarray,
+    amounts: np.ndarray,
+    hours: np.ndarray,
+    states: np.ndarray,
+    mccs: np.ndarray,
+) -> Dict[str, np.ndarray]:
+    """
+    Composantes du score d'anomalie de chaque transaction.
+
+    Parameters
+    ----------
+    offsets : np.ndarray
+        Début des transactions de chaque client (dernier élément = total)
+    amounts : np.ndarray
+        Montant de chaque transaction
+    hours : np.ndarray
+        Heure (0-23) de chaque transaction
+    states : np.ndarray
+        Code de l'État du marchand de chaque transaction
+    mccs : np.ndarray
+        Code du MCC de chaque transaction
+
+    Returns
+    -------
+    Dict[str, np.ndarray]
+        Une entrée par nom de ANOMALY_COMPONENTS
+    """
+    return {
+        "amount_zscore": robust_zscores(amounts, offsets),
+        "hour_surprise": surprise(hours, offsets),
+        "state_surprise": surprise(states, offsets),
+        "mcc_surprise": surprise(mccs, offsets),
+    }
+
+
+def anomaly_scores(components: Dict[str, np.ndarray]) -> np.ndarray:
+    """
+    Score d'anomalie : somme des composantes, en float32 (colonne compacte).
+
+    Parameters
+    ----------
+    components : Dict[str, np.ndarray]
+        Composantes (voir ``anomaly_components``)
+
+    Returns
+    -------
+    np.ndarray
+        Score de chaque transaction (float32)
+    """
+    return sum(components[name] for name in ANOMALY_COMPONENTS).astype(np.float32)
@@ -0,0 +1,136 @@
+"""Service d'analyse par carte (statistiques et vélocité)."""
+
+from typing import Any, Dict
+
+import numpy as np
+from fastapi import HTTPException
+
+from banking_api.services.data_cache import (
+    get_cached_dataframe,
+    get_encoded_column,
+    get_row_index,
+    get_timestamps,
+)
+from banking_api.services.entity_summary import format_timestamps
+
+# Fenêtres de vélocité -> durée en secondes
+VELOCITY_WINDOWS: Dict[str, int] = {
+    "1m": 60,
+    "1h": 3600,
+    "24h": 86400,
+    "7d": 7 * 86400,
+}
+
+
+def window_counts(timestamps: np.ndarray, width: int) -> np.ndarray:
+    """
+    Nombre de transactions dans la fenêtre ``[t, t + width)`` de chaque ligne.
+
+    Parameters
+    ----------
+    timestamps : np.ndarray
+        Horodatages triés (secondes)
+    width : int
+        Largeur de la fenêtre en secondes
+
+    Returns
+    -------
+    np.ndarray
+        Nombre de transactions de la fenêtre ouverte par chaque ligne
+    """
+    ends = np.searchsorted(timestamps, timestamps + width, side="left")
+    return ends - np.arange(len(timestamps))
+
+
+def _velocity(timestamps: np.ndarray) -> Dict[str, Any]:
+    """
+    Métriques de vélocité d'une carte.
+
+    Parameters
+    ----------
+    timestamps : np.ndarray
+        Horodatages triés des transactions de la carte
+
+    Returns
+    -------
+    Dict[str, Any]
+        Pics de transactions par minute/heure/jour et intervalles
+    """
+    intervals = np.diff(timestamps)
+    peaks = {
+        f"peak_per_{name}": int(window_counts(timestamps, width).max())
+        for name, width in (("minute", 60), ("hour", 3600), ("day", 86400))
+    }
+    peaks["min_interval_seconds"] = int(intervals.min()) if len(intervals) else None
+    peaks["median_interval_seconds"] = (
+        float(np.median(intervals)) if len(intervals) else None
+    )
+    return peaks
+
+
+def get_card_profile(card_id: str, window: str = "24h") -> Dict[str, Any]:
+    """
+    Statistiques et vélocité d'une carte.
+
+    Les lignes de la carte sont une tranche contiguë et chronologique de
+    l'index par carte : toutes les métriques sont des opérations
+    vectorisées sur cette seule tranche.
+
+    Parameters
+    ----------
+    card_id : str
+        Identifiant de la carte
+    window : str
+        Fenêtre récente (1m, 1h, 24h ou 7d), terminée à la dernière
+        transaction de la carte
+
+    Returns
+    -------
+    Dict[str, Any]
+        Statistiques, vélocité et activité de la fenêtre récente
+    """
+    if window not in VELOCITY_WINDOWS:
+        raise HTTPException(status_code=400, detail=f"Fenêtre invalide: {window}")
+
+    try:
+        key = int(card_id)
+    except ValueError:
+        raise HTTPException(status_code=404, detail="Carte non trouvée")
+
+    try:
+        index = get_row_index("card_id")
+        position = np.searchsorted(index.labels, key)
+        if position == len(index.labels) or index.labels[position] != key:
+            raise HTTPException(status_code=404, detail="Carte non trouvée")
+
+        rows = index.rows[index.offsets[position] : index.offsets[position + 1]]
+        df = get_cached_dataframe()
+        timestamps = get_timestamps()[rows]
+        amounts = df["amount"].to_numpy(dtype=float)[rows]
+        merchants = get_encoded_column("merchant_id").codes[rows]
+
+        recent = timestamps >= timestamps[-1] - VELOCITY_WINDOWS[window]
+        first_date, last_date = format_timestamps(timestamps[[0, -1]])
+
+        return {
+            "card_id": key,
+            "client_id": int(df["client_id"].iloc[rows[0]]),
+            "transaction_count": len(rows),
+            "total_amount": round(float(amounts.sum()), 2),
+            "avg_amount": round(float(amounts.mean()), 2),
+            "fraud_count": int(df["isFraud"].to_numpy()[rows].sum()),
+            "distinct_merchants": int(len(np.unique(merchants))),
+            "first_date": first_date,
+            "last_date": last_date,
+            "velocity": _velocity(timestamps),
+            "recent": {
+                "window": window,
+                "transaction_count": int(recent.sum()),
+                "total_amount": round(float(amounts[recent].sum()), 2),
+                "distinct_merchants": int(len(np.unique(merchants[recent]))),
+            },
+        }
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Erreur lors du calcul: {str(e)}")
@@ -0,0 +1,221 @@
+"""Encodage entier des colonnes du dataset pour les agrégations vectorisées."""
+
+from typing import List, NamedTuple, Sequence
+
+import numpy as np
+import pandas as pd
+
+# Bornes des tranches de montant (reprises de l'histogramme historique)
+AMOUNT_BUCKET_EDGES: List[float] = [
+    0,
+    100,
+    500,
+    1000,
+    5000,
+    10000,
+    50000,
+    100000,
+    500000,
+    1000000,
+]
+
+SECONDS_PER_DAY: int = 86400
+
+# Nombre maximum de valeurs distinctes d'une colonne de drapeaux (uint16)
+MAX_FLAGS: int = 16
+
+
+class EncodedColumn(NamedTuple):
+    """
+    Colonne encodée en entiers.
+
+    Attributes
+    ----------
+    codes : np.ndarray
+        Code entier de chaque ligne (indice dans ``labels``)
+    labels : np.ndarray
+        Valeurs distinctes triées
+    """
+
+    codes: np.ndarray
+    labels: np.ndarray
+
+
+def encode_categories(values: pd.Series) -> EncodedColumn:
+    """
+    Encode une colonne catégorielle en codes entiers triés.
+
+    Les valeurs manquantes sont regroupées sous le libellé ``""``, placé en
+    dernier.
+
+    Parameters
+    ----------
+    values : pd.Series
+        Colonne à encoder
+
+    Returns
+    -------
+    EncodedColumn
+        Codes (int32) et libellés distincts
+    """
+    codes, labels = pd.factorize(values, sort=True)
+    labels = np.asarray(labels, dtype=object)
+
+    missing = codes < 0
+    if missing.any():
+        codes = np.where(missing, len(labels), codes)
+        labels = np.append(labels, "")
+
+    return EncodedColumn(codes.astype(np.int32), labels)
+
+
+class FlagColumn(NamedTuple):
+    """
+    Colonne multi-valuée encodée en masque de bits.
+
+    Attributes
+    ----------
+    masks : np.ndarray
+        Masque (uint16) de chaque ligne : bit ``i`` levé si ``labels[i]``
+        est présent
+    labels : np.ndarray
+        Valeurs distinctes triées
+    """
+
+    masks: np.ndarray
+    labels: np.ndarray
+
+    def bits(self, names: Sequence[str]) -> int:
+        """
+        Masque correspondant à une liste de valeurs.
+
+        Parameters
+        ----------
+        names : Sequence[str]
+            Valeurs recherchées
+
+        Returns
+        -------
+        int
+            Masque avec un bit levé par valeur
+
+        Raises
+        ------
+        KeyError
+            Si une valeur est inconnue
+        """
+        positions = {label: i for i, label in enumerate(self.labels)}
+        mask = 0
+        for name in names:
+            mask |= 1 << positions[name]
+        return mask
+
+
+def encode_flags(values: pd.Series, separator: str = ",") -> FlagColumn:
+    """
+    Encode une colonne de listes séparées par des virgules en masques de bits.
+
+    Seules les combinaisons distinctes (quelques dizaines) sont découpées en
+    Python ; les lignes reçoivent ensuite leur masque par indexation.
+
+    Parameters
+    ----------
+    values : pd.Series
+        Colonne à encoder (ex: "Bad PIN,Insufficient Balance"), NaN si vide
+    separator : str
+        Séparateur des valeurs
+
+    Returns
+    -------
+    FlagColumn
+        Masques par ligne et libellés des bits
+
+    Raises
+    ------
+    ValueError
+        Si la colonne contient plus de ``MAX_FLAGS`` valeurs distinctes
+    """
+    codes, combinations = pd.factorize(values)
+    parsed = [
+        {item.strip() for item in str(combination).split(separator)} - {""}
+        for combination in combinations
+    ]
+    labels = sorted(set().union(*parsed))
+    if len(labels) > MAX_FLAGS:
+        raise ValueError(f"Plus de {MAX_FLAGS} valeurs distinctes: {len(labels)}")
+
+    bit_of = {label: 1 << i for i, label in enumerate(labels)}
+    combination_masks = np.array(
+        [sum(bit_of[item] for item in items) for items in parsed] + [0],
+        dtype=np.uint16,
+    )
+    # Le code -1 (valeur manquante) pointe sur le dernier masque, nul
+    return FlagColumn(combination_masks[codes], np.array(labels, dtype=object))
+
+
+def encode_days(timestamps: np.ndarray) -> EncodedColumn:
+    """
+    Encode des horodatages (secondes epoch) par jour calendaire.
+
+    Parameters
+    ----------
+    timestamps : np.ndarray
+        Horodatages en secondes depuis l'epoch (int64)
+
+    Returns
+    -------
+    EncodedColumn
+        Codes de jour et libellés au format YYYY-MM-DD
+    """
+    days = timestamps // SECONDS_PER_DAY
+    unique_days, codes = np.unique(days, return_inverse=True)
+    labels = np.datetime_as_string(unique_days.astype("datetime64[D]"), unit="D")
+    return EncodedColumn(codes.astype(np.int32), labels.astype(object))
+
+
+def encode_months(days: EncodedColumn) -> EncodedColumn:
+    """
+    Regroupe un encodage par jour en encodage par mois calendaire.
+
+    Seuls les libellés de jour (un par jour distinct) sont relus : les codes
+    par ligne sont obtenus par une simple indexation.
+
+    Parameters
+    ----------
+    days : EncodedColumn
+        Encodage par jour (libellés YYYY-MM-DD triés)
+
+    Returns
+    -------
+    EncodedColumn
+        Codes de mois et libellés au format YYYY-MM
+    """
+    day_months = np.array([label[:7] for label in days.labels], dtype=object)
+    labels, month_of_day = np.unique(day_months, return_inverse=True)
+    return EncodedColumn(month_of_day[days.codes].astype(np.int32), labels)
+
+
+def encode_amount_buckets(
+    amounts: np.ndarray, edges: Sequence[float] = AMOUNT_BUCKET_EDGES
+) -> np.ndarray:
+    """
+    Affecte chaque montant à sa tranche.
+
+    Le code 0 regroupe les montants négatifs, le code ``i + 1`` les montants
+    compris dans ``[edges[i], edges[i + 1])`` (la dernière tranche est ouverte).
+
+    Parameters
+    ----------
+    amounts : np.ndarray
+        Montants des transactions
+    edges : Sequence[float]
+        Bornes inférieures des tranches, triées
+
+    Returns
+    -------
+    np.ndarray
+        Code de tranche (int32) pour chaque montant
+    """
+    return np.searchsorted(np.asarray(edges, dtype=float), amounts, side="right").astype(
+        np.int32
+    )
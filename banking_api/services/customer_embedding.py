@@ -0,0 +1,164 @@
+"""Vecteurs de profil de dépense des clients et recherche de clients similaires.
+
+Chaque client est résumé par un vecteur de taille fixe, concaténation de
+blocs :
+
+- part des dépenses par MCC, par type de transaction (use_chip) et par
+  heure de la journée (chaque bloc ramené à une norme 1) ;
+- quantiles 10 / 50 / 90 % des montants et nombre de transactions, en
+  logarithme et centrés-réduits sur l'ensemble des clients, pondérés par
+  ``NUMERIC_WEIGHT``.
+
+Les vecteurs sont normalisés : la similarité cosinus entre deux clients est
+un simple produit scalaire, et la recherche des plus proches voisins est un
+produit matrice-vecteur en float32 sur tous les clients.
+"""
+
+from typing import Tuple
+
+import numpy as np
+
+from banking_api.services.entity_summary import quantiles_per_group
+
+AMOUNT_QUANTILES: Tuple[float, ...] = (0.1, 0.5, 0.9)
+
+# Poids du bloc numérique face aux blocs de parts (norme 1 chacun)
+NUMERIC_WEIGHT: float = 0.5
+
+
+def share_matrix(
+    groups: np.ndarray,
+    n_groups: int,
+    codes: np.ndarray,
+    n_codes: int,
+    weights: np.ndarray,
+) -> np.ndarray:
+    """
+    Part de chaque valeur dans le poids total de chaque groupe.
+
+    Parameters
+    ----------
+    groups : np.ndarray
+        Code de groupe de chaque ligne
+    n_groups : int
+        Nombre de groupes
+    codes : np.ndarray
+        Code de la valeur de chaque ligne
+    n_codes : int
+        Nombre de valeurs
+    weights : np.ndarray
+        Poids de chaque ligne (ex: montant)
+
+    Returns
+    -------
+    np.ndarray
+        Matrice (groupes x valeurs), lignes de somme 1 (0 si poids nul)
+    """
+    totals = np.bincount(
+        groups.astype(np.int64) * n_codes + codes,
+        weights=weights,
+        minlength=n_groups * n_codes,
+    ).reshape(n_groups, n_codes)
+    sums = totals.sum(axis=1, keepdims=True)
+    return np.divide(totals, sums, out=np.zeros_like(totals), where=sums > 0)
+
+
+def _unit_rows(matrix: np.ndarray) -> np.ndarray:
+    """Lignes ramenées à une norme 1 (lignes nulles inchangées)."""
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    return np.divide(matrix, norms, out=np.zeros_like(matrix), where=norms > 0)
+
+
+def customer_vectors(
+    clients: np.ndarray,
+    n_clients: int,
+    amounts: np.ndarray,
+    hours: np.ndarray,
+    mccs: np.ndarray,
+    n_mccs: int,
+    types: np.ndarray,
+    n_types: int,
+    counts: np.ndarray,
+) -> np.ndarray:
+    """
+    Vecteur de profil de chaque client.
+
+    Parameters
+    ----------
+    clients : np.ndarray
+        Code du client de chaque transaction
+    n_clients : int
+        Nombre de clients
+    amounts : np.ndarray
+        Montant de chaque transaction
+    hours : np.ndarray
+        Heure (0-23) de chaque transaction
+    mccs : np.ndarray
+        Code du MCC de chaque transaction
+    n_mccs : int
+        Nombre de codes MCC
+    types : np.ndarray
+        Code du type (use_chip) de chaque transaction
+    n_types : int
+        Nombre de types
+    counts : np.ndarray
+        Nombre de transactions de chaque client
+
+    Returns
+    -------
+    np.ndarray
+        Matrice (clients x dimensions) en float32, lignes de norme 1
+    """
+    spend = np.abs(amounts)
+    shares = [
+        share_matrix(clients, n_clients, codes, n_codes, spend)
+        for codes, n_codes in ((mccs, n_mccs), (types, n_types), (hours, 24))
+    ]
+
+    numeric = np.column_stack(
+        [
+            np.log1p(np.abs(quantiles_per_group(clients, n_clients, amounts, AMOUNT_QUANTILES))),
+            np.log1p(counts),
+        ]
+    )
+    numeric = np.nan_to_num(numeric)
+    scale = numeric.std(axis=0)
+    numeric = (numeric - numeric.mean(axis=0)) / np.where(scale > 0, scale, 1.0)
+
+    vectors = np.hstack(
+        [_unit_rows(block) for block in shares]
+        + [NUMERIC_WEIGHT * numeric / np.sqrt(numeric.shape[1])]
+    )
+    return _unit_rows(vectors).astype(np.float32)
+
+
+def nearest_neighbours(
+    vectors: np.ndarray, query: int, k: int
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Les k lignes les plus similaires à une ligne (similarité cosinus).
+
+    Parameters
+    ----------
+    vectors : np.ndarray
+        Vecteurs de norme 1 (float32)
+    query : int
+        Position de la ligne de référence (exclue du résultat)
+    k : int
+        Nombre de voisins
+
+    Returns
+    -------
+    Tuple[np.ndarray, np.ndarray]
+        (positions, similarités), par similarité décroissante
+    """
+    similarities = vectors @ vectors[query]
+    similarities[query] = -np.inf
+    k = min(k, len(vectors) - 1)
+    if k <= 0:
+        return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.float32)
+
+    candidates = np.argpartition(-similarities, k - 1)[:k]
+    order = np.lexsort((candidates, -similarities[candidates]))
+    best = candidates[order]
+    return best, similarities[best]
@@ -1,12 +1,39 @@
 """Service de gestion des profils clients."""
 
 import os
+from functools import lru_cache
 from typing import Any, Dict, List
 
-import pandas as pd
+import numpy as np
 from fastapi import HTTPException
 
-from banking_api.services.data_cache import get_cached_dataframe
+from banking_api.services.anomaly_scoring import (
+    ANOMALY_COMPONENTS,
+    anomaly_components,
+    anomaly_scores,
+)
+from banking_api.services.customer_embedding import customer_vectors, nearest_neighbours
+from banking_api.services.data_cache import (
+    get_cached_dataframe,
+    get_customer_summary,
+    get_dataset_version,
+    get_encoded_column,
+    get_row_index,
+    get_timestamps,
+)
+from banking_api.services.downsampling import lttb, time_buckets
+from banking_api.services.entity_summary import format_timestamps
+from banking_api.services.ranking_service import RANKING_CRITERIA, rank_entities
+
+# Nombre maximum de transactions anormales retournées par client
+MAX_ANOMALIES: int = 100
+
+# Nombre maximum de clients similaires retournés
+MAX_SIMILAR: int = 100
+
+# Méthodes de sous-échantillonnage de la chronologie et taille maximale
+TIMELINE_METHODS = ("lttb", "buckets")
+MAX_TIMELINE_POINTS: int = 1000
 
 
 def _get_csv_path() -> str:
@@ -51,10 +78,8 @@ def get_customers(page: int = 1, limit: int = 10) -> Dict[str, Any]:
         raise HTTPException(status_code=404, detail="Fichier de données non trouvé")
 
     try:
-        df: pd.DataFrame = pd.read_csv(csv_path)
-
-        # Obtenir les clients uniques (client_id)
-        unique_customers: pd.Series = df["client_id"].unique()
+        # Les clients distincts sont l'index de la table de synthèse (en cache)
+        unique_customers: np.ndarray = get_customer_summary().index.to_numpy()
         total: int = len(unique_customers)
 
         # Pagination
@@ -94,6 +119,9 @@ def get_customer_profile(customer_id: str) -> Dict[str, Any]:
         - total_amount : montant total des transactions
         - fraudulent : indique si le client a été impliqué dans une fraude
         - fraud_count : nombre de fraudes impliquant ce client
+        - min_amount, max_amount : montants extrêmes
+        - first_date, last_date : première et dernière transaction
+        - distinct_cards, distinct_merchants : cartes et marchands distincts
     """
     csv_path: str = _get_csv_path()
 
@@ -101,28 +129,29 @@ def get_customer_profile(customer_id: str) -> Dict[str, Any]:
         raise HTTPException(status_code=404, detail="Fichier de données non trouvé")
 
     try:
-        # Utiliser le DataFrame en cache (déjà nettoyé et avec isFraud)
-        df = get_cached_dataframe()
+        # Lecture directe dans la table de synthèse par client
+        summary = get_customer_summary()
+        client_id = int(customer_id)
 
-        # Filtrer les transactions du client
-        customer_transactions: pd.DataFrame = df[df["client_id"] == int(customer_id)]
-
-        if len(customer_transactions) == 0:
+        if client_id not in summary.index:
             raise HTTPException(status_code=404, detail="Client non trouvé")
 
-        transactions_count: int = len(customer_transactions)
-        avg_amount: float = customer_transactions["amount"].mean()
-        total_amount: float = customer_transactions["amount"].sum()
-        fraud_count: int = customer_transactions["isFraud"].sum()
-        fraudulent: bool = fraud_count > 0
+        row = summary.loc[client_id]
+        fraud_count = int(row["fraud_count"])
 
         return {
             "id": customer_id,
-            "transactions_count": transactions_count,
-            "avg_amount": round(avg_amount, 2),
-            "total_amount": round(total_amount, 2),
-            "fraudulent": bool(fraudulent),
-            "fraud_count": int(fraud_count),
+            "transactions_count": int(row["transaction_count"]),
+            "avg_amount": round(float(row["avg_amount"]), 2),
+            "total_amount": round(float(row["total_amount"]), 2),
+            "fraudulent": fraud_count > 0,
+            "fraud_count": fraud_count,
+            "min_amount": round(float(row["min_amount"]), 2),
+            "max_amount": round(float(row["max_amount"]), 2),
+            "first_date": row["first_date"],
+            "last_date": row["last_date"],
+            "distinct_cards": int(row["distinct_cards"]),
+            "distinct_merchants": int(row["distinct_merchants"]),
         }
     except HTTPException:
         raise
@@ -141,7 +170,8 @@ def get_top_customers(n: int = 10, by: str = "volume") -> List[Dict[str, Any]]:
     n : int
         Nombre de clients à retourner (défaut: 10)
     by : str
-        Critère de classement : "volume" (montant total) ou "count" (nombre de transactions)
+        Critère de classement : "volume" (montant total), "count" (nombre de
+        transactions), "fraud_count", "fraud_rate" ou "avg_ticket"
 
     Returns
     -------
@@ -153,51 +183,311 @@ def get_top_customers(n: int = 10, by: str = "volume") -> List[Dict[str, Any]]:
     if not os.path.exists(csv_path):
         raise HTTPException(status_code=404, detail="Fichier de données non trouvé")
 
+    # Critère inconnu : classement par volume, comme historiquement
+    criterion = by if by in RANKING_CRITERIA else "volume"
+    ranked = rank_entities("customers", n, criterion)
+
+    return [
+        {
+            "customer_id": row["id"],
+            "transaction_count": row["transaction_count"],
+            "total_amount": row["total_amount"],
+            "avg_amount": row["avg_amount"],
+            "fraud_count": row["fraud_count"],
+            "fraudulent": row["fraud_count"] > 0,
+        }
+        for row in ranked
+    ]
+
+
+def _anomaly_components(rows: np.ndarray, offsets: np.ndarray) -> Dict[str, np.ndarray]:
+    """Composantes d'anomalie de lignes groupées par client."""
+    return anomaly_components(
+        offsets,
+        get_cached_dataframe()["amount"].to_numpy(dtype=float)[rows],
+        (get_timestamps()[rows] // 3600) % 24,
+        get_encoded_column("merchant_state").codes[rows],
+        get_encoded_column("mcc").codes[rows],
+    )
+
+
+@lru_cache(maxsize=1)
+def _get_anomaly_scores(dataset_version: str) -> np.ndarray:
+    """
+    Score d'anomalie de toutes les transactions, dans l'ordre de l'index par client.
+
+    Parameters
+    ----------
+    dataset_version : str
+        Version du dataset (clé du cache)
+
+    Returns
+    -------
+    np.ndarray
+        Score (float32) aligné sur ``get_row_index("client_id").rows`` :
+        les scores d'un client sont une tranche contiguë
+    """
+    index = get_row_index("client_id")
+    return anomaly_scores(_anomaly_components(index.rows, index.offsets))
+
+
+def get_customer_anomalies(customer_id: str, top: int = 10) -> Dict[str, Any]:
+    """
+    Transactions les plus inhabituelles d'un client, par rapport à son historique.
+
+    Les scores sont précalculés pour tout le dataset ; la requête ne lit
+    que la tranche du client (O(transactions du client)).
+
+    Parameters
+    ----------
+    customer_id : str
+        Identifiant du client
+    top : int
+        Nombre de transactions retournées (défaut: 10)
+
+    Returns
+    -------
+    Dict[str, Any]
+        Dictionnaire contenant :
+        - customer_id, transaction_count
+        - anomalies : transactions par score décroissant, avec le détail
+          des composantes (montant, heure, État, MCC)
+    """
+    if not 0 < top <= MAX_ANOMALIES:
+        raise HTTPException(
+            status_code=400, detail=f"top doit être entre 1 et {MAX_ANOMALIES}"
+        )
+
+    try:
+        client_id = int(customer_id)
+    except ValueError:
+        raise HTTPException(status_code=404, detail="Client non trouvé")
+
     try:
-        # Utiliser le DataFrame en cache (déjà nettoyé et avec isFraud)
+        index = get_row_index("client_id")
+        position = np.searchsorted(index.labels, client_id)
+        if position == len(index.labels) or index.labels[position] != client_id:
+            raise HTTPException(status_code=404, detail="Client non trouvé")
+
+        start, end = index.offsets[position], index.offsets[position + 1]
+        rows = index.rows[start:end]
+        scores = _get_anomaly_scores(get_dataset_version())[start:end]
+        best = np.argsort(-scores, kind="stable")[:top]
+
+        # Détail recalculé sur la seule tranche du client
+        components = _anomaly_components(rows, np.array([0, len(rows)]))
         df = get_cached_dataframe()
+        selected = rows[best]
+        states = get_encoded_column("merchant_state")
+        dates = format_timestamps(get_timestamps()[selected])
+
+        return {
+            "customer_id": client_id,
+            "transaction_count": len(rows),
+            "anomalies": [
+                {
+                    "transaction_id": int(df["id"].iat[row]),
+                    "date": dates[i],
+                    "amount": round(float(df["amount"].iat[row]), 2),
+                    "merchant_state": states.labels[states.codes[row]],
+                    "mcc": int(df["mcc"].iat[row]),
+                    "score": round(float(scores[best[i]]), 3),
+                    **{
+                        name: round(float(components[name][best[i]]), 3)
+                        for name in ANOMALY_COMPONENTS
+                    },
+                }
+                for i, row in enumerate(selected)
+            ],
+        }
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Erreur lors du calcul: {str(e)}")
+
+
+@lru_cache(maxsize=1)
+def _get_customer_vectors(dataset_version: str) -> np.ndarray:
+    """
+    Vecteurs de profil de dépense de tous les clients.
+
+    Parameters
+    ----------
+    dataset_version : str
+        Version du dataset (clé du cache)
+
+    Returns
+    -------
+    np.ndarray
+        Matrice float32 (clients x dimensions), lignes dans l'ordre de
+        la table de synthèse par client
+    """
+    clients = get_encoded_column("client_id")
+    mccs = get_encoded_column("mcc")
+    types = get_encoded_column("use_chip")
+    return customer_vectors(
+        clients.codes,
+        len(clients.labels),
+        get_cached_dataframe()["amount"].to_numpy(dtype=float),
+        (get_timestamps() // 3600) % 24,
+        mccs.codes,
+        len(mccs.labels),
+        types.codes,
+        len(types.labels),
+        get_customer_summary()["transaction_count"].to_numpy(),
+    )
+
+
+def get_similar_customers(customer_id: str, k: int = 10) -> Dict[str, Any]:
+    """
+    Clients au profil de dépense le plus proche (similarité cosinus).
+
+    Parameters
+    ----------
+    customer_id : str
+        Identifiant du client de référence
+    k : int
+        Nombre de clients retournés (défaut: 10)
+
+    Returns
+    -------
+    Dict[str, Any]
+        Dictionnaire contenant :
+        - customer_id, k
+        - similar : clients par similarité décroissante, avec leurs
+          nombre de transactions, montant total et nombre de fraudes
+    """
+    if not 0 < k <= MAX_SIMILAR:
+        raise HTTPException(status_code=400, detail=f"k doit être entre 1 et {MAX_SIMILAR}")
+
+    try:
+        client_id = int(customer_id)
+    except ValueError:
+        raise HTTPException(status_code=404, detail="Client non trouvé")
 
-        # Grouper par client_id
-        customer_stats = (
-            df.groupby("client_id")
-            .agg({"amount": ["count", "sum", "mean"], "isFraud": "sum"})
-            .reset_index()
+    try:
+        summary = get_customer_summary()
+        if client_id not in summary.index:
+            raise HTTPException(status_code=404, detail="Client non trouvé")
+
+        vectors = _get_customer_vectors(get_dataset_version())
+        positions, similarities = nearest_neighbours(
+            vectors, summary.index.get_loc(client_id), k
         )
+        neighbours = summary.iloc[positions]
 
-        # Aplatir les colonnes
-        customer_stats.columns = [
-            "customer_id",
-            "transaction_count",
-            "total_amount",
-            "avg_amount",
-            "fraud_count",
-        ]
-
-        # Trier selon le critère
-        if by == "count":
-            customer_stats = customer_stats.sort_values(
-                "transaction_count", ascending=False
-            )
-        else:  # volume par défaut
-            customer_stats = customer_stats.sort_values("total_amount", ascending=False)
-
-        # Prendre les top N
-        top_customers = customer_stats.head(n)
-
-        # Convertir en liste de dictionnaires
-        results: List[Dict[str, Any]] = []
-        for _, row in top_customers.iterrows():
-            results.append(
+        return {
+            "customer_id": client_id,
+            "k": k,
+            "similar": [
                 {
-                    "customer_id": int(row["customer_id"]),
+                    "customer_id": int(neighbour_id),
+                    "similarity": round(float(similarity), 4),
                     "transaction_count": int(row["transaction_count"]),
                     "total_amount": round(float(row["total_amount"]), 2),
-                    "avg_amount": round(float(row["avg_amount"]), 2),
                     "fraud_count": int(row["fraud_count"]),
-                    "fraudulent": int(row["fraud_count"]) > 0,
                 }
-            )
+                for (neighbour_id, row), similarity in zip(
+                    neighbours.iterrows(), similarities
+                )
+            ],
+        }
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Erreur lors du calcul: {str(e)}")
+
+
+def get_customer_timeline(
+    customer_id: str, points: int = 300, method: str = "lttb"
+) -> Dict[str, Any]:
+    """
+    Chronologie des montants d'un client, sous-échantillonnée côté serveur.
+
+    Les transactions du client sont une tranche contiguë et chronologique
+    de l'index par client : le coût est linéaire en nombre de transactions
+    du client et la réponse compte au plus ``points`` points.
+
+    Parameters
+    ----------
+    customer_id : str
+        Identifiant du client
+    points : int
+        Nombre maximum de points retournés (défaut: 300)
+    method : str
+        "lttb" (transactions représentatives de la forme de la série) ou
+        "buckets" (agrégats par intervalle de temps)
+
+    Returns
+    -------
+    Dict[str, Any]
+        Dictionnaire contenant :
+        - customer_id, transaction_count, method
+        - points : transactions retenues (date, montant, identifiant) ou
+          seaux de temps (début, fin, nombre, montants total / min / max)
+    """
+    if method not in TIMELINE_METHODS:
+        raise HTTPException(status_code=400, detail=f"Méthode invalide: {method}")
+    if not 3 <= points <= MAX_TIMELINE_POINTS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"points doit être entre 3 et {MAX_TIMELINE_POINTS}",
+        )
+
+    try:
+        client_id = int(customer_id)
+    except ValueError:
+        raise HTTPException(status_code=404, detail="Client non trouvé")
+
+    try:
+        index = get_row_index("client_id")
+        position = np.searchsorted(index.labels, client_id)
+        if position == len(index.labels) or index.labels[position] != client_id:
+            raise HTTPException(status_code=404, detail="Client non trouvé")
+
+        rows = index.rows[index.offsets[position] : index.offsets[position + 1]]
+        df = get_cached_dataframe()
+        timestamps = get_timestamps()[rows]
+        amounts = df["amount"].to_numpy(dtype=float)[rows]
+
+        if method == "lttb":
+            kept = lttb(timestamps, amounts, points)
+            series = [
+                {"date": date, "amount": round(float(amount), 2), "transaction_id": int(tid)}
+                for date, amount, tid in zip(
+                    format_timestamps(timestamps[kept]),
+                    amounts[kept],
+                    df["id"].to_numpy()[rows[kept]],
+                )
+            ]
+        else:
+            buckets = time_buckets(timestamps, amounts, points)
+            series = [
+                {
+                    "date": start,
+                    "end_date": end,
+                    "count": int(count),
+                    "total_amount": round(float(total), 2),
+                    "min_amount": round(float(low), 2),
+                    "max_amount": round(float(high), 2),
+                }
+                for start, end, count, total, low, high in zip(
+                    format_timestamps(buckets["start"]),
+                    format_timestamps(buckets["end"]),
+                    buckets["count"],
+                    buckets["sum"],
+                    buckets["min"],
+                    buckets["max"],
+                )
+            ]
 
-        return results
+        return {
+            "customer_id": client_id,
+            "transaction_count": len(rows),
+            "method": method,
+            "points": series,
+        }
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Erreur lors du calcul: {str(e)}")
@@ -2,11 +2,73 @@
 
 import os
 from functools import lru_cache
-from typing import Tuple
+from typing import Dict, List, NamedTuple, Optional, Tuple
 
+import numpy as np
 import pandas as pd
 
+from banking_api.services.aggregate_cube import (
+    CUBE_DIMENSIONS,
+    AggregateCube,
+    build_aggregate_cube,
+    rollup,
+)
+from banking_api.services.column_encoding import (
+    AMOUNT_BUCKET_EDGES,
+    EncodedColumn,
+    FlagColumn,
+    encode_amount_buckets,
+    encode_categories,
+    encode_days,
+    encode_flags,
+    encode_months,
+)
+from banking_api.services.entity_summary import (
+    build_entity_summary,
+    distinct_per_group,
+    mode_per_group,
+)
 from banking_api.services.fraud_labels_loader import load_fraud_labels
+from banking_api.services.hyperloglog import SparseSketches, build_sketches
+from banking_api.services.quantile_sketch import grouped_bin_counts
+
+
+class SortedAmounts(NamedTuple):
+    """
+    Montants triés par groupe.
+
+    Attributes
+    ----------
+    values : np.ndarray
+        Montants, triés à l'intérieur de chaque groupe
+    offsets : np.ndarray
+        Début de chaque groupe dans ``values`` (dernier élément = total)
+    labels : np.ndarray
+        Libellé de chaque groupe
+    """
+
+    values: np.ndarray
+    offsets: np.ndarray
+    labels: np.ndarray
+
+
+class RowIndex(NamedTuple):
+    """
+    Lignes du dataset regroupées par entité, dans l'ordre chronologique.
+
+    Attributes
+    ----------
+    rows : np.ndarray
+        Positions des lignes, triées par (entité, horodatage)
+    offsets : np.ndarray
+        Début des lignes de chaque entité dans ``rows`` (dernier = total)
+    labels : np.ndarray
+        Identifiant de chaque entité
+    """
+
+    rows: np.ndarray
+    offsets: np.ndarray
+    labels: np.ndarray
 
 
 def _get_csv_path() -> str:
@@ -21,6 +83,24 @@ def _get_csv_path() -> str:
     return os.path.join(base_dir, "data", "transactions_data.csv")
 
 
+def _compute_dataset_version(csv_path: str) -> str:
+    """
+    Calcule l'identifiant de version d'un fichier de données.
+
+    Parameters
+    ----------
+    csv_path : str
+        Chemin du fichier CSV
+
+    Returns
+    -------
+    str
+        Version de la forme ``nom:taille:mtime_ns``
+    """
+    stat = os.stat(csv_path)
+    return f"{os.path.basename(csv_path)}:{stat.st_size}:{stat.st_mtime_ns}"
+
+
 @lru_cache(maxsize=1)
 def get_cached_dataframe() -> pd.DataFrame:
     """
@@ -48,106 +128,208 @@ def get_cached_dataframe() -> pd.DataFrame:
         lambda x: 1 if fraud_labels.get(str(x), "No") == "Yes" else 0
     )
 
+    df.attrs["dataset_version"] = _compute_dataset_version(csv_path)
+
     return df
 
 
+def get_dataset_version() -> str:
+    """
+    Retourne la version du dataset actuellement chargé.
+
+    Sert de clé aux caches dérivés : elle change à chaque rechargement
+    d'un fichier modifié.
+
+    Returns
+    -------
+    str
+        Identifiant de version du dataset
+    """
+    return get_cached_dataframe().attrs["dataset_version"]
+
+
 @lru_cache(maxsize=1)
-def get_basic_stats() -> Tuple[int, float, float, str]:
+def get_timestamps() -> np.ndarray:
     """
-    Cache les statistiques de base.
+    Cache les horodatages des transactions.
 
     Returns
     -------
-    Tuple[int, float, float, str]
-        (total_transactions, fraud_rate, avg_amount, most_common_type)
+    np.ndarray
+        Horodatage de chaque ligne en secondes depuis l'epoch (int64)
     """
     df = get_cached_dataframe()
+    dates = pd.to_datetime(df["date"]).to_numpy(dtype="datetime64[s]")
+    return dates.astype(np.int64)
 
-    total_transactions = len(df)
-    fraud_rate = df["isFraud"].mean()
-    avg_amount = df["amount"].mean()
-    most_common_type = df["use_chip"].mode()[0]
 
-    return total_transactions, fraud_rate, avg_amount, most_common_type
+@lru_cache(maxsize=None)
+def get_encoded_column(name: str) -> EncodedColumn:
+    """
+    Cache l'encodage entier d'une colonne.
 
+    En plus des colonnes du CSV, accepte les colonnes dérivées ``day``
+    (jour calendaire), ``month`` (mois calendaire) et ``amount_bucket``
+    (tranche de montant).
 
-@lru_cache(maxsize=1)
-def get_stats_by_type_cached() -> pd.DataFrame:
-    """
-    Cache les stats par type.
+    Parameters
+    ----------
+    name : str
+        Nom de la colonne
 
     Returns
     -------
-    pd.DataFrame
-        DataFrame avec colonnes: type, count, avg_amount, total_amount
+    EncodedColumn
+        Codes entiers par ligne et libellés distincts
     """
     df = get_cached_dataframe()
 
-    grouped = (
-        df.groupby("use_chip").agg({"amount": ["count", "mean", "sum"]}).reset_index()
-    )
+    if name == "day":
+        return encode_days(get_timestamps())
+    if name == "month":
+        return encode_months(get_encoded_column("day"))
+    if name == "isFraud":
+        return EncodedColumn(
+            df["isFraud"].to_numpy(dtype=np.int32), np.array([0, 1], dtype=object)
+        )
+    if name == "amount_bucket":
+        codes = encode_amount_buckets(df["amount"].to_numpy())
+        labels = ["<0"] + [str(int(edge)) for edge in AMOUNT_BUCKET_EDGES]
+        return EncodedColumn(codes, np.array(labels, dtype=object))
 
-    grouped.columns = ["type", "count", "avg_amount", "total_amount"]
+    return encode_categories(df[name])
 
-    return grouped
+
+@lru_cache(maxsize=1)
+def get_error_flags() -> FlagColumn:
+    """
+    Cache la colonne ``errors`` encodée en masque de bits (uint16).
+
+    Returns
+    -------
+    FlagColumn
+        Masque d'erreurs de chaque ligne et libellé de chaque bit
+    """
+    return encode_flags(get_cached_dataframe()["errors"])
 
 
 @lru_cache(maxsize=1)
-def get_fraud_summary_cached() -> Tuple[int, int, float, float]:
+def get_aggregate_cube() -> AggregateCube:
     """
-    Cache le résumé de fraude.
+    Cache le cube d'agrégats (une seule passe sur le dataset).
 
     Returns
     -------
-    Tuple[int, int, float, float]
-        (total_frauds, flagged, precision, recall)
+    AggregateCube
+        Cube use_chip × merchant_state × day × isFraud × amount_bucket
     """
     df = get_cached_dataframe()
+    encoded = {dim: get_encoded_column(dim) for dim in CUBE_DIMENSIONS}
+    return build_aggregate_cube(encoded, df["amount"].to_numpy(dtype=float))
+
+
+@lru_cache(maxsize=1)
+def get_basic_stats() -> Tuple[int, float, float, str]:
+    """
+    Cache les statistiques de base (calculées depuis le cube).
+
+    Returns
+    -------
+    Tuple[int, float, float, str]
+        (total_transactions, fraud_rate, avg_amount, most_common_type)
+    """
+    cube = get_aggregate_cube()
+
+    total_transactions = int(cube.count.sum())
+    fraud_count = int(cube.count[cube.codes["isFraud"] == 1].sum())
+    fraud_rate = fraud_count / total_transactions
+    avg_amount = float(cube.amount_sum.sum()) / total_transactions
 
-    total_frauds = int(df["isFraud"].sum())
-    flagged = total_frauds
-    precision = 1.0 if flagged > 0 else 0.0
-    recall = 1.0 if total_frauds > 0 else 0.0
+    type_codes, type_counts, _ = rollup(cube, ["use_chip"])
+    most_common_type = cube.labels["use_chip"][type_codes["use_chip"][type_counts.argmax()]]
 
-    return total_frauds, flagged, precision, recall
+    return total_transactions, fraud_rate, avg_amount, most_common_type
+
+
+@lru_cache(maxsize=1)
+def get_stats_by_type_cached() -> pd.DataFrame:
+    """
+    Cache les stats par type (calculées depuis le cube).
+
+    Returns
+    -------
+    pd.DataFrame
+        DataFrame avec colonnes: type, count, avg_amount, total_amount
+    """
+    cube = get_aggregate_cube()
+    codes, count, amount_sum = rollup(cube, ["use_chip"])
+
+    return pd.DataFrame(
+        {
+            "type": cube.labels["use_chip"][codes["use_chip"]],
+            "count": count,
+            "avg_amount": amount_sum / count,
+            "total_amount": amount_sum,
+        }
+    )
 
 
 @lru_cache(maxsize=1)
 def get_fraud_by_type_cached() -> pd.DataFrame:
     """
-    Cache les stats de fraude par type.
+    Cache les stats de fraude par type (calculées depuis le cube).
 
     Returns
     -------
     pd.DataFrame
         DataFrame avec colonnes: type, total_transactions, fraud_count, fraud_rate
     """
-    df = get_cached_dataframe()
+    cube = get_aggregate_cube()
+    codes, count, _ = rollup(cube, ["use_chip", "isFraud"])
 
-    fraud_by_type = (
-        df.groupby("use_chip").agg({"isFraud": ["count", "sum", "mean"]}).reset_index()
+    n_types = len(cube.labels["use_chip"])
+    totals = np.bincount(codes["use_chip"], weights=count, minlength=n_types)
+    frauds = np.bincount(
+        codes["use_chip"], weights=count * codes["isFraud"], minlength=n_types
     )
+    present = totals > 0
 
-    fraud_by_type.columns = ["type", "total_transactions", "fraud_count", "fraud_rate"]
-
-    return fraud_by_type
+    return pd.DataFrame(
+        {
+            "type": cube.labels["use_chip"][present],
+            "total_transactions": totals[present].astype(np.int64),
+            "fraud_count": frauds[present].astype(np.int64),
+            "fraud_rate": frauds[present] / totals[present],
+        }
+    )
 
 
 def clear_cache() -> None:
     """Efface tous les caches (utile pour les tests)."""
     get_cached_dataframe.cache_clear()
+    get_timestamps.cache_clear()
+    get_encoded_column.cache_clear()
+    get_aggregate_cube.cache_clear()
     get_basic_stats.cache_clear()
     get_stats_by_type_cached.cache_clear()
-    get_fraud_summary_cached.cache_clear()
     get_fraud_by_type_cached.cache_clear()
     get_daily_stats_cached.cache_clear()
+    get_amount_distribution_cached.cache_clear()
+    get_sorted_amounts.cache_clear()
+    get_amount_sketches.cache_clear()
+    get_distinct_sketches.cache_clear()
+    get_customer_summary.cache_clear()
+    get_merchant_summary.cache_clear()
+    get_merchant_ranking.cache_clear()
+    get_row_index.cache_clear()
+    get_error_flags.cache_clear()
     get_indexed_dataframe.cache_clear()
-    
+
 
 @lru_cache(maxsize=30)
 def get_daily_stats_cached(days: int = 7) -> list:
     """
-    Cache les statistiques journalières.
+    Cache les statistiques journalières (calculées depuis le cube).
 
     Args:
         days: Nombre de jours à retourner
@@ -155,37 +337,266 @@ def get_daily_stats_cached(days: int = 7) -> list:
     Returns:
         list: Liste des statistiques par jour
     """
+    cube = get_aggregate_cube()
+    codes, count, amount_sum = rollup(cube, ["day"])
+
+    # Les jours sont triés par ordre chronologique, comme le groupby d'origine
+    day_labels = cube.labels["day"][codes["day"]][:days]
+    count = count[:days]
+    amount_sum = amount_sum[:days]
+
+    return [
+        {
+            "day": str(day),
+            "count": int(n),
+            "avg_amount": round(float(total / n), 2),
+            "total_amount": round(float(total), 2),
+        }
+        for day, n, total in zip(day_labels, count, amount_sum)
+    ]
+
+
+@lru_cache(maxsize=1)
+def get_amount_distribution_cached() -> Tuple[List[str], List[int]]:
+    """
+    Cache l'histogramme des montants par tranche (calculé depuis le cube).
+
+    Returns
+    -------
+    Tuple[List[str], List[int]]
+        (libellés des tranches, nombre de transactions par tranche)
+    """
+    cube = get_aggregate_cube()
+    codes, count, _ = rollup(cube, ["amount_bucket"])
+    counts = np.bincount(
+        codes["amount_bucket"], weights=count, minlength=len(AMOUNT_BUCKET_EDGES) + 1
+    )
+
+    # Ne garder que les tranches dont la borne basse est atteinte
+    max_amount = cube.amount_max
+    edges = [edge for edge in AMOUNT_BUCKET_EDGES if edge <= max_amount]
+
+    bin_labels: List[str] = []
+    for i, edge in enumerate(edges):
+        if i + 1 < len(edges):
+            bin_labels.append(f"{int(edge)}-{int(edges[i + 1])}")
+        else:
+            bin_labels.append(f"{int(edge)}+")
+
+    # Le code 0 correspond aux montants négatifs, exclus de l'histogramme
+    bin_counts = [int(c) for c in counts[1 : len(edges) + 1]]
+    return bin_labels, bin_counts
+
+
+@lru_cache(maxsize=4)
+def get_sorted_amounts(by: Optional[str] = None) -> SortedAmounts:
+    """
+    Cache les montants triés, éventuellement par groupe.
+
+    Les montants sont triés à l'intérieur de chaque groupe : le groupe ``i``
+    occupe la tranche ``values[offsets[i]:offsets[i + 1]]``.
+
+    Parameters
+    ----------
+    by : Optional[str]
+        Colonne de regroupement (None pour un seul groupe)
+
+    Returns
+    -------
+    SortedAmounts
+        Montants triés, bornes des groupes et libellés
+    """
+    amounts = get_cached_dataframe()["amount"].to_numpy(dtype=float)
+
+    if by is None:
+        offsets = np.array([0, len(amounts)])
+        return SortedAmounts(np.sort(amounts), offsets, np.array([""], dtype=object))
+
+    encoded = get_encoded_column(by)
+    order = np.lexsort((amounts, encoded.codes))
+    sizes = np.bincount(encoded.codes, minlength=len(encoded.labels))
+    offsets = np.concatenate(([0], np.cumsum(sizes)))
+    return SortedAmounts(amounts[order], offsets, encoded.labels)
+
+
+@lru_cache(maxsize=8)
+def get_amount_sketches(by: Optional[str] = None) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Cache les sketches de quantiles des montants, un par groupe.
+
+    Parameters
+    ----------
+    by : Optional[str]
+        Colonne de regroupement (None pour un sketch global)
+
+    Returns
+    -------
+    Tuple[np.ndarray, np.ndarray]
+        (matrice des compteurs (n_groupes, N_BINS), libellés des groupes)
+    """
+    amounts = get_cached_dataframe()["amount"].to_numpy(dtype=float)
+
+    if by is None:
+        codes = np.zeros(len(amounts), dtype=np.int32)
+        return grouped_bin_counts(codes, 1, amounts), np.array([""], dtype=object)
+
+    encoded = get_encoded_column(by)
+    counts = grouped_bin_counts(encoded.codes, len(encoded.labels), amounts)
+    return counts, encoded.labels
+
+
+@lru_cache(maxsize=16)
+def get_distinct_sketches(item: str, dimension: str) -> SparseSketches:
+    """
+    Cache les sketches HyperLogLog d'un identifiant par (dimension, jour).
+
+    Le groupe d'une entrée vaut ``code_dimension * nombre_de_jours + code_jour`` :
+    les sketches d'un même jour ou d'une même valeur se fusionnent ensuite
+    sans relire le dataset.
+
+    Parameters
+    ----------
+    item : str
+        Identifiant compté (client_id, card_id ou merchant_id)
+    dimension : str
+        Dimension de regroupement
+
+    Returns
+    -------
+    SparseSketches
+        Sketches creux par (valeur de dimension, jour)
+    """
     df = get_cached_dataframe()
+    days = get_encoded_column("day")
+    groups = get_encoded_column(dimension).codes.astype(np.int64) * len(
+        days.labels
+    ) + days.codes
+    return build_sketches(groups, df[item].to_numpy())
 
-    # Convertir la date en datetime
-    df["date"] = pd.to_datetime(df["date"])
 
-    # Trier par date décroissante et prendre les N derniers jours
-    df_sorted = df.sort_values("date", ascending=False)
+def _build_summary(entity: str, distinct: Dict[str, str]) -> pd.DataFrame:
+    """
+    Construit la table de synthèse d'une colonne d'identifiants.
 
-    # Grouper par jour
-    daily_stats = (
-        df_sorted.groupby(df_sorted["date"].dt.date)
-        .agg({"amount": ["count", "mean", "sum"]})
-        .reset_index()
+    Parameters
+    ----------
+    entity : str
+        Colonne identifiant l'entité (ex: client_id)
+    distinct : Dict[str, str]
+        Colonnes de sortie ``distinct_*`` -> colonne comptée
+
+    Returns
+    -------
+    pd.DataFrame
+        Une ligne par entité, indexée par identifiant
+    """
+    df = get_cached_dataframe()
+    encoded = get_encoded_column(entity)
+    distinct_codes = {}
+    for column, counted in distinct.items():
+        counted_encoded = get_encoded_column(counted)
+        distinct_codes[column] = (counted_encoded.codes, len(counted_encoded.labels))
+
+    return build_entity_summary(
+        encoded.codes,
+        encoded.labels,
+        df["amount"].to_numpy(dtype=float),
+        df["isFraud"].to_numpy(dtype=float),
+        get_timestamps(),
+        distinct_codes,
+        entity,
     )
 
 
-    daily_stats.columns = ["day", "count", "avg_amount", "total_amount"]
-    daily_stats = daily_stats.head(days)
+@lru_cache(maxsize=1)
+def get_customer_summary() -> pd.DataFrame:
+    """
+    Cache la table de synthèse par client (une passe sur le dataset).
 
-    # Convertir en liste de dictionnaires
-    result = [
-        {
-            "day": str(row["day"]),
-            "count": int(row["count"]),
-            "avg_amount": round(row["avg_amount"], 2),
-            "total_amount": round(row["total_amount"], 2)
-        }
-        for _, row in daily_stats.iterrows()
+    Returns
+    -------
+    pd.DataFrame
+        Indexée par client_id : nombre, montants total/moyen/min/max,
+        fraudes, première et dernière date, cartes et marchands distincts
+    """
+    return _build_summary(
+        "client_id",
+        {"distinct_cards": "card_id", "distinct_merchants": "merchant_id"},
+    )
+
+
+@lru_cache(maxsize=1)
+def get_merchant_summary() -> pd.DataFrame:
+    """
+    Cache la table de synthèse par marchand (une passe sur le dataset).
+
+    Returns
+    -------
+    pd.DataFrame
+        Indexée par merchant_id : colonnes de la synthèse client, plus
+        taux de fraude, MCC et ville principaux, nombre de villes
+    """
+    summary = _build_summary(
+        "merchant_id",
+        {"distinct_customers": "client_id", "distinct_cards": "card_id"},
+    )
+    codes = get_encoded_column("merchant_id").codes
+    mcc = get_encoded_column("mcc")
+    city = get_encoded_column("merchant_city")
+
+    summary["fraud_rate"] = summary["fraud_count"] / summary["transaction_count"]
+    summary["top_mcc"] = mcc.labels[
+        mode_per_group(codes, len(summary), mcc.codes, len(mcc.labels))
     ]
+    summary["top_city"] = city.labels[
+        mode_per_group(codes, len(summary), city.codes, len(city.labels))
+    ]
+    summary["distinct_cities"] = distinct_per_group(
+        codes, len(summary), city.codes, len(city.labels)
+    )
+    return summary
+
+
+@lru_cache(maxsize=4)
+def get_merchant_ranking(column: str) -> np.ndarray:
+    """
+    Cache l'ordre des marchands par valeur décroissante d'une colonne.
+
+    Parameters
+    ----------
+    column : str
+        Colonne de la table de synthèse (ex: total_amount)
+
+    Returns
+    -------
+    np.ndarray
+        Positions des marchands dans la table, du meilleur au moins bon
+    """
+    values = get_merchant_summary()[column].to_numpy()
+    return np.argsort(-values, kind="stable")
+
+
+@lru_cache(maxsize=4)
+def get_row_index(entity: str) -> RowIndex:
+    """
+    Cache l'index des lignes d'une entité (tranche contiguë par entité).
+
+    Parameters
+    ----------
+    entity : str
+        Colonne identifiant l'entité (ex: merchant_id)
+
+    Returns
+    -------
+    RowIndex
+        Lignes triées par (entité, horodatage) et début de chaque entité
+    """
+    encoded = get_encoded_column(entity)
+    rows = np.lexsort((get_timestamps(), encoded.codes))
+    counts = np.bincount(encoded.codes, minlength=len(encoded.labels))
+    offsets = np.concatenate(([0], np.cumsum(counts)))
+    return RowIndex(rows, offsets, encoded.labels)
 
-    return result
 
 @lru_cache(maxsize=1)
 def get_indexed_dataframe() -> pd.DataFrame:
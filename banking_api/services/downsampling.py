@@ -0,0 +1,109 @@
+"""Sous-échantillonnage de séries temporelles pour l'affichage.
+
+Deux méthodes, au coût linéaire en nombre de points d'origine :
+
+- LTTB (Largest-Triangle-Three-Buckets) : garde des points réels de la
+  série, choisis seau par seau pour préserver sa forme visuelle (pics
+  compris) ;
+- seaux de temps : agrégats (nombre, somme, min, max) par intervalle de
+  temps de largeur fixe.
+"""
+
+from typing import Dict
+
+import numpy as np
+
+
+def lttb(x: np.ndarray, y: np.ndarray, n_points: int) -> np.ndarray:
+    """
+    Points retenus par l'algorithme Largest-Triangle-Three-Buckets.
+
+    Le premier et le dernier point sont toujours gardés. Les autres points
+    sont répartis en ``n_points - 2`` seaux consécutifs. Dans chaque seau,
+    on garde le point qui forme le plus grand triangle avec le point
+    retenu précédent et la moyenne du seau suivant. Chaque seau est
+    traité de façon vectorisée.
+
+    Parameters
+    ----------
+    x : np.ndarray
+        Abscisses croissantes (ex: horodatages)
+    y : np.ndarray
+        Ordonnées
+    n_points : int
+        Nombre de points voulus (au moins 3)
+
+    Returns
+    -------
+    np.ndarray
+        Positions des points retenus, croissantes
+    """
+    n = len(x)
+    if n_points < 3:
+        raise ValueError("LTTB garde au moins 3 points")
+    if n_points >= n:
+        return np.arange(n)
+
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    edges = (np.arange(n_points - 1) * (n - 2) / (n_points - 2)).astype(np.int64) + 1
+    edges[-1] = n - 1
+
+    selected = np.empty(n_points, dtype=np.int64)
+    selected[0], selected[-1] = 0, n - 1
+    previous = 0
+    for i in range(n_points - 2):
+        start, end = edges[i], edges[i + 1]
+        next_end = edges[i + 2] if i + 2 < len(edges) else n
+        next_x = x[end:next_end].mean()
+        next_y = y[end:next_end].mean()
+
+        areas = np.abs(
+            (x[previous] - next_x) * (y[start:end] - y[previous])
+            - (x[previous] - x[start:end]) * (next_y - y[previous])
+        )
+        previous = start + int(np.argmax(areas))
+        selected[i + 1] = previous
+    return selected
+
+
+def time_buckets(
+    timestamps: np.ndarray, values: np.ndarray, n_buckets: int
+) -> Dict[str, np.ndarray]:
+    """
+    Agrégats par intervalle de temps de largeur fixe (seaux vides omis).
+
+    Parameters
+    ----------
+    timestamps : np.ndarray
+        Horodatages (secondes), non vides
+    values : np.ndarray
+        Valeur de chaque point
+    n_buckets : int
+        Nombre maximum de seaux entre le premier et le dernier horodatage
+
+    Returns
+    -------
+    Dict[str, np.ndarray]
+        start, end (bornes de chaque seau), count, sum, min et max
+    """
+    first = int(timestamps.min())
+    width = max(-(-(int(timestamps.max()) - first + 1) // n_buckets), 1)
+    buckets = (timestamps.astype(np.int64) - first) // width
+
+    count = np.bincount(buckets, minlength=n_buckets)
+    total = np.bincount(buckets, weights=values, minlength=n_buckets)
+    minimum = np.full(n_buckets, np.inf)
+    maximum = np.full(n_buckets, -np.inf)
+    np.minimum.at(minimum, buckets, values)
+    np.maximum.at(maximum, buckets, values)
+
+    used = np.flatnonzero(count)
+    return {
+        "start": first + used * width,
+        "end": first + (used + 1) * width - 1,
+        "count": count[used],
+        "sum": total[used],
+        "min": minimum[used],
+        "max": maximum[used],
+    }
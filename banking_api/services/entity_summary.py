@@ -0,0 +1,192 @@
+"""Tables de synthèse par entité (client, marchand, carte)."""
+
+from typing import Dict, Tuple
+
+import numpy as np
+import pandas as pd
+
+DATE_FORMAT: str = "%Y-%m-%d %H:%M:%S"
+
+
+def format_timestamps(timestamps: np.ndarray) -> np.ndarray:
+    """
+    Formate des horodatages (secondes epoch) comme la colonne ``date`` du CSV.
+
+    Parameters
+    ----------
+    timestamps : np.ndarray
+        Horodatages en secondes
+
+    Returns
+    -------
+    np.ndarray
+        Dates au format YYYY-MM-DD HH:MM:SS
+    """
+    return pd.to_datetime(timestamps, unit="s").strftime(DATE_FORMAT).to_numpy()
+
+
+def distinct_per_group(
+    codes: np.ndarray, n_groups: int, other_codes: np.ndarray, n_other: int
+) -> np.ndarray:
+    """
+    Nombre exact de valeurs distinctes d'une autre colonne par groupe.
+
+    Parameters
+    ----------
+    codes : np.ndarray
+        Code de groupe de chaque ligne
+    n_groups : int
+        Nombre de groupes
+    other_codes : np.ndarray
+        Code de la colonne comptée
+    n_other : int
+        Nombre de valeurs de la colonne comptée
+
+    Returns
+    -------
+    np.ndarray
+        Nombre de valeurs distinctes par groupe
+    """
+    pairs = np.unique(codes.astype(np.int64) * n_other + other_codes)
+    return np.bincount(pairs // n_other, minlength=n_groups)
+
+
+def mode_per_group(
+    codes: np.ndarray, n_groups: int, other_codes: np.ndarray, n_other: int
+) -> np.ndarray:
+    """
+    Valeur la plus fréquente d'une autre colonne par groupe.
+
+    Parameters
+    ----------
+    codes : np.ndarray
+        Code de groupe de chaque ligne
+    n_groups : int
+        Nombre de groupes
+    other_codes : np.ndarray
+        Code de la colonne étudiée
+    n_other : int
+        Nombre de valeurs de la colonne étudiée
+
+    Returns
+    -------
+    np.ndarray
+        Code de la valeur la plus fréquente (la plus petite en cas d'égalité),
+        -1 pour un groupe vide
+    """
+    pairs, counts = np.unique(
+        codes.astype(np.int64) * n_other + other_codes, return_counts=True
+    )
+    groups, values = pairs // n_other, pairs % n_other
+
+    # Par groupe, fréquence décroissante : la première paire est le mode
+    order = np.lexsort((-counts, groups))
+    groups, values = groups[order], values[order]
+    first = np.concatenate(([True], groups[1:] != groups[:-1]))
+
+    modes = np.full(n_groups, -1, dtype=np.int64)
+    modes[groups[first]] = values[first]
+    return modes
+
+
+def quantiles_per_group(
+    codes: np.ndarray, n_groups: int, values: np.ndarray, quantiles: Tuple[float, ...]
+) -> np.ndarray:
+    """
+    Quantiles (rang inférieur) d'une colonne par groupe, en un seul tri.
+
+    Parameters
+    ----------
+    codes : np.ndarray
+        Code de groupe de chaque ligne
+    n_groups : int
+        Nombre de groupes
+    values : np.ndarray
+        Valeurs de la colonne étudiée
+    quantiles : Tuple[float, ...]
+        Quantiles demandés, entre 0 et 1
+
+    Returns
+    -------
+    np.ndarray
+        Matrice (groupes x quantiles), NaN pour un groupe vide
+    """
+    ordered = values[np.lexsort((values, codes))]
+    sizes = np.bincount(codes, minlength=n_groups)
+    starts = np.concatenate(([0], np.cumsum(sizes)[:-1]))
+
+    result = np.full((n_groups, len(quantiles)), np.nan)
+    present = sizes > 0
+    for j, quantile in enumerate(quantiles):
+        ranks = np.floor(quantile * (sizes[present] - 1)).astype(np.int64)
+        result[present, j] = ordered[starts[present] + ranks]
+    return result
+
+
+def build_entity_summary(
+    codes: np.ndarray,
+    labels: np.ndarray,
+    amounts: np.ndarray,
+    fraud: np.ndarray,
+    timestamps: np.ndarray,
+    distinct: Dict[str, Tuple[np.ndarray, int]],
+    index_name: str,
+) -> pd.DataFrame:
+    """
+    Construit la table de synthèse d'une entité en une passe vectorisée.
+
+    Parameters
+    ----------
+    codes : np.ndarray
+        Code d'entité de chaque ligne
+    labels : np.ndarray
+        Identifiant de chaque entité
+    amounts : np.ndarray
+        Montant de chaque ligne
+    fraud : np.ndarray
+        Indicateur de fraude de chaque ligne
+    timestamps : np.ndarray
+        Horodatage (secondes) de chaque ligne
+    distinct : Dict[str, Tuple[np.ndarray, int]]
+        Colonnes de sortie ``distinct_*`` -> (codes, nombre de valeurs)
+    index_name : str
+        Nom de l'index de la table
+
+    Returns
+    -------
+    pd.DataFrame
+        Une ligne par entité, indexée par identifiant
+    """
+    n_entities = len(labels)
+
+    count = np.bincount(codes, minlength=n_entities)
+    total = np.bincount(codes, weights=amounts, minlength=n_entities)
+    fraud_count = np.bincount(codes, weights=fraud, minlength=n_entities)
+
+    min_amount = np.full(n_entities, np.inf)
+    max_amount = np.full(n_entities, -np.inf)
+    np.minimum.at(min_amount, codes, amounts)
+    np.maximum.at(max_amount, codes, amounts)
+
+    first_seen = np.full(n_entities, np.iinfo(np.int64).max)
+    last_seen = np.full(n_entities, np.iinfo(np.int64).min)
+    np.minimum.at(first_seen, codes, timestamps)
+    np.maximum.at(last_seen, codes, timestamps)
+
+    table = pd.DataFrame(
+        {
+            "transaction_count": count.astype(np.int64),
+            "total_amount": total,
+            "avg_amount": total / np.maximum(count, 1),
+            "min_amount": min_amount,
+            "max_amount": max_amount,
+            "fraud_count": fraud_count.astype(np.int64),
+            "first_date": format_timestamps(first_seen),
+            "last_date": format_timestamps(last_seen),
+        },
+        index=pd.Index(labels.tolist(), name=index_name),
+    )
+    for column, (other_codes, n_other) in distinct.items():
+        table[column] = distinct_per_group(codes, n_entities, other_codes, n_other)
+
+    return table
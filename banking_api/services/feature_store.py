@@ -0,0 +1,400 @@
+"""Profils comportementaux par entité (client, carte) pour le scoring de fraude.
+
+Chaque entité est résumée par des statistiques suffisantes, stockées dans
+des tableaux numpy indexés par la position de l'entité :
+
+- nombre de transactions, somme et somme des carrés des montants
+  (moyenne et écart-type) ;
+- somme des cosinus / sinus de l'heure (heure habituelle, moyenne
+  circulaire : 23h et 1h sont proches) ;
+- dernière transaction et vélocité récente, un compteur à décroissance
+  exponentielle : chaque transaction compte ``exp(-age / VELOCITY_SECONDS)`` ;
+- État et ville principaux, et ensemble des (entité, État) et
+  (entité, ville) déjà vus.
+
+Toutes ces statistiques se construisent en une passe vectorisée sur
+l'historique et se mettent à jour en O(1) par transaction, sans relire les
+transactions brutes.
+"""
+
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+
+import numpy as np
+
+from banking_api.services.entity_summary import mode_per_group
+
+# Constante de temps de la vélocité : une transaction d'il y a 24h compte 1/e
+VELOCITY_SECONDS: float = 86400.0
+
+# Historique minimum pour que les écarts au profil soient significatifs
+MIN_HISTORY: int = 5
+
+# Plancher de l'écart-type (évite des z-scores infinis sur montants constants)
+MIN_AMOUNT_STD: float = 1.0
+
+_TWO_PI_PER_HOUR: float = 2 * np.pi / 24
+
+
+def _hour_angles(timestamps: np.ndarray) -> np.ndarray:
+    """Heure du jour (fractionnaire) convertie en angle."""
+    return (timestamps % 86400) / 3600 * _TWO_PI_PER_HOUR
+
+
+class _Vocabulary:
+    """Codes entiers stables pour des libellés (États, villes)."""
+
+    def __init__(self, labels: Iterable[str]) -> None:
+        self.labels: List[str] = list(labels)
+        self.codes: Dict[str, int] = {label: i for i, label in enumerate(self.labels)}
+
+    def lookup(self, label: str) -> int:
+        """Code d'un libellé, -1 s'il est inconnu."""
+        return self.codes.get(label, -1)
+
+    def add(self, label: str) -> int:
+        """Code d'un libellé, ajouté au vocabulaire si besoin."""
+        if label not in self.codes:
+            self.codes[label] = len(self.labels)
+            self.labels.append(label)
+        return self.codes[label]
+
+
+class _PairSet:
+    """
+    Ensemble de paires (entité, code) : tableau trié + ajouts récents.
+
+    Une paire est codée ``position << 32 | code``.
+    """
+
+    def __init__(self, keys: np.ndarray) -> None:
+        self.sorted: np.ndarray = np.unique(keys)
+        self.added: set = set()
+
+    @staticmethod
+    def pack(positions: Any, codes: Any) -> np.ndarray:
+        """Code des paires (entité, code)."""
+        positions = np.asarray(positions, dtype=np.int64)
+        return (positions << 32) | np.asarray(codes, dtype=np.int64)
+
+    def _in_sorted(self, keys: np.ndarray) -> np.ndarray:
+        """Appartenance de chaque paire au tableau trié (recherche dichotomique)."""
+        if not len(self.sorted):
+            return np.zeros(len(keys), dtype=bool)
+        slots = np.minimum(np.searchsorted(self.sorted, keys), len(self.sorted) - 1)
+        return self.sorted[slots] == keys
+
+    def contains(self, keys: np.ndarray) -> np.ndarray:
+        """Appartenance de chaque paire à l'ensemble (vectorisé)."""
+        found = self._in_sorted(keys)
+        if self.added:
+            # Ajouts récents : test d'appartenance au set, paire par paire
+            missing = np.flatnonzero(~found)
+            found[missing] = [int(key) in self.added for key in keys[missing]]
+        return found
+
+    def add(self, key: int) -> bool:
+        """Ajoute une paire ; retourne True si elle était nouvelle."""
+        if key in self.added or self._in_sorted(np.array([key]))[0]:
+            return False
+        self.added.add(key)
+        return True
+
+
+class FeatureStore:
+    """
+    Profils comportementaux d'un type d'entité (clients ou cartes).
+
+    Parameters
+    ----------
+    states : Sequence[str]
+        Libellés d'États connus
+    cities : Sequence[str]
+        Libellés de villes connus
+    """
+
+    _ARRAYS = (
+        ("ids", np.int64),
+        ("count", np.int64),
+        ("amount_sum", float),
+        ("amount_sq", float),
+        ("hour_cos", float),
+        ("hour_sin", float),
+        ("last_seen", np.int64),
+        ("velocity", float),
+        ("home_state", np.int64),
+        ("home_city", np.int64),
+        ("n_states", np.int64),
+        ("n_cities", np.int64),
+    )
+
+    def __init__(self, states: Sequence[str] = (), cities: Sequence[str] = ()) -> None:
+        for name, dtype in self._ARRAYS:
+            setattr(self, name, np.zeros(0, dtype=dtype))
+        self.size: int = 0
+        self.positions: Dict[int, int] = {}
+        self.states: _Vocabulary = _Vocabulary(states)
+        self.cities: _Vocabulary = _Vocabulary(cities)
+        self.seen_states: _PairSet = _PairSet(np.zeros(0, dtype=np.int64))
+        self.seen_cities: _PairSet = _PairSet(np.zeros(0, dtype=np.int64))
+
+    @classmethod
+    def from_history(
+        cls,
+        keys: np.ndarray,
+        timestamps: np.ndarray,
+        amounts: np.ndarray,
+        state_codes: np.ndarray,
+        state_labels: Sequence[str],
+        city_codes: np.ndarray,
+        city_labels: Sequence[str],
+    ) -> "FeatureStore":
+        """
+        Construit les profils à partir de l'historique (une passe vectorisée).
+
+        Parameters
+        ----------
+        keys : np.ndarray
+            Identifiant de l'entité de chaque transaction
+        timestamps : np.ndarray
+            Horodatage (secondes) de chaque transaction
+        amounts : np.ndarray
+            Montant de chaque transaction
+        state_codes : np.ndarray
+            Code de l'État du marchand de chaque transaction
+        state_labels : Sequence[str]
+            Libellé de chaque code d'État
+        city_codes : np.ndarray
+            Code de la ville du marchand de chaque transaction
+        city_labels : Sequence[str]
+            Libellé de chaque code de ville
+
+        Returns
+        -------
+        FeatureStore
+            Profils de toutes les entités de l'historique
+        """
+        store = cls(state_labels, city_labels)
+        ids, inverse = np.unique(keys, return_inverse=True)
+        n = len(ids)
+        n_states, n_cities = len(state_labels), len(city_labels)
+        angles = _hour_angles(timestamps)
+
+        last_seen = np.full(n, np.iinfo(np.int64).min)
+        np.maximum.at(last_seen, inverse, timestamps)
+        decay = np.exp(-(last_seen[inverse] - timestamps) / VELOCITY_SECONDS)
+
+        state_pairs = np.unique(inverse.astype(np.int64) * n_states + state_codes)
+        city_pairs = np.unique(inverse.astype(np.int64) * n_cities + city_codes)
+
+        store.ids = ids.astype(np.int64)
+        store.count = np.bincount(inverse, minlength=n)
+        store.amount_sum = np.bincount(inverse, weights=amounts, minlength=n)
+        store.amount_sq = np.bincount(inverse, weights=amounts**2, minlength=n)
+        store.hour_cos = np.bincount(inverse, weights=np.cos(angles), minlength=n)
+        store.hour_sin = np.bincount(inverse, weights=np.sin(angles), minlength=n)
+        store.last_seen = last_seen
+        store.velocity = np.bincount(inverse, weights=decay, minlength=n)
+        store.home_state = mode_per_group(inverse, n, state_codes, n_states)
+        store.home_city = mode_per_group(inverse, n, city_codes, n_cities)
+        store.n_states = np.bincount(state_pairs // n_states, minlength=n)
+        store.n_cities = np.bincount(city_pairs // n_cities, minlength=n)
+        store.size = n
+        store.positions = {int(key): i for i, key in enumerate(store.ids)}
+        store.seen_states = _PairSet(
+            _PairSet.pack(state_pairs // n_states, state_pairs % n_states)
+        )
+        store.seen_cities = _PairSet(
+            _PairSet.pack(city_pairs // n_cities, city_pairs % n_cities)
+        )
+        return store
+
+    def _position(self, key: int) -> int:
+        """Position d'une entité, créée (tableaux agrandis) si besoin."""
+        position = self.positions.get(key)
+        if position is not None:
+            return position
+
+        if self.size == len(self.ids):
+            # Capacité doublée : ajout amorti en O(1)
+            capacity = max(2 * self.size, 16)
+            for name, _ in self._ARRAYS:
+                array = getattr(self, name)
+                grown = np.zeros(capacity, dtype=array.dtype)
+                grown[: self.size] = array[: self.size]
+                setattr(self, name, grown)
+
+        position = self.size
+        self.size += 1
+        self.positions[key] = position
+        self.ids[position] = key
+        self.home_state[position] = -1
+        self.home_city[position] = -1
+        return position
+
+    def update(
+        self, key: int, timestamp: int, amount: float, state: str, city: str
+    ) -> None:
+        """
+        Ajoute une transaction au profil de son entité (O(1)).
+
+        L'État et la ville principaux ne sont fixés que pour une nouvelle
+        entité ; ensuite, les nouveaux lieux enrichissent les lieux connus.
+
+        Parameters
+        ----------
+        key : int
+            Identifiant de l'entité
+        timestamp : int
+            Horodatage en secondes
+        amount : float
+            Montant de la transaction
+        state : str
+            État du marchand
+        city : str
+            Ville du marchand
+        """
+        i = self._position(key)
+        angle = _hour_angles(np.array([timestamp]))[0]
+
+        if self.count[i] == 0:
+            self.last_seen[i] = timestamp
+        elapsed = max(timestamp - int(self.last_seen[i]), 0)
+        self.velocity[i] = self.velocity[i] * np.exp(-elapsed / VELOCITY_SECONDS) + 1
+        self.last_seen[i] = max(int(self.last_seen[i]), timestamp)
+
+        self.count[i] += 1
+        self.amount_sum[i] += amount
+        self.amount_sq[i] += amount**2
+        self.hour_cos[i] += np.cos(angle)
+        self.hour_sin[i] += np.sin(angle)
+
+        state_code, city_code = self.states.add(state), self.cities.add(city)
+        if self.home_state[i] < 0:
+            self.home_state[i], self.home_city[i] = state_code, city_code
+        if self.seen_states.add(int(_PairSet.pack(i, state_code))):
+            self.n_states[i] += 1
+        if self.seen_cities.add(int(_PairSet.pack(i, city_code))):
+            self.n_cities[i] += 1
+
+    def _stats(self, positions: np.ndarray) -> Dict[str, np.ndarray]:
+        """Moyenne, écart-type et heure habituelle (NaN si entité inconnue)."""
+        known = positions >= 0
+        if self.size == 0 or not known.any():
+            nan = np.full(len(positions), np.nan)
+            return {
+                "count": np.zeros(len(positions)),
+                "mean": nan,
+                "std": nan,
+                "typical_hour": nan,
+            }
+
+        rows = np.where(known, positions, 0)
+        count = np.where(known, self.count[rows], 0).astype(float)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            mean = np.where(known, self.amount_sum[rows] / count, np.nan)
+            variance = self.amount_sq[rows] / count - mean**2
+        typical = np.arctan2(self.hour_sin[rows], self.hour_cos[rows])
+        return {
+            "count": count,
+            "mean": mean,
+            "std": np.sqrt(np.maximum(variance, 0.0)),
+            "typical_hour": np.where(known, (typical / _TWO_PI_PER_HOUR) % 24, np.nan),
+        }
+
+    def describe(self, key: int) -> Optional[Dict[str, Any]]:
+        """
+        Profil d'une entité.
+
+        Parameters
+        ----------
+        key : int
+            Identifiant de l'entité
+
+        Returns
+        -------
+        Optional[Dict[str, Any]]
+            Statistiques du profil, None si l'entité est inconnue
+        """
+        i = self.positions.get(key)
+        if i is None:
+            return None
+        stats = self._stats(np.array([i]))
+        return {
+            "count": int(self.count[i]),
+            "amount_mean": float(stats["mean"][0]),
+            "amount_std": float(stats["std"][0]),
+            "typical_hour": float(stats["typical_hour"][0]),
+            "home_state": self.states.labels[self.home_state[i]],
+            "home_city": self.cities.labels[self.home_city[i]],
+            "distinct_states": int(self.n_states[i]),
+            "distinct_cities": int(self.n_cities[i]),
+            "last_seen": int(self.last_seen[i]),
+            "velocity": float(self.velocity[i]),
+        }
+
+    def features(
+        self,
+        keys: Sequence[Optional[int]],
+        timestamps: np.ndarray,
+        amounts: np.ndarray,
+        states: Sequence[str],
+        cities: Sequence[str],
+    ) -> Dict[str, np.ndarray]:
+        """
+        Écarts de transactions au profil de leur entité (vectorisé).
+
+        Une transaction d'une entité inconnue ou d'historique inférieur à
+        ``MIN_HISTORY`` reçoit NaN : aucune règle ne s'y déclenche.
+
+        Parameters
+        ----------
+        keys : Sequence[Optional[int]]
+            Identifiant de l'entité de chaque transaction (None si inconnu)
+        timestamps : np.ndarray
+            Horodatage (secondes, NaN si inconnu) de chaque transaction
+        amounts : np.ndarray
+            Montant de chaque transaction
+        states : Sequence[str]
+            État du marchand de chaque transaction
+        cities : Sequence[str]
+            Ville du marchand de chaque transaction
+
+        Returns
+        -------
+        Dict[str, np.ndarray]
+            - amount_zscore : écart du montant à la moyenne, en écarts-types
+            - new_state, new_city : 1 si le lieu n'a jamais été vu, 0 sinon
+            - hour_deviation : écart (heures, 0 à 12) à l'heure habituelle
+            - velocity : vélocité récente, transaction courante incluse
+        """
+        positions = np.array(
+            [-1 if key is None else self.positions.get(int(key), -1) for key in keys],
+            dtype=np.int64,
+        )
+        stats = self._stats(positions)
+        mature = stats["count"] >= MIN_HISTORY
+        rows = np.where(positions >= 0, positions, 0)
+
+        def unseen(
+            pairs: _PairSet, vocabulary: _Vocabulary, labels: Sequence[str]
+        ) -> np.ndarray:
+            codes = np.array([vocabulary.lookup(label) for label in labels], dtype=np.int64)
+            found = pairs.contains(_PairSet.pack(rows, np.maximum(codes, 0))) & (codes >= 0)
+            return np.where(mature, (~found).astype(float), np.nan)
+
+        std = np.maximum(stats["std"], MIN_AMOUNT_STD)
+        hours = (timestamps % 86400) / 3600
+        deviation = np.abs(hours - stats["typical_hour"]) % 24
+        if self.size:
+            elapsed = np.maximum(timestamps - self.last_seen[rows], 0)
+            velocity = self.velocity[rows] * np.exp(-elapsed / VELOCITY_SECONDS) + 1
+        else:
+            velocity = np.full(len(positions), np.nan)
+
+        return {
+            "amount_zscore": np.where(mature, (amounts - stats["mean"]) / std, np.nan),
+            "new_state": unseen(self.seen_states, self.states, states),
+            "new_city": unseen(self.seen_cities, self.cities, cities),
+            "hour_deviation": np.where(mature, np.minimum(deviation, 24 - deviation), np.nan),
+            "velocity": np.where(positions >= 0, velocity, np.nan),
+        }
@@ -0,0 +1,186 @@
+"""Service des profils comportementaux (feature store) par client et par carte."""
+
+import threading
+from functools import lru_cache
+from typing import Any, Dict, Optional, Sequence
+
+import numpy as np
+from fastapi import HTTPException
+
+from banking_api.services.data_cache import (
+    get_cached_dataframe,
+    get_dataset_version,
+    get_encoded_column,
+    get_timestamps,
+)
+from banking_api.services.entity_summary import format_timestamps
+from banking_api.services.feature_store import FeatureStore
+
+# Entités profilées : nom dans l'URL -> colonne identifiant
+FEATURE_ENTITIES: Dict[str, str] = {
+    "customer": "client_id",
+    "card": "card_id",
+}
+
+_NOT_FOUND: Dict[str, str] = {
+    "customer": "Client non trouvé",
+    "card": "Carte non trouvée",
+}
+
+_lock = threading.Lock()
+
+
+@lru_cache(maxsize=1)
+def _get_feature_stores(dataset_version: str) -> Dict[str, FeatureStore]:
+    """
+    Construit les profils de toutes les entités à partir du dataset.
+
+    Parameters
+    ----------
+    dataset_version : str
+        Version du dataset (clé du cache)
+
+    Returns
+    -------
+    Dict[str, FeatureStore]
+        Profils par entité ("customer", "card")
+    """
+    df = get_cached_dataframe()
+    timestamps = get_timestamps()
+    amounts = df["amount"].to_numpy(dtype=float)
+    states = get_encoded_column("merchant_state")
+    cities = get_encoded_column("merchant_city")
+
+    return {
+        entity: FeatureStore.from_history(
+            df[column].to_numpy(dtype=np.int64),
+            timestamps,
+            amounts,
+            states.codes,
+            states.labels,
+            cities.codes,
+            cities.labels,
+        )
+        for entity, column in FEATURE_ENTITIES.items()
+    }
+
+
+def record_transaction(
+    timestamp: int,
+    amount: float,
+    client_id: int,
+    card_id: int,
+    merchant_state: str = "",
+    merchant_city: str = "",
+) -> None:
+    """
+    Met à jour les profils du client et de la carte avec une transaction.
+
+    Parameters
+    ----------
+    timestamp : int
+        Horodatage de la transaction (secondes depuis l'epoch)
+    amount : float
+        Montant de la transaction
+    client_id : int
+        Identifiant du client
+    card_id : int
+        Identifiant de la carte
+    merchant_state : str
+        État du marchand
+    merchant_city : str
+        Ville du marchand
+    """
+    stores = _get_feature_stores(get_dataset_version())
+    with _lock:
+        for entity, key in (("customer", client_id), ("card", card_id)):
+            stores[entity].update(key, timestamp, amount, merchant_state, merchant_city)
+
+
+def transaction_features(
+    client_ids: Sequence[Optional[int]],
+    card_ids: Sequence[Optional[int]],
+    timestamps: np.ndarray,
+    amounts: np.ndarray,
+    merchant_states: Sequence[str],
+    merchant_cities: Sequence[str],
+) -> Dict[str, np.ndarray]:
+    """
+    Champs comportementaux des règles de fraude pour des transactions.
+
+    Les écarts au profil (montant, lieux, heure) viennent du profil du
+    client ; la vélocité vient de celui de la carte.
+
+    Parameters
+    ----------
+    client_ids : Sequence[Optional[int]]
+        Client de chaque transaction (None si inconnu)
+    card_ids : Sequence[Optional[int]]
+        Carte de chaque transaction (None si inconnue)
+    timestamps : np.ndarray
+        Horodatage (secondes, NaN si inconnu) de chaque transaction
+    amounts : np.ndarray
+        Montant de chaque transaction
+    merchant_states : Sequence[str]
+        État du marchand de chaque transaction
+    merchant_cities : Sequence[str]
+        Ville du marchand de chaque transaction
+
+    Returns
+    -------
+    Dict[str, np.ndarray]
+        amount_zscore, new_state, new_city, hour_deviation et velocity
+    """
+    stores = _get_feature_stores(get_dataset_version())
+    with _lock:
+        features = stores["customer"].features(
+            client_ids, timestamps, amounts, merchant_states, merchant_cities
+        )
+        card = stores["card"].features(
+            card_ids, timestamps, amounts, merchant_states, merchant_cities
+        )
+    features["velocity"] = card["velocity"]
+    return features
+
+
+def get_entity_features(entity: str, entity_id: str) -> Dict[str, Any]:
+    """
+    Profil comportemental d'un client ou d'une carte.
+
+    Parameters
+    ----------
+    entity : str
+        "customer" ou "card"
+    entity_id : str
+        Identifiant du client ou de la carte
+
+    Returns
+    -------
+    Dict[str, Any]
+        Nombre de transactions, moyenne et écart-type des montants, lieux
+        et heure habituels, vélocité à la dernière transaction
+    """
+    if entity not in FEATURE_ENTITIES:
+        raise HTTPException(status_code=400, detail=f"Entité invalide: {entity}")
+
+    try:
+        stores = _get_feature_stores(get_dataset_version())
+        with _lock:
+            profile = stores[entity].describe(int(entity_id))
+        if profile is None:
+            raise ValueError(entity_id)
+    except ValueError:
+        raise HTTPException(status_code=404, detail=_NOT_FOUND[entity])
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Erreur lors du calcul: {str(e)}")
+
+    return {
+        "entity": entity,
+        "id": int(entity_id),
+        **profile,
+        "amount_mean": round(profile["amount_mean"], 2),
+        "amount_std": round(profile["amount_std"], 2),
+        "typical_hour": round(profile["typical_hour"], 1),
+        "last_seen": format_timestamps(np.array([profile["last_seen"]]))[0],
+        "velocity": round(profile["velocity"], 2),
+    }
@@ -0,0 +1,186 @@
+"""Métriques de backtest d'un score de fraude sur des transactions labellisées.
+
+Toutes les fonctions sont vectorisées. La courbe de seuils (ROC et
+précision/rappel) est obtenue en une passe : tri des scores par ordre
+décroissant, sommes cumulées des vrais et faux positifs, puis un point par
+score distinct (abaisser le seuil sous ce score déclare toutes les
+transactions de score supérieur ou égal comme frauduleuses).
+"""
+
+from typing import Dict, NamedTuple
+
+import numpy as np
+
+
+class ThresholdCurve(NamedTuple):
+    """
+    Vrais et faux positifs cumulés pour chaque seuil distinct.
+
+    Attributes
+    ----------
+    thresholds : np.ndarray
+        Seuils, par ordre décroissant (une transaction est déclarée
+        frauduleuse si son score est supérieur ou égal au seuil)
+    tp : np.ndarray
+        Vrais positifs à chaque seuil
+    fp : np.ndarray
+        Faux positifs à chaque seuil
+    positives : int
+        Nombre total de fraudes labellisées
+    negatives : int
+        Nombre total de transactions légitimes labellisées
+    """
+
+    thresholds: np.ndarray
+    tp: np.ndarray
+    fp: np.ndarray
+    positives: int
+    negatives: int
+
+
+def _ratio(numerator: np.ndarray, denominator: np.ndarray) -> np.ndarray:
+    """Division élément par élément, 0 quand le dénominateur est nul."""
+    numerator = np.asarray(numerator, dtype=float)
+    denominator = np.asarray(denominator, dtype=float)
+    return np.divide(
+        numerator,
+        denominator,
+        out=np.zeros(np.broadcast(numerator, denominator).shape),
+        where=denominator > 0,
+    )
+
+
+def confusion_matrix(labels: np.ndarray, predictions: np.ndarray) -> Dict[str, int]:
+    """
+    Matrice de confusion binaire.
+
+    Parameters
+    ----------
+    labels : np.ndarray
+        Fraude réelle (booléen) de chaque transaction
+    predictions : np.ndarray
+        Fraude prédite (booléen) de chaque transaction
+
+    Returns
+    -------
+    Dict[str, int]
+        Vrais positifs (tp), faux positifs (fp), faux négatifs (fn)
+        et vrais négatifs (tn)
+    """
+    # Code 2 * label + prédiction : tn, fp, fn, tp
+    counts = np.bincount(
+        2 * labels.astype(np.int64) + predictions.astype(np.int64), minlength=4
+    )
+    return {
+        "tp": int(counts[3]),
+        "fp": int(counts[1]),
+        "fn": int(counts[2]),
+        "tn": int(counts[0]),
+    }
+
+
+def classification_metrics(tp: int, fp: int, fn: int) -> Dict[str, float]:
+    """
+    Précision, rappel et F1 à partir de la matrice de confusion.
+
+    Les métriques non définies (aucune prédiction, aucune fraude) valent 0.
+
+    Parameters
+    ----------
+    tp : int
+        Vrais positifs
+    fp : int
+        Faux positifs
+    fn : int
+        Faux négatifs
+
+    Returns
+    -------
+    Dict[str, float]
+        precision, recall et f1
+    """
+    precision = float(_ratio(tp, tp + fp))
+    recall = float(_ratio(tp, tp + fn))
+    f1 = float(_ratio(2 * precision * recall, precision + recall))
+    return {"precision": precision, "recall": recall, "f1": f1}
+
+
+def threshold_curve(scores: np.ndarray, labels: np.ndarray) -> ThresholdCurve:
+    """
+    Balaye tous les seuils de score en une passe triée.
+
+    Parameters
+    ----------
+    scores : np.ndarray
+        Score de fraude de chaque transaction
+    labels : np.ndarray
+        Fraude réelle (booléen) de chaque transaction
+
+    Returns
+    -------
+    ThresholdCurve
+        Vrais et faux positifs cumulés par seuil distinct
+    """
+    if len(scores) == 0:
+        empty = np.zeros(0, dtype=np.int64)
+        return ThresholdCurve(np.zeros(0), empty, empty, 0, 0)
+
+    order = np.argsort(-scores, kind="stable")
+    sorted_scores = scores[order]
+    sorted_labels = labels[order].astype(np.int64)
+
+    # Dernière position de chaque score distinct (les ex aequo sont groupés)
+    last = np.flatnonzero(np.append(sorted_scores[1:] != sorted_scores[:-1], True))
+
+    tp = np.cumsum(sorted_labels)[last]
+    fp = (last + 1) - tp
+    positives = int(sorted_labels.sum())
+    return ThresholdCurve(
+        thresholds=sorted_scores[last],
+        tp=tp,
+        fp=fp,
+        positives=positives,
+        negatives=len(scores) - positives,
+    )
+
+
+def roc_auc(curve: ThresholdCurve) -> float:
+    """
+    Aire sous la courbe ROC (méthode des trapèzes).
+
+    Parameters
+    ----------
+    curve : ThresholdCurve
+        Courbe de seuils
+
+    Returns
+    -------
+    float
+        AUC entre 0 et 1 (0 si une des deux classes est absente)
+    """
+    if curve.positives == 0 or curve.negatives == 0:
+        return 0.0
+    tpr = np.concatenate(([0.0], curve.tp / curve.positives))
+    fpr = np.concatenate(([0.0], curve.fp / curve.negatives))
+    return float(np.sum(np.diff(fpr) * (tpr[1:] + tpr[:-1]) / 2))
+
+
+def average_precision(curve: ThresholdCurve) -> float:
+    """
+    Précision moyenne : aire sous la courbe précision/rappel (en escalier).
+
+    Parameters
+    ----------
+    curve : ThresholdCurve
+        Courbe de seuils
+
+    Returns
+    -------
+    float
+        Précision moyenne entre 0 et 1 (0 sans fraude labellisée)
+    """
+    if curve.positives == 0:
+        return 0.0
+    precision = _ratio(curve.tp, curve.tp + curve.fp)
+    recall = np.concatenate(([0.0], curve.tp / curve.positives))
+    return float(np.sum(np.diff(recall) * precision))
@@ -0,0 +1,193 @@
+"""Micro-batching des prédictions de fraude unitaires.
+
+Sous forte charge, des milliers de ``POST /api/fraud/predict`` concurrents
+paient chacun le coût fixe du scoring (construction des colonnes,
+évaluation des règles ou du modèle). Le ``MicroBatcher`` regroupe les
+requêtes arrivées pendant au plus ``max_wait_ms`` millisecondes (ou dès
+``max_batch_size`` requêtes), les score en un seul appel vectorisé de
+``predict_fraud_batch`` dans un thread, puis résout la future de chaque
+requête. La latence ajoutée est bornée par ``max_wait_ms`` plus la durée
+du scoring d'un lot.
+"""
+
+import asyncio
+import os
+from typing import Any, Dict, List, Optional, Set, Tuple, Union
+
+from fastapi import HTTPException
+
+from banking_api.services import fraud_detection_service
+
+DEFAULT_MAX_BATCH_SIZE: int = 256
+DEFAULT_MAX_WAIT_MS: float = 2.0
+
+_Pending = Tuple[Dict[str, Any], "asyncio.Future[Dict[str, Any]]"]
+
+
+def _score_transactions(
+    transactions: List[Dict[str, Any]],
+) -> List[Union[Dict[str, Any], Exception]]:
+    """
+    Score un lot de transactions, résultat par transaction.
+
+    Si le lot est rejeté (une transaction invalide), chaque transaction est
+    rescorée seule : l'erreur n'est renvoyée qu'à la requête fautive.
+
+    Parameters
+    ----------
+    transactions : List[Dict[str, Any]]
+        Arguments de ``predict_fraud`` de chaque requête
+
+    Returns
+    -------
+    List[Union[Dict[str, Any], Exception]]
+        Prédiction, ou exception à lever, pour chaque transaction
+    """
+    try:
+        batch = fraud_detection_service.predict_fraud_batch(
+            [t["transaction_type"] for t in transactions],
+            [t["amount"] for t in transactions],
+            [t.get("merchant_city", "") for t in transactions],
+            [t.get("merchant_state", "") for t in transactions],
+            [t.get("mcc") for t in transactions],
+            [t.get("date") for t in transactions],
+            [t.get("client_id") for t in transactions],
+            [t.get("card_id") for t in transactions],
+            [t.get("zip_code") for t in transactions],
+        )
+    except HTTPException:
+        results: List[Union[Dict[str, Any], Exception]] = []
+        for transaction in transactions:
+            try:
+                results.append(fraud_detection_service.predict_fraud(**transaction))
+            except HTTPException as e:
+                results.append(e)
+        return results
+
+    return [
+        {"isFraud": flag, "probability": probability, "reasons": reasons}
+        for flag, probability, reasons in zip(
+            batch["isFraud"], batch["probability"], batch["reasons"]
+        )
+    ]
+
+
+class MicroBatcher:
+    """
+    Regroupe les prédictions unitaires concurrentes en lots vectorisés.
+
+    Parameters
+    ----------
+    max_batch_size : int
+        Taille à partir de laquelle le lot est scoré sans attendre
+    max_wait_ms : float
+        Attente maximale de la première requête d'un lot (millisecondes)
+    """
+
+    def __init__(
+        self,
+        max_batch_size: int = DEFAULT_MAX_BATCH_SIZE,
+        max_wait_ms: float = DEFAULT_MAX_WAIT_MS,
+    ) -> None:
+        if max_batch_size < 1 or max_wait_ms < 0:
+            raise ValueError("Taille de lot >= 1 et attente >= 0 requises")
+        self.max_batch_size: int = max_batch_size
+        self.max_wait_ms: float = max_wait_ms
+        self.batches: int = 0
+        self.transactions: int = 0
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._pending: List[_Pending] = []
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._tasks: Set["asyncio.Task[None]"] = set()
+
+    def _bind(self, loop: asyncio.AbstractEventLoop) -> None:
+        """Rattache le batcher à la boucle courante (état remis à zéro si elle change)."""
+        if self._loop is not loop:
+            self._loop = loop
+            self._pending = []
+            self._timer = None
+            self._tasks = set()
+
+    async def predict(self, **transaction: Any) -> Dict[str, Any]:
+        """
+        Prédiction de fraude d'une transaction, scorée avec ses voisines.
+
+        Parameters
+        ----------
+        **transaction : Any
+            Arguments de ``fraud_detection_service.predict_fraud``
+
+        Returns
+        -------
+        Dict[str, Any]
+            Même résultat que ``predict_fraud``
+        """
+        loop = asyncio.get_running_loop()
+        self._bind(loop)
+        future: "asyncio.Future[Dict[str, Any]]" = loop.create_future()
+        self._pending.append((transaction, future))
+
+        if len(self._pending) >= self.max_batch_size:
+            self._flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.max_wait_ms / 1000, self._flush)
+        return await future
+
+    def _flush(self) -> None:
+        """Envoie les requêtes en attente au scoring."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        batch, self._pending = self._pending, []
+        if not batch or self._loop is None:
+            return
+
+        task = self._loop.create_task(self._score(batch))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _score(self, batch: List[_Pending]) -> None:
+        """Score un lot hors de la boucle et résout les futures."""
+        self.batches += 1
+        self.transactions += len(batch)
+        transactions = [transaction for transaction, _ in batch]
+        try:
+            results = await asyncio.get_running_loop().run_in_executor(
+                None, _score_transactions, transactions
+            )
+        except Exception as e:
+            error = HTTPException(status_code=500, detail=f"Erreur lors du calcul: {str(e)}")
+            results = [error] * len(batch)
+
+        for (_, future), result in zip(batch, results):
+            if future.done():
+                # Requête annulée (client déconnecté)
+                continue
+            if isinstance(result, Exception):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
+
+
+_batcher: Optional[MicroBatcher] = None
+
+
+def get_batcher() -> MicroBatcher:
+    """
+    Batcher des prédictions unitaires, configuré par l'environnement.
+
+    ``FRAUD_BATCH_MAX_SIZE`` et ``FRAUD_BATCH_MAX_WAIT_MS`` remplacent les
+    limites par défaut.
+
+    Returns
+    -------
+    MicroBatcher
+        Instance partagée
+    """
+    global _batcher
+    if _batcher is None:
+        _batcher = MicroBatcher(
+            int(os.environ.get("FRAUD_BATCH_MAX_SIZE", DEFAULT_MAX_BATCH_SIZE)),
+            float(os.environ.get("FRAUD_BATCH_MAX_WAIT_MS", DEFAULT_MAX_WAIT_MS)),
+        )
+    return _batcher
@@ -1,14 +1,36 @@
 """Service de détection et analyse de fraude."""
 
 import os
-from typing import Any, Dict, List
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
+import numpy as np
+import pandas as pd
 from fastapi import HTTPException
 
+from banking_api.services import fraud_labels_loader
 from banking_api.services.data_cache import (
+    get_cached_dataframe,
+    get_dataset_version,
     get_fraud_by_type_cached,
-    get_fraud_summary_cached,
+    get_timestamps,
 )
+from banking_api.services.features_service import transaction_features
+from banking_api.services.fraud_backtest import (
+    average_precision,
+    classification_metrics,
+    confusion_matrix,
+    roc_auc,
+    threshold_curve,
+)
+from banking_api.services.fraud_model import (
+    FEATURE_NAMES,
+    LogisticModel,
+    feature_matrix,
+    get_fraud_model,
+)
+from banking_api.services.fraud_rules import RuleSet, get_rule_set
+from banking_api.services.geo_service import dataset_location_features, location_features
 
 
 def _get_csv_path() -> str:
@@ -31,24 +53,29 @@ def get_fraud_summary() -> Dict[str, Any]:
     """
     Vue d'ensemble de la fraude dans le dataset (avec cache).
 
+    Les métriques proviennent du backtest du scoring de ``predict_fraud``
+    (modèle s'il est chargé, règles sinon) sur les transactions labellisées
+    évaluées, postérieures à l'entraînement du modèle le cas échéant (voir
+    ``get_fraud_backtest``).
+
     Returns
     -------
     Dict[str, Any]
         Dictionnaire contenant :
-        - total_frauds : nombre total de fraudes
-        - flagged : nombre de fraudes détectées
+        - total_frauds : nombre de fraudes labellisées évaluées
+        - flagged : nombre de transactions labellisées déclarées frauduleuses
         - precision : précision de la détection
         - recall : rappel de la détection
     """
     try:
-        # Utiliser le cache pour des performances optimales
-        total_frauds, flagged, precision, recall = get_fraud_summary_cached()
+        backtest = _backtest_cached(*_backtest_key())
+        confusion = backtest["confusion"]
 
         return {
-            "total_frauds": int(total_frauds),
-            "flagged": int(flagged),
-            "precision": round(precision, 2),
-            "recall": round(recall, 2),
+            "total_frauds": backtest["positives"],
+            "flagged": confusion["tp"] + confusion["fp"],
+            "precision": round(backtest["precision"], 2),
+            "recall": round(backtest["recall"], 2),
         }
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Erreur lors du calcul: {str(e)}")
@@ -90,15 +117,293 @@ def get_fraud_by_type() -> List[Dict[str, Any]]:
         raise HTTPException(status_code=500, detail=f"Erreur lors du calcul: {str(e)}")
 
 
+MAX_BATCH_SIZE: int = 100_000
+
+
+def _provided(values: Optional[Sequence[Any]]) -> Optional[Sequence[Any]]:
+    """Valeurs d'un champ optionnel, None si aucune transaction ne le renseigne."""
+    if values is None or all(value is None for value in values):
+        return None
+    return values
+
+
+def transaction_columns(
+    types: Sequence[str],
+    amounts: Sequence[float],
+    merchant_cities: Optional[Sequence[str]] = None,
+    merchant_states: Optional[Sequence[str]] = None,
+    mccs: Optional[Sequence[Optional[int]]] = None,
+    dates: Optional[Sequence[Optional[str]]] = None,
+    client_ids: Optional[Sequence[Optional[int]]] = None,
+    card_ids: Optional[Sequence[Optional[int]]] = None,
+    zips: Optional[Sequence[Optional[str]]] = None,
+) -> Dict[str, np.ndarray]:
+    """
+    Colonnes numpy attendues par le moteur de règles.
+
+    Si le lieu est fourni, le risque géographique (taux de fraude lissé de
+    la zone) est lu dans les tables précalculées. Si le client ou la carte
+    sont fournis, les champs comportementaux (écarts au profil, vélocité)
+    sont lus dans le feature store. Une date, un client ou une carte à None
+    pour toutes les transactions équivaut à un champ absent : un lot sans
+    identifiant n'interroge pas le feature store.
+
+    Parameters
+    ----------
+    types : Sequence[str]
+        Type (use_chip) de chaque transaction
+    amounts : Sequence[float]
+        Montant de chaque transaction
+    merchant_cities : Optional[Sequence[str]]
+        Ville du marchand
+    merchant_states : Optional[Sequence[str]]
+        État du marchand
+    mccs : Optional[Sequence[Optional[int]]]
+        Code MCC (None si inconnu)
+    dates : Optional[Sequence[Optional[str]]]
+        Date de la transaction (YYYY-MM-DD HH:MM:SS), pour les règles horaires
+    client_ids : Optional[Sequence[Optional[int]]]
+        Client de la transaction (None si inconnu)
+    card_ids : Optional[Sequence[Optional[int]]]
+        Carte de la transaction (None si inconnue)
+    zips : Optional[Sequence[Optional[str]]]
+        Code postal du marchand (None si inconnu)
+
+    Returns
+    -------
+    Dict[str, np.ndarray]
+        Champ -> tableau de valeurs
+    """
+    dates, client_ids, card_ids = _provided(dates), _provided(client_ids), _provided(card_ids)
+    columns: Dict[str, np.ndarray] = {
+        "type": np.asarray(types, dtype=object),
+        "amount": np.asarray(amounts, dtype=float),
+    }
+    if merchant_cities is not None:
+        columns["merchant_city"] = np.asarray(merchant_cities, dtype=object)
+    if merchant_states is not None:
+        columns["merchant_state"] = np.asarray(merchant_states, dtype=object)
+    if mccs is not None:
+        columns["mcc"] = np.array(
+            [np.nan if mcc is None else mcc for mcc in mccs], dtype=float
+        )
+    n_rows = len(columns["amount"])
+    if merchant_states is not None or merchant_cities is not None:
+        columns.update(
+            location_features(
+                merchant_states if merchant_states is not None else [""] * n_rows,
+                merchant_cities if merchant_cities is not None else [""] * n_rows,
+                zips if zips is not None else [None] * n_rows,
+            )
+        )
+    timestamps = np.full(n_rows, np.nan)
+    if dates is not None:
+        parsed = pd.to_datetime(pd.Series(dates, dtype=object), errors="coerce")
+        columns["hour"] = parsed.dt.hour.to_numpy(dtype=float)
+        timestamps = (parsed - pd.Timestamp(0)).dt.total_seconds().to_numpy(dtype=float)
+    if client_ids is not None or card_ids is not None:
+        columns.update(
+            transaction_features(
+                client_ids if client_ids is not None else [None] * n_rows,
+                card_ids if card_ids is not None else [None] * n_rows,
+                timestamps,
+                columns["amount"],
+                merchant_states if merchant_states is not None else [""] * n_rows,
+                merchant_cities if merchant_cities is not None else [""] * n_rows,
+            )
+        )
+    return columns
+
+
+MODEL_REASON: str = "Score du modèle élevé"
+
+
+def _decide(
+    columns: Dict[str, np.ndarray],
+    rule_set: RuleSet,
+    model: Optional[LogisticModel],
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Décision et score non arrondi de chaque transaction.
+
+    Sans modèle entraîné, la décision vient des règles, calculée une fois
+    par combinaison distincte de règles déclenchées, et le score est la
+    somme plafonnée de leurs poids. Avec un modèle, décision et score
+    viennent du modèle (inférence vectorisée).
+
+    Parameters
+    ----------
+    columns : Dict[str, np.ndarray]
+        Colonnes produites par ``transaction_columns``
+    rule_set : RuleSet
+        Jeu de règles compilé
+    model : Optional[LogisticModel]
+        Modèle entraîné, ou None pour les règles seules
+
+    Returns
+    -------
+    Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]
+        (combinaisons de règles distinctes, combinaison de chaque
+        transaction, fraude prédite, score)
+    """
+    patterns = rule_set.patterns(columns)
+    unique_patterns, inverse = np.unique(patterns, return_inverse=True)
+
+    if model is None:
+        flags = np.array(
+            [rule_set.outcome(int(pattern))[0] for pattern in unique_patterns], dtype=bool
+        )[inverse]
+        return unique_patterns, inverse, flags, rule_set.scores(patterns)
+
+    scores = model.predict_proba(feature_matrix(columns))
+    return unique_patterns, inverse, scores >= model.threshold, scores
+
+
+def _score(
+    columns: Dict[str, np.ndarray],
+) -> Tuple[np.ndarray, np.ndarray, List[List[str]]]:
+    """
+    Décision, probabilité et raisons pour des colonnes de transactions.
+
+    La décision vient de ``_decide`` (modèle s'il est chargé, règles
+    sinon). Avec un modèle, les règles déclenchées servent de raisons.
+
+    Parameters
+    ----------
+    columns : Dict[str, np.ndarray]
+        Colonnes produites par ``transaction_columns``
+
+    Returns
+    -------
+    Tuple[np.ndarray, np.ndarray, List[List[str]]]
+        (fraude prédite, probabilité, raisons) par transaction
+    """
+    rule_set = get_rule_set()
+    model = get_fraud_model()
+    unique_patterns, inverse, flags, scores = _decide(columns, rule_set, model)
+
+    if model is None:
+        # Probabilité et raisons par combinaison distincte, puis diffusion
+        outcomes = [rule_set.outcome(int(pattern)) for pattern in unique_patterns]
+        probabilities = np.array([outcome[1] for outcome in outcomes])[inverse]
+        reasons = [list(outcome[2]) for outcome in outcomes]
+        return flags, probabilities, [reasons[i] for i in inverse]
+
+    triggered = [list(rule_set.triggered(int(pattern))) for pattern in unique_patterns]
+    return (
+        flags,
+        np.round(scores, 4),
+        [
+            (triggered[i] or [MODEL_REASON]) if flag else ["Transaction normale"]
+            for i, flag in zip(inverse, flags)
+        ],
+    )
+
+
+def predict_fraud_batch(
+    types: List[str],
+    amounts: List[float],
+    merchant_cities: Optional[List[str]] = None,
+    merchant_states: Optional[List[str]] = None,
+    mccs: Optional[List[Optional[int]]] = None,
+    dates: Optional[List[Optional[str]]] = None,
+    client_ids: Optional[List[Optional[int]]] = None,
+    card_ids: Optional[List[Optional[int]]] = None,
+    zips: Optional[List[Optional[str]]] = None,
+) -> Dict[str, Any]:
+    """
+    Prédiction de fraude vectorisée pour un lot de transactions.
+
+    Chaque ligne reçoit exactement le résultat de ``predict_fraud`` : les
+    deux chemins évaluent le même modèle et le même jeu de règles compilé.
+
+    Parameters
+    ----------
+    types : List[str]
+        Type (use_chip) de chaque transaction
+    amounts : List[float]
+        Montant de chaque transaction
+    merchant_cities : Optional[List[str]]
+        Ville du marchand de chaque transaction
+    merchant_states : Optional[List[str]]
+        État du marchand de chaque transaction
+    mccs : Optional[List[Optional[int]]]
+        Code MCC de chaque transaction
+    dates : Optional[List[Optional[str]]]
+        Date de chaque transaction (YYYY-MM-DD HH:MM:SS)
+    client_ids : Optional[List[Optional[int]]]
+        Client de chaque transaction (profil comportemental)
+    card_ids : Optional[List[Optional[int]]]
+        Carte de chaque transaction (vélocité)
+    zips : Optional[List[Optional[str]]]
+        Code postal du marchand de chaque transaction
+
+    Returns
+    -------
+    Dict[str, Any]
+        Dictionnaire contenant :
+        - count : nombre de transactions
+        - flagged : nombre de fraudes prédites
+        - isFraud, probability, reasons : résultats par transaction
+    """
+    n = len(amounts)
+    if len(types) != n or any(
+        column is not None and len(column) != n
+        for column in (
+            merchant_cities, merchant_states, mccs, dates, client_ids, card_ids, zips
+        )
+    ):
+        raise HTTPException(
+            status_code=400, detail="Les colonnes du lot n'ont pas la même longueur"
+        )
+    if n > MAX_BATCH_SIZE:
+        raise HTTPException(
+            status_code=413, detail=f"Lot limité à {MAX_BATCH_SIZE} transactions"
+        )
+
+    flags, probabilities, reasons = _score(
+        transaction_columns(
+            types,
+            amounts,
+            merchant_cities,
+            merchant_states,
+            mccs,
+            dates,
+            client_ids,
+            card_ids,
+            zips,
+        )
+    )
+
+    return {
+        "count": n,
+        "flagged": int(flags.sum()),
+        "isFraud": flags.tolist(),
+        "probability": probabilities.tolist(),
+        "reasons": reasons,
+    }
+
+
 def predict_fraud(
     transaction_type: str,
     amount: float,
     merchant_city: str = "",
     merchant_state: str = "",
+    mcc: Optional[int] = None,
+    date: Optional[str] = None,
+    client_id: Optional[int] = None,
+    card_id: Optional[int] = None,
+    zip_code: Optional[str] = None,
 ) -> Dict[str, Any]:
     """
     Prédiction simple de fraude basée sur des règles heuristiques.
 
+    Les règles sont lues dans ``fraud_rules.json`` (voir ``fraud_rules``).
+    Si un modèle entraîné est disponible, il fournit la probabilité et la
+    décision ; les règles déclenchées en donnent les raisons. Avec
+    ``client_id`` / ``card_id``, les règles comportementales comparent la
+    transaction au profil du client et de la carte.
+
     Parameters
     ----------
     transaction_type : str
@@ -109,6 +414,16 @@ def predict_fraud(
         Ville du marchand
     merchant_state : str
         État du marchand
+    mcc : Optional[int]
+        Code MCC du marchand
+    date : Optional[str]
+        Date de la transaction (YYYY-MM-DD HH:MM:SS)
+    client_id : Optional[int]
+        Identifiant du client
+    card_id : Optional[int]
+        Identifiant de la carte
+    zip_code : Optional[str]
+        Code postal du marchand
 
     Returns
     -------
@@ -118,44 +433,272 @@ def predict_fraud(
         - probability : probabilité estimée de fraude
         - reasons : liste des raisons de la prédiction
     """
-    is_fraud: bool = False
-    probability: float = 0.0
-    reasons: List[str] = []
+    flags, probabilities, reasons = _score(
+        transaction_columns(
+            [transaction_type],
+            [amount],
+            [merchant_city],
+            [merchant_state],
+            [mcc],
+            None if date is None else [date],
+            None if client_id is None else [client_id],
+            None if card_id is None else [card_id],
+            [zip_code],
+        )
+    )
+
+    return {
+        "isFraud": bool(flags[0]),
+        "probability": float(probabilities[0]),
+        "reasons": reasons[0],
+    }
+
+
+# Partitions du backtest (risque géographique hors échantillon)
+BACKTEST_FOLDS: int = 5
+
+
+def labelled_rows() -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Transactions du dataset présentes dans les labels de fraude.
+
+    Returns
+    -------
+    Tuple[np.ndarray, np.ndarray]
+        (positions des lignes labellisées, fraude réelle de chaque ligne)
+    """
+    df = get_cached_dataframe()
+    labels = df["id"].astype(str).map(fraud_labels_loader.load_fraud_labels())
+    rows = np.flatnonzero(labels.notna().to_numpy())
+    return rows, (labels.to_numpy()[rows] == "Yes").astype(bool)
+
+
+def dataset_columns(
+    rows: np.ndarray, history: Optional[np.ndarray] = None
+) -> Dict[str, np.ndarray]:
+    """
+    Colonnes du moteur de règles pour des lignes du dataset.
+
+    Les champs comportementaux (profil client) ne sont pas calculés : le
+    profil construit sur tout le dataset contient déjà ces transactions.
+
+    Parameters
+    ----------
+    rows : np.ndarray
+        Positions des lignes dans le DataFrame
+    history : Optional[np.ndarray]
+        Lignes dont les labels alimentent le risque géographique
+        (défaut: tout le dataset)
+
+    Returns
+    -------
+    Dict[str, np.ndarray]
+        Champ -> tableau de valeurs
+    """
+    df = get_cached_dataframe()
+    hours = (get_timestamps()[rows] // 3600) % 24
+    return {
+        "type": df["use_chip"].to_numpy(dtype=object)[rows],
+        "amount": df["amount"].to_numpy(dtype=float)[rows],
+        "merchant_city": df["merchant_city"].to_numpy(dtype=object)[rows],
+        "merchant_state": df["merchant_state"].to_numpy(dtype=object)[rows],
+        "mcc": df["mcc"].to_numpy(dtype=float)[rows],
+        "hour": hours.astype(float),
+        **dataset_location_features(rows, history),
+    }
+
+
+def out_of_fold_columns(rows: np.ndarray) -> Dict[str, np.ndarray]:
+    """
+    Colonnes du moteur de règles, risque géographique calculé hors échantillon.
+
+    Les lignes sont réparties en ``BACKTEST_FOLDS`` partitions ; le risque
+    géographique d'une partition vient des tables construites sans ses
+    labels. Sinon, une zone dont les fraudes sont celles-là mêmes que l'on
+    évalue paraîtrait risquée et gonflerait précision et rappel.
+
+    Parameters
+    ----------
+    rows : np.ndarray
+        Positions des lignes dans le DataFrame
+
+    Returns
+    -------
+    Dict[str, np.ndarray]
+        Champ -> tableau de valeurs, dans l'ordre de ``rows``
+    """
+    if len(rows) == 0:
+        return dataset_columns(rows)
+
+    folds = np.arange(len(rows)) % BACKTEST_FOLDS
+    in_history = np.ones(len(get_cached_dataframe()), dtype=bool)
+    columns: Dict[str, np.ndarray] = {}
+    for fold in range(BACKTEST_FOLDS):
+        held_out = np.flatnonzero(folds == fold)
+        in_history[rows[held_out]] = False
+        fold_columns = dataset_columns(rows[held_out], np.flatnonzero(in_history))
+        in_history[rows[held_out]] = True
+        for name, values in fold_columns.items():
+            columns.setdefault(name, np.empty(len(rows), dtype=values.dtype))[held_out] = values
+    return columns
+
 
-    # Règle 1 : Montant élevé
-    if amount > 10000:
-        probability += 0.4
-        reasons.append("Montant très élevé")
+def _backtest_key() -> Tuple[str, Optional[str], str]:
+    """Versions des règles, du modèle (None sans modèle) et du dataset."""
+    model = get_fraud_model()
+    return (
+        get_rule_set().version,
+        model.version if model is not None else None,
+        get_dataset_version(),
+    )
 
-    # Règle 2 : Montant négatif (remboursement ou erreur)
-    if amount < 0:
-        probability += 0.5
-        reasons.append("Montant négatif détecté")
 
-    # Règle 3 : Transaction Swipe avec montant très élevé
-    if transaction_type == "Swipe Transaction" and amount > 5000:
-        probability += 0.3
-        reasons.append("Swipe transaction avec montant élevé")
+@lru_cache(maxsize=4)
+def _backtest_cached(
+    rule_version: str, model_version: Optional[str], dataset_version: str
+) -> Dict[str, Any]:
+    """
+    Backtest du scoring de ``predict_fraud`` sur les transactions labellisées.
 
-    # Règle 4 : Transaction Online avec montant élevé (plus risqué)
-    if transaction_type == "Online Transaction" and amount > 3000:
-        probability += 0.25
-        reasons.append("Transaction en ligne avec montant élevé")
+    Avec un modèle, seules les transactions postérieures à sa période
+    d'entraînement (``train_cutoff`` des métadonnées) sont évaluées ; un
+    artefact sans cette date est évalué sur tout le dataset (``in_sample``).
 
-    # Règle 5 : Montant très faible (test de carte volée)
-    if 0 < amount < 1:
-        probability += 0.1
-        reasons.append("Montant très faible (test potentiel)")
+    Parameters
+    ----------
+    rule_version : str
+        Version du jeu de règles (clé du cache)
+    model_version : Optional[str]
+        Version du modèle (clé du cache), None pour les règles seules
+    dataset_version : str
+        Version du dataset (clé du cache)
 
-    # Limiter la probabilité à 1.0
-    probability = min(probability, 1.0)
+    Returns
+    -------
+    Dict[str, Any]
+        Matrice de confusion, métriques et courbe de seuils (non arrondies)
+    """
+    rows, is_fraud = labelled_rows()
+    rule_set = get_rule_set()
+    model = get_fraud_model()
+    cutoff = model.metadata.get("train_cutoff") if model is not None else None
+    if cutoff is not None:
+        after = get_timestamps()[rows] > cutoff
+        rows, is_fraud = rows[after], is_fraud[after]
+    _, _, flags, scores = _decide(out_of_fold_columns(rows), rule_set, model)
+    confusion = confusion_matrix(is_fraud, flags)
 
-    # Décision finale
-    if probability >= 0.5:
-        is_fraud = True
+    curve = threshold_curve(scores, is_fraud)
+    precisions = curve.tp / np.maximum(curve.tp + curve.fp, 1)
+    recalls = curve.tp / max(curve.positives, 1)
+    fprs = curve.fp / max(curve.negatives, 1)
 
     return {
-        "isFraud": is_fraud,
-        "probability": round(probability, 2),
-        "reasons": reasons if is_fraud else ["Transaction normale"],
+        "scorer": "rules" if model is None else "model",
+        "rule_version": rule_set.version,
+        "model_version": model.version if model is not None else None,
+        "dataset_version": dataset_version,
+        "threshold": rule_set.threshold if model is None else model.threshold,
+        "evaluated_after": (
+            pd.Timestamp(cutoff, unit="s").strftime("%Y-%m-%d %H:%M:%S")
+            if cutoff is not None
+            else None
+        ),
+        "in_sample": model is not None and cutoff is None,
+        "labelled": len(rows),
+        "positives": curve.positives,
+        "confusion": confusion,
+        **classification_metrics(confusion["tp"], confusion["fp"], confusion["fn"]),
+        "roc_auc": roc_auc(curve),
+        "average_precision": average_precision(curve),
+        "curve": [
+            {
+                "threshold": float(threshold),
+                "flagged": int(tp + fp),
+                "tp": int(tp),
+                "fp": int(fp),
+                "precision": float(precision),
+                "recall": float(recall),
+                "fpr": float(fpr),
+            }
+            for threshold, tp, fp, precision, recall, fpr in zip(
+                curve.thresholds, curve.tp, curve.fp, precisions, recalls, fprs
+            )
+        ],
+    }
+
+
+def get_fraud_backtest() -> Dict[str, Any]:
+    """
+    Backtest du scoring de ``predict_fraud`` sur le dataset labellisé (avec cache).
+
+    Le scoring servi par l'API (modèle s'il est chargé, règles sinon) est
+    évalué de façon vectorisée sur les transactions présentes dans les
+    labels, avec un risque géographique calculé hors échantillon (voir
+    ``out_of_fold_columns``). Le modèle n'est évalué que sur les transactions
+    postérieures à sa période d'entraînement ; un artefact qui ne la
+    renseigne pas est évalué sur tout le dataset et marqué ``in_sample``.
+    Le résultat est mis en cache par version du jeu de règles, du modèle et
+    du dataset.
+
+    Returns
+    -------
+    Dict[str, Any]
+        Dictionnaire contenant :
+        - scorer : "model" ou "rules"
+        - rule_version, model_version, dataset_version : versions évaluées
+        - threshold : seuil de décision du scoring
+        - evaluated_after : fin de l'entraînement du modèle (None sinon)
+        - in_sample : métriques incluant les transactions d'entraînement
+        - labelled, positives : transactions labellisées évaluées et fraudes réelles
+        - confusion : matrice de confusion (tp, fp, fn, tn)
+        - precision, recall, f1 : métriques au seuil de décision
+        - roc_auc, average_precision : qualité du score tous seuils confondus
+        - curve : un point (ROC et précision/rappel) par seuil distinct
+    """
+    try:
+        backtest = _backtest_cached(*_backtest_key())
+        metrics = ("precision", "recall", "f1", "roc_auc", "average_precision")
+        return {
+            **backtest,
+            **{metric: round(backtest[metric], 4) for metric in metrics},
+            "curve": [
+                {
+                    **point,
+                    "threshold": round(point["threshold"], 4),
+                    "precision": round(point["precision"], 4),
+                    "recall": round(point["recall"], 4),
+                    "fpr": round(point["fpr"], 4),
+                }
+                for point in backtest["curve"]
+            ],
+        }
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Erreur lors du calcul: {str(e)}")
+
+
+def get_model_info() -> Dict[str, Any]:
+    """
+    Description du modèle de fraude utilisé pour le scoring.
+
+    Returns
+    -------
+    Dict[str, Any]
+        Dictionnaire contenant :
+        - available : True si un modèle entraîné est chargé
+        - version, threshold, features, metadata : artefact du modèle
+        - rule_version : version du jeu de règles (repli et raisons)
+    """
+    model = get_fraud_model()
+    info: Dict[str, Any] = {
+        "available": model is not None,
+        "rule_version": get_rule_set().version,
     }
+    if model is not None:
+        info.update(
+            version=model.version,
+            threshold=model.threshold,
+            features=list(FEATURE_NAMES),
+            metadata=model.metadata,
+        )
+    return info
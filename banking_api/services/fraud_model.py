@@ -0,0 +1,332 @@
+"""Modèle de fraude appris : régression logistique en numpy pur.
+
+Le modèle est entraîné hors ligne (voir ``banking_api.train_fraud_model``)
+sur des caractéristiques dérivées des colonnes du moteur de règles, puis
+sauvegardé dans un artefact JSON versionné. L'inférence est un produit
+matrice-vecteur : quelques microsecondes par transaction.
+
+Si aucun artefact n'est présent, ``get_fraud_model`` retourne None et le
+scoring utilise les règles seules.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import threading
+from typing import Any, Dict, Mapping, Optional, Tuple
+
+import numpy as np
+
+from banking_api.services.fraud_backtest import classification_metrics, threshold_curve
+
+logger = logging.getLogger(__name__)
+
+# Version du format d'artefact (incrémentée si les caractéristiques changent)
+MODEL_FORMAT: int = 1
+
+FEATURE_NAMES: Tuple[str, ...] = (
+    "log_amount",
+    "negative_amount",
+    "micro_amount",
+    "online",
+    "swipe",
+    "hour_sin",
+    "hour_cos",
+    "hour_known",
+    "log_location_lift",
+)
+
+
+def feature_matrix(columns: Mapping[str, np.ndarray]) -> np.ndarray:
+    """
+    Caractéristiques du modèle à partir des colonnes du moteur de règles.
+
+    Parameters
+    ----------
+    columns : Mapping[str, np.ndarray]
+        Colonnes produites par ``transaction_columns`` (``type`` et
+        ``amount`` obligatoires, ``hour`` et ``location_lift`` optionnels)
+
+    Returns
+    -------
+    np.ndarray
+        Matrice (transactions x FEATURE_NAMES), float64
+    """
+    amounts = np.asarray(columns["amount"], dtype=float)
+    types = columns["type"]
+    n_rows = len(amounts)
+
+    hours = np.asarray(columns.get("hour", np.full(n_rows, np.nan)), dtype=float)
+    hour_known = ~np.isnan(hours)
+    angles = np.where(hour_known, hours, 0.0) * 2 * np.pi / 24
+    lift = np.asarray(columns.get("location_lift", np.ones(n_rows)), dtype=float)
+
+    return np.column_stack(
+        [
+            np.sign(amounts) * np.log1p(np.abs(amounts)),
+            amounts < 0,
+            (amounts > 0) & (amounts < 1),
+            types == "Online Transaction",
+            types == "Swipe Transaction",
+            np.where(hour_known, np.sin(angles), 0.0),
+            np.where(hour_known, np.cos(angles), 0.0),
+            hour_known,
+            np.log(np.where(lift > 0, lift, 1.0)),
+        ]
+    ).astype(float)
+
+
+class LogisticModel:
+    """
+    Régression logistique sur caractéristiques standardisées.
+
+    Parameters
+    ----------
+    weights : np.ndarray
+        Coefficient de chaque caractéristique standardisée
+    bias : float
+        Ordonnée à l'origine
+    mean : np.ndarray
+        Moyenne de chaque caractéristique (standardisation)
+    scale : np.ndarray
+        Écart-type de chaque caractéristique (standardisation)
+    threshold : float
+        Probabilité à partir de laquelle la transaction est frauduleuse
+    metadata : Optional[Dict[str, Any]]
+        Informations d'entraînement (date, métriques de validation...)
+    """
+
+    def __init__(
+        self,
+        weights: np.ndarray,
+        bias: float,
+        mean: np.ndarray,
+        scale: np.ndarray,
+        threshold: float = 0.5,
+        metadata: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        self.weights: np.ndarray = np.asarray(weights, dtype=float)
+        self.bias: float = float(bias)
+        self.mean: np.ndarray = np.asarray(mean, dtype=float)
+        self.scale: np.ndarray = np.asarray(scale, dtype=float)
+        self.threshold: float = float(threshold)
+        self.metadata: Dict[str, Any] = dict(metadata or {})
+        self.version: str = self.metadata.get("version", "")
+
+    def predict_proba(self, features: np.ndarray) -> np.ndarray:
+        """
+        Probabilité de fraude de chaque transaction (vectorisé).
+
+        Parameters
+        ----------
+        features : np.ndarray
+            Matrice de caractéristiques (voir ``feature_matrix``)
+
+        Returns
+        -------
+        np.ndarray
+            Probabilités entre 0 et 1
+        """
+        logits = ((features - self.mean) / self.scale) @ self.weights + self.bias
+        return 1.0 / (1.0 + np.exp(-np.clip(logits, -500, 500)))
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Contenu de l'artefact (sérialisable en JSON)."""
+        return {
+            "format": MODEL_FORMAT,
+            "features": list(FEATURE_NAMES),
+            "weights": self.weights.tolist(),
+            "bias": self.bias,
+            "mean": self.mean.tolist(),
+            "scale": self.scale.tolist(),
+            "threshold": self.threshold,
+            "metadata": {k: v for k, v in self.metadata.items() if k != "version"},
+        }
+
+
+def fit_logistic(
+    features: np.ndarray,
+    labels: np.ndarray,
+    l2: float = 1.0,
+    max_iter: int = 25,
+    tol: float = 1e-8,
+) -> LogisticModel:
+    """
+    Entraîne une régression logistique régularisée (méthode de Newton).
+
+    Avec une dizaine de caractéristiques, chaque itération coûte
+    O(n * d²) et la convergence prend quelques itérations.
+
+    Parameters
+    ----------
+    features : np.ndarray
+        Matrice de caractéristiques (n x d)
+    labels : np.ndarray
+        1 si fraude, 0 sinon
+    l2 : float
+        Pénalité L2 sur les coefficients (pas sur l'ordonnée à l'origine)
+    max_iter : int
+        Nombre maximum d'itérations de Newton
+    tol : float
+        Arrêt quand la mise à jour devient plus petite
+
+    Returns
+    -------
+    LogisticModel
+        Modèle entraîné (seuil 0.5)
+    """
+    mean = features.mean(axis=0)
+    scale = features.std(axis=0)
+    scale[scale == 0] = 1.0
+    design = np.column_stack([(features - mean) / scale, np.ones(len(features))])
+    y = labels.astype(float)
+
+    penalty = np.full(design.shape[1], l2)
+    penalty[-1] = 0.0
+    theta = np.zeros(design.shape[1])
+    for _ in range(max_iter):
+        p = 1.0 / (1.0 + np.exp(-np.clip(design @ theta, -500, 500)))
+        gradient = design.T @ (p - y) + penalty * theta
+        hessian = (design.T * (p * (1 - p))) @ design + np.diag(penalty + 1e-9)
+        step = np.linalg.solve(hessian, gradient)
+        theta -= step
+        if np.max(np.abs(step)) < tol:
+            break
+
+    return LogisticModel(theta[:-1], theta[-1], mean, scale)
+
+
+def save_model(model: LogisticModel, path: str) -> str:
+    """
+    Écrit l'artefact du modèle.
+
+    Parameters
+    ----------
+    model : LogisticModel
+        Modèle entraîné
+    path : str
+        Chemin du fichier JSON
+
+    Returns
+    -------
+    str
+        Version de l'artefact (empreinte de son contenu)
+    """
+    content = json.dumps(model.to_dict(), indent=2).encode()
+    with open(path, "wb") as f:
+        f.write(content)
+    return _version(content)
+
+
+def _version(content: bytes) -> str:
+    """Version d'un artefact : format suivi d'une empreinte du contenu."""
+    return f"{MODEL_FORMAT}:{hashlib.sha1(content).hexdigest()[:12]}"
+
+
+def load_model(path: str) -> LogisticModel:
+    """
+    Lit un artefact de modèle.
+
+    Parameters
+    ----------
+    path : str
+        Chemin du fichier JSON
+
+    Returns
+    -------
+    LogisticModel
+        Modèle prêt pour l'inférence
+    """
+    with open(path, "rb") as f:
+        content = f.read()
+    artifact = json.loads(content)
+    if artifact.get("format") != MODEL_FORMAT or artifact["features"] != list(FEATURE_NAMES):
+        raise ValueError("Artefact incompatible avec les caractéristiques actuelles")
+
+    return LogisticModel(
+        np.array(artifact["weights"]),
+        artifact["bias"],
+        np.array(artifact["mean"]),
+        np.array(artifact["scale"]),
+        artifact["threshold"],
+        {**artifact.get("metadata", {}), "version": _version(content)},
+    )
+
+
+def get_model_path() -> str:
+    """Retourne le chemin de l'artefact du modèle."""
+    base_dir: str = os.path.dirname(
+        os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    )
+    return os.environ.get(
+        "FRAUD_MODEL_PATH", os.path.join(base_dir, "data", "fraud_model.json")
+    )
+
+
+_lock = threading.Lock()
+_state: Dict[str, Any] = {"path": None, "mtime_ns": None, "model": None}
+
+
+def get_fraud_model() -> Optional[LogisticModel]:
+    """
+    Modèle courant, rechargé si l'artefact a changé.
+
+    Returns
+    -------
+    Optional[LogisticModel]
+        Modèle chargé, ou None si aucun artefact valide n'est présent
+        (le scoring utilise alors les règles seules)
+    """
+    path = get_model_path()
+    try:
+        mtime_ns: Optional[int] = os.stat(path).st_mtime_ns
+    except OSError:
+        mtime_ns = None
+
+    with _lock:
+        if _state["path"] != path or _state["mtime_ns"] != mtime_ns:
+            model = None
+            if mtime_ns is not None:
+                try:
+                    model = load_model(path)
+                except (OSError, ValueError, KeyError, TypeError) as e:
+                    logger.error("Modèle de fraude invalide, règles seules: %s", e)
+            _state.update(path=path, mtime_ns=mtime_ns, model=model)
+        return _state["model"]
+
+
+def best_f1_threshold(
+    probabilities: np.ndarray, labels: np.ndarray
+) -> Tuple[float, Dict[str, float]]:
+    """
+    Seuil de probabilité maximisant le F1 (courbe de seuils en une passe).
+
+    Parameters
+    ----------
+    probabilities : np.ndarray
+        Probabilités prédites
+    labels : np.ndarray
+        1 si fraude, 0 sinon
+
+    Returns
+    -------
+    Tuple[float, Dict[str, float]]
+        (seuil, {precision, recall, f1} à ce seuil)
+    """
+    curve = threshold_curve(probabilities, labels.astype(bool))
+    if curve.positives == 0:
+        return 0.5, {"precision": 0.0, "recall": 0.0, "f1": 0.0}
+
+    precision = curve.tp / (curve.tp + curve.fp)
+    recall = curve.tp / curve.positives
+    f1 = np.divide(
+        2 * precision * recall,
+        precision + recall,
+        out=np.zeros(len(precision)),
+        where=precision + recall > 0,
+    )
+    best = int(np.argmax(f1))
+    tp, fp = int(curve.tp[best]), int(curve.fp[best])
+    metrics = classification_metrics(tp, fp, curve.positives - tp)
+    return float(curve.thresholds[best]), metrics
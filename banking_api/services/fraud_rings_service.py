@@ -0,0 +1,200 @@
+"""Service de détection des réseaux de fraude (fraud rings).
+
+Le graphe relie chaque client aux marchands et aux cartes de ses
+transactions frauduleuses. Deux clients sont dans le même réseau s'ils
+sont reliés par une suite de cartes partagées ou de marchands fraudés en
+commun. Les marchands fraudés par plus de ``MAX_MERCHANT_CLIENTS`` clients
+(grandes enseignes, marchands en ligne) sont ignorés : ils relieraient
+sinon des clients sans rapport entre eux en une composante géante.
+"""
+
+from functools import lru_cache
+from typing import Any, Dict, List
+
+import numpy as np
+from fastapi import HTTPException
+
+from banking_api.services.data_cache import (
+    get_cached_dataframe,
+    get_dataset_version,
+    get_encoded_column,
+    get_timestamps,
+)
+from banking_api.services.entity_summary import format_timestamps
+from banking_api.services.graph import connected_components, csr_adjacency, csr_edges
+
+# Marchand ignoré au-delà de ce nombre de clients fraudés distincts
+MAX_MERCHANT_CLIENTS: int = 20
+
+# Identifiants listés par réseau (clients, marchands, cartes)
+MAX_MEMBERS: int = 50
+
+
+def find_rings(
+    clients: np.ndarray,
+    merchants: np.ndarray,
+    cards: np.ndarray,
+    n_clients: int,
+    n_merchants: int,
+    n_cards: int,
+    max_merchant_clients: int = MAX_MERCHANT_CLIENTS,
+) -> np.ndarray:
+    """
+    Réseau de chaque transaction frauduleuse (composantes connexes).
+
+    Parameters
+    ----------
+    clients : np.ndarray
+        Code du client de chaque transaction frauduleuse
+    merchants : np.ndarray
+        Code du marchand de chaque transaction frauduleuse
+    cards : np.ndarray
+        Code de la carte de chaque transaction frauduleuse
+    n_clients : int
+        Nombre de codes clients
+    n_merchants : int
+        Nombre de codes marchands
+    n_cards : int
+        Nombre de codes cartes
+    max_merchant_clients : int
+        Marchands reliant plus de clients ignorés
+
+    Returns
+    -------
+    np.ndarray
+        Réseau de chaque transaction (identifiant de composante)
+    """
+    merchant_indptr, merchant_clients = csr_adjacency(merchants, clients, n_merchants)
+    card_indptr, card_clients = csr_adjacency(cards, clients, n_cards)
+
+    merchant_nodes, merchant_targets = csr_edges(merchant_indptr, merchant_clients)
+    kept = np.diff(merchant_indptr)[merchant_nodes] <= max_merchant_clients
+    card_nodes, card_targets = csr_edges(card_indptr, card_clients)
+
+    # Nœuds : clients, puis marchands, puis cartes
+    components = connected_components(
+        n_clients + n_merchants + n_cards,
+        np.concatenate((merchant_nodes[kept] + n_clients, card_nodes + n_clients + n_merchants)),
+        np.concatenate((merchant_targets[kept], card_targets)),
+    )
+    return components[clients]
+
+
+def _members(labels: np.ndarray, codes: np.ndarray) -> List[int]:
+    """Identifiants distincts d'un réseau (au plus MAX_MEMBERS)."""
+    return [int(value) for value in labels[np.unique(codes)[:MAX_MEMBERS]]]
+
+
+@lru_cache(maxsize=1)
+def _get_rings(dataset_version: str) -> List[Dict[str, Any]]:
+    """
+    Calcule et classe les réseaux de fraude du dataset.
+
+    Parameters
+    ----------
+    dataset_version : str
+        Version du dataset (clé du cache)
+
+    Returns
+    -------
+    List[Dict[str, Any]]
+        Réseaux d'au moins deux clients, par nombre de fraudes décroissant
+    """
+    df = get_cached_dataframe()
+    rows = np.flatnonzero(df["isFraud"].to_numpy() == 1)
+    if len(rows) == 0:
+        return []
+    encoded = {
+        name: get_encoded_column(name) for name in ("client_id", "merchant_id", "card_id")
+    }
+    codes = {name: column.codes[rows] for name, column in encoded.items()}
+
+    ring_of_row = find_rings(
+        codes["client_id"],
+        codes["merchant_id"],
+        codes["card_id"],
+        *(len(column.labels) for column in encoded.values()),
+    )
+
+    # Transactions regroupées par réseau : chaque réseau est une tranche
+    order = np.argsort(ring_of_row, kind="stable")
+    ring_ids, starts, sizes = np.unique(
+        ring_of_row[order], return_index=True, return_counts=True
+    )
+    codes = {name: values[order] for name, values in codes.items()}
+    amounts = df["amount"].to_numpy(dtype=float)[rows][order]
+    timestamps = get_timestamps()[rows][order]
+
+    ring_position = np.repeat(np.arange(len(ring_ids)), sizes)
+    n_clients = len(encoded["client_id"].labels)
+    pairs = np.unique(ring_position * n_clients + codes["client_id"])
+    client_counts = np.bincount(pairs // n_clients, minlength=len(ring_ids))
+    fraud_amounts = np.add.reduceat(amounts, starts)
+    first = np.minimum.reduceat(timestamps, starts)
+    last = np.maximum.reduceat(timestamps, starts)
+
+    ranked = np.lexsort((-fraud_amounts, -sizes))
+    ranked = ranked[client_counts[ranked] >= 2]
+
+    rings = []
+    for position in ranked:
+        ring = slice(starts[position], starts[position] + sizes[position])
+        first_date, last_date = format_timestamps(
+            np.array([first[position], last[position]])
+        )
+        rings.append(
+            {
+                "client_count": int(client_counts[position]),
+                "merchant_count": int(len(np.unique(codes["merchant_id"][ring]))),
+                "card_count": int(len(np.unique(codes["card_id"][ring]))),
+                "fraud_count": int(sizes[position]),
+                "fraud_amount": round(float(fraud_amounts[position]), 2),
+                "first_date": first_date,
+                "last_date": last_date,
+                **{
+                    key: _members(encoded[name].labels, codes[name][ring])
+                    for key, name in (
+                        ("clients", "client_id"),
+                        ("merchants", "merchant_id"),
+                        ("cards", "card_id"),
+                    )
+                },
+            }
+        )
+    return rings
+
+
+def get_fraud_rings(limit: int = 20, min_clients: int = 2) -> Dict[str, Any]:
+    """
+    Réseaux de fraude classés par nombre de transactions frauduleuses.
+
+    Parameters
+    ----------
+    limit : int
+        Nombre maximum de réseaux retournés (défaut: 20)
+    min_clients : int
+        Taille minimale d'un réseau, en clients (défaut: 2)
+
+    Returns
+    -------
+    Dict[str, Any]
+        Nombre de réseaux et réseaux classés (clients, marchands et cartes
+        impliqués, nombre et montant des fraudes, période)
+    """
+    if limit < 1 or min_clients < 2:
+        raise HTTPException(status_code=400, detail="limit >= 1 et min_clients >= 2 requis")
+
+    try:
+        rings = [
+            ring
+            for ring in _get_rings(get_dataset_version())
+            if ring["client_count"] >= min_clients
+        ]
+        return {
+            "total": len(rings),
+            "rings": [
+                {"rank": rank, **ring} for rank, ring in enumerate(rings[:limit], start=1)
+            ],
+        }
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Erreur lors du calcul: {str(e)}")
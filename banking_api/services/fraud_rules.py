@@ -0,0 +1,318 @@
+"""Moteur de règles de fraude déclaratives, compilées en prédicats numpy.
+
+Les règles sont décrites dans un fichier JSON (``fraud_rules.json``) :
+
+- ``threshold`` : probabilité à partir de laquelle la transaction est
+  déclarée frauduleuse ;
+- ``max_probability`` : plafond de la probabilité ;
+- ``rules`` : liste ordonnée de règles ``{name, weight, reason, when}``.
+
+``when`` associe un champ à des opérateurs, tous combinés par ET ::
+
+    {"type": {"eq": "Swipe Transaction"}, "amount": {"gt": 5000}}
+
+Champs : ``type``, ``amount``, ``merchant_city``, ``merchant_state``,
+``mcc`` et ``hour`` (heure de la transaction), plus les champs
+comportementaux du feature store quand le client ou la carte sont connus :
+``amount_zscore``, ``new_state``, ``new_city``, ``hour_deviation`` et
+``velocity`` (voir ``feature_store``), et le risque géographique
+``location_risk`` / ``location_lift`` (voir ``location_risk``).
+Opérateurs : ``eq``, ``ne``, ``in``, ``not_in``, ``gt``, ``gte``, ``lt``,
+``lte``. Une condition sur un champ absent des données n'est jamais
+vérifiée.
+
+Le fichier est recompilé dès que sa date de modification change.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import threading
+from typing import Any, Callable, Dict, Mapping, NamedTuple, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+RULE_FIELDS: Tuple[str, ...] = (
+    "type",
+    "amount",
+    "merchant_city",
+    "merchant_state",
+    "mcc",
+    "hour",
+    "amount_zscore",
+    "new_state",
+    "new_city",
+    "hour_deviation",
+    "velocity",
+    "location_risk",
+    "location_lift",
+)
+
+_OPERATORS: Dict[str, Callable[[np.ndarray, Any], np.ndarray]] = {
+    "eq": lambda values, operand: values == operand,
+    "ne": lambda values, operand: values != operand,
+    "in": lambda values, operand: np.isin(values, list(operand)),
+    "not_in": lambda values, operand: ~np.isin(values, list(operand)),
+    "gt": lambda values, operand: values > operand,
+    "gte": lambda values, operand: values >= operand,
+    "lt": lambda values, operand: values < operand,
+    "lte": lambda values, operand: values <= operand,
+}
+
+Columns = Mapping[str, np.ndarray]
+Predicate = Callable[[Columns, int], np.ndarray]
+
+
+class CompiledRule(NamedTuple):
+    """
+    Règle compilée.
+
+    Attributes
+    ----------
+    name : str
+        Identifiant de la règle
+    weight : float
+        Poids ajouté à la probabilité si la règle est déclenchée
+    reason : str
+        Raison retournée à l'utilisateur
+    predicate : Predicate
+        Fonction (colonnes, nombre de lignes) -> masque booléen
+    """
+
+    name: str
+    weight: float
+    reason: str
+    predicate: Predicate
+
+
+def _compile_condition(field: str, operator: str, operand: Any) -> Predicate:
+    """
+    Compile une condition élémentaire ``field operator operand``.
+
+    Parameters
+    ----------
+    field : str
+        Champ testé
+    operator : str
+        Opérateur (eq, gt, in...)
+    operand : Any
+        Valeur de comparaison
+
+    Returns
+    -------
+    Predicate
+        Prédicat vectorisé
+    """
+    if field not in RULE_FIELDS:
+        raise ValueError(f"Champ de règle inconnu: {field}")
+    if operator not in _OPERATORS:
+        raise ValueError(f"Opérateur de règle inconnu: {operator}")
+    compare = _OPERATORS[operator]
+
+    def predicate(columns: Columns, n_rows: int) -> np.ndarray:
+        values = columns.get(field)
+        if values is None:
+            return np.zeros(n_rows, dtype=bool)
+        return np.asarray(compare(values, operand), dtype=bool)
+
+    return predicate
+
+
+def _compile_rule(spec: Dict[str, Any]) -> CompiledRule:
+    """
+    Compile une règle : conjonction de ses conditions.
+
+    Parameters
+    ----------
+    spec : Dict[str, Any]
+        Règle telle que décrite dans le fichier de configuration
+
+    Returns
+    -------
+    CompiledRule
+        Règle compilée
+    """
+    conditions = [
+        _compile_condition(field, operator, operand)
+        for field, operators in spec["when"].items()
+        for operator, operand in operators.items()
+    ]
+
+    def predicate(columns: Columns, n_rows: int) -> np.ndarray:
+        mask = np.ones(n_rows, dtype=bool)
+        for condition in conditions:
+            mask &= condition(columns, n_rows)
+        return mask
+
+    return CompiledRule(spec["name"], float(spec["weight"]), spec["reason"], predicate)
+
+
+class RuleSet:
+    """
+    Jeu de règles compilé.
+
+    Parameters
+    ----------
+    config : Dict[str, Any]
+        Configuration (contenu du fichier JSON)
+    version : str
+        Version du jeu de règles (clé de cache des backtests)
+    """
+
+    def __init__(self, config: Dict[str, Any], version: str) -> None:
+        self.version: str = version
+        self.threshold: float = float(config.get("threshold", 0.5))
+        self.max_probability: float = float(config.get("max_probability", 1.0))
+        self.rules: Tuple[CompiledRule, ...] = tuple(
+            _compile_rule(spec) for spec in config["rules"]
+        )
+        self._outcomes: Dict[int, Tuple[bool, float, Tuple[str, ...]]] = {}
+
+    def patterns(self, columns: Columns) -> np.ndarray:
+        """
+        Évalue toutes les règles sur des colonnes de transactions.
+
+        Parameters
+        ----------
+        columns : Columns
+            Champ -> tableau de valeurs (une entrée par transaction)
+
+        Returns
+        -------
+        np.ndarray
+            Combinaison de règles déclenchées (bit ``i`` = règle ``i``)
+        """
+        n_rows = len(columns["amount"])
+        patterns = np.zeros(n_rows, dtype=np.int64)
+        for i, rule in enumerate(self.rules):
+            patterns |= rule.predicate(columns, n_rows).astype(np.int64) << i
+        return patterns
+
+    def scores(self, patterns: np.ndarray) -> np.ndarray:
+        """
+        Probabilité (non arrondie) de chaque combinaison de règles.
+
+        Parameters
+        ----------
+        patterns : np.ndarray
+            Combinaisons de règles déclenchées
+
+        Returns
+        -------
+        np.ndarray
+            Probabilité plafonnée par ligne
+        """
+        scores = np.zeros(len(patterns))
+        for i, rule in enumerate(self.rules):
+            scores += rule.weight * ((patterns >> i) & 1)
+        return np.minimum(scores, self.max_probability)
+
+    def triggered(self, pattern: int) -> Tuple[str, ...]:
+        """
+        Raisons des règles déclenchées, dans l'ordre des règles.
+
+        Parameters
+        ----------
+        pattern : int
+            Bit ``i`` levé si la règle ``i`` est déclenchée
+
+        Returns
+        -------
+        Tuple[str, ...]
+            Raison de chaque règle déclenchée
+        """
+        return tuple(rule.reason for i, rule in enumerate(self.rules) if pattern >> i & 1)
+
+    def outcome(self, pattern: int) -> Tuple[bool, float, Tuple[str, ...]]:
+        """
+        Décision associée à une combinaison de règles déclenchées.
+
+        Calculée une fois par combinaison, en additionnant les poids dans
+        l'ordre des règles.
+
+        Parameters
+        ----------
+        pattern : int
+            Bit ``i`` levé si la règle ``i`` est déclenchée
+
+        Returns
+        -------
+        Tuple[bool, float, Tuple[str, ...]]
+            (fraude prédite, probabilité arrondie, raisons)
+        """
+        if pattern not in self._outcomes:
+            probability = 0.0
+            for i, rule in enumerate(self.rules):
+                if pattern >> i & 1:
+                    probability += rule.weight
+            probability = min(probability, self.max_probability)
+            is_fraud = probability >= self.threshold
+            self._outcomes[pattern] = (
+                is_fraud,
+                round(probability, 2),
+                self.triggered(pattern) if is_fraud else ("Transaction normale",),
+            )
+        return self._outcomes[pattern]
+
+
+def load_rule_set(path: str) -> RuleSet:
+    """
+    Lit et compile un fichier de règles.
+
+    Parameters
+    ----------
+    path : str
+        Chemin du fichier JSON
+
+    Returns
+    -------
+    RuleSet
+        Jeu de règles compilé ; sa version est ``version`` du fichier
+        suivie d'une empreinte du contenu
+    """
+    with open(path, "rb") as f:
+        content = f.read()
+    config = json.loads(content)
+    digest = hashlib.sha1(content).hexdigest()[:12]
+    return RuleSet(config, f"{config.get('version', '0')}:{digest}")
+
+
+def _get_rules_path() -> str:
+    """Retourne le chemin vers le fichier de règles."""
+    return os.environ.get(
+        "FRAUD_RULES_PATH",
+        os.path.join(os.path.dirname(os.path.abspath(__file__)), "fraud_rules.json"),
+    )
+
+
+_lock = threading.Lock()
+_state: Dict[str, Any] = {"path": None, "mtime_ns": None, "rule_set": None}
+
+
+def get_rule_set() -> RuleSet:
+    """
+    Jeu de règles courant, recompilé si le fichier a changé.
+
+    Si le fichier modifié est invalide, le dernier jeu valide est conservé.
+
+    Returns
+    -------
+    RuleSet
+        Jeu de règles compilé
+    """
+    path = _get_rules_path()
+    mtime_ns = os.stat(path).st_mtime_ns
+
+    with _lock:
+        if _state["path"] != path or _state["mtime_ns"] != mtime_ns:
+            try:
+                _state["rule_set"] = load_rule_set(path)
+            except (OSError, ValueError, KeyError, TypeError) as e:
+                if _state["rule_set"] is None:
+                    raise
+                logger.error("Règles de fraude invalides, version conservée: %s", e)
+            _state["path"], _state["mtime_ns"] = path, mtime_ns
+        return _state["rule_set"]
@@ -0,0 +1,330 @@
+"""Service d'analyse géographique (état, ville, code postal)."""
+
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+from fastapi import HTTPException
+
+from banking_api.services.aggregation_service import (
+    aggregate,
+    build_filters,
+    top_k_indices,
+)
+from banking_api.services.data_cache import get_dataset_version, get_encoded_column
+from banking_api.services.location_risk import LocationRisk, factorize_labels
+
+# Niveau géographique -> dimensions de regroupement (une ville est
+# identifiée par son état : plusieurs états ont des villes homonymes)
+GEO_LEVELS: Dict[str, Tuple[str, ...]] = {
+    "state": ("merchant_state",),
+    "city": ("merchant_state", "merchant_city"),
+    "zip": ("merchant_state", "zip"),
+}
+
+# Colonne de sortie de chaque dimension
+_OUTPUT_NAMES: Dict[str, str] = {
+    "merchant_state": "state",
+    "merchant_city": "city",
+    "zip": "zip",
+}
+
+_GEO_METRICS: Tuple[str, ...] = ("count", "sum", "mean", "fraud_count", "fraud_rate")
+
+# Critères de tri -> métrique de l'agrégation
+GEO_SORTS: Dict[str, str] = {
+    "count": "count",
+    "volume": "sum",
+    "fraud_count": "fraud_count",
+    "fraud_rate": "fraud_rate",
+}
+
+
+def format_zip(label: Any) -> str:
+    """
+    Formate un code postal lu comme flottant (ex: 1001.0 -> "01001").
+
+    Parameters
+    ----------
+    label : Any
+        Libellé encodé du code postal ("" si manquant)
+
+    Returns
+    -------
+    str
+        Code postal sur 5 chiffres, ou "" si manquant
+    """
+    if label == "":
+        return ""
+    return f"{int(float(label)):05d}"
+
+
+def get_geo_stats(
+    level: str = "state",
+    type_filter: Optional[str] = None,
+    merchant_state: Optional[str] = None,
+    start_date: Optional[str] = None,
+    end_date: Optional[str] = None,
+    sort: str = "count",
+    limit: Optional[int] = None,
+) -> Dict[str, Any]:
+    """
+    Nombre, volume et fraude par zone géographique du marchand.
+
+    Les zones sont agrégées sur les colonnes encodées en entiers ; le
+    résultat est mis en cache par (niveau, filtres, version du dataset).
+    Les transactions en ligne (sans état) forment la zone ``""``.
+
+    Parameters
+    ----------
+    level : str
+        "state", "city" ou "zip"
+    type_filter : Optional[str]
+        Filtrer par type de transaction
+    merchant_state : Optional[str]
+        Restreindre à un état (ex: villes du Texas)
+    start_date : Optional[str]
+        Date de début incluse (YYYY-MM-DD)
+    end_date : Optional[str]
+        Date de fin incluse (YYYY-MM-DD)
+    sort : str
+        Tri décroissant : count, volume, fraud_count ou fraud_rate
+    limit : Optional[int]
+        Nombre maximum de zones retournées
+
+    Returns
+    -------
+    Dict[str, Any]
+        Niveau, nombre de zones et statistiques par zone
+    """
+    if level not in GEO_LEVELS:
+        raise HTTPException(status_code=400, detail=f"Niveau invalide: {level}")
+    if sort not in GEO_SORTS:
+        raise HTTPException(status_code=400, detail=f"Critère de tri invalide: {sort}")
+    if limit is not None and limit <= 0:
+        raise HTTPException(status_code=400, detail="limit doit être positif")
+
+    filters = build_filters(
+        type_filter, merchant_state, start_date=start_date, end_date=end_date
+    )
+
+    try:
+        by = GEO_LEVELS[level]
+        columns = aggregate(by, _GEO_METRICS, filters)
+        values = columns[GEO_SORTS[sort]]
+        selected = top_k_indices(values, len(values) if limit is None else limit)
+
+        areas: List[Dict[str, Any]] = []
+        for i in selected:
+            area: Dict[str, Any] = {
+                _OUTPUT_NAMES[dim]: str(columns[dim][i]) for dim in by
+            }
+            if "zip" in area:
+                area["zip"] = format_zip(columns["zip"][i])
+            area.update(
+                {
+                    "count": int(columns["count"][i]),
+                    "total_amount": round(float(columns["sum"][i]), 2),
+                    "avg_amount": round(float(columns["mean"][i]), 2),
+                    "fraud_count": int(columns["fraud_count"][i]),
+                    "fraud_rate": round(float(columns["fraud_rate"][i]), 5),
+                }
+            )
+            areas.append(area)
+
+        return {
+            "level": level,
+            "total_areas": len(values),
+            "areas": areas,
+        }
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Erreur lors du calcul: {str(e)}")
+
+
+def _zip_key(zip_code: Optional[str]) -> str:
+    """Code postal normalisé, "" s'il est absent ou invalide."""
+    try:
+        return format_zip(zip_code) if zip_code else ""
+    except ValueError:
+        return ""
+
+
+def _build_location_risk(history: Optional[np.ndarray] = None) -> LocationRisk:
+    """
+    Construit les tables de risque géographique à partir de lignes du dataset.
+
+    Parameters
+    ----------
+    history : Optional[np.ndarray]
+        Positions des lignes dont les labels alimentent les tables
+        (défaut: tout le dataset)
+
+    Returns
+    -------
+    LocationRisk
+        Taux de fraude lissés par État, ville et code postal
+    """
+    selected = slice(None) if history is None else history
+    states = get_encoded_column("merchant_state")
+    cities = get_encoded_column("merchant_city")
+    zips = get_encoded_column("zip")
+    return LocationRisk.from_history(
+        get_encoded_column("isFraud").codes[selected],
+        states.codes[selected],
+        states.labels,
+        cities.codes[selected],
+        cities.labels,
+        zips.codes[selected],
+        [format_zip(label) for label in zips.labels],
+    )
+
+
+@lru_cache(maxsize=1)
+def _get_location_risk(dataset_version: str) -> LocationRisk:
+    """
+    Construit les tables de risque géographique du dataset.
+
+    Parameters
+    ----------
+    dataset_version : str
+        Version du dataset (clé du cache : les tables sont recalculées
+        à chaque rechargement des données)
+
+    Returns
+    -------
+    LocationRisk
+        Taux de fraude lissés par État, ville et code postal
+    """
+    return _build_location_risk()
+
+
+def location_features(
+    merchant_states: Sequence[str],
+    merchant_cities: Sequence[str],
+    zips: Sequence[Optional[str]],
+    risk: Optional[LocationRisk] = None,
+) -> Dict[str, np.ndarray]:
+    """
+    Champs de risque géographique des règles de fraude.
+
+    Parameters
+    ----------
+    merchant_states : Sequence[str]
+        État du marchand de chaque transaction
+    merchant_cities : Sequence[str]
+        Ville du marchand de chaque transaction
+    zips : Sequence[Optional[str]]
+        Code postal de chaque transaction (None si inconnu)
+    risk : Optional[LocationRisk]
+        Tables à interroger (défaut: tables du dataset entier, en cache)
+
+    Returns
+    -------
+    Dict[str, np.ndarray]
+        - location_risk : taux de fraude lissé de la zone la plus précise
+        - location_lift : ce taux rapporté au taux global
+    """
+    if risk is None:
+        risk = _get_location_risk(get_dataset_version())
+    zip_codes, zip_labels = factorize_labels(zips)
+    zip_keys = np.array([_zip_key(label) for label in zip_labels], dtype=object)
+    rates = risk.risk(merchant_states, merchant_cities, zip_keys[zip_codes])
+    return {"location_risk": rates, "location_lift": risk.lift(rates)}
+
+
+def preload_location_risk() -> None:
+    """
+    Construit les tables de risque géographique avant la première prédiction.
+
+    Sans fichier de données, les tables sont construites au premier appel.
+    """
+    try:
+        _get_location_risk(get_dataset_version())
+    except FileNotFoundError:
+        pass
+
+
+def dataset_location_features(
+    rows: np.ndarray, history: Optional[np.ndarray] = None
+) -> Dict[str, np.ndarray]:
+    """
+    Champs de risque géographique pour des lignes du dataset.
+
+    Les tables sont interrogées une fois par zone distincte
+    (État, ville, code postal), puis le résultat est diffusé aux lignes.
+
+    Parameters
+    ----------
+    rows : np.ndarray
+        Positions des lignes dans le DataFrame
+    history : Optional[np.ndarray]
+        Lignes dont les labels alimentent les tables (défaut: tout le
+        dataset) ; les exclure de ``rows`` évite d'évaluer une ligne
+        avec son propre label
+
+    Returns
+    -------
+    Dict[str, np.ndarray]
+        location_risk et location_lift de chaque ligne
+    """
+    states = get_encoded_column("merchant_state")
+    cities = get_encoded_column("merchant_city")
+    zips = get_encoded_column("zip")
+
+    keys = np.column_stack(
+        [states.codes[rows], cities.codes[rows], zips.codes[rows]]
+    ).astype(np.int64)
+    areas, inverse = np.unique(keys, axis=0, return_inverse=True)
+    features = location_features(
+        states.labels[areas[:, 0]],
+        cities.labels[areas[:, 1]],
+        [format_zip(label) for label in zips.labels[areas[:, 2]]],
+        None if history is None else _build_location_risk(history),
+    )
+    return {name: values[inverse.ravel()] for name, values in features.items()}
+
+
+def get_location_risk(
+    merchant_state: str, merchant_city: str = "", zip_code: str = ""
+) -> Dict[str, Any]:
+    """
+    Risque de fraude historique d'une zone.
+
+    Parameters
+    ----------
+    merchant_state : str
+        État du marchand
+    merchant_city : str
+        Ville du marchand
+    zip_code : str
+        Code postal
+
+    Returns
+    -------
+    Dict[str, Any]
+        Niveau de la zone retenue (zip, city, state, ou None si inconnue),
+        transactions, fraudes, taux lissé et lift par rapport au taux global
+    """
+    try:
+        zip_label = format_zip(zip_code) if zip_code else ""
+    except ValueError:
+        raise HTTPException(status_code=400, detail=f"Code postal invalide: {zip_code}")
+
+    try:
+        risk = _get_location_risk(get_dataset_version())
+        level, position = risk.lookup(merchant_state, merchant_city, zip_label)
+        table = risk.tables[level] if level is not None else None
+        rate = float(table.rates[position]) if table is not None else risk.prior
+
+        return {
+            "level": level,
+            "transaction_count": int(table.counts[position]) if table is not None else 0,
+            "fraud_count": int(table.frauds[position]) if table is not None else 0,
+            "fraud_rate": round(rate, 6),
+            "global_rate": round(risk.prior, 6),
+            "lift": round(float(risk.lift(np.array([rate]))[0]), 3),
+        }
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Erreur lors du calcul: {str(e)}")
@@ -0,0 +1,191 @@
+"""Service des heavy hitters : top-K approximatifs par fenêtre de temps."""
+
+import threading
+from functools import lru_cache
+from typing import Any, Dict, Tuple
+
+import numpy as np
+from fastapi import HTTPException
+
+from banking_api.services.data_cache import (
+    get_cached_dataframe,
+    get_dataset_version,
+    get_timestamps,
+)
+from banking_api.services.entity_summary import format_timestamps
+from banking_api.services.space_saving import WindowedSummaries
+
+# Entités suivies : nom dans l'URL -> colonne identifiant
+HEAVY_HITTER_ENTITIES: Dict[str, str] = {
+    "merchant": "merchant_id",
+    "customer": "client_id",
+    "card": "card_id",
+}
+
+# Le volume est la somme des montants absolus : Space-Saving (surestimation
+# et borne d'erreur) suppose des poids positifs, et un remboursement déplace
+# autant d'argent qu'un achat
+HEAVY_HITTER_MEASURES: Tuple[str, ...] = ("volume", "count")
+
+# Granularité -> (durée d'un seau en secondes, nombre de seaux conservés)
+GRANULARITIES: Dict[str, Tuple[int, int]] = {
+    "hour": (3600, 48),
+    "day": (86400, 90),
+}
+
+# Fenêtre -> (granularité, nombre de seaux fusionnés)
+WINDOWS: Dict[str, Tuple[str, int]] = {
+    "1h": ("hour", 1),
+    "6h": ("hour", 6),
+    "24h": ("hour", 24),
+    "1d": ("day", 1),
+    "7d": ("day", 7),
+    "30d": ("day", 30),
+    "90d": ("day", 90),
+}
+
+# Compteurs par seau : une clé pesant plus de 1/200 du seau est garantie
+SUMMARY_CAPACITY: int = 200
+
+_lock = threading.Lock()
+
+_SummaryKey = Tuple[str, str, str]
+
+
+@lru_cache(maxsize=1)
+def _get_windows(dataset_version: str) -> Dict[_SummaryKey, WindowedSummaries]:
+    """
+    Construit les résumés de toutes les (entité, mesure, granularité).
+
+    Les fenêtres sont relatives à la transaction la plus récente du dataset,
+    puis avancent avec les transactions reçues en flux. Un rechargement du
+    dataset (nouvelle version) reconstruit les résumés.
+
+    Parameters
+    ----------
+    dataset_version : str
+        Version du dataset (clé du cache)
+
+    Returns
+    -------
+    Dict[_SummaryKey, WindowedSummaries]
+        Résumés par (entité, mesure, granularité)
+    """
+    df = get_cached_dataframe()
+    timestamps = get_timestamps()
+    amounts = df["amount"].to_numpy(dtype=float)
+    weights = {"volume": np.abs(amounts), "count": np.ones(len(df))}
+
+    windows = {}
+    for entity, column in HEAVY_HITTER_ENTITIES.items():
+        keys = df[column].to_numpy(dtype=np.int64)
+        for measure in HEAVY_HITTER_MEASURES:
+            for granularity, (seconds, retention) in GRANULARITIES.items():
+                windows[(entity, measure, granularity)] = (
+                    WindowedSummaries.from_history(
+                        timestamps,
+                        keys,
+                        weights[measure],
+                        bucket_seconds=seconds,
+                        retention=retention,
+                        capacity=SUMMARY_CAPACITY,
+                    )
+                )
+    return windows
+
+
+def record_transaction(
+    timestamp: int, amount: float, client_id: int, card_id: int, merchant_id: int
+) -> None:
+    """
+    Ajoute une transaction reçue en flux à tous les résumés.
+
+    Parameters
+    ----------
+    timestamp : int
+        Horodatage de la transaction (secondes depuis l'epoch)
+    amount : float
+        Montant de la transaction
+    client_id : int
+        Identifiant du client
+    card_id : int
+        Identifiant de la carte
+    merchant_id : int
+        Identifiant du marchand
+    """
+    ids = {"customer": client_id, "card": card_id, "merchant": merchant_id}
+    weights = {"volume": abs(amount), "count": 1.0}
+
+    windows = _get_windows(get_dataset_version())
+    with _lock:
+        for (entity, measure, _), summaries in windows.items():
+            summaries.add(timestamp, ids[entity], weights[measure])
+
+
+def get_top(
+    entity: str = "merchant", window: str = "1d", k: int = 20, by: str = "volume"
+) -> Dict[str, Any]:
+    """
+    Top K des entités sur une fenêtre de temps récente.
+
+    Les fenêtres sont alignées sur les seaux (heure ou jour) et se terminent
+    au seau le plus récent. Les valeurs sont des surestimations : la valeur
+    exacte est dans ``[value - error, value]``, et toute entité absente de la
+    liste pèse au plus ``max_error``.
+
+    Parameters
+    ----------
+    entity : str
+        "merchant", "customer" ou "card"
+    window : str
+        1h, 6h, 24h, 1d, 7d, 30d ou 90d
+    k : int
+        Nombre d'entités retournées (défaut: 20)
+    by : str
+        "volume" (somme des montants absolus) ou "count"
+
+    Returns
+    -------
+    Dict[str, Any]
+        Fenêtre, borne d'erreur et entités classées
+    """
+    if entity not in HEAVY_HITTER_ENTITIES:
+        raise HTTPException(status_code=400, detail=f"Entité invalide: {entity}")
+    if window not in WINDOWS:
+        raise HTTPException(status_code=400, detail=f"Fenêtre invalide: {window}")
+    if by not in HEAVY_HITTER_MEASURES:
+        raise HTTPException(status_code=400, detail=f"Critère invalide: {by}")
+    if not 0 < k <= SUMMARY_CAPACITY:
+        raise HTTPException(
+            status_code=400, detail=f"k doit être entre 1 et {SUMMARY_CAPACITY}"
+        )
+
+    try:
+        granularity, n_buckets = WINDOWS[window]
+        windows = _get_windows(get_dataset_version())
+        with _lock:
+            summary, start, end = windows[(entity, by, granularity)].window(n_buckets)
+
+        window_start, window_end = format_timestamps(np.array([start, end]))
+        return {
+            "entity": entity,
+            "window": window,
+            "by": by,
+            "window_start": window_start,
+            "window_end": window_end,
+            "total": round(summary.total_weight, 2),
+            "max_error": round(summary.absent_bound, 2),
+            "top": [
+                {
+                    "rank": rank,
+                    "id": key,
+                    "value": round(value, 2),
+                    "error": round(error, 2),
+                }
+                for rank, (key, value, error) in enumerate(summary.top(k), start=1)
+            ],
+        }
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Erreur lors du calcul: {str(e)}")
@@ -0,0 +1,274 @@
+"""Comptage approximatif de valeurs distinctes (HyperLogLog).
+
+Les sketches d'un ensemble de groupes sont stockés sous forme creuse : une
+entrée par couple (groupe, registre) non nul, avec le rang maximal observé.
+Fusionner des groupes (ex: plusieurs jours d'un même état) revient à
+renuméroter les groupes puis à garder le maximum par registre.
+
+Avec ``PRECISION = 12`` (4096 registres), l'erreur type est d'environ
+1,04 / sqrt(4096) ≈ 1,6 %.
+"""
+
+from typing import Iterable, NamedTuple, Optional, Tuple
+
+import numpy as np
+
+PRECISION: int = 12
+N_REGISTERS: int = 1 << PRECISION
+STANDARD_ERROR: float = 1.04 / np.sqrt(N_REGISTERS)
+
+_ALPHA: float = 0.7213 / (1 + 1.079 / N_REGISTERS)
+_SUFFIX_BITS: int = 64 - PRECISION
+
+
+class SparseSketches(NamedTuple):
+    """
+    Sketches HyperLogLog creux d'un ensemble de groupes.
+
+    Attributes
+    ----------
+    groups : np.ndarray
+        Groupe de chaque entrée (int64), trié
+    registers : np.ndarray
+        Registre de chaque entrée (trié à groupe égal)
+    ranks : np.ndarray
+        Rang maximal observé (uint8)
+    """
+
+    groups: np.ndarray
+    registers: np.ndarray
+    ranks: np.ndarray
+
+
+def hash64(values: np.ndarray) -> np.ndarray:
+    """
+    Hache des identifiants entiers sur 64 bits (splitmix64, vectorisé).
+
+    Parameters
+    ----------
+    values : np.ndarray
+        Identifiants entiers
+
+    Returns
+    -------
+    np.ndarray
+        Hachés uint64
+    """
+    with np.errstate(over="ignore"):
+        z = np.asarray(values).astype(np.int64).view(np.uint64) + np.uint64(
+            0x9E3779B97F4A7C15
+        )
+        z = (z ^ (z >> np.uint64(30))) * np.uint64(0xBF58476D1CE4E5B9)
+        z = (z ^ (z >> np.uint64(27))) * np.uint64(0x94D049BB133111EB)
+        return z ^ (z >> np.uint64(31))
+
+
+def _registers_and_ranks(hashes: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Registre (bits de poids fort) et rang (zéros de tête + 1) de chaque haché.
+
+    Parameters
+    ----------
+    hashes : np.ndarray
+        Hachés uint64
+
+    Returns
+    -------
+    Tuple[np.ndarray, np.ndarray]
+        (registres int64, rangs uint8)
+    """
+    registers = (hashes >> np.uint64(_SUFFIX_BITS)).astype(np.int64)
+    suffix = hashes & np.uint64((1 << _SUFFIX_BITS) - 1)
+
+    # frexp donne la longueur en bits (exacte : le suffixe tient sur 52 bits)
+    _, bit_length = np.frexp(suffix.astype(np.float64))
+    ranks = (_SUFFIX_BITS - bit_length + 1).astype(np.uint8)
+    return registers, ranks
+
+
+def _max_reduce(
+    groups: np.ndarray, registers: np.ndarray, ranks: np.ndarray
+) -> SparseSketches:
+    """
+    Garde le rang maximal par couple (groupe, registre), par tri.
+
+    Parameters
+    ----------
+    groups : np.ndarray
+        Groupe de chaque entrée
+    registers : np.ndarray
+        Registre de chaque entrée
+    ranks : np.ndarray
+        Rang de chaque entrée
+
+    Returns
+    -------
+    SparseSketches
+        Sketches creux triés
+    """
+    keys = groups.astype(np.int64) * N_REGISTERS + registers
+    order = np.argsort(keys, kind="stable")
+    keys = keys[order]
+    if len(keys) == 0:
+        empty = np.zeros(0, dtype=np.int64)
+        return SparseSketches(empty, empty, np.zeros(0, dtype=np.uint8))
+
+    starts = np.flatnonzero(np.concatenate(([True], keys[1:] != keys[:-1])))
+    max_ranks = np.maximum.reduceat(ranks[order], starts)
+    unique_keys = keys[starts]
+    return SparseSketches(
+        unique_keys // N_REGISTERS, unique_keys % N_REGISTERS, max_ranks
+    )
+
+
+def build_sketches(groups: np.ndarray, values: np.ndarray) -> SparseSketches:
+    """
+    Construit un sketch par groupe en une passe vectorisée.
+
+    Parameters
+    ----------
+    groups : np.ndarray
+        Groupe de chaque ligne
+    values : np.ndarray
+        Identifiant compté (ex: client_id) de chaque ligne
+
+    Returns
+    -------
+    SparseSketches
+        Sketches creux
+    """
+    registers, ranks = _registers_and_ranks(hash64(values))
+    return _max_reduce(groups, registers, ranks)
+
+
+def merge_groups(
+    sketches: SparseSketches, mapping: np.ndarray, keep: Optional[np.ndarray] = None
+) -> SparseSketches:
+    """
+    Fusionne des groupes en les renumérotant.
+
+    Parameters
+    ----------
+    sketches : SparseSketches
+        Sketches source
+    mapping : np.ndarray
+        Nouveau groupe de chaque entrée
+    keep : Optional[np.ndarray]
+        Masque des entrées conservées (ex: filtre de dates)
+
+    Returns
+    -------
+    SparseSketches
+        Sketches fusionnés
+    """
+    registers, ranks = sketches.registers, sketches.ranks
+    if keep is not None:
+        mapping, registers, ranks = mapping[keep], registers[keep], ranks[keep]
+    return _max_reduce(mapping, registers, ranks)
+
+
+def estimate(sketches: SparseSketches, n_groups: int) -> np.ndarray:
+    """
+    Estimation du nombre de valeurs distinctes de chaque groupe.
+
+    Parameters
+    ----------
+    sketches : SparseSketches
+        Sketches creux dont les groupes sont dans ``[0, n_groups)``
+    n_groups : int
+        Nombre de groupes
+
+    Returns
+    -------
+    np.ndarray
+        Cardinalité estimée de chaque groupe
+    """
+    groups = sketches.groups
+    nonzero = np.bincount(groups, minlength=n_groups)
+    harmonic = np.bincount(
+        groups, weights=np.exp2(-sketches.ranks.astype(float)), minlength=n_groups
+    )
+    zeros = N_REGISTERS - nonzero
+    harmonic = harmonic + zeros
+
+    raw = _ALPHA * N_REGISTERS**2 / harmonic
+    # Correction des petites cardinalités (linear counting)
+    with np.errstate(divide="ignore"):
+        linear = N_REGISTERS * np.log(N_REGISTERS / np.maximum(zeros, 1))
+    small = (raw <= 2.5 * N_REGISTERS) & (zeros > 0)
+    return np.where(small, linear, raw)
+
+
+class HyperLogLog:
+    """
+    Sketch HyperLogLog dense, pour les mises à jour en flux.
+
+    Parameters
+    ----------
+    registers : Optional[np.ndarray]
+        Registres initiaux (sketch vide par défaut)
+    """
+
+    def __init__(self, registers: Optional[np.ndarray] = None) -> None:
+        self.registers: np.ndarray = (
+            np.zeros(N_REGISTERS, dtype=np.uint8)
+            if registers is None
+            else registers.copy()
+        )
+
+    def add_all(self, values: Iterable[int]) -> None:
+        """
+        Ajoute un lot d'identifiants.
+
+        Parameters
+        ----------
+        values : Iterable[int]
+            Identifiants entiers
+        """
+        hashes = hash64(np.fromiter(values, dtype=np.int64))
+        registers, ranks = _registers_and_ranks(hashes)
+        np.maximum.at(self.registers, registers, ranks)
+
+    def add(self, value: int) -> None:
+        """
+        Ajoute un identifiant.
+
+        Parameters
+        ----------
+        value : int
+            Identifiant entier
+        """
+        self.add_all([value])
+
+    def merge(self, other: "HyperLogLog") -> "HyperLogLog":
+        """
+        Fusionne deux sketches.
+
+        Parameters
+        ----------
+        other : HyperLogLog
+            Sketch à fusionner
+
+        Returns
+        -------
+        HyperLogLog
+            Sketch de l'union des deux ensembles
+        """
+        return HyperLogLog(np.maximum(self.registers, other.registers))
+
+    def estimate(self) -> float:
+        """
+        Nombre approximatif de valeurs distinctes.
+
+        Returns
+        -------
+        float
+            Cardinalité estimée
+        """
+        registers = np.flatnonzero(self.registers)
+        sketches = SparseSketches(
+            np.zeros(len(registers), dtype=np.int64),
+            registers,
+            self.registers[registers],
+        )
+        return float(estimate(sketches, 1)[0])
@@ -0,0 +1,295 @@
+"""Taux de fraude historiques lissés par État, ville et code postal.
+
+Le taux brut d'une zone peu fréquentée est très bruité (1 fraude sur 2
+transactions = 50 %). Chaque taux est donc lissé (estimateur bayésien
+bêta-binomial) vers le taux de la zone parente ::
+
+    taux = (fraudes + SMOOTHING_STRENGTH * taux_parent)
+           / (transactions + SMOOTHING_STRENGTH)
+
+La zone parente d'un État est le dataset entier ; celle d'une ville ou d'un
+code postal est son État. Les taux sont précalculés dans des tableaux ; un
+dictionnaire clé -> position donne une recherche en O(1) par zone distincte
+d'un lot de transactions.
+"""
+
+from typing import Any, Dict, Hashable, NamedTuple, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+# Nombre de transactions fictives au taux parent ajoutées à chaque zone
+SMOOTHING_STRENGTH: float = 100.0
+
+# Niveaux, du plus précis au plus large
+LOCATION_LEVELS: Tuple[str, ...] = ("zip", "city", "state")
+
+
+class RiskTable(NamedTuple):
+    """
+    Taux de fraude lissés d'un niveau géographique.
+
+    Attributes
+    ----------
+    index : Dict[Hashable, int]
+        Clé de la zone -> position dans les tableaux
+    counts : np.ndarray
+        Nombre de transactions par zone
+    frauds : np.ndarray
+        Nombre de fraudes par zone
+    rates : np.ndarray
+        Taux de fraude lissé par zone (float32)
+    """
+
+    index: Dict[Hashable, int]
+    counts: np.ndarray
+    frauds: np.ndarray
+    rates: np.ndarray
+
+
+def smoothed_rates(
+    counts: np.ndarray, frauds: np.ndarray, priors: Any, strength: float
+) -> np.ndarray:
+    """
+    Taux de fraude lissés vers un taux a priori.
+
+    Parameters
+    ----------
+    counts : np.ndarray
+        Nombre de transactions par zone
+    frauds : np.ndarray
+        Nombre de fraudes par zone
+    priors : Any
+        Taux a priori (scalaire ou un par zone)
+    strength : float
+        Poids de l'a priori, en nombre de transactions
+
+    Returns
+    -------
+    np.ndarray
+        Taux lissés
+    """
+    return (frauds + strength * np.asarray(priors, dtype=float)) / (counts + strength)
+
+
+def _child_table(
+    fraud: np.ndarray,
+    state_codes: np.ndarray,
+    state_labels: Sequence[str],
+    state_rates: np.ndarray,
+    child_codes: np.ndarray,
+    child_labels: Sequence[str],
+    strength: float,
+) -> RiskTable:
+    """Table des zones (État, ville) ou (État, code postal)."""
+    n_children = len(child_labels)
+    pairs, inverse = np.unique(
+        state_codes.astype(np.int64) * n_children + child_codes, return_inverse=True
+    )
+    counts = np.bincount(inverse, minlength=len(pairs))
+    frauds = np.bincount(inverse, weights=fraud, minlength=len(pairs))
+    parents = pairs // n_children
+    rates = smoothed_rates(counts, frauds, state_rates[parents], strength)
+
+    index = {
+        (state_labels[parent], child_labels[child]): i
+        for i, (parent, child) in enumerate(zip(parents, pairs % n_children))
+        if child_labels[child] != ""
+    }
+    return RiskTable(index, counts, frauds.astype(np.int64), rates.astype(np.float32))
+
+
+def factorize_labels(values: Sequence[Any]) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Codes entiers de libellés, les valeurs manquantes valant "".
+
+    Parameters
+    ----------
+    values : Sequence[Any]
+        Libellés (None ou NaN si manquant)
+
+    Returns
+    -------
+    Tuple[np.ndarray, np.ndarray]
+        (code de chaque valeur, libellés distincts) avec
+        ``libellés[codes]`` égal aux valeurs d'origine
+    """
+    codes, uniques = pd.factorize(np.asarray(values, dtype=object))
+    # Code -1 des valeurs manquantes : pointe sur le "" ajouté en dernier
+    return codes, np.append(np.asarray(uniques, dtype=object), "")
+
+
+class LocationRisk:
+    """
+    Tables de risque par État, ville et code postal.
+
+    Parameters
+    ----------
+    prior : float
+        Taux de fraude global
+    tables : Dict[str, RiskTable]
+        Table de chaque niveau ("state", "city", "zip")
+    """
+
+    def __init__(self, prior: float, tables: Dict[str, RiskTable]) -> None:
+        self.prior: float = prior
+        self.tables: Dict[str, RiskTable] = tables
+
+    @classmethod
+    def from_history(
+        cls,
+        fraud: np.ndarray,
+        state_codes: np.ndarray,
+        state_labels: Sequence[str],
+        city_codes: np.ndarray,
+        city_labels: Sequence[str],
+        zip_codes: np.ndarray,
+        zip_labels: Sequence[str],
+        strength: float = SMOOTHING_STRENGTH,
+    ) -> "LocationRisk":
+        """
+        Précalcule les tables à partir de l'historique (vectorisé).
+
+        Parameters
+        ----------
+        fraud : np.ndarray
+            1 si la transaction est frauduleuse, 0 sinon
+        state_codes : np.ndarray
+            Code de l'État du marchand de chaque transaction
+        state_labels : Sequence[str]
+            Libellé de chaque code d'État ("" si manquant)
+        city_codes : np.ndarray
+            Code de la ville du marchand de chaque transaction
+        city_labels : Sequence[str]
+            Libellé de chaque code de ville ("" si manquant)
+        zip_codes : np.ndarray
+            Code du code postal de chaque transaction
+        zip_labels : Sequence[str]
+            Code postal sur 5 chiffres de chaque code ("" si manquant)
+        strength : float
+            Poids de l'a priori, en nombre de transactions
+
+        Returns
+        -------
+        LocationRisk
+            Tables de risque des trois niveaux
+        """
+        fraud = fraud.astype(float)
+        prior = float(fraud.mean()) if len(fraud) else 0.0
+
+        n_states = len(state_labels)
+        counts = np.bincount(state_codes, minlength=n_states)
+        frauds = np.bincount(state_codes, weights=fraud, minlength=n_states)
+        state_rates = smoothed_rates(counts, frauds, prior, strength)
+        states = RiskTable(
+            {label: i for i, label in enumerate(state_labels) if label != ""},
+            counts,
+            frauds.astype(np.int64),
+            state_rates.astype(np.float32),
+        )
+
+        parent = (fraud, state_codes, state_labels, state_rates)
+        return cls(
+            prior,
+            {
+                "state": states,
+                "city": _child_table(*parent, city_codes, city_labels, strength),
+                "zip": _child_table(*parent, zip_codes, zip_labels, strength),
+            },
+        )
+
+    @staticmethod
+    def _key(level: str, state: str, city: str, zip_code: str) -> Optional[Hashable]:
+        """Clé d'une transaction dans la table d'un niveau (None si non renseignée)."""
+        if level == "state":
+            return state or None
+        child = zip_code if level == "zip" else city
+        return (state, child) if child else None
+
+    def lookup(
+        self, state: str, city: str = "", zip_code: str = ""
+    ) -> Tuple[Optional[str], int]:
+        """
+        Zone la plus précise connue pour une transaction.
+
+        Parameters
+        ----------
+        state : str
+            État du marchand
+        city : str
+            Ville du marchand
+        zip_code : str
+            Code postal sur 5 chiffres
+
+        Returns
+        -------
+        Tuple[Optional[str], int]
+            (niveau, position dans sa table), ou (None, -1) si la zone
+            est inconnue
+        """
+        for level in LOCATION_LEVELS:
+            key = self._key(level, state, city, zip_code)
+            position = self.tables[level].index.get(key, -1) if key else -1
+            if position >= 0:
+                return level, position
+        return None, -1
+
+    def risk(
+        self,
+        states: Sequence[str],
+        cities: Sequence[str],
+        zip_codes: Sequence[str],
+    ) -> np.ndarray:
+        """
+        Taux de fraude lissé de la zone de chaque transaction.
+
+        Parameters
+        ----------
+        states : Sequence[str]
+            État du marchand de chaque transaction
+        cities : Sequence[str]
+            Ville du marchand de chaque transaction
+        zip_codes : Sequence[str]
+            Code postal de chaque transaction ("" si inconnu)
+
+        Returns
+        -------
+        np.ndarray
+            Taux de la zone connue la plus précise, taux global sinon
+        """
+        if len(states) == 0:
+            return np.zeros(0)
+
+        # Une recherche par zone (État, ville, code postal) distincte
+        columns = [factorize_labels(values) for values in (states, cities, zip_codes)]
+        areas, inverse = np.unique(
+            np.column_stack([codes for codes, _ in columns]), axis=0, return_inverse=True
+        )
+        state_labels, city_labels, zip_labels = (labels for _, labels in columns)
+
+        rates = np.full(len(areas), self.prior)
+        for i, (state, city, zip_code) in enumerate(areas):
+            level, position = self.lookup(
+                state_labels[state], city_labels[city], zip_labels[zip_code]
+            )
+            if level is not None:
+                rates[i] = self.tables[level].rates[position]
+        return rates[inverse.reshape(-1)]
+
+    def lift(self, rates: np.ndarray) -> np.ndarray:
+        """
+        Rapport entre des taux de zone et le taux global.
+
+        Parameters
+        ----------
+        rates : np.ndarray
+            Taux de fraude lissés
+
+        Returns
+        -------
+        np.ndarray
+            Lift (1 si le dataset ne contient aucune fraude)
+        """
+        if self.prior == 0:
+            return np.ones(len(rates))
+        return rates / self.prior
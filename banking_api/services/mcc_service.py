@@ -0,0 +1,158 @@
+"""Service d'analyse par catégorie de marchand (code MCC)."""
+
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+from fastapi import HTTPException
+
+from banking_api.services.aggregation_service import (
+    aggregate,
+    build_filters,
+    top_k_indices,
+)
+
+# Critères de tri -> métrique de l'agrégation
+MCC_SORTS: Dict[str, str] = {
+    "volume": "sum",
+    "count": "count",
+    "avg_ticket": "mean",
+    "fraud_count": "fraud_count",
+    "fraud_rate": "fraud_rate",
+}
+
+_MCC_METRICS = ("count", "sum", "mean", "fraud_count", "fraud_rate")
+
+
+def _mcc_row(columns: Dict[str, np.ndarray], i: int, base_rate: float) -> Dict[str, Any]:
+    """
+    Formate les statistiques d'un MCC.
+
+    Parameters
+    ----------
+    columns : Dict[str, np.ndarray]
+        Agrégats par MCC
+    i : int
+        Position du MCC dans les agrégats
+    base_rate : float
+        Taux de fraude global (pour le lift)
+
+    Returns
+    -------
+    Dict[str, Any]
+        Statistiques du MCC
+    """
+    fraud_rate = float(columns["fraud_rate"][i])
+    return {
+        "mcc": int(columns["mcc"][i]),
+        "count": int(columns["count"][i]),
+        "total_amount": round(float(columns["sum"][i]), 2),
+        "avg_amount": round(float(columns["mean"][i]), 2),
+        "fraud_count": int(columns["fraud_count"][i]),
+        "fraud_rate": round(fraud_rate, 5),
+        "fraud_lift": round(fraud_rate / base_rate, 3) if base_rate > 0 else 0.0,
+    }
+
+
+def _base_fraud_rate(columns: Dict[str, np.ndarray]) -> float:
+    """Taux de fraude de l'ensemble des lignes agrégées."""
+    total = float(columns["count"].sum())
+    return float(columns["fraud_count"].sum()) / total if total > 0 else 0.0
+
+
+def get_mcc_stats(
+    sort: str = "volume",
+    limit: Optional[int] = None,
+    min_count: int = 1,
+    type_filter: Optional[str] = None,
+    start_date: Optional[str] = None,
+    end_date: Optional[str] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Volume, nombre, ticket moyen et fraude par MCC.
+
+    Le ``fraud_lift`` compare le taux de fraude du MCC au taux global :
+    trié par ``fraud_rate`` avec un ``min_count`` suffisant, la liste donne
+    les catégories les plus risquées.
+
+    Parameters
+    ----------
+    sort : str
+        Tri décroissant : volume, count, avg_ticket, fraud_count, fraud_rate
+    limit : Optional[int]
+        Nombre maximum de MCC retournés
+    min_count : int
+        Nombre minimum de transactions pour figurer (défaut: 1)
+    type_filter : Optional[str]
+        Filtrer par type de transaction
+    start_date : Optional[str]
+        Date de début incluse (YYYY-MM-DD)
+    end_date : Optional[str]
+        Date de fin incluse (YYYY-MM-DD)
+
+    Returns
+    -------
+    List[Dict[str, Any]]
+        Statistiques par MCC
+    """
+    if sort not in MCC_SORTS:
+        raise HTTPException(status_code=400, detail=f"Critère de tri invalide: {sort}")
+    if limit is not None and limit <= 0:
+        raise HTTPException(status_code=400, detail="limit doit être positif")
+
+    filters = build_filters(type_filter, start_date=start_date, end_date=end_date)
+
+    try:
+        columns = aggregate(("mcc",), _MCC_METRICS, filters)
+        base_rate = _base_fraud_rate(columns)
+
+        eligible = np.flatnonzero(columns["count"] >= min_count)
+        values = columns[MCC_SORTS[sort]][eligible]
+        selected = eligible[
+            top_k_indices(values, len(values) if limit is None else limit)
+        ]
+        return [_mcc_row(columns, i, base_rate) for i in selected]
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Erreur lors du calcul: {str(e)}")
+
+
+def get_mcc_detail(mcc: int) -> Dict[str, Any]:
+    """
+    Statistiques d'un MCC et tendance mensuelle.
+
+    Parameters
+    ----------
+    mcc : int
+        Code MCC
+
+    Returns
+    -------
+    Dict[str, Any]
+        Statistiques du MCC et activité par mois
+    """
+    try:
+        columns = aggregate(("mcc",), _MCC_METRICS)
+        positions = np.flatnonzero(columns["mcc"] == mcc)
+        if len(positions) == 0:
+            raise HTTPException(status_code=404, detail="MCC non trouvé")
+
+        detail = _mcc_row(columns, int(positions[0]), _base_fraud_rate(columns))
+
+        monthly = aggregate(("mcc", "month"), _MCC_METRICS)
+        rows = np.flatnonzero(monthly["mcc"] == mcc)
+        detail["trend"] = [
+            {
+                "month": str(monthly["month"][i]),
+                "count": int(monthly["count"][i]),
+                "total_amount": round(float(monthly["sum"][i]), 2),
+                "fraud_count": int(monthly["fraud_count"][i]),
+                "fraud_rate": round(float(monthly["fraud_rate"][i]), 5),
+            }
+            for i in rows
+        ]
+        return detail
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Erreur lors du calcul: {str(e)}")
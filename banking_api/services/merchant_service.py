@@ -0,0 +1,206 @@
+"""Service des profils et statistiques marchands."""
+
+from typing import Any, Dict, List
+
+import numpy as np
+import pandas as pd
+from fastapi import HTTPException
+
+from banking_api.services.data_cache import (
+    get_cached_dataframe,
+    get_encoded_column,
+    get_merchant_ranking,
+    get_merchant_summary,
+    get_row_index,
+)
+
+# Critères de tri de la liste -> colonne de la table de synthèse
+MERCHANT_SORT_COLUMNS: Dict[str, str] = {
+    "volume": "total_amount",
+    "count": "transaction_count",
+    "fraud_rate": "fraud_rate",
+    "avg_ticket": "avg_amount",
+    "customers": "distinct_customers",
+}
+
+
+def _summary_row(merchant_id: int, row: pd.Series) -> Dict[str, Any]:
+    """
+    Formate une ligne de la table de synthèse marchand.
+
+    Parameters
+    ----------
+    merchant_id : int
+        Identifiant du marchand
+    row : pd.Series
+        Ligne de la table de synthèse
+
+    Returns
+    -------
+    Dict[str, Any]
+        Statistiques agrégées du marchand
+    """
+    return {
+        "merchant_id": int(merchant_id),
+        "transaction_count": int(row["transaction_count"]),
+        "total_amount": round(float(row["total_amount"]), 2),
+        "avg_amount": round(float(row["avg_amount"]), 2),
+        "fraud_count": int(row["fraud_count"]),
+        "fraud_rate": round(float(row["fraud_rate"]), 5),
+        "top_mcc": int(row["top_mcc"]),
+        "top_city": str(row["top_city"]),
+        "distinct_cities": int(row["distinct_cities"]),
+        "distinct_customers": int(row["distinct_customers"]),
+    }
+
+
+def get_merchants(page: int = 1, limit: int = 10, sort: str = "id") -> Dict[str, Any]:
+    """
+    Liste paginée des marchands avec leurs statistiques.
+
+    Parameters
+    ----------
+    page : int
+        Numéro de la page (défaut: 1)
+    limit : int
+        Nombre de marchands par page (défaut: 10)
+    sort : str
+        "id" (croissant) ou critère décroissant : volume, count, fraud_rate,
+        avg_ticket, customers
+
+    Returns
+    -------
+    Dict[str, Any]
+        Page, limite, total, critère de tri et marchands de la page
+    """
+    if sort != "id" and sort not in MERCHANT_SORT_COLUMNS:
+        raise HTTPException(status_code=400, detail=f"Critère de tri invalide: {sort}")
+    if page < 1 or limit < 1:
+        raise HTTPException(status_code=400, detail="page et limit doivent être positifs")
+
+    try:
+        summary = get_merchant_summary()
+        start = (page - 1) * limit
+
+        if sort == "id":
+            page_rows = summary.iloc[start : start + limit]
+        else:
+            positions = get_merchant_ranking(MERCHANT_SORT_COLUMNS[sort])
+            page_rows = summary.iloc[positions[start : start + limit]]
+
+        return {
+            "page": page,
+            "limit": limit,
+            "total": len(summary),
+            "sort": sort,
+            "merchants": [_summary_row(i, row) for i, row in page_rows.iterrows()],
+        }
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Erreur lors du calcul: {str(e)}")
+
+
+def _daily_trend(rows: np.ndarray) -> List[Dict[str, Any]]:
+    """
+    Activité par jour d'un ensemble de lignes.
+
+    Parameters
+    ----------
+    rows : np.ndarray
+        Positions des lignes dans le dataset
+
+    Returns
+    -------
+    List[Dict[str, Any]]
+        Nombre, montant moyen et total par jour, dans l'ordre chronologique
+    """
+    days = get_encoded_column("day")
+    amounts = get_cached_dataframe()["amount"].to_numpy(dtype=float)[rows]
+    day_codes, inverse = np.unique(days.codes[rows], return_inverse=True)
+    counts = np.bincount(inverse)
+    totals = np.bincount(inverse, weights=amounts)
+
+    return [
+        {
+            "day": days.labels[code],
+            "count": int(count),
+            "avg_amount": round(float(total / count), 2),
+            "total_amount": round(float(total), 2),
+        }
+        for code, count, total in zip(day_codes, counts, totals)
+    ]
+
+
+def _cities(rows: np.ndarray) -> List[Dict[str, Any]]:
+    """
+    Villes d'un ensemble de lignes, par fréquence décroissante.
+
+    Parameters
+    ----------
+    rows : np.ndarray
+        Positions des lignes dans le dataset
+
+    Returns
+    -------
+    List[Dict[str, Any]]
+        Ville et nombre de transactions
+    """
+    cities = get_encoded_column("merchant_city")
+    city_codes, counts = np.unique(cities.codes[rows], return_counts=True)
+    order = np.argsort(-counts, kind="stable")
+    return [
+        {"city": str(cities.labels[city_codes[i]]), "count": int(counts[i])}
+        for i in order
+    ]
+
+
+def get_merchant_profile(merchant_id: str) -> Dict[str, Any]:
+    """
+    Profil détaillé d'un marchand.
+
+    Les agrégats viennent de la table de synthèse ; villes et tendance
+    journalière sont calculées sur la seule tranche de lignes du marchand.
+
+    Parameters
+    ----------
+    merchant_id : str
+        Identifiant du marchand
+
+    Returns
+    -------
+    Dict[str, Any]
+        Statistiques du marchand, villes et activité par jour
+    """
+    try:
+        key = int(merchant_id)
+    except ValueError:
+        raise HTTPException(status_code=404, detail="Marchand non trouvé")
+
+    try:
+        summary = get_merchant_summary()
+        if key not in summary.index:
+            raise HTTPException(status_code=404, detail="Marchand non trouvé")
+
+        position = summary.index.get_loc(key)
+        row = summary.iloc[position]
+        index = get_row_index("merchant_id")
+        rows = index.rows[index.offsets[position] : index.offsets[position + 1]]
+
+        profile = _summary_row(key, row)
+        profile.update(
+            {
+                "min_amount": round(float(row["min_amount"]), 2),
+                "max_amount": round(float(row["max_amount"]), 2),
+                "first_date": row["first_date"],
+                "last_date": row["last_date"],
+                "distinct_cards": int(row["distinct_cards"]),
+                "cities": _cities(rows),
+                "daily_trend": _daily_trend(rows),
+            }
+        )
+        return profile
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Erreur lors du calcul: {str(e)}")
@@ -0,0 +1,211 @@
+"""Sketch de quantiles à erreur relative bornée (type DDSketch).
+
+Chaque valeur est rangée dans un seau logarithmique de raison
+``gamma = (1 + alpha) / (1 - alpha)``. Le représentant d'un seau est à
+moins de ``alpha`` (1 %) en relatif de toute valeur du seau, donc tout
+quantile renvoyé est à moins de 1 % de la valeur exacte de même rang.
+
+Les seaux ont une disposition fixe, commune à tous les sketches : fusionner
+deux sketches (groupes ou shards) revient à additionner leurs compteurs, et
+construire un sketch par groupe se fait en un seul ``bincount``.
+
+Limites documentées :
+- les valeurs dont la valeur absolue est inférieure à ``MIN_VALUE`` sont
+  comptées dans un seau zéro et restituées comme 0 ;
+- les valeurs au-delà de ``MAX_VALUE`` sont ramenées dans le dernier seau.
+"""
+
+from typing import Iterable, Optional, Sequence
+
+import numpy as np
+
+RELATIVE_ACCURACY: float = 0.01
+MIN_VALUE: float = 0.01
+MAX_VALUE: float = 1e7
+
+_GAMMA: float = (1 + RELATIVE_ACCURACY) / (1 - RELATIVE_ACCURACY)
+_LOG_GAMMA: float = float(np.log(_GAMMA))
+_KEY_MIN: int = int(np.ceil(np.log(MIN_VALUE) / _LOG_GAMMA))
+_KEY_MAX: int = int(np.ceil(np.log(MAX_VALUE) / _LOG_GAMMA))
+_KEYS_PER_SIGN: int = _KEY_MAX - _KEY_MIN + 1
+
+# Seaux : négatifs (décroissants en valeur absolue), zéro, puis positifs
+N_BINS: int = 2 * _KEYS_PER_SIGN + 1
+_ZERO_BIN: int = _KEYS_PER_SIGN
+
+
+def _bin_values() -> np.ndarray:
+    """
+    Valeur représentative de chaque seau, dans l'ordre croissant.
+
+    Returns
+    -------
+    np.ndarray
+        Représentants des ``N_BINS`` seaux
+    """
+    keys = np.arange(_KEY_MIN, _KEY_MAX + 1)
+    magnitudes = 2 * _GAMMA**keys / (_GAMMA + 1)
+    return np.concatenate((-magnitudes[::-1], [0.0], magnitudes))
+
+
+BIN_VALUES: np.ndarray = _bin_values()
+
+
+def bin_indices(values: np.ndarray) -> np.ndarray:
+    """
+    Seau de chaque valeur (vectorisé).
+
+    Parameters
+    ----------
+    values : np.ndarray
+        Valeurs à ranger
+
+    Returns
+    -------
+    np.ndarray
+        Indice de seau (int64) dans ``[0, N_BINS)``
+    """
+    values = np.asarray(values, dtype=float)
+    magnitude = np.clip(np.abs(values), MIN_VALUE, MAX_VALUE)
+    key_index = np.ceil(np.log(magnitude) / _LOG_GAMMA).astype(np.int64) - _KEY_MIN
+    key_index = np.clip(key_index, 0, _KEYS_PER_SIGN - 1)
+
+    bins = np.where(values > 0, _ZERO_BIN + 1 + key_index, _ZERO_BIN - 1 - key_index)
+    return np.where(np.abs(values) < MIN_VALUE, _ZERO_BIN, bins)
+
+
+def grouped_bin_counts(
+    codes: np.ndarray, n_groups: int, values: np.ndarray
+) -> np.ndarray:
+    """
+    Construit un sketch par groupe en une seule passe.
+
+    Parameters
+    ----------
+    codes : np.ndarray
+        Code de groupe de chaque valeur
+    n_groups : int
+        Nombre de groupes
+    values : np.ndarray
+        Valeurs à résumer
+
+    Returns
+    -------
+    np.ndarray
+        Matrice (n_groups, N_BINS) des compteurs (uint32)
+    """
+    flat = codes.astype(np.int64) * N_BINS + bin_indices(values)
+    counts = np.bincount(flat, minlength=n_groups * N_BINS)
+    return counts.reshape(n_groups, N_BINS).astype(np.uint32)
+
+
+def quantiles_from_counts(counts: np.ndarray, quantiles: Sequence[float]) -> np.ndarray:
+    """
+    Quantiles de plusieurs sketches à la fois.
+
+    Parameters
+    ----------
+    counts : np.ndarray
+        Matrice (n_groups, N_BINS) des compteurs
+    quantiles : Sequence[float]
+        Quantiles demandés, dans [0, 1]
+
+    Returns
+    -------
+    np.ndarray
+        Matrice (n_groups, len(quantiles)) ; NaN pour un groupe vide
+    """
+    counts = np.atleast_2d(counts)
+    cumulative = np.cumsum(counts, axis=1, dtype=np.int64)
+    totals = cumulative[:, -1]
+
+    result = np.full((len(counts), len(quantiles)), np.nan)
+    for j, q in enumerate(quantiles):
+        # Rang (0-based) de l'élément cherché, puis premier seau qui le contient
+        rank = np.floor(q * (totals - 1))
+        positions = (cumulative <= rank[:, None]).sum(axis=1)
+        positions = np.minimum(positions, N_BINS - 1)
+        result[:, j] = np.where(totals > 0, BIN_VALUES[positions], np.nan)
+    return result
+
+
+class QuantileSketch:
+    """
+    Sketch de quantiles fusionnable à erreur relative de 1 %.
+
+    Parameters
+    ----------
+    counts : Optional[np.ndarray]
+        Compteurs par seau (sketch vide par défaut)
+    """
+
+    def __init__(self, counts: Optional[np.ndarray] = None) -> None:
+        self.counts: np.ndarray = (
+            np.zeros(N_BINS, dtype=np.uint32) if counts is None else counts.copy()
+        )
+
+    @classmethod
+    def from_values(cls, values: Iterable[float]) -> "QuantileSketch":
+        """
+        Construit un sketch à partir d'un ensemble de valeurs.
+
+        Parameters
+        ----------
+        values : Iterable[float]
+            Valeurs à résumer
+
+        Returns
+        -------
+        QuantileSketch
+            Sketch des valeurs
+        """
+        indices = bin_indices(np.fromiter(values, dtype=float))
+        return cls(np.bincount(indices, minlength=N_BINS).astype(np.uint32))
+
+    @property
+    def count(self) -> int:
+        """Nombre de valeurs résumées."""
+        return int(self.counts.sum())
+
+    def add(self, value: float) -> None:
+        """
+        Ajoute une valeur (mise à jour en flux).
+
+        Parameters
+        ----------
+        value : float
+            Valeur à ajouter
+        """
+        self.counts[bin_indices(np.array([value]))[0]] += 1
+
+    def merge(self, other: "QuantileSketch") -> "QuantileSketch":
+        """
+        Fusionne deux sketches (groupes ou shards différents).
+
+        Parameters
+        ----------
+        other : QuantileSketch
+            Sketch à fusionner
+
+        Returns
+        -------
+        QuantileSketch
+            Nouveau sketch résumant l'union des deux ensembles
+        """
+        return QuantileSketch(self.counts + other.counts)
+
+    def quantiles(self, quantiles: Sequence[float]) -> np.ndarray:
+        """
+        Quantiles approchés du sketch.
+
+        Parameters
+        ----------
+        quantiles : Sequence[float]
+            Quantiles demandés, dans [0, 1]
+
+        Returns
+        -------
+        np.ndarray
+            Valeurs approchées (NaN si le sketch est vide)
+        """
+        return quantiles_from_counts(self.counts, quantiles)[0]
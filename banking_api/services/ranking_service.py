@@ -0,0 +1,108 @@
+"""Service de classements (top-K) des clients, marchands et cartes."""
+
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+from fastapi import HTTPException
+
+from banking_api.services.aggregation_service import (
+    aggregate,
+    build_filters,
+    top_k_indices,
+)
+
+# Entités classables : nom dans l'URL -> colonne identifiant
+RANKING_ENTITIES: Dict[str, str] = {
+    "customers": "client_id",
+    "merchants": "merchant_id",
+    "cards": "card_id",
+}
+
+# Critères de classement -> métrique de l'agrégation
+RANKING_CRITERIA: Dict[str, str] = {
+    "volume": "sum",
+    "count": "count",
+    "fraud_count": "fraud_count",
+    "fraud_rate": "fraud_rate",
+    "avg_ticket": "mean",
+}
+
+_RANKING_METRICS = ("count", "sum", "mean", "fraud_count", "fraud_rate")
+
+
+def rank_entities(
+    entity: str,
+    n: int = 10,
+    by: str = "volume",
+    type_filter: Optional[str] = None,
+    merchant_state: Optional[str] = None,
+    start_date: Optional[str] = None,
+    end_date: Optional[str] = None,
+    min_count: int = 1,
+) -> List[Dict[str, Any]]:
+    """
+    Top N des entités selon un critère, avec filtres optionnels.
+
+    Les agrégats par entité sont calculés une fois par (filtres, version du
+    dataset) puis mis en cache ; chaque classement est ensuite une sélection
+    ``argpartition`` en O(nombre d'entités).
+
+    Parameters
+    ----------
+    entity : str
+        "customers", "merchants" ou "cards"
+    n : int
+        Nombre d'entités retournées (défaut: 10)
+    by : str
+        Critère : volume, count, fraud_count, fraud_rate ou avg_ticket
+    type_filter : Optional[str]
+        Filtrer par type de transaction
+    merchant_state : Optional[str]
+        Filtrer par état du marchand
+    start_date : Optional[str]
+        Date de début incluse (YYYY-MM-DD)
+    end_date : Optional[str]
+        Date de fin incluse (YYYY-MM-DD)
+    min_count : int
+        Nombre minimum de transactions pour être classé (défaut: 1)
+
+    Returns
+    -------
+    List[Dict[str, Any]]
+        Entités classées avec leurs statistiques
+    """
+    if entity not in RANKING_ENTITIES:
+        raise HTTPException(status_code=400, detail=f"Entité invalide: {entity}")
+    if by not in RANKING_CRITERIA:
+        raise HTTPException(status_code=400, detail=f"Critère invalide: {by}")
+    if n <= 0:
+        raise HTTPException(status_code=400, detail="n doit être positif")
+
+    filters = build_filters(
+        type_filter, merchant_state, start_date=start_date, end_date=end_date
+    )
+
+    try:
+        id_column = RANKING_ENTITIES[entity]
+        columns = aggregate((id_column,), _RANKING_METRICS, filters)
+
+        eligible = np.flatnonzero(columns["count"] >= min_count)
+        criterion = columns[RANKING_CRITERIA[by]][eligible]
+        selected = eligible[top_k_indices(criterion, n)]
+
+        return [
+            {
+                "rank": rank,
+                "id": int(columns[id_column][i]),
+                "transaction_count": int(columns["count"][i]),
+                "total_amount": round(float(columns["sum"][i]), 2),
+                "avg_amount": round(float(columns["mean"][i]), 2),
+                "fraud_count": int(columns["fraud_count"][i]),
+                "fraud_rate": round(float(columns["fraud_rate"][i]), 5),
+            }
+            for rank, i in enumerate(selected, start=1)
+        ]
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Erreur lors du calcul: {str(e)}")
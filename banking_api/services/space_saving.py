@@ -0,0 +1,318 @@
+"""Résumés Space-Saving pondérés pour les top-K approximatifs (heavy hitters).
+
+Un résumé garde au plus ``capacity`` compteurs. Pour une clé présente,
+``counts`` surestime la valeur exacte d'au plus ``errors``. Pour une clé
+absente, la valeur exacte est au plus ``absent_bound``. Avec ``W`` le poids
+total résumé, on a ``absent_bound <= W / capacity`` : toute clé pesant plus
+de ``W / capacity`` est présente dans le résumé.
+
+Les résumés sont fusionnables (Agarwal et al., "Mergeable summaries") :
+les fenêtres temporelles sont obtenues en fusionnant des résumés par seau.
+"""
+
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+
+class SpaceSaving:
+    """
+    Résumé Space-Saving pondéré, fusionnable.
+
+    Parameters
+    ----------
+    capacity : int
+        Nombre maximum de compteurs
+    """
+
+    def __init__(self, capacity: int) -> None:
+        self.capacity: int = capacity
+        self.keys: np.ndarray = np.zeros(0, dtype=np.int64)
+        self.counts: np.ndarray = np.zeros(0, dtype=float)
+        self.errors: np.ndarray = np.zeros(0, dtype=float)
+        self.absent_bound: float = 0.0
+        self.total_weight: float = 0.0
+
+    @classmethod
+    def from_exact(
+        cls, keys: np.ndarray, weights: np.ndarray, capacity: int
+    ) -> "SpaceSaving":
+        """
+        Résumé d'agrégats exacts : on garde les ``capacity`` plus lourds.
+
+        Parameters
+        ----------
+        keys : np.ndarray
+            Clés distinctes
+        weights : np.ndarray
+            Poids exact de chaque clé
+        capacity : int
+            Nombre maximum de compteurs
+
+        Returns
+        -------
+        SpaceSaving
+            Résumé (erreurs nulles pour les clés conservées)
+        """
+        summary = cls(capacity)
+        summary.total_weight = float(weights.sum())
+        order = np.argsort(-weights, kind="stable")
+        kept, dropped = order[:capacity], order[capacity:]
+        summary.keys = keys[kept].astype(np.int64)
+        summary.counts = weights[kept].astype(float)
+        summary.errors = np.zeros(len(kept))
+        summary.absent_bound = float(weights[dropped].max()) if len(dropped) else 0.0
+        return summary
+
+    def update(self, key: int, weight: float = 1.0) -> None:
+        """
+        Ajoute une observation (algorithme Space-Saving).
+
+        Parameters
+        ----------
+        key : int
+            Clé observée
+        weight : float
+            Poids de l'observation (1 pour un comptage)
+        """
+        self.total_weight += weight
+        position = np.flatnonzero(self.keys == key)
+        if len(position):
+            self.counts[position[0]] += weight
+            return
+
+        if len(self.keys) < self.capacity:
+            self.keys = np.append(self.keys, key)
+            self.counts = np.append(self.counts, self.absent_bound + weight)
+            self.errors = np.append(self.errors, self.absent_bound)
+            return
+
+        # Remplace le plus petit compteur, qui devient la borne des absents
+        smallest = int(np.argmin(self.counts))
+        minimum = float(self.counts[smallest])
+        self.absent_bound = max(self.absent_bound, minimum)
+        self.keys[smallest] = key
+        self.counts[smallest] = minimum + weight
+        self.errors[smallest] = minimum
+
+    def merge(self, other: "SpaceSaving") -> "SpaceSaving":
+        """
+        Fusionne deux résumés (ex: deux seaux de temps).
+
+        Parameters
+        ----------
+        other : SpaceSaving
+            Résumé à fusionner
+
+        Returns
+        -------
+        SpaceSaving
+            Résumé de l'union des deux flux
+        """
+        return merge_all([self, other], max(self.capacity, other.capacity))
+
+    def top(self, k: int) -> List[Tuple[int, float, float]]:
+        """
+        Les ``k`` clés les plus lourdes.
+
+        Parameters
+        ----------
+        k : int
+            Nombre de clés
+
+        Returns
+        -------
+        List[Tuple[int, float, float]]
+            (clé, estimation, erreur maximale) par estimation décroissante
+        """
+        order = np.argsort(-self.counts, kind="stable")[:k]
+        return [
+            (int(self.keys[i]), float(self.counts[i]), float(self.errors[i]))
+            for i in order
+        ]
+
+
+def merge_all(
+    summaries: List[SpaceSaving], capacity: Optional[int] = None
+) -> SpaceSaving:
+    """
+    Fusionne une liste de résumés en une passe vectorisée.
+
+    Une clé absente d'un résumé y compte pour sa borne ``absent_bound``
+    (en estimation comme en erreur), ce qui préserve la surestimation.
+
+    Parameters
+    ----------
+    summaries : List[SpaceSaving]
+        Résumés à fusionner
+    capacity : Optional[int]
+        Capacité du résultat (défaut: la plus grande des capacités)
+
+    Returns
+    -------
+    SpaceSaving
+        Résumé fusionné
+    """
+    capacity = capacity or max((s.capacity for s in summaries), default=1)
+    merged = SpaceSaving(capacity)
+    if not summaries:
+        return merged
+
+    all_keys = np.concatenate([s.keys for s in summaries])
+    keys, inverse = np.unique(all_keys, return_inverse=True)
+    bound_total = sum(s.absent_bound for s in summaries)
+
+    # Part des résumés où la clé est présente, puis bornes des autres
+    counts = np.full(len(keys), bound_total)
+    errors = np.full(len(keys), bound_total)
+    offset = 0
+    for summary in summaries:
+        positions = inverse[offset : offset + len(summary.keys)]
+        counts[positions] += summary.counts - summary.absent_bound
+        errors[positions] += summary.errors - summary.absent_bound
+        offset += len(summary.keys)
+
+    order = np.argsort(-counts, kind="stable")
+    kept, dropped = order[:capacity], order[capacity:]
+    merged.keys = keys[kept]
+    merged.counts = counts[kept]
+    merged.errors = errors[kept]
+    merged.absent_bound = max(
+        bound_total, float(counts[dropped].max()) if len(dropped) else 0.0
+    )
+    merged.total_weight = sum(s.total_weight for s in summaries)
+    return merged
+
+
+class WindowedSummaries:
+    """
+    Résumés Space-Saving par seau de temps, sur une rétention glissante.
+
+    Seuls les ``retention`` seaux les plus récents sont conservés : la mémoire
+    est bornée par ``retention * capacity`` compteurs.
+
+    Parameters
+    ----------
+    bucket_seconds : int
+        Durée d'un seau (ex: 3600 pour l'heure)
+    retention : int
+        Nombre de seaux conservés
+    capacity : int
+        Nombre maximum de compteurs par seau
+    """
+
+    def __init__(self, bucket_seconds: int, retention: int, capacity: int) -> None:
+        self.bucket_seconds: int = bucket_seconds
+        self.retention: int = retention
+        self.capacity: int = capacity
+        self.buckets: Dict[int, SpaceSaving] = {}
+        self.latest: Optional[int] = None
+
+    @classmethod
+    def from_history(
+        cls,
+        timestamps: np.ndarray,
+        keys: np.ndarray,
+        weights: np.ndarray,
+        bucket_seconds: int,
+        retention: int,
+        capacity: int,
+    ) -> "WindowedSummaries":
+        """
+        Construit les seaux retenus à partir d'un historique (vectorisé).
+
+        Parameters
+        ----------
+        timestamps : np.ndarray
+            Horodatage (secondes) de chaque observation
+        keys : np.ndarray
+            Clé (identifiant entier) de chaque observation
+        weights : np.ndarray
+            Poids de chaque observation
+        bucket_seconds : int
+            Durée d'un seau
+        retention : int
+            Nombre de seaux conservés
+        capacity : int
+            Nombre maximum de compteurs par seau
+
+        Returns
+        -------
+        WindowedSummaries
+            Résumés des ``retention`` derniers seaux
+        """
+        windows = cls(bucket_seconds, retention, capacity)
+        if len(timestamps) == 0:
+            return windows
+
+        buckets = timestamps // bucket_seconds
+        windows.latest = int(buckets.max())
+        recent = buckets > windows.latest - retention
+        buckets, keys, weights = buckets[recent], keys[recent], weights[recent]
+
+        # Agrégats exacts par (seau, clé) : tri puis sommes par plage
+        order = np.lexsort((keys, buckets))
+        buckets, keys = buckets[order], keys[order]
+        changes = (buckets[1:] != buckets[:-1]) | (keys[1:] != keys[:-1])
+        starts = np.flatnonzero(np.concatenate(([True], changes)))
+        sums = np.add.reduceat(weights[order].astype(float), starts)
+        pair_buckets, pair_keys = buckets[starts], keys[starts]
+
+        bounds = np.flatnonzero(
+            np.concatenate(([True], pair_buckets[1:] != pair_buckets[:-1], [True]))
+        )
+        for start, end in zip(bounds[:-1], bounds[1:]):
+            windows.buckets[int(pair_buckets[start])] = SpaceSaving.from_exact(
+                pair_keys[start:end], sums[start:end], capacity
+            )
+        return windows
+
+    def add(self, timestamp: int, key: int, weight: float = 1.0) -> None:
+        """
+        Ajoute une observation au seau de son horodatage.
+
+        Les observations plus anciennes que la rétention sont ignorées.
+
+        Parameters
+        ----------
+        timestamp : int
+            Horodatage en secondes
+        key : int
+            Clé observée
+        weight : float
+            Poids de l'observation
+        """
+        bucket = timestamp // self.bucket_seconds
+        if self.latest is None or bucket > self.latest:
+            self.latest = bucket
+            oldest = bucket - self.retention
+            for expired in [b for b in self.buckets if b <= oldest]:
+                del self.buckets[expired]
+        elif bucket <= self.latest - self.retention:
+            return
+
+        if bucket not in self.buckets:
+            self.buckets[bucket] = SpaceSaving(self.capacity)
+        self.buckets[bucket].update(key, weight)
+
+    def window(self, n_buckets: int) -> Tuple[SpaceSaving, int, int]:
+        """
+        Résumé fusionné des ``n_buckets`` derniers seaux.
+
+        Parameters
+        ----------
+        n_buckets : int
+            Nombre de seaux de la fenêtre (au plus ``retention``)
+
+        Returns
+        -------
+        Tuple[SpaceSaving, int, int]
+            (résumé, début et fin de la fenêtre en secondes)
+        """
+        if self.latest is None:
+            return SpaceSaving(self.capacity), 0, 0
+        first = self.latest - n_buckets + 1
+        summaries = [s for b, s in self.buckets.items() if b >= first]
+        start = first * self.bucket_seconds
+        end = (self.latest + 1) * self.bucket_seconds
+        return merge_all(summaries, self.capacity), start, end
@@ -1,18 +1,27 @@
 """Service de calcul de statistiques sur les transactions."""
 
 import os
-from typing import Any, Dict, List
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple
 
 import numpy as np
-import pandas as pd
 from fastapi import HTTPException
 
 from banking_api.services.data_cache import (
+    get_amount_distribution_cached,
+    get_amount_sketches,
     get_basic_stats,
     get_cached_dataframe,
+    get_dataset_version,
+    get_error_flags,
+    get_sorted_amounts,
     get_daily_stats_cached,
     get_stats_by_type_cached,
 )
+from banking_api.services.quantile_sketch import (
+    RELATIVE_ACCURACY,
+    quantiles_from_counts,
+)
 
 
 def _get_csv_path() -> str:
@@ -58,14 +67,176 @@ def get_overview() -> Dict[str, Any]:
         raise HTTPException(status_code=500, detail=f"Erreur lors du calcul: {str(e)}")
 
 
-def get_amount_distribution(bins: int = 10) -> Dict[str, Any]:
+# Breakdowns acceptés par l'histogramme : paramètre -> colonne encodée
+HISTOGRAM_BREAKDOWNS: Dict[str, str] = {"type": "use_chip", "isFraud": "isFraud"}
+
+MAX_HISTOGRAM_BINS: int = 1000
+
+
+def _format_edge(edge: float) -> str:
+    """
+    Formate une borne de tranche (entier si possible, sinon 2 décimales).
+
+    Parameters
+    ----------
+    edge : float
+        Borne à formater
+
+    Returns
+    -------
+    str
+        Borne lisible
+    """
+    if float(edge).is_integer():
+        return str(int(edge))
+    return f"{edge:.2f}".rstrip("0").rstrip(".")
+
+
+def _histogram_counts(sorted_values: np.ndarray, edges: np.ndarray) -> np.ndarray:
+    """
+    Histogramme d'un tableau trié par recherche dichotomique.
+
+    Même convention que ``np.histogram`` : tranches ``[a, b)`` sauf la
+    dernière, fermée. Coût O(bins log n).
+
+    Parameters
+    ----------
+    sorted_values : np.ndarray
+        Valeurs triées
+    edges : np.ndarray
+        Bornes strictement croissantes
+
+    Returns
+    -------
+    np.ndarray
+        Nombre de valeurs par tranche
+    """
+    positions = np.searchsorted(sorted_values, edges, side="left")
+    positions[-1] = np.searchsorted(sorted_values, edges[-1], side="right")
+    return np.diff(positions)
+
+
+def _resolve_edges(
+    bins: Optional[int], edges: Optional[str], scale: str
+) -> Tuple[float, ...]:
+    """
+    Calcule les bornes de l'histogramme à partir des paramètres.
+
+    Parameters
+    ----------
+    bins : Optional[int]
+        Nombre de tranches régulières
+    edges : Optional[str]
+        Bornes explicites séparées par des virgules
+    scale : str
+        "linear" ou "log"
+
+    Returns
+    -------
+    Tuple[float, ...]
+        Bornes strictement croissantes
+    """
+    if edges:
+        try:
+            values = [float(v) for v in edges.split(",") if v.strip()]
+        except ValueError:
+            raise HTTPException(status_code=400, detail="Bornes invalides")
+        if len(values) < 2 or any(b <= a for a, b in zip(values, values[1:])):
+            raise HTTPException(
+                status_code=400,
+                detail="Au moins deux bornes strictement croissantes sont requises",
+            )
+        return tuple(values)
+
+    if scale not in ("linear", "log"):
+        raise HTTPException(status_code=400, detail=f"Échelle invalide: {scale}")
+    n_bins = bins if bins is not None else 10
+    if not 1 <= n_bins <= MAX_HISTOGRAM_BINS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"bins doit être compris entre 1 et {MAX_HISTOGRAM_BINS}",
+        )
+
+    amounts = get_sorted_amounts().values
+    max_amount = float(amounts[-1])
+    if scale == "log":
+        # Échelle log : seuls les montants strictement positifs sont couverts
+        positive = amounts[np.searchsorted(amounts, 0.0, side="right"):]
+        if len(positive) == 0:
+            raise HTTPException(status_code=400, detail="Aucun montant positif")
+        spaced = np.geomspace(float(positive[0]), max_amount, n_bins + 1)
+    else:
+        spaced = np.linspace(0.0, max_amount, n_bins + 1)
+    return tuple(float(edge) for edge in spaced)
+
+
+@lru_cache(maxsize=64)
+def _amount_histogram_cached(
+    dataset_version: str, edges: Tuple[float, ...], by: Optional[str]
+) -> Dict[str, Any]:
+    """
+    Cache un histogramme par (version, bornes, breakdown).
+
+    Parameters
+    ----------
+    dataset_version : str
+        Version du dataset (clé de cache uniquement)
+    edges : Tuple[float, ...]
+        Bornes des tranches
+    by : Optional[str]
+        Colonne de breakdown
+
+    Returns
+    -------
+    Dict[str, Any]
+        Libellés, bornes, comptes globaux et comptes par groupe
+    """
+    edge_array = np.asarray(edges, dtype=float)
+    bin_labels = [
+        f"{_format_edge(a)}-{_format_edge(b)}" for a, b in zip(edges, edges[1:])
+    ]
+
+    result: Dict[str, Any] = {
+        "bins": bin_labels,
+        "counts": _histogram_counts(get_sorted_amounts().values, edge_array).tolist(),
+        "edges": list(edges),
+    }
+
+    if by is not None:
+        sorted_amounts = get_sorted_amounts(HISTOGRAM_BREAKDOWNS[by])
+        breakdown: Dict[str, List[int]] = {}
+        for i, label in enumerate(sorted_amounts.labels):
+            start, end = sorted_amounts.offsets[i], sorted_amounts.offsets[i + 1]
+            group_values = sorted_amounts.values[start:end]
+            breakdown[str(label)] = _histogram_counts(group_values, edge_array).tolist()
+        result["breakdown"] = breakdown
+
+    return result
+
+
+def get_amount_distribution(
+    bins: Optional[int] = None,
+    edges: Optional[str] = None,
+    scale: str = "linear",
+    by: Optional[str] = None,
+) -> Dict[str, Any]:
     """
     Histogramme du montant des transactions (en classes de valeurs, avec cache).
 
+    Sans paramètre, retourne les tranches standards pré-agrégées dans le cube.
+    Sinon, l'histogramme est calculé par ``searchsorted`` sur les montants
+    pré-triés, puis mis en cache par spécification.
+
     Parameters
     ----------
-    bins : int
-        Nombre de classes (défaut: 10)
+    bins : Optional[int]
+        Nombre de tranches régulières (défaut: 10 si ``scale`` est fourni)
+    edges : Optional[str]
+        Bornes explicites séparées par des virgules (ex: "0,50,100,1000")
+    scale : str
+        "linear" ou "log" (ignoré si ``edges`` est fourni)
+    by : Optional[str]
+        Breakdown par "type" ou "isFraud"
 
     Returns
     -------
@@ -73,44 +244,22 @@ def get_amount_distribution(bins: int = 10) -> Dict[str, Any]:
         Dictionnaire contenant :
         - bins : liste des intervalles
         - counts : nombre de transactions par intervalle
+        - edges : bornes numériques (spécification personnalisée)
+        - breakdown : comptes par groupe (si ``by`` est fourni)
     """
+    if by is not None and by not in HISTOGRAM_BREAKDOWNS:
+        raise HTTPException(status_code=400, detail=f"Breakdown invalide: {by}")
+
     try:
-        # Utiliser le DataFrame en cache
-        df = get_cached_dataframe()
-
-        # Créer des bins personnalisés pour avoir des intervalles lisibles
-        max_amount: float = df["amount"].max()
-
-        # Définir des bins standards et ne garder que ceux inférieurs au max
-        standard_bins: List[float] = [
-            0,
-            100,
-            500,
-            1000,
-            5000,
-            10000,
-            50000,
-            100000,
-            500000,
-            1000000,
-        ]
-        bin_edges: List[float] = [b for b in standard_bins if b <= max_amount]
-
-        # Ajouter le max + 1 pour inclure toutes les valeurs
-        bin_edges.append(max_amount + 1)
-
-        # Calculer l'histogramme
-        counts, edges = np.histogram(df["amount"], bins=bin_edges)
-
-        # Créer les labels des bins
-        bin_labels: List[str] = []
-        for i in range(len(edges) - 1):
-            if edges[i + 1] == max_amount + 1:
-                bin_labels.append(f"{int(edges[i])}+")
-            else:
-                bin_labels.append(f"{int(edges[i])}-{int(edges[i + 1])}")
-
-        return {"bins": bin_labels, "counts": counts.tolist()}
+        if bins is None and edges is None and scale == "linear" and by is None:
+            # Histogramme standard pré-agrégé dans le cube
+            bin_labels, counts = get_amount_distribution_cached()
+            return {"bins": bin_labels, "counts": counts}
+
+        resolved_edges = _resolve_edges(bins, edges, scale)
+        return _amount_histogram_cached(get_dataset_version(), resolved_edges, by)
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Erreur lors du calcul: {str(e)}")
 
@@ -171,3 +320,201 @@ def get_daily_stats(days: int = 7) -> List[Dict[str, Any]]:
         return get_daily_stats_cached(days)
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Erreur lors du calcul: {str(e)}")
+
+
+# Dimensions disponibles pour les percentiles
+PERCENTILE_DIMENSIONS: Tuple[str, ...] = ("use_chip", "merchant_state", "client_id")
+
+DEFAULT_QUANTILES: str = "0.5,0.9,0.99,0.999"
+
+
+def _quantile_label(q: float) -> str:
+    """Libellé d'un quantile (ex: 0.999 -> "p99.9")."""
+    return f"p{q * 100:g}"
+
+
+def _parse_quantiles(q: str) -> List[float]:
+    """
+    Découpe et valide une liste de quantiles.
+
+    Parameters
+    ----------
+    q : str
+        Quantiles séparés par des virgules (ex: "0.5,0.99")
+
+    Returns
+    -------
+    List[float]
+        Quantiles dans [0, 1]
+    """
+    try:
+        quantiles = [float(v) for v in q.split(",") if v.strip()]
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Quantiles invalides")
+    if not quantiles or any(not 0 <= v <= 1 for v in quantiles):
+        raise HTTPException(
+            status_code=400, detail="Les quantiles doivent être compris entre 0 et 1"
+        )
+    return quantiles
+
+
+def get_percentiles(
+    by: Optional[str] = None,
+    q: str = DEFAULT_QUANTILES,
+    key: Optional[str] = None,
+) -> Dict[str, Any]:
+    """
+    Percentiles approchés du montant, globaux ou par groupe.
+
+    Les percentiles sont lus dans des sketches construits une fois par
+    dimension : erreur relative garantie de 1 % sur la valeur (montants en
+    valeur absolue inférieurs à 0,01 restitués comme 0).
+
+    Parameters
+    ----------
+    by : Optional[str]
+        Dimension de regroupement : use_chip, merchant_state ou client_id
+    q : str
+        Quantiles séparés par des virgules, dans [0, 1]
+    key : Optional[str]
+        Ne retourner que ce groupe (ex: un client_id)
+
+    Returns
+    -------
+    Dict[str, Any]
+        Dictionnaire contenant :
+        - by : dimension de regroupement
+        - quantiles : quantiles demandés
+        - relative_accuracy : erreur relative maximale
+        - groups : count et percentiles de chaque groupe
+    """
+    if by is not None and by not in PERCENTILE_DIMENSIONS:
+        raise HTTPException(status_code=400, detail=f"Dimension invalide: {by}")
+    quantiles = _parse_quantiles(q)
+
+    try:
+        counts, labels = get_amount_sketches(by)
+
+        if key is not None:
+            matches = np.flatnonzero(labels.astype(str) == key)
+            if len(matches) == 0:
+                raise HTTPException(status_code=404, detail="Groupe non trouvé")
+            counts, labels = counts[matches], labels[matches]
+
+        values = quantiles_from_counts(counts, quantiles)
+        totals = counts.sum(axis=1)
+
+        groups: List[Dict[str, Any]] = []
+        for i, label in enumerate(labels):
+            group: Dict[str, Any] = {}
+            if by is not None:
+                group[by] = label.item() if isinstance(label, np.generic) else label
+            group["count"] = int(totals[i])
+            for j, quantile in enumerate(quantiles):
+                group[_quantile_label(quantile)] = round(float(values[i, j]), 2)
+            groups.append(group)
+
+        return {
+            "by": by,
+            "quantiles": quantiles,
+            "relative_accuracy": RELATIVE_ACCURACY,
+            "groups": groups,
+        }
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Erreur lors du calcul: {str(e)}")
+
+
+# Nombre de combinaisons d'erreurs détaillées dans le breakdown
+MAX_ERROR_COMBINATIONS: int = 10
+
+
+@lru_cache(maxsize=1)
+def _error_breakdown_cached(dataset_version: str) -> Dict[str, Any]:
+    """
+    Cache la répartition des codes d'erreur par version du dataset.
+
+    Un seul ``bincount`` par masque (au plus 2^16 combinaisons) ; les
+    totaux par code sont ensuite des sommes sur les masques où son bit est
+    levé.
+
+    Parameters
+    ----------
+    dataset_version : str
+        Version du dataset (clé de cache uniquement)
+
+    Returns
+    -------
+    Dict[str, Any]
+        Totaux, statistiques par code d'erreur et combinaisons fréquentes
+    """
+    df = get_cached_dataframe()
+    flags = get_error_flags()
+    n_masks = 1 << len(flags.labels)
+    masks = flags.masks.astype(np.int64)
+
+    count = np.bincount(masks, minlength=n_masks)
+    amount = np.bincount(
+        masks, weights=df["amount"].to_numpy(dtype=float), minlength=n_masks
+    )
+    fraud = np.bincount(
+        masks, weights=df["isFraud"].to_numpy(dtype=float), minlength=n_masks
+    )
+
+    total = int(count.sum())
+    mask_values = np.arange(n_masks)
+    errors: List[Dict[str, Any]] = []
+    for bit, label in enumerate(flags.labels):
+        has_bit = (mask_values >> bit) & 1 == 1
+        error_count = int(count[has_bit].sum())
+        fraud_count = int(fraud[has_bit].sum())
+        errors.append(
+            {
+                "error": label,
+                "count": error_count,
+                "share": round(error_count / total, 5) if total else 0.0,
+                "total_amount": round(float(amount[has_bit].sum()), 2),
+                "fraud_count": fraud_count,
+                "fraud_rate": round(fraud_count / error_count, 5) if error_count else 0.0,
+            }
+        )
+    errors.sort(key=lambda row: -row["count"])
+
+    present = np.flatnonzero(count[1:]) + 1
+    present = present[np.argsort(-count[present], kind="stable")]
+    combinations = [
+        {
+            "errors": [
+                label for bit, label in enumerate(flags.labels) if (mask >> bit) & 1
+            ],
+            "count": int(count[mask]),
+        }
+        for mask in present[:MAX_ERROR_COMBINATIONS]
+    ]
+
+    return {
+        "total_transactions": total,
+        "with_errors": total - int(count[0]),
+        "errors": errors,
+        "combinations": combinations,
+    }
+
+
+def get_error_breakdown() -> Dict[str, Any]:
+    """
+    Répartition des transactions par code d'erreur.
+
+    Returns
+    -------
+    Dict[str, Any]
+        Dictionnaire contenant :
+        - total_transactions : nombre total de transactions
+        - with_errors : transactions avec au moins une erreur
+        - errors : nombre, part, montant et fraude par code d'erreur
+        - combinations : combinaisons d'erreurs les plus fréquentes
+    """
+    try:
+        return _error_breakdown_cached(get_dataset_version())
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Erreur lors du calcul: {str(e)}")
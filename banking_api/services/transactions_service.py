@@ -3,9 +3,12 @@
 import os
 from typing import Any, Dict, List, Optional
 
+import numpy as np
 import pandas as pd
 from fastapi import HTTPException
 
+from banking_api.services.column_encoding import FlagColumn, encode_flags
+
 
 def _get_csv_path() -> str:
     """
@@ -66,6 +69,32 @@ def _convert_transaction_types(transaction: Dict[str, Any]) -> Dict[str, Any]:
     }
 
 
+def _errors_mask(error_flags: FlagColumn, errors: str) -> np.ndarray:
+    """
+    Lignes présentant toutes les erreurs demandées (test bit à bit).
+
+    Parameters
+    ----------
+    error_flags : FlagColumn
+        Masques d'erreurs des lignes
+    errors : str
+        Codes d'erreur séparés par des virgules (ex: "Bad CVV,Bad PIN")
+
+    Returns
+    -------
+    np.ndarray
+        Masque booléen des lignes retenues
+    """
+    names = [name.strip() for name in errors.split(",") if name.strip()]
+    try:
+        wanted = error_flags.bits(names)
+    except KeyError as e:
+        raise HTTPException(
+            status_code=400, detail=f"Code d'erreur inconnu: {e.args[0]}"
+        )
+    return (error_flags.masks & wanted) == wanted
+
+
 def get_paginated_transactions(
     page: int,
     limit: int,
@@ -73,6 +102,7 @@ def get_paginated_transactions(
     is_fraud: Optional[int] = None,
     min_amount: Optional[float] = None,
     max_amount: Optional[float] = None,
+    errors: Optional[str] = None,
 ) -> Dict[str, Any]:
     """
     Retourne une liste paginée de transactions avec filtres optionnels.
@@ -91,6 +121,8 @@ def get_paginated_transactions(
         Montant minimum
     max_amount : Optional[float]
         Montant maximum
+    errors : Optional[str]
+        Codes d'erreur requis, séparés par des virgules (ex: "Bad CVV")
 
     Returns
     -------
@@ -115,11 +147,12 @@ def get_paginated_transactions(
         )
 
         # Add fraud detection based on errors column
-        df["isFraud"] = df["errors"].apply(
-            lambda x: 1 if pd.notna(x) and str(x).strip() != "" else 0
-        )
+        error_flags = encode_flags(df["errors"])
+        df["isFraud"] = (error_flags.masks != 0).astype(int)
 
         # Appliquer les filtres
+        if errors:
+            df = df[_errors_mask(error_flags, errors)]
         if type_filter:
             # Use 'use_chip' as type since this dataset doesn't have 'type'
             df = df[df["use_chip"] == type_filter]
@@ -144,6 +177,8 @@ def get_paginated_transactions(
             "total": total,
             "transactions": transactions,
         }
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=500, detail=f"Erreur lors de la lecture: {str(e)}"
@@ -182,9 +217,8 @@ def get_transaction_by_id(transaction_id: str) -> Optional[Dict[str, Any]]:
         )
 
         # Add fraud detection
-        df["isFraud"] = df["errors"].apply(
-            lambda x: 1 if pd.notna(x) and str(x).strip() != "" else 0
-        )
+        error_flags = encode_flags(df["errors"])
+        df["isFraud"] = (error_flags.masks != 0).astype(int)
 
         # Search by transaction ID (column 'id')
         transaction_id_int: int = int(transaction_id)
@@ -277,9 +311,8 @@ def get_recent_transactions(n: int = 10) -> List[Dict[str, Any]]:
         )
 
         # Add fraud detection
-        df["isFraud"] = df["errors"].apply(
-            lambda x: 1 if pd.notna(x) and str(x).strip() != "" else 0
-        )
+        error_flags = encode_flags(df["errors"])
+        df["isFraud"] = (error_flags.masks != 0).astype(int)
 
         recent: List[Dict[str, Any]] = df.to_dict("records")
         return recent
@@ -294,6 +327,7 @@ def search_transactions(
     is_fraud: Optional[int] = None,
     amount_min: Optional[float] = None,
     amount_max: Optional[float] = None,
+    errors: Optional[str] = None,
 ) -> List[Dict[str, Any]]:
     """
     Recherche multicritère de transactions.
@@ -308,6 +342,8 @@ def search_transactions(
         Montant minimum
     amount_max : Optional[float]
         Montant maximum
+    errors : Optional[str]
+        Codes d'erreur requis, séparés par des virgules (ex: "Bad CVV")
 
     Returns
     -------
@@ -332,10 +368,11 @@ def search_transactions(
         )
 
         # Add fraud detection
-        df["isFraud"] = df["errors"].apply(
-            lambda x: 1 if pd.notna(x) and str(x).strip() != "" else 0
-        )
+        error_flags = encode_flags(df["errors"])
+        df["isFraud"] = (error_flags.masks != 0).astype(int)
 
+        if errors:
+            df = df[_errors_mask(error_flags, errors)]
         if type_filter:
             df = df[df["use_chip"] == type_filter]
         if is_fraud is not None:
@@ -347,6 +384,8 @@ def search_transactions(
 
         results: List[Dict[str, Any]] = df.to_dict("records")
         return results
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=500, detail=f"Erreur lors de la recherche: {str(e)}"
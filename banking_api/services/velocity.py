@@ -0,0 +1,219 @@
+"""Règles de vélocité sur fenêtre glissante (cartes et clients).
+
+Une règle porte sur la fenêtre ``(t - window, t]`` qui précède chaque
+transaction de la même entité : nombre de transactions, nombre d'États
+distincts, saut de montant par rapport à la transaction précédente.
+
+Les transactions sont traitées triées par (entité, horodatage), toutes
+entités confondues : le début de la fenêtre de chaque ligne est obtenu par
+une seule recherche dichotomique sur la clé composite
+``entité * étendue + horodatage``, qui ne peut pas franchir la frontière
+entre deux entités. Les États distincts ne sont comptés que pour les
+lignes qui passent déjà le seuil de nombre de transactions.
+"""
+
+from typing import Dict, NamedTuple, Tuple
+
+import numpy as np
+
+
+class VelocityRule(NamedTuple):
+    """
+    Règle de vélocité.
+
+    Attributes
+    ----------
+    name : str
+        Identifiant de la règle
+    entity : str
+        Entité surveillée ("card" ou "customer")
+    window : int
+        Largeur de la fenêtre glissante en secondes
+    min_count : int
+        Nombre minimum de transactions dans la fenêtre (transaction incluse)
+    min_states : int
+        Nombre minimum d'États distincts dans la fenêtre
+    min_amount_jump : float
+        Rapport minimum entre le montant et celui de la transaction
+        précédente de la fenêtre (0 : critère ignoré)
+    min_amount : float
+        Montant minimum de la transaction
+    description : str
+        Raison affichée dans les alertes
+    """
+
+    name: str
+    entity: str
+    window: int
+    min_count: int = 1
+    min_states: int = 0
+    min_amount_jump: float = 0.0
+    min_amount: float = float("-inf")
+    description: str = ""
+
+
+VELOCITY_RULES: Tuple[VelocityRule, ...] = (
+    VelocityRule(
+        "card_multi_state_burst",
+        "card",
+        window=600,
+        min_count=5,
+        min_states=3,
+        description="5 transactions ou plus sur la carte en 10 min, dans 3 États ou plus",
+    ),
+    VelocityRule(
+        "card_rapid_fire",
+        "card",
+        window=60,
+        min_count=4,
+        description="4 transactions ou plus sur la carte en 1 min",
+    ),
+    VelocityRule(
+        "customer_amount_jump",
+        "customer",
+        window=3600,
+        min_count=2,
+        min_amount_jump=10.0,
+        min_amount=500.0,
+        description="Montant 10 fois supérieur à la transaction précédente du client dans l'heure",
+    ),
+)
+
+
+def window_starts(groups: np.ndarray, timestamps: np.ndarray, window: int) -> np.ndarray:
+    """
+    Début de la fenêtre ``(t - window, t]`` de chaque ligne.
+
+    Parameters
+    ----------
+    groups : np.ndarray
+        Code de l'entité de chaque ligne (lignes triées par entité puis date)
+    timestamps : np.ndarray
+        Horodatage de chaque ligne (secondes)
+    window : int
+        Largeur de la fenêtre en secondes
+
+    Returns
+    -------
+    np.ndarray
+        Position de la première ligne de la fenêtre de chaque ligne
+    """
+    if len(timestamps) == 0:
+        return np.zeros(0, dtype=np.int64)
+    offsets = timestamps.astype(np.int64) - int(timestamps.min())
+    span = int(offsets.max()) + window + 1
+    keys = groups.astype(np.int64) * span + offsets
+    return np.searchsorted(keys, keys - window, side="right")
+
+
+def previous_occurrence(values: np.ndarray) -> np.ndarray:
+    """
+    Position de l'occurrence précédente de la même valeur (-1 si aucune).
+
+    Parameters
+    ----------
+    values : np.ndarray
+        Codes entiers
+
+    Returns
+    -------
+    np.ndarray
+        Position de la ligne précédente portant le même code
+    """
+    order = np.argsort(values, kind="stable")
+    sorted_values = values[order]
+    previous = np.full(len(values), -1, dtype=np.int64)
+    same = sorted_values[1:] == sorted_values[:-1]
+    previous[order[1:][same]] = order[:-1][same]
+    return previous
+
+
+def window_distinct(
+    values: np.ndarray, starts: np.ndarray, rows: np.ndarray
+) -> np.ndarray:
+    """
+    Nombre de valeurs distinctes (codes >= 0) dans la fenêtre de lignes choisies.
+
+    Une valeur est comptée à sa première occurrence dans la fenêtre, c'est-à-
+    dire quand son occurrence précédente est avant le début de la fenêtre.
+    Le coût est O(lignes x taille maximale de leurs fenêtres).
+
+    Parameters
+    ----------
+    values : np.ndarray
+        Code de chaque ligne (-1 si manquant)
+    starts : np.ndarray
+        Début de la fenêtre de chaque ligne (voir ``window_starts``)
+    rows : np.ndarray
+        Lignes dont on compte les valeurs distinctes
+
+    Returns
+    -------
+    np.ndarray
+        Nombre de valeurs distinctes de la fenêtre de chaque ligne choisie
+    """
+    previous = previous_occurrence(values)
+    first = starts[rows]
+    sizes = rows - first + 1
+    distinct = np.zeros(len(rows), dtype=np.int64)
+    for lag in range(int(sizes.max()) if len(rows) else 0):
+        inside = lag < sizes
+        positions = np.where(inside, rows - lag, 0)
+        distinct += (
+            inside & (values[positions] >= 0) & (previous[positions] < first)
+        )
+    return distinct
+
+
+def evaluate_rule(
+    rule: VelocityRule,
+    groups: np.ndarray,
+    timestamps: np.ndarray,
+    states: np.ndarray,
+    amounts: np.ndarray,
+) -> Dict[str, np.ndarray]:
+    """
+    Lignes qui déclenchent une règle de vélocité (vectorisé).
+
+    Parameters
+    ----------
+    rule : VelocityRule
+        Règle à évaluer
+    groups : np.ndarray
+        Code de l'entité de chaque ligne (lignes triées par entité puis date)
+    timestamps : np.ndarray
+        Horodatage de chaque ligne (secondes)
+    states : np.ndarray
+        Code de l'État du marchand de chaque ligne (-1 si manquant)
+    amounts : np.ndarray
+        Montant de chaque ligne
+
+    Returns
+    -------
+    Dict[str, np.ndarray]
+        positions (lignes déclenchées), count, distinct_states et
+        amount_jump (NaN sans transaction précédente dans la fenêtre)
+    """
+    starts = window_starts(groups, timestamps, rule.window)
+    positions = np.arange(len(timestamps))
+    counts = positions - starts + 1
+
+    previous = np.concatenate(([np.nan], amounts[:-1])) if len(amounts) else amounts
+    has_previous = (counts >= 2) & (previous > 0)
+    jumps = np.full(len(amounts), np.nan)
+    np.divide(amounts, previous, out=jumps, where=has_previous)
+
+    mask = (counts >= rule.min_count) & (amounts >= rule.min_amount)
+    if rule.min_amount_jump > 0:
+        mask &= has_previous & (jumps >= rule.min_amount_jump)
+
+    rows = np.flatnonzero(mask)
+    distinct = window_distinct(states, starts, rows)
+    keep = distinct >= rule.min_states
+    rows = rows[keep]
+    return {
+        "positions": rows,
+        "count": counts[rows],
+        "distinct_states": distinct[keep],
+        "amount_jump": jumps[rows],
+    }
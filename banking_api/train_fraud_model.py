@@ -0,0 +1,134 @@
+"""Entraînement hors ligne du modèle de fraude.
+
+Usage ::
+
+    python -m banking_api.train_fraud_model [--output data/fraud_model.json]
+
+Le modèle est entraîné sur les transactions labellisées les plus anciennes
+et validé sur les plus récentes : le seuil de décision retenu est celui qui
+maximise le F1 sur la période de validation. Les taux de fraude par zone
+(caractéristique ``log_location_lift``) sont calculés sur la seule période
+d'entraînement, dont la fin est enregistrée dans les métadonnées
+(``train_cutoff``) pour que le backtest de l'API l'exclue. Un modèle dont l'AUC de
+validation est inférieure à ``--min-auc`` n'est pas écrit : l'API garde
+alors les règles seules.
+"""
+
+import argparse
+import json
+import sys
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+from banking_api.services.data_cache import get_dataset_version, get_timestamps
+from banking_api.services.fraud_backtest import roc_auc, threshold_curve
+from banking_api.services.fraud_detection_service import dataset_columns, labelled_rows
+from banking_api.services.fraud_model import (
+    best_f1_threshold,
+    feature_matrix,
+    fit_logistic,
+    get_model_path,
+    save_model,
+)
+
+
+def train(
+    output: str, validation: float = 0.2, l2: float = 1.0, min_auc: float = 0.6
+) -> Dict[str, Any]:
+    """
+    Entraîne, valide et sauvegarde le modèle de fraude.
+
+    Parameters
+    ----------
+    output : str
+        Chemin de l'artefact à écrire
+    validation : float
+        Part des transactions (les plus récentes) réservée à la validation
+    l2 : float
+        Pénalité L2 de la régression logistique
+    min_auc : float
+        AUC de validation minimale pour écrire l'artefact
+
+    Returns
+    -------
+    Dict[str, Any]
+        Version de l'artefact, seuil et métriques de validation
+    """
+    rows, labels = labelled_rows()
+    if not labels.any() or labels.all():
+        raise ValueError("Les labels doivent contenir des fraudes et des non-fraudes")
+
+    # Découpage temporel : validation sur la période la plus récente
+    timestamps = get_timestamps()[rows]
+    order = np.argsort(timestamps, kind="stable")
+    rows, labels, timestamps = rows[order], labels[order], timestamps[order]
+    split = int(len(rows) * (1 - validation))
+
+    # Risque géographique tiré des seuls labels d'entraînement : la
+    # validation (AUC, seuil) ne voit pas ses propres fraudes
+    features = feature_matrix(dataset_columns(rows, history=rows[:split]))
+
+    model = fit_logistic(features[:split], labels[:split], l2=l2)
+    scores = model.predict_proba(features[split:])
+    model.threshold, metrics = best_f1_threshold(scores, labels[split:])
+    metrics["roc_auc"] = roc_auc(threshold_curve(scores, labels[split:]))
+    if metrics["roc_auc"] < min_auc:
+        raise ValueError(
+            f"AUC de validation {metrics['roc_auc']:.3f} inférieure à {min_auc}"
+        )
+
+    model.metadata = {
+        "trained_at": datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M:%S"),
+        "dataset_version": get_dataset_version(),
+        "train_size": split,
+        "train_cutoff": int(timestamps[split - 1]),
+        "validation_size": len(rows) - split,
+        "validation": {name: round(value, 4) for name, value in metrics.items()},
+    }
+    version = save_model(model, output)
+    return {
+        "version": version,
+        "output": output,
+        "threshold": round(model.threshold, 4),
+        **model.metadata,
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Point d'entrée de la ligne de commande.
+
+    Parameters
+    ----------
+    argv : Optional[List[str]]
+        Arguments (défaut: ceux de la ligne de commande)
+
+    Returns
+    -------
+    int
+        Code de sortie
+    """
+    parser = argparse.ArgumentParser(description="Entraîne le modèle de fraude.")
+    parser.add_argument("--output", default=get_model_path(), help="Artefact à écrire")
+    parser.add_argument(
+        "--validation", type=float, default=0.2, help="Part réservée à la validation"
+    )
+    parser.add_argument("--l2", type=float, default=1.0, help="Pénalité L2")
+    parser.add_argument(
+        "--min-auc", type=float, default=0.6, help="AUC de validation minimale"
+    )
+    args = parser.parse_args(argv)
+
+    try:
+        summary = train(args.output, args.validation, args.l2, args.min_auc)
+    except ValueError as e:
+        print(f"Entraînement impossible: {e}", file=sys.stderr)
+        return 1
+    print(json.dumps(summary, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
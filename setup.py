@@ -50,11 +50,13 @@ setup(
     entry_points={
         'console_scripts': [
             'banking-api=banking_api.main:app',
+            'banking-train-fraud-model=banking_api.train_fraud_model:main',
         ],
     },
     include_package_data=True,
     package_data={
         'banking_api': ['py.typed'],
+        'banking_api.services': ['*.json'],
     },
     zip_safe=False,
     keywords='banking transactions api fastapi fraud-detection analytics',
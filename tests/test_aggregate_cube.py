@@ -0,0 +1,52 @@
+"""Tests pour le cube d'agrégats."""
+
+import numpy as np
+
+from banking_api.services import data_cache
+from banking_api.services.aggregate_cube import CUBE_DIMENSIONS, group_rows, rollup
+
+
+class TestAggregateCube:
+    """Tests pour la construction et l'agrégation du cube."""
+
+    def test_cube_counts_every_transaction(self):
+        """Test : la somme des cellules correspond au dataset."""
+        df = data_cache.get_cached_dataframe()
+        cube = data_cache.get_aggregate_cube()
+
+        assert cube.dimensions == CUBE_DIMENSIONS
+        assert int(cube.count.sum()) == len(df)
+        assert np.isclose(cube.amount_sum.sum(), df["amount"].sum())
+
+    def test_rollup_matches_groupby(self):
+        """Test : le rollup par type équivaut au groupby pandas."""
+        df = data_cache.get_cached_dataframe()
+        cube = data_cache.get_aggregate_cube()
+
+        codes, count, amount_sum = rollup(cube, ["use_chip"])
+        expected = df.groupby("use_chip")["amount"].agg(["count", "sum"])
+
+        labels = cube.labels["use_chip"][codes["use_chip"]]
+        assert list(labels) == list(expected.index)
+        assert count.tolist() == expected["count"].tolist()
+        assert np.allclose(amount_sum, expected["sum"].to_numpy())
+
+    def test_amount_distribution_from_cube(self):
+        """Test : l'histogramme exclut les montants négatifs."""
+        df = data_cache.get_cached_dataframe()
+        bins, counts = data_cache.get_amount_distribution_cached()
+
+        assert len(bins) == len(counts)
+        assert sum(counts) == int((df["amount"] >= 0).sum())
+        assert bins[-1].endswith("+")
+
+    def test_group_rows_beyond_int64_keys(self):
+        """Test : cardinalités dont le produit dépasse un int64, même ordre de groupes."""
+        codes = [np.array([3, 1, 3, 1]), np.array([7, 2, 7, 5]), np.array([0, 9, 0, 9])]
+
+        small, small_inverse = group_rows(codes, [10, 10, 10])
+        large, large_inverse = group_rows(codes, [1 << 30, 1 << 30, 1 << 30])
+
+        assert [c.tolist() for c in large] == [[1, 1, 3], [2, 5, 7], [9, 9, 0]]
+        assert [c.tolist() for c in small] == [c.tolist() for c in large]
+        assert small_inverse.tolist() == large_inverse.tolist() == [2, 0, 2, 1]
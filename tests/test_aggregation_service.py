@@ -0,0 +1,55 @@
+"""Tests pour l'agrégation générique."""
+
+
+class TestGroupStatsRoute:
+    """Tests pour GET /api/stats/group."""
+
+    def test_group_by_type(self, client):
+        """Test : regroupement simple par type."""
+        response = client.get("/api/stats/group?by=use_chip&metrics=count,sum")
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["by"] == ["use_chip"]
+        assert data["total_groups"] == len(data["groups"])
+        assert sum(g["count"] for g in data["groups"]) == 10
+
+    def test_group_by_two_dimensions_with_filter(self, client):
+        """Test : deux dimensions avec filtre par type."""
+        response = client.get(
+            "/api/stats/group?by=use_chip,merchant_state"
+            "&metrics=count,mean,max&type=Chip Transaction"
+        )
+
+        assert response.status_code == 200
+        groups = response.json()["groups"]
+        assert all(g["use_chip"] == "Chip Transaction" for g in groups)
+        assert all(g["max"] >= g["mean"] for g in groups)
+
+    def test_having_and_top(self, client):
+        """Test : filtre having puis top-k trié."""
+        response = client.get(
+            "/api/stats/group?by=merchant_state&metrics=count,sum"
+            "&having=count>=2&top=2&sort=sum"
+        )
+
+        assert response.status_code == 200
+        groups = response.json()["groups"]
+        assert len(groups) <= 2
+        assert all(g["count"] >= 2 for g in groups)
+        assert groups == sorted(groups, key=lambda g: -g["sum"])
+
+    def test_invalid_dimension(self, client):
+        """Test : dimension inconnue rejetée."""
+        response = client.get("/api/stats/group?by=unknown")
+
+        assert response.status_code == 400
+
+    def test_date_filter_normalized(self, client):
+        """Test : date sans zéros de tête acceptée, date invalide rejetée."""
+        response = client.get("/api/stats/group?by=day&metrics=count&start_date=2023-1-1")
+        assert response.status_code == 200
+        assert sum(g["count"] for g in response.json()["groups"]) == 10
+
+        response = client.get("/api/stats/group?by=day&metrics=count&start_date=2023-13-01")
+        assert response.status_code == 400
@@ -0,0 +1,109 @@
+"""Tests pour le score d'anomalie par client."""
+
+import numpy as np
+import pytest
+
+from banking_api.services import customer_service
+from banking_api.services.anomaly_scoring import (
+    MAX_AMOUNT_ZSCORE,
+    anomaly_components,
+    anomaly_scores,
+    group_medians,
+    robust_zscores,
+    surprise,
+)
+
+
+class TestGroupedPasses:
+    """Tests pour les statistiques groupées vectorisées."""
+
+    def test_group_medians(self):
+        """Test : médiane de chaque tranche (paire et impaire)."""
+        values = np.array([5.0, 1.0, 3.0, 10.0, 2.0])
+        offsets = np.array([0, 3, 5])
+
+        assert group_medians(values, offsets).tolist() == [3.0, 6.0]
+
+    def test_robust_zscores(self):
+        """Test : z-score par rapport à la médiane et à la MAD du groupe."""
+        values = np.array([10.0, 12.0, 8.0, 11.0, 9.0, 1000.0])
+        offsets = np.array([0, 6])
+
+        zscores = robust_zscores(values, offsets)
+
+        # médiane 10.5, MAD 1.5 -> échelle 2.22, plancher relatif 1.05
+        assert zscores[0] == pytest.approx(0.5 / (1.4826 * 1.5))
+        assert zscores[-1] == MAX_AMOUNT_ZSCORE
+
+    def test_constant_amounts_use_floor(self):
+        """Test : montants constants, échelle minimale relative à la médiane."""
+        zscores = robust_zscores(np.array([100.0, 100.0, 100.0, 120.0]), np.array([0, 4]))
+
+        assert zscores.tolist() == pytest.approx([0.0, 0.0, 0.0, 2.0])
+
+    def test_surprise(self):
+        """Test : -log10 de la part de la valeur dans le groupe."""
+        codes = np.array([0, 0, 0, 1, 1, 1])
+        offsets = np.array([0, 4, 6])
+
+        values = surprise(codes, offsets)
+
+        assert values.tolist() == pytest.approx(
+            [np.log10(4 / 3)] * 3 + [np.log10(4), 0.0, 0.0]
+        )
+
+    def test_scores_are_float32(self):
+        """Test : le score est la somme des composantes, en float32."""
+        offsets = np.array([0, 3])
+        components = anomaly_components(
+            offsets,
+            np.array([10.0, 10.0, 10.0]),
+            np.array([9, 9, 3]),
+            np.array([0, 0, 0]),
+            np.array([1, 1, 1]),
+        )
+
+        scores = anomaly_scores(components)
+
+        assert scores.dtype == np.float32
+        assert scores[2] == pytest.approx(np.log10(3))
+
+
+class TestCustomerAnomaliesRoute:
+    """Tests pour la route des anomalies d'un client."""
+
+    def test_customer_anomalies(self, client):
+        """Test : transactions du client avec le détail du score."""
+        response = client.get("/api/customers/100/anomalies", params={"top": 3})
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["customer_id"] == 100
+        assert data["transaction_count"] == 1
+        anomaly = data["anomalies"][0]
+        assert anomaly["transaction_id"] == 1001
+        assert anomaly["score"] == 0.0
+
+    def test_unknown_customer(self, client):
+        """Test : client inconnu."""
+        response = client.get("/api/customers/999999/anomalies")
+
+        assert response.status_code == 404
+        assert client.get("/api/customers/abc/anomalies").status_code == 404
+
+    def test_internal_error(self, client, monkeypatch):
+        """Test : une erreur interne n'est pas un client inconnu."""
+
+        def failing(rows, offsets):
+            raise ValueError("erreur interne")
+
+        monkeypatch.setattr(customer_service, "_anomaly_components", failing)
+        response = client.get("/api/customers/100/anomalies")
+
+        assert response.status_code == 500
+
+    def test_invalid_top(self, client):
+        """Test : top hors limites."""
+        response = client.get("/api/customers/100/anomalies", params={"top": 0})
+
+        assert response.status_code == 400
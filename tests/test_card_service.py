@@ -0,0 +1,54 @@
+"""Tests pour l'analyse par carte."""
+
+import numpy as np
+
+from banking_api.services import card_service
+from banking_api.services.card_service import window_counts
+
+
+class TestCardVelocity:
+    """Tests pour les métriques de vélocité."""
+
+    def test_window_counts(self):
+        """Test : nombre de transactions dans la fenêtre ouverte par chaque ligne."""
+        timestamps = np.array([0, 10, 50, 59, 200])
+
+        assert window_counts(timestamps, 60).tolist() == [4, 3, 2, 1, 1]
+
+
+class TestCardRoutes:
+    """Tests pour GET /api/cards/{card_id}."""
+
+    def test_card_profile(self, client):
+        """Test : profil d'une carte à une seule transaction."""
+        response = client.get("/api/cards/201")
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["client_id"] == 101
+        assert data["total_amount"] == 15000.0
+        assert data["velocity"]["peak_per_hour"] == 1
+        assert data["velocity"]["min_interval_seconds"] is None
+        assert data["recent"]["distinct_merchants"] == 1
+
+    def test_unknown_card(self, client):
+        """Test : carte inconnue."""
+        assert client.get("/api/cards/999").status_code == 404
+        assert client.get("/api/cards/abc").status_code == 404
+
+    def test_internal_error(self, client, monkeypatch):
+        """Test : une erreur interne n'est pas une carte inconnue."""
+
+        def failing(timestamps):
+            raise ValueError("erreur interne")
+
+        monkeypatch.setattr(card_service, "_velocity", failing)
+        response = client.get("/api/cards/201")
+
+        assert response.status_code == 500
+
+    def test_invalid_window(self, client):
+        """Test : fenêtre inconnue rejetée."""
+        response = client.get("/api/cards/201?window=2h")
+
+        assert response.status_code == 400
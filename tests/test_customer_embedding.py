@@ -0,0 +1,103 @@
+"""Tests pour les vecteurs de profil client et la recherche de similaires."""
+
+import numpy as np
+import pytest
+
+from banking_api.services import customer_service
+from banking_api.services.customer_embedding import (
+    customer_vectors,
+    nearest_neighbours,
+    share_matrix,
+)
+from banking_api.services.entity_summary import quantiles_per_group
+
+
+class TestCustomerVectors:
+    """Tests pour la construction des vecteurs."""
+
+    def test_share_matrix(self):
+        """Test : part des dépenses par valeur, lignes de somme 1."""
+        shares = share_matrix(
+            np.array([0, 0, 0, 1]), 3, np.array([0, 1, 1, 2]), 3, np.array([1.0, 1.0, 2.0, 5.0])
+        )
+
+        assert shares.tolist() == [[0.25, 0.75, 0.0], [0.0, 0.0, 1.0], [0.0, 0.0, 0.0]]
+
+    def test_quantiles_per_group(self):
+        """Test : quantiles de rang inférieur par groupe, NaN si vide."""
+        quantiles = quantiles_per_group(
+            np.array([1, 0, 1, 1, 1]), 3, np.array([9.0, 4.0, 1.0, 3.0, 2.0]), (0.0, 0.5, 1.0)
+        )
+
+        assert quantiles[0].tolist() == [4.0, 4.0, 4.0]
+        assert quantiles[1].tolist() == [1.0, 2.0, 9.0]
+        assert np.isnan(quantiles[2]).all()
+
+    def test_similar_profiles_are_close(self):
+        """Test : deux clients aux dépenses proches sont plus similaires."""
+        # Clients 0 et 1 : épicerie le matin ; client 2 : restaurants le soir
+        clients = np.array([0, 0, 1, 1, 2, 2])
+        vectors = customer_vectors(
+            clients,
+            3,
+            np.array([50.0, 60.0, 55.0, 45.0, 900.0, 1200.0]),
+            np.array([9, 10, 9, 10, 21, 22]),
+            np.array([0, 0, 0, 0, 1, 1]),
+            2,
+            np.array([0, 0, 0, 0, 1, 1]),
+            2,
+            np.array([2, 2, 2]),
+        )
+
+        assert vectors.dtype == np.float32
+        assert np.linalg.norm(vectors, axis=1) == pytest.approx(np.ones(3))
+        positions, similarities = nearest_neighbours(vectors, 0, 2)
+        assert positions.tolist() == [1, 2]
+        assert similarities[0] > similarities[1]
+
+    def test_neighbours_exclude_query(self):
+        """Test : le client de référence n'est pas son propre voisin."""
+        vectors = np.eye(3, dtype=np.float32)
+
+        positions, _ = nearest_neighbours(vectors, 1, 10)
+
+        assert sorted(positions.tolist()) == [0, 2]
+
+
+class TestSimilarCustomersRoute:
+    """Tests pour la route des clients similaires."""
+
+    def test_similar_customers(self, client):
+        """Test : k clients, sans le client de référence."""
+        response = client.get("/api/customers/100/similar", params={"k": 3})
+
+        assert response.status_code == 200
+        data = response.json()
+        assert len(data["similar"]) == 3
+        assert 100 not in [similar["customer_id"] for similar in data["similar"]]
+        similarities = [similar["similarity"] for similar in data["similar"]]
+        assert similarities == sorted(similarities, reverse=True)
+
+    def test_unknown_customer(self, client):
+        """Test : client inconnu."""
+        response = client.get("/api/customers/999999/similar")
+
+        assert response.status_code == 404
+        assert client.get("/api/customers/abc/similar").status_code == 404
+
+    def test_internal_error(self, client, monkeypatch):
+        """Test : une erreur interne n'est pas un client inconnu."""
+
+        def failing(vectors, query, k):
+            raise ValueError("erreur interne")
+
+        monkeypatch.setattr(customer_service, "nearest_neighbours", failing)
+        response = client.get("/api/customers/100/similar")
+
+        assert response.status_code == 500
+
+    def test_invalid_k(self, client):
+        """Test : k hors limites."""
+        response = client.get("/api/customers/100/similar", params={"k": 0})
+
+        assert response.status_code == 400
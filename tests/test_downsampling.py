@@ -0,0 +1,93 @@
+"""Tests pour le sous-échantillonnage et la chronologie des clients."""
+
+import numpy as np
+import pytest
+
+from banking_api.services import customer_service
+from banking_api.services.downsampling import lttb, time_buckets
+
+
+class TestDownsampling:
+    """Tests pour LTTB et les seaux de temps."""
+
+    def test_lttb_keeps_ends_and_peak(self):
+        """Test : premier et dernier points et pic isolé conservés."""
+        x = np.arange(1000, dtype=float)
+        y = np.sin(x / 50)
+        y[437] = 25.0
+
+        kept = lttb(x, y, 50)
+
+        assert len(kept) == 50
+        assert kept[0] == 0 and kept[-1] == 999
+        assert 437 in kept
+        assert np.all(np.diff(kept) > 0)
+
+    def test_lttb_short_series(self):
+        """Test : série plus courte que la cible retournée entière."""
+        assert lttb(np.arange(5.0), np.ones(5), 10).tolist() == [0, 1, 2, 3, 4]
+
+    def test_lttb_requires_three_points(self):
+        """Test : au moins 3 points demandés."""
+        with pytest.raises(ValueError):
+            lttb(np.arange(5.0), np.ones(5), 2)
+
+    def test_time_buckets(self):
+        """Test : agrégats par seau, seaux vides omis."""
+        buckets = time_buckets(
+            np.array([0, 1, 2, 9, 10, 11]), np.array([1.0, 5.0, 3.0, 2.0, 4.0, 6.0]), 3
+        )
+
+        assert buckets["start"].tolist() == [0, 8]
+        assert buckets["end"].tolist() == [3, 11]
+        assert buckets["count"].tolist() == [3, 3]
+        assert buckets["sum"].tolist() == [9.0, 12.0]
+        assert buckets["min"].tolist() == [1.0, 2.0]
+        assert buckets["max"].tolist() == [5.0, 6.0]
+
+
+class TestCustomerTimelineRoute:
+    """Tests pour la route de chronologie d'un client."""
+
+    def test_timeline_lttb(self, client):
+        """Test : transactions du client avec date, montant et identifiant."""
+        response = client.get("/api/customers/100/timeline")
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["method"] == "lttb"
+        assert len(data["points"]) == data["transaction_count"]
+        assert {"date", "amount", "transaction_id"} <= set(data["points"][0])
+
+    def test_timeline_buckets(self, client):
+        """Test : agrégats par seau de temps."""
+        response = client.get(
+            "/api/customers/100/timeline", params={"method": "buckets", "points": 10}
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert sum(point["count"] for point in data["points"]) == data["transaction_count"]
+        assert "transaction_id" not in data["points"][0]
+
+    def test_unknown_customer(self, client):
+        """Test : client inconnu."""
+        response = client.get("/api/customers/999999/timeline")
+        assert response.status_code == 404
+        assert client.get("/api/customers/abc/timeline").status_code == 404
+
+    def test_internal_error(self, client, monkeypatch):
+        """Test : une erreur interne n'est pas un client inconnu."""
+
+        def failing(timestamps, amounts, points):
+            raise ValueError("erreur interne")
+
+        monkeypatch.setattr(customer_service, "lttb", failing)
+        response = client.get("/api/customers/100/timeline")
+        assert response.status_code == 500
+
+    @pytest.mark.parametrize("params", [{"points": 2}, {"points": 5000}, {"method": "mean"}])
+    def test_invalid_params(self, client, params):
+        """Test : nombre de points ou méthode invalides."""
+        response = client.get("/api/customers/100/timeline", params=params)
+        assert response.status_code == 400
@@ -0,0 +1,56 @@
+"""Tests pour l'encodage des codes d'erreur en masque de bits."""
+
+import pandas as pd
+
+from banking_api.services.column_encoding import encode_flags
+
+
+class TestEncodeFlags:
+    """Tests pour encode_flags."""
+
+    def test_masks_and_labels(self):
+        """Test : un bit par code, masque nul sans erreur."""
+        flags = encode_flags(
+            pd.Series(["Bad PIN,Insufficient Balance", None, "Bad CVV", " ", "Bad PIN"])
+        )
+
+        assert flags.labels.tolist() == ["Bad CVV", "Bad PIN", "Insufficient Balance"]
+        assert flags.masks.tolist() == [6, 0, 1, 0, 2]
+        assert flags.bits(["Bad PIN", "Bad CVV"]) == 3
+
+
+class TestErrorRoutes:
+    """Tests pour les filtres et statistiques d'erreurs."""
+
+    def test_error_breakdown(self, client):
+        """Test : répartition par code d'erreur."""
+        response = client.get("/api/stats/errors")
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["total_transactions"] == 10
+        assert data["with_errors"] == 1
+        assert data["errors"][0]["error"] == "Bad PIN"
+        assert data["combinations"] == [{"errors": ["Bad PIN"], "count": 1}]
+
+    def test_transactions_filtered_by_error(self, client):
+        """Test : filtre errors= sur la liste paginée."""
+        response = client.get("/api/transactions?errors=Bad PIN")
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["total"] == 1
+        assert data["transactions"][0]["id"] == 1004
+
+    def test_search_by_error(self, client):
+        """Test : filtre errors dans la recherche."""
+        response = client.post("/api/transactions/search", json={"errors": "Bad PIN"})
+
+        assert response.status_code == 200
+        assert response.json()["count"] == 1
+
+    def test_unknown_error_code(self, client):
+        """Test : code d'erreur inconnu rejeté."""
+        response = client.get("/api/transactions?errors=Bad CVV")
+
+        assert response.status_code == 400
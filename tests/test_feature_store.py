@@ -0,0 +1,167 @@
+"""Tests pour le feature store comportemental."""
+
+import numpy as np
+
+from banking_api.services import fraud_detection_service
+from banking_api.services.feature_store import FeatureStore
+from banking_api.services.features_service import _get_feature_stores
+
+DAY = 86400
+
+
+def _history() -> FeatureStore:
+    """Client 1 : 6 achats de 30$ à 10h à Paris ; client 2 : 1 achat."""
+    timestamps = np.array([d * DAY + 10 * 3600 for d in range(6)] + [0])
+    return FeatureStore.from_history(
+        keys=np.array([1] * 6 + [2]),
+        timestamps=timestamps,
+        amounts=np.array([30.0] * 6 + [500.0]),
+        state_codes=np.zeros(7, dtype=np.int64),
+        state_labels=["FR"],
+        city_codes=np.zeros(7, dtype=np.int64),
+        city_labels=["Paris"],
+    )
+
+
+class TestFeatureStore:
+    """Tests pour FeatureStore."""
+
+    def test_profile_from_history(self):
+        """Test : statistiques d'un client construites en une passe."""
+        profile = _history().describe(1)
+
+        assert profile["count"] == 6
+        assert profile["amount_mean"] == 30.0
+        assert profile["amount_std"] == 0.0
+        assert round(profile["typical_hour"], 6) == 10.0
+        assert (profile["home_state"], profile["home_city"]) == ("FR", "Paris")
+        assert profile["velocity"] == sum(np.exp(-np.arange(6)))
+
+    def test_update_matches_history(self):
+        """Test : les mises à jour incrémentales redonnent le même profil."""
+        store = FeatureStore()
+        for day in range(6):
+            store.update(1, day * DAY + 10 * 3600, 30.0, "FR", "Paris")
+
+        assert store.describe(1) == _history().describe(1)
+
+    def test_features_flag_deviations(self):
+        """Test : montant, lieu et heure inhabituels ; historique trop court ignoré."""
+        features = _history().features(
+            keys=[1, 1, 2, None],
+            timestamps=np.array([6 * DAY + 22 * 3600, 6 * DAY + 10 * 3600, 0, 0]),
+            amounts=np.array([5000.0, 30.0, 5000.0, 5000.0]),
+            states=["NY", "FR", "NY", "NY"],
+            cities=["New York", "Paris", "New York", "New York"],
+        )
+
+        assert features["amount_zscore"][0] == 4970.0
+        assert features["amount_zscore"][1] == 0.0
+        assert features["new_state"][:2].tolist() == [1.0, 0.0]
+        assert features["hour_deviation"][0] == 12.0
+        assert np.isnan(features["amount_zscore"][2:]).all()
+        assert np.isnan(features["velocity"][3])
+
+    def test_new_entity_is_appended(self):
+        """Test : une entité inconnue est ajoutée au fil de l'eau."""
+        store = _history()
+        for i in range(40):
+            store.update(100 + i, i, 1.0, "NY", "New York")
+
+        assert store.describe(139)["home_state"] == "NY"
+        assert store.describe(1)["count"] == 6
+
+    def test_streamed_states_are_seen(self):
+        """Test : un État reçu en flux n'est plus nouveau pour l'entité."""
+        store = _history()
+        store.update(1, 6 * DAY, 30.0, "NY", "New York")
+
+        features = store.features(
+            keys=[1, 1, 2],
+            timestamps=np.full(3, 7 * DAY),
+            amounts=np.full(3, 30.0),
+            states=["NY", "FR", "NY"],
+            cities=["New York", "Paris", "New York"],
+        )
+
+        assert features["new_state"][:2].tolist() == [0.0, 0.0]
+
+
+class TestBehaviouralScoring:
+    """Tests pour le scoring enrichi par le profil client."""
+
+    def test_unusual_amount_for_customer(self, client):
+        """Test : 5000$ pour un client habitué à 30$ est signalé."""
+        _get_feature_stores.cache_clear()
+        for minute in range(5):
+            response = client.post(
+                "/api/stats/top/events",
+                json={
+                    "date": f"2023-01-01 11:0{minute}:00",
+                    "amount": 30.0,
+                    "client_id": 100,
+                    "card_id": 200,
+                    "merchant_id": 5000,
+                    "merchant_state": "NY",
+                    "merchant_city": "New York",
+                },
+            )
+            assert response.status_code == 200
+
+        transaction = {
+            "type": "Online Transaction",
+            "amount": 5000.0,
+            "merchant_city": "New York",
+            "merchant_state": "NY",
+            "date": "2023-01-01 11:10:00",
+        }
+        anonymous = fraud_detection_service.predict_fraud(
+            transaction["type"], transaction["amount"], "New York", "NY"
+        )
+        response = client.post("/api/fraud/predict", json={**transaction, "client_id": 100})
+
+        assert anonymous["isFraud"] is False
+        data = response.json()
+        assert data["isFraud"] is True
+        assert "Montant inhabituel pour ce client" in data["reasons"]
+        _get_feature_stores.cache_clear()
+
+    def test_customer_features_route(self, client):
+        """Test : GET /api/customers/{id}/features."""
+        _get_feature_stores.cache_clear()
+        response = client.get("/api/customers/101/features")
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["count"] == 1
+        assert data["amount_mean"] == 15000.0
+        assert data["home_state"] == "CA"
+        assert data["last_seen"] == "2023-01-01 10:05:00"
+
+    def test_unknown_card_features(self, client):
+        """Test : carte inconnue -> 404."""
+        response = client.get("/api/cards/999/features")
+
+        assert response.status_code == 404
+
+    def test_invalid_event_date_not_recorded(self, client):
+        """Test : date vide ou invalide -> 400, rien n'est enregistré."""
+        _get_feature_stores.cache_clear()
+        before = client.get("/api/cards/200/features").json()
+
+        for date in ("", "not a date"):
+            response = client.post(
+                "/api/stats/top/events",
+                json={
+                    "date": date,
+                    "amount": 30.0,
+                    "client_id": 100,
+                    "card_id": 200,
+                    "merchant_id": 5000,
+                    "merchant_state": "CA",
+                },
+            )
+            assert response.status_code == 400
+
+        assert client.get("/api/cards/200/features").json() == before
+        _get_feature_stores.cache_clear()
@@ -0,0 +1,87 @@
+"""Tests pour le backtest des règles de fraude."""
+
+import numpy as np
+
+from banking_api.services import fraud_detection_service
+from banking_api.services.fraud_backtest import (
+    average_precision,
+    classification_metrics,
+    confusion_matrix,
+    roc_auc,
+    threshold_curve,
+)
+
+
+class TestBacktestMetrics:
+    """Tests pour les métriques vectorisées."""
+
+    def test_confusion_matrix(self):
+        """Test : chaque combinaison label/prédiction est comptée."""
+        labels = np.array([True, True, False, False, False])
+        predictions = np.array([True, False, True, False, False])
+
+        assert confusion_matrix(labels, predictions) == {"tp": 1, "fp": 1, "fn": 1, "tn": 2}
+
+    def test_metrics_without_predictions(self):
+        """Test : métriques non définies ramenées à 0."""
+        assert classification_metrics(0, 0, 3) == {
+            "precision": 0.0,
+            "recall": 0.0,
+            "f1": 0.0,
+        }
+
+    def test_threshold_curve_groups_ties(self):
+        """Test : un point par score distinct, ex aequo regroupés."""
+        scores = np.array([0.1, 0.9, 0.5, 0.9, 0.1])
+        labels = np.array([False, True, True, False, False])
+
+        curve = threshold_curve(scores, labels)
+
+        assert curve.thresholds.tolist() == [0.9, 0.5, 0.1]
+        assert curve.tp.tolist() == [1, 2, 2]
+        assert curve.fp.tolist() == [1, 1, 3]
+        assert (curve.positives, curve.negatives) == (2, 3)
+
+    def test_auc_matches_pairwise_definition(self):
+        """Test : AUC = probabilité qu'une fraude ait un score supérieur."""
+        rng = np.random.default_rng(0)
+        scores = rng.integers(0, 10, 500) / 10
+        labels = rng.random(500) < scores / 2
+
+        positives, negatives = scores[labels], scores[~labels]
+        diff = positives[:, None] - negatives[None, :]
+        expected = ((diff > 0).sum() + 0.5 * (diff == 0).sum()) / diff.size
+
+        assert np.isclose(roc_auc(threshold_curve(scores, labels)), expected)
+
+    def test_perfect_ranking(self):
+        """Test : un score parfait a une AUC et une précision moyenne de 1."""
+        curve = threshold_curve(np.array([0.9, 0.8, 0.2]), np.array([True, True, False]))
+
+        assert roc_auc(curve) == 1.0
+        assert average_precision(curve) == 1.0
+
+
+class TestFraudBacktest:
+    """Tests pour le backtest sur le dataset de test."""
+
+    def test_backtest_on_labels(self, client):
+        """Test : règles évaluées sur les 10 transactions labellisées."""
+        response = client.get("/api/fraud/backtest")
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["labelled"] == 10
+        assert data["positives"] == 2
+        # 1002 (15000 en ligne) détectée, 1004 (montant négatif) signalée à tort
+        assert data["confusion"] == {"tp": 1, "fp": 1, "fn": 1, "tn": 7}
+        assert data["precision"] == data["recall"] == data["f1"] == 0.5
+        assert data["roc_auc"] == 0.6875
+        assert [point["threshold"] for point in data["curve"]] == [0.65, 0.5, 0.1, 0.0]
+        assert data["curve"][-1]["recall"] == 1.0
+
+    def test_summary_uses_backtest(self):
+        """Test : le résumé reporte la précision et le rappel réels."""
+        result = fraud_detection_service.get_fraud_summary()
+
+        assert result == {"total_frauds": 2, "flagged": 2, "precision": 0.5, "recall": 0.5}
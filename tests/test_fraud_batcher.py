@@ -0,0 +1,110 @@
+"""Tests pour le micro-batching des prédictions de fraude."""
+
+import asyncio
+
+import pytest
+from fastapi import HTTPException
+
+from banking_api.services import fraud_detection_service
+from banking_api.services.fraud_batcher import MicroBatcher
+
+
+def _transactions(n):
+    """Transactions variées (montants, types, dates manquantes)."""
+    return [
+        {
+            "transaction_type": "Online Transaction" if i % 2 else "Chip Transaction",
+            "amount": float(i * 700),
+            "merchant_city": "New York",
+            "merchant_state": "NY",
+            "date": "2023-01-01 03:00:00" if i % 3 else None,
+        }
+        for i in range(n)
+    ]
+
+
+async def _predict_all(batcher, transactions):
+    """Soumet toutes les transactions simultanément."""
+    return await asyncio.gather(
+        *[batcher.predict(**transaction) for transaction in transactions],
+        return_exceptions=True,
+    )
+
+
+class TestMicroBatcher:
+    """Tests pour le regroupement des requêtes."""
+
+    def test_results_match_single_predictions(self):
+        """Test : chaque requête reçoit le résultat de predict_fraud."""
+        transactions = _transactions(20)
+        batcher = MicroBatcher(max_batch_size=64, max_wait_ms=5)
+
+        results = asyncio.run(_predict_all(batcher, transactions))
+
+        assert results == [
+            fraud_detection_service.predict_fraud(**transaction)
+            for transaction in transactions
+        ]
+        assert batcher.batches == 1
+
+    def test_batch_size_limit(self):
+        """Test : un lot plein est scoré sans attendre le délai."""
+        batcher = MicroBatcher(max_batch_size=8, max_wait_ms=10_000)
+
+        results = asyncio.run(
+            asyncio.wait_for(_predict_all(batcher, _transactions(16)), timeout=5)
+        )
+
+        assert len(results) == 16
+        assert batcher.batches == 2
+
+    def test_new_event_loop(self):
+        """Test : le batcher reste utilisable d'une boucle à l'autre."""
+        batcher = MicroBatcher(max_wait_ms=1)
+
+        for _ in range(2):
+            results = asyncio.run(_predict_all(batcher, _transactions(3)))
+            assert all(isinstance(result, dict) for result in results)
+        assert batcher.batches == 2
+
+    def test_batch_without_ids_skips_feature_store(self, monkeypatch):
+        """Test : un lot sans client ni carte n'interroge pas le feature store."""
+
+        def unexpected(*args):
+            raise AssertionError("feature store interrogé")
+
+        monkeypatch.setattr(fraud_detection_service, "transaction_features", unexpected)
+        batcher = MicroBatcher(max_wait_ms=1)
+
+        results = asyncio.run(_predict_all(batcher, _transactions(4)))
+
+        assert all(isinstance(result, dict) for result in results)
+
+    def test_error_isolated_to_request(self, monkeypatch):
+        """Test : un lot rejeté est rescoré transaction par transaction."""
+        predict_fraud = fraud_detection_service.predict_fraud
+
+        def reject_batch(*args, **kwargs):
+            raise HTTPException(status_code=400, detail="Lot invalide")
+
+        def reject_negative(**transaction):
+            if transaction["amount"] < 0:
+                raise HTTPException(status_code=400, detail="Montant invalide")
+            return predict_fraud(**transaction)
+
+        monkeypatch.setattr(fraud_detection_service, "predict_fraud_batch", reject_batch)
+        monkeypatch.setattr(fraud_detection_service, "predict_fraud", reject_negative)
+        transactions = _transactions(3)
+        transactions[1]["amount"] = -1.0
+
+        results = asyncio.run(_predict_all(MicroBatcher(max_wait_ms=1), transactions))
+
+        assert isinstance(results[0], dict)
+        assert isinstance(results[1], HTTPException)
+        assert results[1].status_code == 400
+        assert isinstance(results[2], dict)
+
+    def test_invalid_limits(self):
+        """Test : limites invalides refusées."""
+        with pytest.raises(ValueError):
+            MicroBatcher(max_batch_size=0)
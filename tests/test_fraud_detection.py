@@ -120,3 +120,66 @@ class TestFraudByType:
 
             # Le nombre de fraudes ne peut pas dépasser le total
             assert item["fraud_count"] <= item["total_transactions"]
+
+
+class TestPredictFraudBatch:
+    """Tests pour le scoring par lot."""
+
+    def test_batch_matches_single(self):
+        """Test : chaque ligne du lot égale la prédiction unitaire."""
+        types = ["Online Transaction", "Swipe Transaction", "Chip Transaction"] * 4
+        amounts = [15000.0, 6000.0, -5.0, 0.5, 3000.01, 50.0] * 2
+
+        batch = fraud_detection_service.predict_fraud_batch(types, amounts)
+
+        assert batch["count"] == 12
+        for i, (t, a) in enumerate(zip(types, amounts)):
+            single = fraud_detection_service.predict_fraud(t, a)
+            assert batch["isFraud"][i] == single["isFraud"]
+            assert batch["probability"][i] == single["probability"]
+            assert batch["reasons"][i] == single["reasons"]
+
+    def test_batch_route_columnar(self, client):
+        """Test : lot en colonnes."""
+        response = client.post(
+            "/api/fraud/predict/batch",
+            json={"type": ["Online Transaction", "Chip Transaction"], "amount": [15000, 50]},
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["isFraud"] == [True, False]
+        assert data["flagged"] == 1
+
+    def test_batch_route_rows(self, client, sample_fraud_data):
+        """Test : lot en liste d'objets."""
+        response = client.post(
+            "/api/fraud/predict/batch", json={"transactions": [sample_fraud_data]}
+        )
+
+        assert response.status_code == 200
+        assert response.json()["probability"] == [0.65]
+
+    def test_batch_rows_without_ids_skip_feature_store(
+        self, client, sample_fraud_data, monkeypatch
+    ):
+        """Test : un lot d'objets sans client ni carte n'interroge pas le feature store."""
+
+        def unexpected(*args):
+            raise AssertionError("feature store interrogé")
+
+        monkeypatch.setattr(fraud_detection_service, "transaction_features", unexpected)
+        response = client.post(
+            "/api/fraud/predict/batch", json={"transactions": [sample_fraud_data] * 2}
+        )
+
+        assert response.status_code == 200
+        assert response.json()["probability"] == [0.65, 0.65]
+
+    def test_batch_length_mismatch(self, client):
+        """Test : colonnes de longueurs différentes rejetées."""
+        response = client.post(
+            "/api/fraud/predict/batch", json={"type": ["Chip Transaction"], "amount": []}
+        )
+
+        assert response.status_code == 400
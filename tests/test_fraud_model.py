@@ -0,0 +1,222 @@
+"""Tests pour le modèle de fraude appris et son entraînement."""
+
+import json
+
+import numpy as np
+import pytest
+
+from banking_api import train_fraud_model
+from banking_api.services import fraud_detection_service, fraud_model
+from banking_api.services.fraud_model import (
+    FEATURE_NAMES,
+    LogisticModel,
+    feature_matrix,
+    fit_logistic,
+    load_model,
+    save_model,
+)
+
+
+@pytest.fixture
+def model_path(tmp_path, monkeypatch):
+    """Chemin d'artefact temporaire utilisé par l'API."""
+    path = tmp_path / "fraud_model.json"
+    monkeypatch.setenv("FRAUD_MODEL_PATH", str(path))
+    return path
+
+
+def _amount_model(threshold=0.5):
+    """Modèle dont la probabilité croît avec le montant uniquement."""
+    weights = np.zeros(len(FEATURE_NAMES))
+    weights[0] = 5.0
+    return LogisticModel(
+        weights,
+        -5.0 * np.log1p(1000),
+        np.zeros(len(FEATURE_NAMES)),
+        np.ones(len(FEATURE_NAMES)),
+        threshold,
+    )
+
+
+class TestLogisticModel:
+    """Tests pour l'entraînement et l'artefact."""
+
+    def test_feature_matrix(self):
+        """Test : une colonne par caractéristique, heure inconnue neutralisée."""
+        features = feature_matrix(
+            {
+                "type": np.array(["Online Transaction", "Swipe Transaction"]),
+                "amount": np.array([-10.0, 0.5]),
+                "hour": np.array([6.0, np.nan]),
+            }
+        )
+
+        assert features.shape == (2, len(FEATURE_NAMES))
+        assert features[:, 1].tolist() == [1.0, 0.0]
+        assert features[:, 2].tolist() == [0.0, 1.0]
+        assert features[:, 3].tolist() == [1.0, 0.0]
+        assert features[:, 5].tolist() == pytest.approx([1.0, 0.0])
+        assert features[:, 7].tolist() == [1.0, 0.0]
+        assert features[:, 8].tolist() == [0.0, 0.0]
+
+    def test_fit_separates_classes(self):
+        """Test : le modèle retrouve une caractéristique discriminante."""
+        rng = np.random.default_rng(0)
+        features = rng.normal(size=(2000, 3))
+        labels = features[:, 0] + 0.1 * rng.normal(size=2000) > 1
+
+        model = fit_logistic(features, labels, l2=0.1)
+        accuracy = ((model.predict_proba(features) >= 0.5) == labels).mean()
+
+        assert accuracy > 0.95
+        assert abs(model.weights[0]) > 10 * abs(model.weights[1:]).max()
+
+    def test_save_load_roundtrip(self, tmp_path):
+        """Test : l'artefact relu prédit à l'identique et est versionné."""
+        model = _amount_model(threshold=0.3)
+        model.metadata = {"train_size": 10}
+        path = str(tmp_path / "model.json")
+
+        version = save_model(model, path)
+        loaded = load_model(path)
+        features = feature_matrix(
+            {"type": np.array(["Chip Transaction"] * 2), "amount": np.array([10.0, 1e5])}
+        )
+
+        assert loaded.version == version
+        assert version.startswith("1:")
+        assert loaded.threshold == 0.3
+        assert loaded.metadata["train_size"] == 10
+        assert np.allclose(loaded.predict_proba(features), model.predict_proba(features))
+
+    def test_incompatible_artifact_ignored(self, model_path):
+        """Test : un artefact aux caractéristiques différentes n'est pas chargé."""
+        artifact = _amount_model().to_dict()
+        artifact["features"] = artifact["features"][:-1]
+        model_path.write_text(json.dumps(artifact))
+
+        with pytest.raises(ValueError):
+            load_model(str(model_path))
+        assert fraud_model.get_fraud_model() is None
+
+
+class TestModelScoring:
+    """Tests pour le scoring avec et sans modèle."""
+
+    def test_rules_fallback_without_model(self, model_path):
+        """Test : sans artefact, le scoring utilise les règles."""
+        assert fraud_model.get_fraud_model() is None
+        assert fraud_detection_service.get_model_info()["available"] is False
+
+    def test_predict_with_model(self, model_path):
+        """Test : l'artefact est chargé et son seuil appliqué."""
+        save_model(_amount_model(), str(model_path))
+
+        high = fraud_detection_service.predict_fraud("Chip Transaction", 5000.0)
+        low = fraud_detection_service.predict_fraud("Chip Transaction", 20.0)
+
+        assert high["isFraud"] is True
+        assert high["probability"] > 0.9
+        # Aucune règle déclenchée : la raison est le score du modèle
+        assert high["reasons"] == [fraud_detection_service.MODEL_REASON]
+        assert low["isFraud"] is False
+        assert low["probability"] < 0.1
+
+    def test_batch_matches_single(self, model_path):
+        """Test : le scoring par lot donne les mêmes probabilités."""
+        save_model(_amount_model(), str(model_path))
+        amounts = [20.0, 999.0, 50000.0]
+
+        batch = fraud_detection_service.predict_fraud_batch(
+            ["Chip Transaction"] * 3, amounts
+        )
+        single = [
+            fraud_detection_service.predict_fraud("Chip Transaction", amount)["probability"]
+            for amount in amounts
+        ]
+
+        assert batch["probability"] == single
+
+    def test_backtest_uses_served_scorer(self, client, model_path):
+        """Test : le backtest évalue le modèle chargé, pas les règles."""
+        rules = client.get("/api/fraud/backtest").json()
+        save_model(_amount_model(), str(model_path))
+        model = client.get("/api/fraud/backtest").json()
+
+        assert (rules["scorer"], rules["model_version"]) == ("rules", None)
+        assert model["scorer"] == "model"
+        assert model["model_version"] == fraud_model.get_fraud_model().version
+        assert model["threshold"] == 0.5
+        # Seule la transaction de 15000 dépasse 1000
+        assert model["confusion"] == {"tp": 1, "fp": 0, "fn": 1, "tn": 8}
+        assert fraud_detection_service.get_fraud_summary()["flagged"] == 1
+        # Artefact sans fin d'entraînement : évalué sur tout le dataset
+        assert model["in_sample"] is True
+
+    def test_backtest_excludes_training_rows(self, client, model_path):
+        """Test : le modèle n'est évalué qu'après sa période d'entraînement."""
+        model = _amount_model()
+        # Fin de l'entraînement : transaction 1002 (10:05), fraude de 15000
+        model.metadata = {"train_cutoff": 1672567500}
+        save_model(model, str(model_path))
+
+        data = client.get("/api/fraud/backtest").json()
+
+        assert data["in_sample"] is False
+        assert data["evaluated_after"] == "2023-01-01 10:05:00"
+        assert (data["labelled"], data["positives"]) == (8, 1)
+        assert data["confusion"] == {"tp": 0, "fp": 0, "fn": 1, "tn": 7}
+
+    def test_model_route(self, client, model_path):
+        """Test : la route décrit le modèle chargé."""
+        save_model(_amount_model(threshold=0.7), str(model_path))
+
+        data = client.get("/api/fraud/model").json()
+
+        assert data["available"] is True
+        assert data["threshold"] == 0.7
+        assert data["features"] == list(FEATURE_NAMES)
+
+
+class TestTraining:
+    """Tests pour la commande d'entraînement."""
+
+    def test_train_writes_artifact(self, tmp_path):
+        """Test : l'entraînement écrit un artefact rechargeable."""
+        path = str(tmp_path / "model.json")
+
+        summary = train_fraud_model.train(path, validation=0.5, min_auc=0.0)
+
+        assert load_model(path).version == summary["version"]
+        assert summary["train_size"] == 5
+        assert summary["validation_size"] == 5
+        # Dernière transaction d'entraînement : 1005 (2023-01-01 10:20)
+        assert summary["train_cutoff"] == 1672568400
+        assert 0.0 <= summary["validation"]["roc_auc"] <= 1.0
+
+    def test_location_risk_from_training_period(self, tmp_path, monkeypatch):
+        """Test : les taux par zone ignorent les labels de validation."""
+        calls = []
+        dataset_columns = train_fraud_model.dataset_columns
+
+        def recording(rows, history=None):
+            calls.append((rows, history))
+            return dataset_columns(rows, history)
+
+        monkeypatch.setattr(train_fraud_model, "dataset_columns", recording)
+        train_fraud_model.train(str(tmp_path / "model.json"), validation=0.5, min_auc=0.0)
+
+        (rows, history), = calls
+        assert history.tolist() == rows[:5].tolist()
+
+    def test_low_auc_not_written(self, tmp_path, capsys):
+        """Test : un modèle sous l'AUC minimale n'est pas écrit."""
+        path = tmp_path / "model.json"
+
+        code = train_fraud_model.main(
+            ["--output", str(path), "--validation", "0.5", "--min-auc", "1.01"]
+        )
+
+        assert code == 1
+        assert not path.exists()
+        assert "AUC" in capsys.readouterr().err
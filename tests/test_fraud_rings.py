@@ -0,0 +1,121 @@
+"""Tests pour la détection des réseaux de fraude."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from banking_api.services import fraud_rings_service
+from banking_api.services.column_encoding import encode_categories
+from banking_api.services.fraud_rings_service import find_rings
+from banking_api.services.graph import connected_components, csr_adjacency
+
+
+class TestGraph:
+    """Tests pour l'adjacence CSR et les composantes connexes."""
+
+    def test_csr_adjacency_deduplicates(self):
+        """Test : voisins triés et dédoublonnés par nœud source."""
+        indptr, indices = csr_adjacency(np.array([2, 0, 2, 2]), np.array([5, 1, 3, 5]), 4)
+
+        assert indptr.tolist() == [0, 1, 1, 3, 3]
+        assert indices.tolist() == [1, 3, 5]
+
+    def test_connected_components(self):
+        """Test : chaque nœud est étiqueté par le plus petit nœud de sa composante."""
+        components = connected_components(7, np.array([4, 1, 6]), np.array([2, 4, 5]))
+
+        assert components.tolist() == [0, 1, 1, 3, 1, 5, 5]
+
+    def test_components_match_union_find(self):
+        """Test : même résultat qu'un union-find séquentiel."""
+        rng = np.random.default_rng(0)
+        sources, targets = rng.integers(0, 200, 150), rng.integers(0, 200, 150)
+        parent = list(range(200))
+
+        def find(node):
+            while parent[node] != node:
+                node = parent[node]
+            return node
+
+        for a, b in zip(sources, targets):
+            parent[max(find(a), find(b))] = min(find(a), find(b))
+
+        components = connected_components(200, sources, targets)
+
+        assert components.tolist() == [find(node) for node in range(200)]
+
+
+class TestFindRings:
+    """Tests pour le graphe client ↔ marchand / carte."""
+
+    def test_shared_merchant_and_card(self):
+        """Test : clients reliés par un marchand ou une carte en commun."""
+        # Clients 0-1 : même marchand ; 2-3 : même carte ; 4 isolé
+        clients = np.array([0, 1, 2, 3, 4])
+        merchants = np.array([0, 0, 1, 2, 3])
+        cards = np.array([0, 1, 2, 2, 3])
+
+        rings = find_rings(clients, merchants, cards, 5, 4, 4)
+
+        assert rings[0] == rings[1]
+        assert rings[2] == rings[3]
+        assert len(np.unique(rings)) == 3
+
+    def test_hub_merchant_ignored(self):
+        """Test : un marchand fraudé par trop de clients ne les relie pas."""
+        clients = np.arange(4)
+        merchants = np.zeros(4, dtype=int)
+
+        rings = find_rings(clients, merchants, clients, 4, 1, 4, max_merchant_clients=3)
+
+        assert len(np.unique(rings)) == 4
+
+
+@pytest.fixture
+def fraud_dataset(monkeypatch):
+    """Petit dataset avec deux réseaux de fraude."""
+    df = pd.DataFrame(
+        {
+            "client_id": [1, 2, 2, 3, 4, 5, 6],
+            "merchant_id": [10, 10, 11, 11, 20, 20, 30],
+            "card_id": [100, 200, 201, 300, 400, 500, 600],
+            "amount": [10.0, 20.0, 30.0, 40.0, 500.0, 600.0, 5.0],
+            "isFraud": [1, 1, 1, 1, 1, 1, 0],
+        }
+    )
+    timestamps = np.arange(len(df), dtype=np.int64) * 3600 + 1672567200
+    monkeypatch.setattr(fraud_rings_service, "get_cached_dataframe", lambda: df)
+    monkeypatch.setattr(fraud_rings_service, "get_timestamps", lambda: timestamps)
+    monkeypatch.setattr(
+        fraud_rings_service, "get_encoded_column", lambda name: encode_categories(df[name])
+    )
+    return df
+
+
+class TestRingsService:
+    """Tests pour le classement des réseaux."""
+
+    def test_rings_ranked_by_fraud_count(self, fraud_dataset):
+        """Test : réseaux d'au moins deux clients, par nombre de fraudes."""
+        rings = fraud_rings_service._get_rings.__wrapped__("test")
+
+        assert [ring["clients"] for ring in rings] == [[1, 2, 3], [4, 5]]
+        assert rings[0]["fraud_count"] == 4
+        assert rings[0]["merchants"] == [10, 11]
+        assert rings[0]["fraud_amount"] == 100.0
+        assert rings[0]["first_date"] == "2023-01-01 10:00:00"
+        assert rings[1]["card_count"] == 2
+
+    def test_rings_route(self, client):
+        """Test : la route retourne les réseaux classés."""
+        response = client.get("/api/fraud/rings", params={"limit": 5})
+
+        assert response.status_code == 200
+        data = response.json()
+        assert len(data["rings"]) == min(data["total"], 5)
+
+    def test_invalid_min_clients(self, client):
+        """Test : un réseau compte au moins deux clients."""
+        response = client.get("/api/fraud/rings", params={"min_clients": 1})
+
+        assert response.status_code == 400
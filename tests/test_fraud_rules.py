@@ -0,0 +1,90 @@
+"""Tests pour le moteur de règles de fraude déclaratives."""
+
+import json
+import os
+
+import numpy as np
+
+from banking_api.services import fraud_detection_service
+from banking_api.services.fraud_rules import RuleSet, get_rule_set
+
+NIGHT_RULES = {
+    "version": "test",
+    "threshold": 0.5,
+    "rules": [
+        {
+            "name": "night_online",
+            "weight": 0.6,
+            "reason": "Transaction en ligne de nuit",
+            "when": {"type": {"eq": "Online Transaction"}, "hour": {"lt": 6}},
+        },
+        {
+            "name": "risky_mcc",
+            "weight": 0.5,
+            "reason": "Catégorie à risque",
+            "when": {"mcc": {"in": [7995, 4829]}},
+        },
+    ],
+}
+
+
+def _write_rules(path, config, mtime):
+    """Écrit un fichier de règles avec une date de modification donnée."""
+    path.write_text(json.dumps(config), encoding="utf-8")
+    os.utime(path, ns=(mtime, mtime))
+
+
+class TestRuleSet:
+    """Tests pour la compilation des règles."""
+
+    def test_conditions_on_time_and_mcc(self):
+        """Test : conditions horaires et MCC, champ absent jamais vérifié."""
+        rule_set = RuleSet(NIGHT_RULES, "test")
+        columns = {
+            "type": np.array(["Online Transaction", "Online Transaction", "Chip"]),
+            "amount": np.array([10.0, 10.0, 10.0]),
+            "hour": np.array([3.0, 12.0, 3.0]),
+        }
+
+        assert rule_set.patterns(columns).tolist() == [1, 0, 0]
+        columns["mcc"] = np.array([5411.0, 7995.0, np.nan])
+        assert rule_set.patterns(columns).tolist() == [1, 2, 0]
+
+    def test_default_rules_loaded(self):
+        """Test : le fichier livré commence par les cinq règles historiques."""
+        weights = [rule.weight for rule in get_rule_set().rules]
+        assert weights[:5] == [0.4, 0.5, 0.3, 0.25, 0.1]
+
+
+class TestHotReload:
+    """Tests pour le rechargement à chaud du fichier de règles."""
+
+    def test_reload_on_change(self, tmp_path, monkeypatch):
+        """Test : une modification du fichier change les prédictions."""
+        path = tmp_path / "rules.json"
+        monkeypatch.setenv("FRAUD_RULES_PATH", str(path))
+        _write_rules(path, NIGHT_RULES, 1_000_000_000)
+
+        night = fraud_detection_service.predict_fraud(
+            "Online Transaction", 20.0, date="2023-01-01 03:00:00"
+        )
+        assert night["reasons"] == ["Transaction en ligne de nuit"]
+
+        config = dict(NIGHT_RULES, threshold=0.9)
+        _write_rules(path, config, 2_000_000_000)
+        night = fraud_detection_service.predict_fraud(
+            "Online Transaction", 20.0, date="2023-01-01 03:00:00"
+        )
+        assert night["isFraud"] is False
+
+    def test_invalid_file_keeps_last_rules(self, tmp_path, monkeypatch):
+        """Test : un fichier invalide ne remplace pas les règles valides."""
+        path = tmp_path / "rules.json"
+        monkeypatch.setenv("FRAUD_RULES_PATH", str(path))
+        _write_rules(path, NIGHT_RULES, 1_000_000_000)
+        version = get_rule_set().version
+
+        path.write_text("{invalid", encoding="utf-8")
+        os.utime(path, ns=(3_000_000_000, 3_000_000_000))
+
+        assert get_rule_set().version == version
@@ -0,0 +1,41 @@
+"""Tests pour l'analyse géographique."""
+
+from banking_api.services.geo_service import format_zip
+
+
+class TestGeoRoutes:
+    """Tests pour GET /api/stats/geo."""
+
+    def test_states_by_count(self, client):
+        """Test : états triés par nombre de transactions."""
+        response = client.get("/api/stats/geo?level=state&limit=2")
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["total_areas"] == 6
+        assert [(a["state"], a["count"]) for a in data["areas"]] == [("CA", 3), ("TX", 3)]
+        assert "city" not in data["areas"][0]
+
+    def test_cities_filtered_by_type(self, client):
+        """Test : villes filtrées par type, triées par volume."""
+        response = client.get(
+            "/api/stats/geo?level=city&type=Swipe Transaction&sort=volume"
+        )
+
+        data = response.json()
+        assert [a["city"] for a in data["areas"]] == ["San Antonio", "San Jose", "Chicago"]
+        assert data["areas"][0]["total_amount"] == 200.0
+
+    def test_zip_labels(self, client):
+        """Test : codes postaux formatés sur 5 chiffres."""
+        data = client.get("/api/stats/geo?level=zip&merchant_state=PA").json()
+
+        assert data["areas"][0]["zip"] == "19019"
+        assert format_zip(1001.0) == "01001"
+        assert format_zip("") == ""
+
+    def test_invalid_level(self, client):
+        """Test : niveau inconnu rejeté."""
+        response = client.get("/api/stats/geo?level=country")
+
+        assert response.status_code == 400
@@ -0,0 +1,61 @@
+"""Tests pour le comptage approximatif de valeurs distinctes."""
+
+import numpy as np
+
+from banking_api.services.hyperloglog import (
+    STANDARD_ERROR,
+    HyperLogLog,
+    build_sketches,
+    estimate,
+)
+
+
+class TestHyperLogLog:
+    """Tests pour les sketches HyperLogLog."""
+
+    def test_large_cardinality_within_error(self):
+        """Test : estimation à quelques erreurs types près."""
+        sketch = HyperLogLog()
+        sketch.add_all(range(100000))
+
+        assert abs(sketch.estimate() - 100000) <= 4 * STANDARD_ERROR * 100000
+
+    def test_merge_is_union(self):
+        """Test : la fusion compte l'union sans doublons."""
+        first, second = HyperLogLog(), HyperLogLog()
+        first.add_all(range(0, 600))
+        second.add_all(range(400, 1000))
+
+        assert abs(first.merge(second).estimate() - 1000) <= 50
+
+    def test_grouped_sketches(self):
+        """Test : un sketch par groupe, petites cardinalités quasi exactes."""
+        groups = np.array([0, 0, 0, 1, 1, 2])
+        values = np.array([7, 7, 8, 7, 9, 10])
+        estimates = estimate(build_sketches(groups, values), 3)
+
+        assert np.round(estimates).tolist() == [2, 2, 1]
+
+
+class TestDistinctMetrics:
+    """Tests pour les métriques distinct_* de /api/stats/group."""
+
+    def test_distinct_customers_by_state_and_day(self, client):
+        """Test : clients distincts par état et par jour."""
+        response = client.get(
+            "/api/stats/group?by=merchant_state,day&metrics=count,distinct_customers"
+        )
+
+        assert response.status_code == 200
+        groups = response.json()["groups"]
+        assert {g["merchant_state"] for g in groups} == {"NY", "CA", "IL", "TX", "AZ", "PA"}
+        assert all(g["distinct_customers"] == g["count"] for g in groups)
+
+    def test_distinct_cards_with_type_filter(self, client):
+        """Test : cartes distinctes avec filtre (calcul depuis les lignes)."""
+        response = client.get(
+            "/api/stats/group?by=use_chip&metrics=distinct_cards&type=Swipe Transaction"
+        )
+
+        assert response.status_code == 200
+        assert response.json()["groups"][0]["distinct_cards"] == 3
@@ -0,0 +1,152 @@
+"""Tests pour les tables de risque géographique."""
+
+import numpy as np
+
+from banking_api.services import fraud_detection_service, geo_service
+from banking_api.services.column_encoding import EncodedColumn
+from banking_api.services.location_risk import LocationRisk
+
+
+def _risk() -> LocationRisk:
+    """
+    CA : 100 transactions dont 50 fraudes, toutes à Los Angeles (90001).
+    NY : 900 transactions sans fraude, dont 1 fraude isolée à Albany.
+    """
+    n_ca, n_ny = 100, 900
+    fraud = np.zeros(n_ca + n_ny)
+    fraud[:50] = 1
+    fraud[-1] = 1
+    states = np.array([0] * n_ca + [1] * n_ny)
+    cities = np.array([1] * n_ca + [2] * (n_ny - 1) + [0])
+    zips = np.array([0] * n_ca + [1] * n_ny)
+    return LocationRisk.from_history(
+        fraud,
+        states,
+        ["CA", "NY"],
+        cities,
+        ["Albany", "Los Angeles", "New York"],
+        zips,
+        ["90001", "10001"],
+        strength=100.0,
+    )
+
+
+class TestLocationRisk:
+    """Tests pour LocationRisk."""
+
+    def test_state_rate_is_smoothed_to_global(self):
+        """Test : taux d'État tiré vers le taux global."""
+        risk = _risk()
+        level, position = risk.lookup("CA")
+
+        assert risk.prior == 51 / 1000
+        assert level == "state"
+        assert np.isclose(risk.tables["state"].rates[position], (50 + 100 * 0.051) / 200)
+
+    def test_rare_city_shrinks_to_state(self):
+        """Test : 1 fraude sur 1 transaction reste proche du taux de l'État."""
+        risk = _risk()
+        rates = risk.risk(["NY", "NY"], ["Albany", "New York"], ["", ""])
+
+        state_rate = risk.tables["state"].rates[risk.lookup("NY")[1]]
+        assert rates[0] < 0.02
+        assert np.isclose(rates[0], (1 + 100 * state_rate) / 101)
+        assert rates[1] < state_rate
+
+    def test_most_specific_level_wins(self):
+        """Test : code postal, puis ville, puis État, puis taux global."""
+        risk = _risk()
+
+        assert risk.lookup("CA", "Los Angeles", "90001")[0] == "zip"
+        assert risk.lookup("CA", "Los Angeles", "99999")[0] == "city"
+        assert risk.lookup("CA", "Paris")[0] == "state"
+        assert risk.lookup("FR", "Paris") == (None, -1)
+        assert risk.risk(["FR"], ["Paris"], [""])[0] == risk.prior
+
+    def test_batch_matches_single_lookups(self):
+        """Test : lot avec doublons et valeurs manquantes, une recherche par zone."""
+        risk = _risk()
+        states = ["CA", None, "CA", "NY", "CA"]
+        cities = ["Los Angeles", "Albany", "Los Angeles", np.nan, "Los Angeles"]
+        zips = ["90001", "", "90001", None, "99999"]
+
+        expected = [
+            risk.risk([state or ""], [city if isinstance(city, str) else ""], [zip_code or ""])[0]
+            for state, city, zip_code in zip(states, cities, zips)
+        ]
+        assert risk.risk(states, cities, zips).tolist() == expected
+        assert risk.risk([], [], []).tolist() == []
+
+    def test_lift_without_frauds(self):
+        """Test : lift neutre si le dataset ne contient aucune fraude."""
+        risk = LocationRisk.from_history(
+            np.zeros(3), np.zeros(3, dtype=int), ["CA"], np.zeros(3, dtype=int),
+            ["Los Angeles"], np.zeros(3, dtype=int), ["90001"],
+        )
+
+        assert risk.lift(np.array([0.0])).tolist() == [1.0]
+
+
+class TestLocationScoring:
+    """Tests pour le risque géographique dans le scoring."""
+
+    def test_risky_location_adds_reason(self, monkeypatch):
+        """Test : une zone à risque ajoute son poids à la prédiction."""
+        monkeypatch.setattr(geo_service, "_get_location_risk", lambda version: _risk())
+
+        risky = fraud_detection_service.predict_fraud(
+            "Swipe Transaction", 6000.0, "Los Angeles", "CA"
+        )
+        safe = fraud_detection_service.predict_fraud(
+            "Swipe Transaction", 6000.0, "New York", "NY"
+        )
+
+        assert risky["isFraud"] is True
+        assert "Zone à taux de fraude élevé" in risky["reasons"]
+        assert safe["isFraud"] is False
+
+    def test_backtest_location_risk_is_out_of_fold(self, monkeypatch):
+        """Test : le label d'une transaction n'entre pas dans son propre risque."""
+        encoded = geo_service.get_encoded_column
+
+        def with_one_fraud(name):
+            if name != "isFraud":
+                return encoded(name)
+            codes = np.zeros(10, dtype=np.int64)
+            codes[1] = 1
+            return EncodedColumn(codes, np.array([0, 1]))
+
+        monkeypatch.setattr(geo_service, "get_encoded_column", with_one_fraud)
+        rows = np.arange(10)
+
+        geo_service._get_location_risk.cache_clear()
+        try:
+            in_sample = fraud_detection_service.dataset_columns(rows)["location_lift"]
+        finally:
+            geo_service._get_location_risk.cache_clear()
+        out_of_fold = fraud_detection_service.out_of_fold_columns(rows)["location_lift"]
+
+        # Transaction 1 (CA) : seule fraude, exclue de ses propres tables
+        assert in_sample[1] > 1
+        assert out_of_fold[1] == 1.0
+        # Transaction 3 (TX) : zone connue des autres partitions, sans fraude
+        assert out_of_fold[3] < 1
+
+    def test_location_risk_route(self, client):
+        """Test : GET /api/stats/geo/risk."""
+        response = client.get(
+            "/api/stats/geo/risk?merchant_state=CA&merchant_city=Los Angeles&zip=90001"
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["level"] == "zip"
+        assert data["transaction_count"] == 1
+        assert data["lift"] == 1.0
+
+    def test_unknown_location(self, client):
+        """Test : zone inconnue -> taux global, sans niveau."""
+        data = client.get("/api/stats/geo/risk?merchant_state=FR&merchant_city=Paris").json()
+
+        assert data["level"] is None
+        assert data["transaction_count"] == 0
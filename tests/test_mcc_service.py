@@ -0,0 +1,45 @@
+"""Tests pour l'analyse par MCC."""
+
+
+class TestMccRoutes:
+    """Tests pour /api/stats/mcc."""
+
+    def test_stats_by_volume(self, client):
+        """Test : MCC triés par volume."""
+        response = client.get("/api/stats/mcc")
+
+        assert response.status_code == 200
+        data = response.json()
+        assert [row["mcc"] for row in data] == [5812, 5999, 5411]
+        assert data[0]["count"] == 3
+        assert data[0]["total_amount"] == 15575.0
+
+    def test_risky_min_count(self, client):
+        """Test : min_count exclut les MCC trop peu représentés."""
+        response = client.get("/api/stats/mcc/risky?min_count=4")
+
+        assert response.status_code == 200
+        assert [row["mcc"] for row in response.json()] == [5411]
+
+    def test_detail_with_monthly_trend(self, client):
+        """Test : détail d'un MCC et tendance par mois."""
+        response = client.get("/api/stats/mcc/5999")
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["count"] == 3
+        assert data["trend"] == [
+            {
+                "month": "2023-01",
+                "count": 3,
+                "total_amount": 350.5,
+                "fraud_count": 0,
+                "fraud_rate": 0.0,
+            }
+        ]
+
+    def test_unknown_mcc(self, client):
+        """Test : MCC inconnu."""
+        response = client.get("/api/stats/mcc/1234")
+
+        assert response.status_code == 404
@@ -0,0 +1,77 @@
+"""Tests pour les profils et statistiques marchands."""
+
+import numpy as np
+
+from banking_api.services import merchant_service
+from banking_api.services.entity_summary import mode_per_group
+
+
+class TestMerchantSummary:
+    """Tests pour la table de synthèse marchand."""
+
+    def test_mode_per_group(self):
+        """Test : valeur la plus fréquente par groupe, -1 si vide."""
+        modes = mode_per_group(
+            np.array([0, 0, 0, 2, 2]), 3, np.array([1, 2, 2, 1, 0]), 3
+        )
+
+        assert modes.tolist() == [2, -1, 0]
+
+
+class TestMerchantRoutes:
+    """Tests pour /api/merchants."""
+
+    def test_list_sorted_by_volume(self, client):
+        """Test : liste paginée triée par volume décroissant."""
+        response = client.get("/api/merchants?sort=volume&limit=3")
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["total"] == 10
+        assert [m["merchant_id"] for m in data["merchants"]] == [5001, 5007, 5006]
+
+    def test_list_default_order(self, client):
+        """Test : tri par identifiant par défaut, seconde page."""
+        data = client.get("/api/merchants?page=2&limit=4").json()
+
+        assert [m["merchant_id"] for m in data["merchants"]] == [
+            5004, 5005, 5006, 5007,
+        ]
+
+    def test_invalid_sort(self, client):
+        """Test : critère de tri inconnu rejeté."""
+        response = client.get("/api/merchants?sort=unknown")
+
+        assert response.status_code == 400
+
+    def test_profile(self, client):
+        """Test : profil détaillé avec villes et tendance journalière."""
+        response = client.get("/api/merchants/5000")
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["top_mcc"] == 5411
+        assert data["top_city"] == "New York"
+        assert data["distinct_customers"] == 1
+        assert data["cities"] == [{"city": "New York", "count": 1}]
+        assert data["daily_trend"] == [
+            {"day": "2023-01-01", "count": 1, "avg_amount": 50.0, "total_amount": 50.0}
+        ]
+
+    def test_profile_not_found(self, client):
+        """Test : marchand inconnu."""
+        response = client.get("/api/merchants/999999")
+
+        assert response.status_code == 404
+        assert client.get("/api/merchants/abc").status_code == 404
+
+    def test_profile_internal_error(self, client, monkeypatch):
+        """Test : une erreur interne n'est pas un marchand inconnu."""
+
+        def failing(rows):
+            raise ValueError("erreur interne")
+
+        monkeypatch.setattr(merchant_service, "_cities", failing)
+        response = client.get("/api/merchants/5000")
+
+        assert response.status_code == 500
@@ -0,0 +1,60 @@
+"""Tests pour les sketches de quantiles."""
+
+import numpy as np
+
+from banking_api.services.quantile_sketch import RELATIVE_ACCURACY, QuantileSketch
+
+
+class TestQuantileSketch:
+    """Tests pour le sketch à erreur relative bornée."""
+
+    def test_relative_accuracy(self):
+        """Test : les quantiles respectent l'erreur relative annoncée."""
+        values = np.random.default_rng(0).lognormal(3, 1.5, 50000)
+        sketch = QuantileSketch.from_values(values)
+
+        quantiles = [0.5, 0.9, 0.99, 0.999]
+        approx = sketch.quantiles(quantiles)
+        exact = np.quantile(values, quantiles, method="lower")
+        assert np.all(np.abs(approx - exact) <= RELATIVE_ACCURACY * exact + 1e-9)
+
+    def test_merge_equals_union(self):
+        """Test : fusionner deux sketches équivaut au sketch de l'union."""
+        values = np.array([-20.0, 0.0, 3.5, 10.0, 250.0, 1200.0])
+        merged = QuantileSketch.from_values(values[:3]).merge(
+            QuantileSketch.from_values(values[3:])
+        )
+
+        assert merged.count == len(values)
+        assert np.array_equal(merged.counts, QuantileSketch.from_values(values).counts)
+
+    def test_streaming_add(self):
+        """Test : ajout en flux d'une valeur négative."""
+        sketch = QuantileSketch()
+        sketch.add(-100.0)
+
+        assert sketch.count == 1
+        assert abs(sketch.quantiles([0.5])[0] + 100.0) <= 1.0
+
+
+class TestPercentilesRoute:
+    """Tests pour GET /api/stats/percentiles."""
+
+    def test_percentiles_by_type(self, client):
+        """Test : percentiles par type de transaction."""
+        response = client.get("/api/stats/percentiles?by=use_chip&q=0.5,0.99")
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["relative_accuracy"] == RELATIVE_ACCURACY
+        assert sum(g["count"] for g in data["groups"]) == 10
+        assert all(g["p50"] <= g["p99"] for g in data["groups"])
+
+    def test_percentiles_single_customer(self, client):
+        """Test : percentiles d'un client donné."""
+        response = client.get("/api/stats/percentiles?by=client_id&key=101&q=0.5")
+
+        assert response.status_code == 200
+        groups = response.json()["groups"]
+        assert len(groups) == 1
+        assert abs(groups[0]["p50"] - 15000.0) <= 150.0
@@ -0,0 +1,46 @@
+"""Tests pour les classements top-K."""
+
+
+class TestRankingRoutes:
+    """Tests pour GET /api/stats/rankings/{entity}."""
+
+    def test_customers_by_volume(self, client):
+        """Test : classement des clients par volume."""
+        response = client.get("/api/stats/rankings/customers?n=3")
+
+        assert response.status_code == 200
+        data = response.json()
+        assert [row["rank"] for row in data] == [1, 2, 3]
+        assert data[0]["id"] == 101
+        assert data[0]["total_amount"] >= data[1]["total_amount"] >= data[2]["total_amount"]
+
+    def test_merchants_with_filters(self, client):
+        """Test : classement filtré par type et par état."""
+        response = client.get(
+            "/api/stats/rankings/merchants?by=avg_ticket&type=Swipe Transaction"
+            "&merchant_state=TX"
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert [row["id"] for row in data] == [5006]
+
+    def test_cards_min_count(self, client):
+        """Test : min_count exclut les cartes trop peu actives."""
+        response = client.get("/api/stats/rankings/cards?by=fraud_rate&min_count=2")
+
+        assert response.status_code == 200
+        assert response.json() == []
+
+    def test_invalid_criterion(self, client):
+        """Test : critère inconnu rejeté."""
+        response = client.get("/api/stats/rankings/customers?by=unknown")
+
+        assert response.status_code == 400
+
+    def test_top_customers_by_avg_ticket(self, client):
+        """Test : /api/customers/top accepte les nouveaux critères."""
+        response = client.get("/api/customers/top?n=1&by=avg_ticket")
+
+        assert response.status_code == 200
+        assert response.json()[0]["customer_id"] == 101
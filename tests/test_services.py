@@ -126,3 +126,62 @@ class TestTransactionsService:
         data = response.json()
         assert "transactions" in data
         assert isinstance(data["transactions"], list)
+
+
+class TestAmountDistribution:
+    """Tests pour l'histogramme configurable des montants."""
+
+    def test_custom_edges(self, client):
+        """Test : bornes explicites, convention de np.histogram."""
+        response = client.get("/api/stats/amount-distribution?edges=0,50,200,15000")
+        assert response.status_code == 200
+        data = response.json()
+        assert data["bins"] == ["0-50", "50-200", "200-15000"]
+        assert data["counts"] == [3, 3, 3]
+
+    def test_log_scale_with_breakdown(self, client):
+        """Test : échelle log avec répartition par fraude."""
+        response = client.get("/api/stats/amount-distribution?bins=4&scale=log&by=isFraud")
+        assert response.status_code == 200
+        data = response.json()
+        assert len(data["counts"]) == 4
+        assert sum(data["counts"]) == 9
+        per_group = [sum(c) for c in zip(*data["breakdown"].values())]
+        assert per_group == data["counts"]
+
+    def test_invalid_edges(self, client):
+        """Test : bornes non croissantes rejetées."""
+        response = client.get("/api/stats/amount-distribution?edges=10,5")
+        assert response.status_code == 400
+
+
+class TestCustomerSummary:
+    """Tests pour la table de synthèse par client."""
+
+    def test_summary_matches_groupby(self):
+        """Test : la table de synthèse équivaut au groupby pandas."""
+        from banking_api.services import data_cache
+
+        df = data_cache.get_cached_dataframe()
+        summary = data_cache.get_customer_summary()
+        expected = df.groupby("client_id")["amount"].agg(["count", "sum", "min", "max"])
+
+        assert list(summary.index) == list(expected.index)
+        assert summary["transaction_count"].tolist() == expected["count"].tolist()
+        assert summary["total_amount"].tolist() == expected["sum"].tolist()
+        assert summary["min_amount"].tolist() == expected["min"].tolist()
+
+    def test_profile_includes_summary_fields(self, client):
+        """Test : le profil expose dates et entités distinctes."""
+        response = client.get("/api/customers/103")
+        assert response.status_code == 200
+        data = response.json()
+        assert data["min_amount"] == -100.0
+        assert data["first_date"] == "2023-01-01 10:15:00"
+        assert data["distinct_cards"] == 1
+        assert data["distinct_merchants"] == 1
+
+    def test_unknown_customer(self, client):
+        """Test : client inconnu -> 404."""
+        response = client.get("/api/customers/999999")
+        assert response.status_code == 404
@@ -0,0 +1,97 @@
+"""Tests pour les heavy hitters par fenêtre de temps."""
+
+import numpy as np
+
+from banking_api.services.heavy_hitters_service import _get_windows
+from banking_api.services.space_saving import SpaceSaving, WindowedSummaries
+
+
+class TestSpaceSaving:
+    """Tests pour les résumés Space-Saving."""
+
+    def test_heavy_keys_found_with_bounded_error(self):
+        """Test : les clés lourdes sont retrouvées, erreur sous W / capacité."""
+        rng = np.random.default_rng(0)
+        stream = np.concatenate([np.repeat([1, 2, 3], 500), rng.integers(10, 1000, 3000)])
+        rng.shuffle(stream)
+
+        summary = SpaceSaving(50)
+        for key in stream:
+            summary.update(int(key))
+
+        top = summary.top(3)
+        assert sorted(key for key, _, _ in top) == [1, 2, 3]
+        for _, value, error in top:
+            assert value - error <= 500 <= value
+            assert error <= len(stream) / 50
+
+    def test_merge_matches_exact_for_small_streams(self):
+        """Test : sans débordement, la fusion est exacte."""
+        first = SpaceSaving.from_exact(np.array([1, 2]), np.array([10.0, 5.0]), 10)
+        second = SpaceSaving.from_exact(np.array([2, 3]), np.array([7.0, 1.0]), 10)
+
+        assert first.merge(second).top(3) == [(2, 12.0, 0.0), (1, 10.0, 0.0), (3, 1.0, 0.0)]
+
+    def test_windows_evict_old_buckets(self):
+        """Test : seuls les seaux de la rétention sont conservés."""
+        windows = WindowedSummaries.from_history(
+            np.array([0, 3600, 7200]), np.array([1, 2, 3]), np.ones(3), 3600, 2, 10
+        )
+        assert sorted(windows.buckets) == [1, 2]
+
+        windows.add(3 * 3600, 4, 5.0)
+        summary, start, end = windows.window(2)
+
+        assert sorted(windows.buckets) == [2, 3]
+        assert summary.top(1) == [(4, 5.0, 0.0)]
+        assert (start, end) == (2 * 3600, 4 * 3600)
+
+
+class TestHeavyHitterRoutes:
+    """Tests pour GET /api/stats/top."""
+
+    def test_top_merchants_by_volume(self, client):
+        """Test : top marchands du dernier jour."""
+        _get_windows.cache_clear()
+        response = client.get("/api/stats/top?entity=merchant&window=1d&k=2")
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["window_start"] == "2023-01-01 00:00:00"
+        assert [row["id"] for row in data["top"]] == [5001, 5007]
+        assert data["max_error"] == 0
+
+    def test_refunds_count_as_positive_volume(self, client):
+        """Test : un remboursement pèse son montant absolu."""
+        _get_windows.cache_clear()
+        data = client.get("/api/stats/top?entity=merchant&window=1d&k=10").json()
+
+        values = {row["id"]: row["value"] for row in data["top"]}
+        assert values[5003] == 100.0
+        assert data["total"] == 16106.0
+
+    def test_streamed_event_updates_window(self, client):
+        """Test : une transaction reçue en flux avance la fenêtre."""
+        _get_windows.cache_clear()
+        response = client.post(
+            "/api/stats/top/events",
+            json={
+                "date": "2023-01-01 11:30:00",
+                "amount": 99.0,
+                "client_id": 100,
+                "card_id": 200,
+                "merchant_id": 5000,
+            },
+        )
+        assert response.status_code == 200
+
+        data = client.get("/api/stats/top?entity=customer&window=1h&by=count").json()
+        assert data["window_start"] == "2023-01-01 11:00:00"
+        assert data["top"] == [{"rank": 1, "id": 100, "value": 1.0, "error": 0.0}]
+        _get_windows.cache_clear()
+
+    def test_invalid_window(self, client):
+        """Test : fenêtre inconnue rejetée."""
+        response = client.get("/api/stats/top?window=2w")
+
+        assert response.status_code == 400
@@ -0,0 +1,125 @@
+"""Tests pour les règles de vélocité et les alertes."""
+
+import numpy as np
+
+from banking_api.services import alerts_service
+from banking_api.services.velocity import (
+    VelocityRule,
+    evaluate_rule,
+    window_distinct,
+    window_starts,
+)
+
+# 2023-01-03 00:00:00, en secondes depuis l'epoch
+DAY_3 = 1672704000
+
+
+class TestSlidingWindows:
+    """Tests pour les fenêtres glissantes vectorisées."""
+
+    def test_window_does_not_cross_entities(self):
+        """Test : la fenêtre s'arrête au début de l'entité."""
+        groups = np.array([0, 0, 0, 1, 1])
+        timestamps = np.array([0, 50, 200, 210, 230])
+
+        starts = window_starts(groups, timestamps, 100)
+
+        assert starts.tolist() == [0, 0, 2, 3, 3]
+
+    def test_window_excludes_left_bound(self):
+        """Test : fenêtre (t - window, t]."""
+        starts = window_starts(np.zeros(3, dtype=int), np.array([0, 100, 101]), 100)
+
+        assert starts.tolist() == [0, 1, 1]
+
+    def test_distinct_ignores_missing(self):
+        """Test : les États manquants (-1) ne comptent pas."""
+        values = np.array([1, 2, 1, -1, 3])
+        starts = np.array([0, 0, 0, 1, 2])
+
+        distinct = window_distinct(values, starts, np.arange(5))
+
+        assert distinct.tolist() == [1, 2, 2, 2, 2]
+
+    def test_burst_across_states(self):
+        """Test : 5 transactions en 10 min dans 3 États."""
+        rule = VelocityRule("burst", "card", window=600, min_count=5, min_states=3)
+        timestamps = np.array([0, 60, 120, 180, 240, 5000])
+        states = np.array([0, 0, 1, 1, 2, 2])
+
+        hits = evaluate_rule(
+            rule, np.zeros(6, dtype=int), timestamps, states, np.ones(6)
+        )
+
+        assert hits["positions"].tolist() == [4]
+        assert hits["count"].tolist() == [5]
+        assert hits["distinct_states"].tolist() == [3]
+
+    def test_amount_jump(self):
+        """Test : saut de montant par rapport à la transaction précédente."""
+        rule = VelocityRule(
+            "jump", "customer", window=3600, min_count=2, min_amount_jump=10.0
+        )
+        groups = np.array([0, 0, 1, 1])
+        timestamps = np.array([0, 60, 0, 7200])
+        amounts = np.array([20.0, 400.0, 20.0, 400.0])
+
+        hits = evaluate_rule(rule, groups, timestamps, np.full(4, -1), amounts)
+
+        assert hits["positions"].tolist() == [1]
+        assert hits["amount_jump"].tolist() == [20.0]
+
+
+class TestAlerts:
+    """Tests pour les alertes du dataset et du flux."""
+
+    def test_stream_burst_alert(self, client):
+        """Test : une rafale sur une carte en flux déclenche une alerte."""
+        for minute, state in enumerate(["NY", "NY", "NJ", "CT", "CT"]):
+            response = client.post(
+                "/api/stats/top/events",
+                json={
+                    "date": f"2023-01-02 09:0{minute}:30",
+                    "amount": 25.0,
+                    "client_id": 9100,
+                    "card_id": 9200,
+                    "merchant_id": 5000,
+                    "merchant_state": state,
+                },
+            )
+            assert response.status_code == 200
+
+        response = client.get("/api/fraud/alerts", params={"rule": "card_multi_state_burst"})
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["by_rule"]["card_multi_state_burst"] >= 1
+        alert = data["alerts"][0]
+        assert alert["entity_id"] == 9200
+        assert alert["source"] == "stream"
+        assert alert["transaction_count"] == 5
+        assert alert["distinct_states"] == 3
+        assert alert["date"] == "2023-01-02 09:04:30"
+
+    def test_record_returns_alerts(self):
+        """Test : la transaction qui déclenche la règle reçoit l'alerte."""
+        first = alerts_service.record_transaction(DAY_3 + 36000, 20.0, 9101, 9201)
+        second = alerts_service.record_transaction(DAY_3 + 36300, 900.0, 9101, 9201)
+
+        assert first == []
+        assert [alert["rule"] for alert in second] == ["customer_amount_jump"]
+
+    def test_dataset_alerts(self, client):
+        """Test : alertes du dataset paginées et filtrées."""
+        response = client.get("/api/fraud/alerts", params={"limit": 5})
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["total"] == sum(data["by_rule"].values())
+        assert len(data["alerts"]) <= 5
+
+    def test_invalid_rule(self, client):
+        """Test : règle inconnue refusée."""
+        response = client.get("/api/fraud/alerts", params={"rule": "inconnue"})
+
+        assert response.status_code == 400